@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""
+Measure how many AWS requests per second can be signed with signature
+version 2 and 4.
+
+"v4 (no key cache)" clears the signing key cache before every request which
+matches the behaviour before signing keys were cached.
+
+Usage: ./benchmark_aws_signing.py [--requests 20000] [--body-size 65536]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.insert(0, BASE_DIR)
+
+from libcloud.compute.drivers.ec2 import EC2NodeDriver  # noqa
+
+
+def get_headers():
+    return {'Host': 'ec2.us-east-1.amazonaws.com',
+            'User-Agent': 'libcloud benchmark',
+            'Accept-Encoding': 'gzip,deflate'}
+
+
+def get_params():
+    return {'Action': 'DescribeInstances', 'Filter.1.Name': 'tag:Name',
+            'Filter.1.Value.1': 'web', 'MaxResults': '100'}
+
+
+def sign(connection, method, data, clear_cache):
+    signer = connection.signer
+    connection.action = '/'
+    connection.method = method
+    connection.data = data
+
+    if clear_cache:
+        signer._signing_keys.clear()
+
+    params = connection.add_default_params(get_params())
+    connection.pre_connect_hook(params, get_headers())
+
+
+def run(connection, method, data, requests, clear_cache=False):
+    start = time.time()
+
+    for _ in range(requests):
+        sign(connection, method, data, clear_cache)
+
+    return requests / (time.time() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--body-size', type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    body = 'a' * args.body_size
+    v2 = EC2NodeDriver('key', 'secret').connection
+    v4 = EC2NodeDriver('key', 'secret', region='eu-central-1').connection
+
+    print('Requests: %s, POST body size: %s bytes' %
+          (args.requests, args.body_size))
+    print('')
+
+    cases = [
+        ('v2 GET', v2, 'GET', None, False),
+        ('v4 GET (no key cache)', v4, 'GET', None, True),
+        ('v4 GET', v4, 'GET', None, False),
+        ('v4 POST', v4, 'POST', body, False)
+    ]
+
+    for name, connection, method, data, clear_cache in cases:
+        rate = run(connection, method, data, args.requests,
+                   clear_cache=clear_cache)
+        print('%-22s %10.0f signatures/s' % (name, rate))
+
+
+if __name__ == '__main__':
+    main()
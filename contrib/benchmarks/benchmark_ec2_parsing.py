@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+#
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""
+Compare peak memory usage and duration of parsing a large EC2
+DescribeInstances response with a full ElementTree (XmlResponse) and with
+the incremental parser used by ``EC2NodeDriver.ex_iterate_nodes``.
+
+The response is synthetic, every reservation is a copy of the first
+reservation in the DescribeInstances test fixture with a unique instance
+id. The body is gzip compressed (same as the responses returned by the
+API).
+
+Note: Memory usage is measured using tracemalloc which requires Python 3.4+.
+
+Usage: ./benchmark_ec2_parsing.py [--instances 50000]
+"""
+
+from __future__ import print_function
+
+import os
+import re
+import sys
+import time
+import zlib
+import argparse
+import tracemalloc
+
+from io import BytesIO
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.insert(0, BASE_DIR)
+
+from libcloud.common.base import StreamingResponse  # noqa
+from libcloud.compute.drivers.ec2 import EC2NodeDriver  # noqa
+from libcloud.compute.drivers.ec2 import EC2Response, NAMESPACE  # noqa
+from libcloud.utils.xml import findall, iterfindall  # noqa
+
+FIXTURE_PATH = os.path.join(BASE_DIR, 'libcloud/test/compute/fixtures/ec2/'
+                                      'describe_instances.xml')
+
+
+class FakeHTTPResponse(object):
+    status = 200
+    reason = 'OK'
+
+    def __init__(self, body):
+        self._body = BytesIO(body)
+
+    def read(self, *args):
+        return self._body.read(*args)
+
+    def getheaders(self):
+        return [('content-encoding', 'gzip')]
+
+
+def get_response_body(instances):
+    with open(FIXTURE_PATH) as fp:
+        fixture = fp.read()
+
+    start = fixture.index('<item>', fixture.index('<reservationSet>'))
+    end = fixture.index('</reservationSet>')
+    reservation_end = fixture.index('\n        </item>', start) + 16
+    reservation = re.sub(r'<instanceId>[^<]+</instanceId>',
+                         '<instanceId>INSTANCE_ID</instanceId>',
+                         fixture[start:reservation_end])
+
+    items = [reservation.replace('INSTANCE_ID', 'i-%08x' % (index))
+             for index in range(instances)]
+    body = (fixture[:start] + ''.join(items) + fixture[end:]).encode('utf-8')
+
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush(), len(body)
+
+
+def parse_tree(driver, body):
+    response = EC2Response(response=FakeHTTPResponse(body), connection=None)
+    nodes = []
+
+    for rs in findall(element=response.object, xpath='reservationSet/item',
+                      namespace=NAMESPACE):
+        nodes += driver._to_nodes(rs, 'instancesSet/item')
+
+    return len(nodes)
+
+
+def parse_stream(driver, body):
+    response = StreamingResponse(response=FakeHTTPResponse(body),
+                                 connection=None)
+    count = 0
+
+    for rs in iterfindall(stream=response.stream,
+                          xpath='reservationSet/item', namespace=NAMESPACE):
+        count += len(driver._to_nodes(rs, 'instancesSet/item'))
+
+    return count
+
+
+def measure(func, driver, body):
+    tracemalloc.start()
+    start = time.time()
+    count = func(driver, body)
+    duration = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, duration, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--instances', type=int, default=50000)
+    args = parser.parse_args()
+
+    driver = EC2NodeDriver('key', 'secret')
+    body, size = get_response_body(args.instances)
+
+    print('Instances: %s, response size: %.1f MB (%.1f MB compressed)' %
+          (args.instances, size / 1024.0 / 1024, len(body) / 1024.0 / 1024))
+    print('')
+
+    for name, func in [('full tree', parse_tree),
+                       ('iterparse', parse_stream)]:
+        count, duration, peak = measure(func, driver, body)
+        print('%-10s nodes: %6s, duration: %7.2f s, peak memory: %8.1f MB' %
+              (name, count, duration, peak / 1024.0 / 1024))
+
+
+if __name__ == '__main__':
+    main()
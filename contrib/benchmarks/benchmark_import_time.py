@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+#
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""
+Measure how long it takes to import the provider modules and to load
+drivers with get_driver() in a fresh interpreter.
+
+Every case runs in a new process with "python -X importtime" and the
+cumulative time of the libcloud imports reported by the interpreter is used
+(interpreter start up is not included). Modules with the highest self time
+are listed for every case so regressions are easy to track down.
+
+The fastest of all the runs is reported (same as timeit does) since the
+slower runs are mostly affected by other processes.
+
+Use --max-import-ms / --max-get-driver-ms to fail (exit code 1) if the
+time of a case exceeds the limit.
+
+Note: -X importtime requires Python 3.7+.
+
+Usage: ./benchmark_import_time.py [--runs 10] [--top 5]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.insert(0, BASE_DIR)
+
+IMPORT_CASES = [
+    ('import compute.providers', 'import libcloud.compute.providers'),
+    ('import storage.providers', 'import libcloud.storage.providers'),
+    ('import dns.providers', 'import libcloud.dns.providers'),
+]
+
+GET_DRIVER_CASES = [
+    ('get_driver(EC2)',
+     'from libcloud.compute.providers import get_driver\n'
+     'from libcloud.compute.types import Provider\n'
+     'get_driver(Provider.EC2)'),
+    ('get_driver(GCE)',
+     'from libcloud.compute.providers import get_driver\n'
+     'from libcloud.compute.types import Provider\n'
+     'get_driver(Provider.GCE)'),
+    ('get_driver(S3)',
+     'from libcloud.storage.providers import get_driver\n'
+     'from libcloud.storage.types import Provider\n'
+     'get_driver(Provider.S3)'),
+]
+
+
+def parse_importtime(output):
+    """
+    Return the total time of the libcloud imports and a dictionary with the
+    self time of every module (in microseconds).
+    """
+    total = 0
+    modules = {}
+
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(self_time)
+
+        # Nested imports are indented and already included in the
+        # cumulative time of the top level import
+        if name[1:].startswith('libcloud'):
+            total += int(cumulative)
+
+    return total, modules
+
+
+def run_case(statement):
+    env = dict(os.environ, PYTHONPATH=BASE_DIR)
+
+    # Measure imports from cached bytecode (same as an installed package)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    process = subprocess.Popen([sys.executable, '-X', 'importtime', '-c',
+                                statement], stderr=subprocess.PIPE,
+                               universal_newlines=True, env=env,
+                               cwd=BASE_DIR)
+    _, stderr = process.communicate()
+
+    if process.returncode != 0:
+        raise RuntimeError('Failed to run %r: %s' % (statement, stderr))
+
+    return parse_importtime(stderr)
+
+
+def measure(statement, runs):
+    totals = []
+    modules = {}
+
+    # Warm up run which compiles the modules
+    run_case(statement)
+
+    for _ in range(runs):
+        total, run_modules = run_case(statement)
+        totals.append(total)
+
+        for name, value in run_modules.items():
+            modules[name] = min(value, modules.get(name, value))
+
+    return min(totals) / 1000.0, modules
+
+
+def measure_lookups(lookups):
+    from libcloud.compute.providers import get_driver
+    from libcloud.compute.types import Provider
+
+    get_driver(Provider.EC2)
+    start = time.time()
+
+    for _ in range(lookups):
+        get_driver(Provider.EC2)
+
+    return lookups / (time.time() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--top', type=int, default=5,
+                        help='Number of modules with the highest self time '
+                             'to show')
+    parser.add_argument('--lookups', type=int, default=100000)
+    parser.add_argument('--max-import-ms', type=float, default=None)
+    parser.add_argument('--max-get-driver-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    failed = False
+    cases = [(name, statement, args.max_import_ms)
+             for name, statement in IMPORT_CASES]
+    cases += [(name, statement, args.max_get_driver_ms)
+              for name, statement in GET_DRIVER_CASES]
+
+    print('Python %s, best of %s runs' % (sys.version.split()[0],
+                                          args.runs))
+    print('')
+
+    for name, statement, limit in cases:
+        median, modules = measure(statement, args.runs)
+        status = ''
+
+        if limit is not None and median > limit:
+            status = ' (limit: %.1f ms)' % (limit)
+            failed = True
+
+        print('%-26s %8.1f ms%s' % (name, median, status))
+
+        slowest = sorted(modules.items(), key=lambda item: item[1],
+                         reverse=True)[:args.top]
+
+        for module, value in slowest:
+            print('    %-38s %8.1f ms' % (module, value / 1000.0))
+
+    print('')
+    print('get_driver() lookups: %.0f/s' % (measure_lookups(args.lookups)))
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+#
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""
+Compare memory usage (RSS) per object of the slotted model classes (Node,
+NodeSize, NodeImage, StorageVolume, storage Object and Container) with dict
+based classes which store the same attributes the way the model classes
+did before (an attribute __dict__ and an empty "extra" dictionary).
+
+Every case runs in a new process which creates the objects and reports the
+RSS increase.
+
+Usage: ./benchmark_model_memory.py [--objects 100000]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import argparse
+import subprocess
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.insert(0, BASE_DIR)
+
+from libcloud.compute.base import Node, NodeSize, NodeImage  # noqa
+from libcloud.compute.base import StorageVolume  # noqa
+from libcloud.compute.drivers.dummy import DummyNodeDriver  # noqa
+from libcloud.storage.base import Object, Container  # noqa
+
+
+class DictModel(object):
+    def __init__(self, **kwargs):
+        self._uuid = None
+
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+
+class DictNode(DictModel):
+    def __init__(self, id, name, state, public_ips, private_ips, driver,
+                 extra=None):
+        super(DictNode, self).__init__(
+            id=id, name=name, state=state, public_ips=public_ips,
+            private_ips=private_ips, driver=driver, size=None, image=None,
+            extra=extra or {})
+
+
+class DictNodeSize(DictModel):
+    def __init__(self, id, name, ram, disk, bandwidth, price, driver,
+                 extra=None):
+        super(DictNodeSize, self).__init__(
+            id=id, name=name, ram=ram, disk=disk, bandwidth=bandwidth,
+            price=price, driver=driver, extra=extra or {})
+
+
+class DictNodeImage(DictModel):
+    def __init__(self, id, name, driver, extra=None):
+        super(DictNodeImage, self).__init__(id=id, name=name, driver=driver,
+                                            extra=extra or {})
+
+
+class DictStorageVolume(DictModel):
+    def __init__(self, id, name, size, driver, state=None, extra=None):
+        super(DictStorageVolume, self).__init__(
+            id=id, name=name, size=size, driver=driver, state=state,
+            extra=extra)
+
+
+class DictObject(object):
+    def __init__(self, name, size, hash, extra, meta_data, container,
+                 driver):
+        self.name = name
+        self.size = size
+        self.hash = hash
+        self.container = container
+        self.extra = extra or {}
+        self.meta_data = meta_data or {}
+        self.driver = driver
+
+
+class DictContainer(object):
+    def __init__(self, name, extra, driver):
+        self.name = name
+        self.extra = extra or {}
+        self.driver = driver
+
+
+def create_node(cls, index, driver):
+    return cls(id='i-%08x' % (index), name='node-%s' % (index), state=0,
+               public_ips=['10.0.0.1'], private_ips=[], driver=driver,
+               extra={'zone': 'us-east-1a'})
+
+
+def create_size(cls, index, driver):
+    return cls(id='size-%s' % (index), name='size', ram=512, disk=10,
+               bandwidth=None, price=0.1, driver=driver)
+
+
+def create_image(cls, index, driver):
+    return cls(id='ami-%08x' % (index), name='image', driver=driver)
+
+
+def create_volume(cls, index, driver):
+    return cls(id='vol-%08x' % (index), name='volume', size=10,
+               driver=driver)
+
+
+def create_object(cls, index, driver):
+    return cls(name='object-%s' % (index), size=1024, hash='abc',
+               extra=None, meta_data=None, container=None, driver=driver)
+
+
+def create_container(cls, index, driver):
+    return cls(name='container-%s' % (index), extra=None, driver=driver)
+
+
+CASES = [
+    ('Node', create_node, Node, DictNode),
+    ('NodeSize', create_size, NodeSize, DictNodeSize),
+    ('NodeImage', create_image, NodeImage, DictNodeImage),
+    ('StorageVolume', create_volume, StorageVolume, DictStorageVolume),
+    ('Object', create_object, Object, DictObject),
+    ('Container', create_container, Container, DictContainer),
+]
+
+
+def get_rss():
+    """
+    Return RSS of the current process in bytes.
+    """
+    try:
+        with open('/proc/self/statm') as fp:
+            return int(fp.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except IOError:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, OS X bytes
+        return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def run_case(name, variant, objects):
+    """
+    Create the objects and print the RSS increase (called in a subprocess).
+    """
+    for case_name, func, slotted_cls, dict_cls in CASES:
+        if case_name == name:
+            break
+
+    cls = slotted_cls if variant == 'slots' else dict_cls
+    driver = DummyNodeDriver(0)
+
+    start = get_rss()
+    items = [func(cls, index, driver) for index in range(objects)]
+    print(get_rss() - start)
+    return items
+
+
+def measure(name, variant, objects):
+    output = subprocess.check_output([sys.executable, __file__, '--case',
+                                      name, '--variant', variant,
+                                      '--objects', str(objects)])
+    return int(output.decode('utf-8').strip()) / float(objects)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--objects', type=int, default=100000)
+    parser.add_argument('--case', default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--variant', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        run_case(args.case, args.variant, args.objects)
+        return
+
+    print('Python %s, %s objects, RSS bytes per object' %
+          (sys.version.split()[0], args.objects))
+    print('')
+    print('%-15s %10s %10s %8s' % ('class', 'dict', 'slots', 'saved'))
+
+    for name, _, _, _ in CASES:
+        before = measure(name, 'dict', args.objects)
+        after = measure(name, 'slots', args.objects)
+        print('%-15s %10.0f %10.0f %7.0f%%' %
+              (name, before, after, (1 - after / before) * 100))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+#
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""
+Compare cold-start time and memory usage of the JSON pricing loader and the
+memory-mapped pricing index.
+
+Every measurement is performed in a new Python process which looks up a
+single size price (the same thing a short-lived worker which calls
+``list_sizes`` does).
+
+``--scale N`` benchmarks a synthetic pricing file which contains every
+driver from the pricing file N times.
+
+Note: Memory usage is measured using tracemalloc which requires Python 3.4+.
+
+Usage: ./benchmark_pricing.py [--runs 20] [--scale 1] [--pricing-file path]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+
+SCRIPT = """
+import json
+import resource
+import time
+import tracemalloc
+
+import libcloud.pricing
+
+libcloud.pricing.USE_PRICING_INDEX = %(use_index)s
+libcloud.pricing.PRICING_INDEX_DIRECTORY = %(index_directory)r
+libcloud.pricing.get_pricing_file_path = lambda file_path=None: %(path)r
+
+start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+tracemalloc.start()
+start = time.time()
+libcloud.pricing.get_size_price(driver_type='compute',
+                                driver_name=%(driver_name)r,
+                                size_id=%(size_id)r)
+duration = time.time() - start
+retained = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+end_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({'duration': duration, 'rss': end_rss - start_rss,
+                  'retained': retained}))
+"""
+
+
+def get_largest_driver(pricing_file_path):
+    with open(pricing_file_path) as fp:
+        pricing = json.load(fp)['compute']
+
+    driver_name = max(pricing, key=lambda name: len(pricing[name]))
+    size_id = sorted(pricing[driver_name])[0]
+    return driver_name, size_id
+
+
+def write_scaled_pricing_file(pricing_file_path, scale, directory):
+    with open(pricing_file_path) as fp:
+        data = json.load(fp)
+
+    compute = {}
+
+    for index in range(scale):
+        for driver_name, pricing in data['compute'].items():
+            name = driver_name if index == 0 else '%s_%s' % (driver_name,
+                                                             index)
+            compute[name] = pricing
+
+    data['compute'] = compute
+    file_path = os.path.join(directory, 'pricing-x%s.json' % (scale))
+
+    with open(file_path, 'w') as fp:
+        json.dump(data, fp)
+
+    return file_path
+
+
+def run(use_index, pricing_file_path, index_directory, driver_name,
+        size_id):
+    script = SCRIPT % {'use_index': use_index,
+                       'index_directory': index_directory,
+                       'path': pricing_file_path,
+                       'driver_name': driver_name,
+                       'size_id': size_id}
+    env = dict(os.environ)
+    env['PYTHONPATH'] = BASE_DIR
+    output = subprocess.check_output([sys.executable, '-c', script], env=env)
+    return json.loads(output.decode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('--pricing-file',
+                        default=os.path.join(BASE_DIR,
+                                             'libcloud/data/pricing.json'))
+    parser.add_argument('--index-directory', default='/tmp/libcloud-bench/')
+    args = parser.parse_args()
+
+    pricing_file_path = os.path.abspath(args.pricing_file)
+
+    if not os.path.exists(args.index_directory):
+        os.makedirs(args.index_directory)
+
+    if args.scale > 1:
+        pricing_file_path = write_scaled_pricing_file(
+            pricing_file_path, args.scale, args.index_directory)
+
+    driver_name, size_id = get_largest_driver(pricing_file_path)
+
+    print('Pricing file: %s (%s bytes)' %
+          (pricing_file_path, os.path.getsize(pricing_file_path)))
+    print('Looking up: %s / %s, %s runs' % (driver_name, size_id, args.runs))
+    print('')
+
+    # The first run compiles the index
+    run(True, pricing_file_path, args.index_directory, driver_name, size_id)
+
+    for name, use_index in [('json loader', False), ('mmap index', True)]:
+        results = [run(use_index, pricing_file_path, args.index_directory,
+                       driver_name, size_id) for _ in range(args.runs)]
+        durations = sorted([result['duration'] for result in results])
+        rss = sorted([result['rss'] for result in results])
+        retained = sorted([result['retained'] for result in results])
+        median = len(results) // 2
+
+        print('%-12s lookup: %8.3f ms, retained: %8.1f KB, '
+              'max RSS increase: %6s KB' %
+              (name, durations[median] * 1000, retained[median] / 1024.0,
+               rss[median]))
+
+
+if __name__ == '__main__':
+    main()
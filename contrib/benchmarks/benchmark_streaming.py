@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+#
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing,
+#  software distributed under the License is distributed on an
+#  "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#  KIND, either express or implied.  See the License for the
+#  specific language governing permissions and limitations
+#  under the License.
+
+"""
+Measure throughput of the storage upload streaming pipeline.
+
+1. ``read_in_chunks`` with ``fill_size=True`` - the previous implementation
+   (``data += chunk`` and ``data = data[chunk_size:]``) is compared with the
+   current one for small and large input chunks.
+2. Uploading a file to a local TCP socket using ``StorageDriver._upload_file``
+   with the regular (chunked and non-chunked) streaming code path and with
+   ``socket.sendfile``.
+
+Usage: ./benchmark_streaming.py [--size-mb 64] [--runs 3]
+"""
+
+from __future__ import print_function
+from __future__ import with_statement
+
+import os
+import sys
+import time
+import socket
+import argparse
+import tempfile
+import threading
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.insert(0, BASE_DIR)
+
+from libcloud.utils.files import read_in_chunks  # NOQA
+from libcloud.storage.base import StorageDriver  # NOQA
+
+CHUNK_SIZE = 8096
+MB = 1024 * 1024
+
+
+def legacy_read_in_chunks(iterator, chunk_size, fill_size=True):
+    data = b''
+    empty = False
+
+    while not empty or len(data) > 0:
+        if not empty:
+            try:
+                chunk = next(iterator)
+                if len(chunk) > 0:
+                    data += chunk
+                else:
+                    empty = True
+            except StopIteration:
+                empty = True
+
+        if len(data) == 0:
+            return
+
+        if empty or len(data) >= chunk_size:
+            yield data[:chunk_size]
+            data = data[chunk_size:]
+
+
+def get_pieces(size, piece_size):
+    piece = b'a' * piece_size
+
+    for _ in range(size // piece_size):
+        yield piece
+
+
+def measure(func, runs):
+    durations = []
+
+    for _ in range(runs):
+        start = time.time()
+        func()
+        durations.append(time.time() - start)
+
+    return min(durations)
+
+
+def benchmark_read_in_chunks(size, runs):
+    print('read_in_chunks(fill_size=True, chunk_size=%s), %s MB' %
+          (CHUNK_SIZE, size // MB))
+
+    for piece_size in [1024, 64 * 1024, MB]:
+        for name, func in [('previous', legacy_read_in_chunks),
+                           ('current', read_in_chunks)]:
+            def consume():
+                for _ in func(get_pieces(size, piece_size),
+                              chunk_size=CHUNK_SIZE, fill_size=True):
+                    pass
+
+            duration = measure(consume, runs)
+            print('  input chunk %8s bytes, %-8s: %8.1f MB/s' %
+                  (piece_size, name, size / duration / MB))
+
+
+class Receiver(object):
+    """
+    Local TCP server which discards all the received data.
+    """
+
+    def __init__(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(5)
+        self.address = self.server.getsockname()
+
+        thread = threading.Thread(target=self._accept)
+        thread.daemon = True
+        thread.start()
+
+    def _accept(self):
+        while True:
+            connection, _ = self.server.accept()
+            thread = threading.Thread(target=self._drain, args=(connection, ))
+            thread.daemon = True
+            thread.start()
+
+    def _drain(self, connection):
+        buf = bytearray(MB)
+
+        while connection.recv_into(buf):
+            pass
+
+        connection.close()
+
+
+class SocketConnection(object):
+    def __init__(self, sock):
+        self.sock = sock
+        self.send = sock.sendall
+
+
+class Connection(object):
+    def __init__(self, sock):
+        self.connection = SocketConnection(sock)
+
+
+class Response(object):
+    def __init__(self, sock):
+        self.connection = Connection(sock)
+
+
+def benchmark_upload(size, runs):
+    driver = StorageDriver('key', 'secret')
+    receiver = Receiver()
+    fd, file_path = tempfile.mkstemp()
+
+    with os.fdopen(fd, 'wb') as fp:
+        for piece in get_pieces(size, MB):
+            fp.write(piece)
+
+    print('')
+    print('StorageDriver._upload_file, %s MB' % (size // MB))
+
+    modes = [('stream', False, False), ('stream chunked', True, False),
+             ('sendfile', False, True)]
+
+    try:
+        for name, chunked, use_sendfile in modes:
+            if use_sendfile and not hasattr(socket.socket, 'sendfile'):
+                continue
+
+            driver.use_sendfile = use_sendfile
+
+            def upload():
+                sock = socket.create_connection(receiver.address)
+
+                try:
+                    result = driver._upload_file(response=Response(sock),
+                                                 file_path=file_path,
+                                                 chunked=chunked)
+                    assert result[0] and result[2] == size
+                finally:
+                    sock.close()
+
+            duration = measure(upload, runs)
+            print('  %-16s: %8.1f MB/s' % (name, size / duration / MB))
+    finally:
+        os.remove(file_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--size-mb', type=int, default=64)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    size = args.size_mb * MB
+    benchmark_read_in_chunks(size, args.runs)
+    benchmark_upload(size, args.runs)
+
+
+if __name__ == '__main__':
+    main()
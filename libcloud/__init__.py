@@ -19,7 +19,7 @@ libcloud provides a unified interface to the cloud computing resources.
 :var __version__: Current version of libcloud
 """
 
-__all__ = ['__version__', 'enable_debug']
+__all__ = ['__version__', 'enable_debug', 'enable_keep_alive']
 __version__ = '0.17.1-dev'
 
 import os
@@ -48,6 +48,26 @@ def enable_debug(fo):
                                LoggingHTTPSConnection)
 
 
+def enable_keep_alive(max_size=None, idle_timeout=None):
+    """
+    Enable library wide re-use of keep-alive HTTP(S) connections.
+
+    :param max_size: Maximum number of idle connections kept per host.
+    :type max_size: ``int``
+
+    :param idle_timeout: How many seconds an idle connection is kept around
+                         before it's closed.
+    :type idle_timeout: ``int``
+
+    :return: Connection pool which is shared by all the connections.
+    :rtype: :class:`libcloud.common.base.ConnectionPool`
+    """
+    from libcloud.common.base import Connection, ConnectionPool
+    Connection.connection_pool = ConnectionPool(max_size=max_size,
+                                                idle_timeout=idle_timeout)
+    return Connection.connection_pool
+
+
 def _init_once():
     """
     Utility function that is ran once on Library import.
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from libcloud.common.base import ConnectionKey, BaseDriver, LibcloudError
+from libcloud.autoscale.reconcile import Reconciler
 
 __all__ = [
     'AutoScaleDriver',
@@ -117,6 +118,10 @@ class AutoScaleDriver(BaseDriver):
     _TERMINATION_POLICY_TO_VALUE_MAP = {}
     _VALUE_TO_TERMINATION_POLICY_MAP = {}
 
+    # Waiter used for long running operations (defaults to the shared one,
+    # see libcloud.autoscale.waiter.get_default_waiter)
+    waiter = None
+
     def __init__(self, key, secret=None, secure=True, host=None,
                  port=None, api_version=None, **kwargs):
         super(AutoScaleDriver, self).__init__(
@@ -276,6 +281,38 @@ class AutoScaleDriver(BaseDriver):
         raise NotImplementedError(
             'delete_auto_scale_group not implemented for this driver')
 
+    def reconcile(self, desired_spec, monitor_driver=None, prune=False,
+                  dry_run=False, max_concurrency=None):
+        """
+        Converge groups, their policies and alarms to the desired state.
+
+        See :mod:`libcloud.autoscale.reconcile` for the format of the
+        desired state.
+
+        :param desired_spec: Desired state of the groups.
+        :type desired_spec: ``list`` of ``dict``
+
+        :param monitor_driver: Monitor driver used to manage the alarms. If
+                               not provided, alarms are ignored.
+        :type monitor_driver: :class:`MonitorDriver`
+
+        :param prune: Delete policies and alarms of the specified groups
+                      which are not part of the desired state.
+        :type prune: ``bool``
+
+        :param dry_run: Only compute the changes, don't apply them.
+        :type dry_run: ``bool``
+
+        :param max_concurrency: Maximum number of concurrent requests.
+        :type max_concurrency: ``int``
+
+        :return: Changes (with their results if they have been applied).
+        :rtype: :class:`ReconcilePlan`
+        """
+        reconciler = Reconciler(driver=self, monitor_driver=monitor_driver,
+                                prune=prune, max_concurrency=max_concurrency)
+        return reconciler.reconcile(desired_spec, dry_run=dry_run)
+
     def list_supported_scale_adjustment_types(self):
         """
         Return scale adjustment types supported by this driver.
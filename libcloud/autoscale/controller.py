@@ -0,0 +1,609 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process controller which makes scaling decisions for auto scale groups
+based on metrics retrieved using a :class:`MonitorDriver`.
+"""
+
+from __future__ import with_statement
+
+import sys
+import time
+import heapq
+import itertools
+import threading
+
+from collections import deque
+
+from libcloud.autoscale.types import AutoScaleAdjustmentType
+from libcloud.common.types import LibcloudError
+from libcloud.compute.bulk import BulkExecutor, BulkResult
+from libcloud.monitor.base import OPERATOR_FUNCTIONS
+from libcloud.monitor.types import MetricStatistic
+
+__all__ = [
+    'SlidingWindow',
+    'ScalingActivity',
+    'AutoScaleController'
+]
+
+
+class SlidingWindow(object):
+    """
+    Aggregates of the metric samples from the last ``length`` seconds.
+
+    Adding a sample and expiring old samples is O(1) (amortized) - sum is
+    updated incrementally and minimum / maximum are tracked using monotonic
+    queues.
+    """
+
+    def __init__(self, length):
+        """
+        :param length: Length of the window in seconds.
+        :type length: ``int``
+        """
+        self.length = length
+        self.total = 0.0
+        self.last_timestamp = None
+
+        self._samples = deque()
+        self._minimums = deque()
+        self._maximums = deque()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def add(self, timestamp, value):
+        """
+        Add a sample to the window.
+
+        Samples need to be added in order, samples which are older than the
+        last sample are ignored.
+
+        :return: ``True`` if the sample has been added.
+        :rtype: ``bool``
+        """
+        if self.last_timestamp is not None and \
+                timestamp <= self.last_timestamp:
+            return False
+
+        sample = (timestamp, value)
+        self._samples.append(sample)
+        self.total += value
+        self.last_timestamp = timestamp
+
+        while self._minimums and self._minimums[-1][1] >= value:
+            self._minimums.pop()
+        self._minimums.append(sample)
+
+        while self._maximums and self._maximums[-1][1] <= value:
+            self._maximums.pop()
+        self._maximums.append(sample)
+
+        return True
+
+    def expire(self, now):
+        """
+        Remove samples which are older than ``now - length``.
+        """
+        cutoff = now - self.length
+
+        while self._samples and self._samples[0][0] < cutoff:
+            self.total -= self._samples.popleft()[1]
+
+        while self._minimums and self._minimums[0][0] < cutoff:
+            self._minimums.popleft()
+
+        while self._maximums and self._maximums[0][0] < cutoff:
+            self._maximums.popleft()
+
+        if not self._samples:
+            # Prevent floating point errors from accumulating
+            self.total = 0.0
+
+    def get_value(self, statistic):
+        """
+        Return value of the statistic over the samples in the window or
+        ``None`` if the window is empty.
+
+        :param statistic: The statistic.
+        :type statistic: value within :class:`MetricStatistic`
+
+        :rtype: ``float``
+        """
+        if not self._samples:
+            return None
+
+        if statistic == MetricStatistic.AVG:
+            return self.total / len(self._samples)
+        elif statistic == MetricStatistic.MIN:
+            return self._minimums[0][1]
+        elif statistic == MetricStatistic.MAX:
+            return self._maximums[0][1]
+        elif statistic == MetricStatistic.SUM:
+            return self.total
+        elif statistic == MetricStatistic.SAMPLE_COUNT:
+            return float(len(self._samples))
+
+        raise ValueError('Invalid statistic: %s' % (statistic))
+
+
+class ScalingActivity(object):
+    """
+    Scaling decision made (or attempted) by :class:`AutoScaleController`.
+    """
+
+    def __init__(self, group, timestamp, alarm=None, policy=None,
+                 previous_capacity=None, capacity=None, error=None):
+        """
+        :param group: The group.
+        :type group: :class:`AutoScaleGroup`
+
+        :param timestamp: Time of the decision (seconds since epoch).
+        :type timestamp: ``float``
+
+        :param alarm: Alarm which has triggered the activity.
+        :type alarm: :class:`AutoScaleAlarm`
+
+        :param policy: Policy which has been applied.
+        :type policy: :class:`AutoScalePolicy`
+
+        :param previous_capacity: Number of members before the activity.
+        :type previous_capacity: ``int``
+
+        :param capacity: Number of members after the activity.
+        :type capacity: ``int``
+
+        :param error: Exception if retrieving the metrics or updating the
+                      group has failed.
+        :type error: :class:`Exception`
+        """
+        self.group = group
+        self.timestamp = timestamp
+        self.alarm = alarm
+        self.policy = policy
+        self.previous_capacity = previous_capacity
+        self.capacity = capacity
+        self.error = error
+
+    @property
+    def success(self):
+        return self.error is None
+
+    def __repr__(self):
+        return (('<ScalingActivity: group=%s, policy=%s, '
+                 'previous_capacity=%s, capacity=%s, success=%s>') %
+                (self.group.name, self.policy and self.policy.name,
+                 self.previous_capacity, self.capacity, self.success))
+
+
+class ScalingRule(object):
+    """
+    Alarm and the policy which is applied when the alarm is triggered.
+
+    The window contains the per period values of the alarm statistic, e.g.
+    the number of samples of every period for ``SAMPLE_COUNT`` which are
+    then summed up.
+    """
+
+    # Statistic which combines the per period values of a statistic
+    WINDOW_STATISTICS = {
+        MetricStatistic.AVG: MetricStatistic.AVG,
+        MetricStatistic.MIN: MetricStatistic.MIN,
+        MetricStatistic.MAX: MetricStatistic.MAX,
+        MetricStatistic.SUM: MetricStatistic.SUM,
+        MetricStatistic.SAMPLE_COUNT: MetricStatistic.SUM
+    }
+
+    def __init__(self, alarm, policy):
+        self.alarm = alarm
+        self.policy = policy
+        self.window = SlidingWindow(length=alarm.period)
+
+    def is_triggered(self, now):
+        self.window.expire(now)
+        value = self.window.get_value(
+            self.WINDOW_STATISTICS[self.alarm.statistic])
+
+        if value is None:
+            return False
+
+        func = OPERATOR_FUNCTIONS[self.alarm.operator]
+        return func(value, self.alarm.threshold)
+
+
+class GroupState(object):
+    """
+    State of a group which is managed by :class:`AutoScaleController`.
+    """
+
+    def __init__(self, group, rules, monitor_driver, metric_kwargs,
+                 min_size, max_size):
+        self.group = group
+        self.rules = rules
+        self.monitor_driver = monitor_driver
+        self.metric_kwargs = metric_kwargs
+        self.min_size = min_size
+        self.max_size = max_size
+
+        # Timestamp of the last retrieved sample of every metric
+        self.last_samples = {}
+        self.last_scaling = None
+        self.next_evaluation = 0
+        self.removed = False
+
+    def get_metrics(self):
+        """
+        Return the window length and the statistics which are needed for
+        every metric.
+
+        :rtype: ``dict`` of ``tuple``
+        """
+        metrics = {}
+
+        for rule in self.rules:
+            metric = rule.alarm.metric_name
+            length, statistics = metrics.get(metric, (0, []))
+
+            if rule.alarm.statistic not in statistics:
+                statistics = statistics + [rule.alarm.statistic]
+
+            metrics[metric] = (max(length, rule.alarm.period), statistics)
+
+        return metrics
+
+
+class AutoScaleController(object):
+    """
+    Makes scaling decisions locally instead of relying on the provider.
+
+    Metrics of every group are retrieved periodically using
+    :meth:`MonitorDriver.get_metric_statistics` (only the samples which
+    haven't been retrieved yet, with the statistics the alarms use). Per
+    period values of ``alarm.statistic`` are fed into a sliding window per
+    alarm which is ``alarm.period`` seconds long and the alarm is triggered
+    once the statistic over the window compared with ``alarm.threshold``
+    using ``alarm.operator`` is true.
+
+    Policy of a triggered alarm is applied unless the group is in cooldown.
+    If many alarms of a group are triggered at once, the policy which results
+    in the largest capacity wins. The new capacity is limited by the group
+    ``min_size`` and ``max_size`` and applied using
+    :meth:`AutoScaleDriver.update_auto_scale_group` with both the limits set
+    to the new capacity (the provider keeps exactly that number of members).
+
+    All the groups are evaluated by a single scheduler thread, metrics of the
+    groups which are due at the same time are retrieved concurrently.
+    """
+
+    # Number of seconds between two evaluations of a group
+    evaluation_interval = 60
+
+    # Period (in seconds) of the retrieved metric samples
+    metric_period = 60
+
+    # Maximum number of groups which are evaluated concurrently
+    max_concurrency = 10
+
+    def __init__(self, evaluation_interval=None, metric_period=None,
+                 max_concurrency=None, callback=None, clock=None):
+        """
+        :param evaluation_interval: Number of seconds between two evaluations
+                                    of a group.
+        :type evaluation_interval: ``int``
+
+        :param metric_period: Period (in seconds) of the metric samples.
+        :type metric_period: ``int``
+
+        :param max_concurrency: Maximum number of groups which are evaluated
+                                concurrently.
+        :type max_concurrency: ``int``
+
+        :param callback: Function which is called with every
+                         :class:`ScalingActivity` by the scheduler thread.
+        :type callback: ``callable``
+
+        :param clock: Function which returns the current time (defaults to
+                      ``time.time``).
+        :type clock: ``callable``
+        """
+        if evaluation_interval is not None:
+            self.evaluation_interval = evaluation_interval
+
+        if metric_period is not None:
+            self.metric_period = metric_period
+
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+
+        self.callback = callback
+        self.clock = clock or time.time
+
+        self._groups = {}
+        self._queue = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    @property
+    def groups(self):
+        """
+        Groups managed by the controller.
+
+        :rtype: ``list`` of :class:`AutoScaleGroup`
+        """
+        with self._condition:
+            return [state.group for state in self._groups.values()]
+
+    def add_group(self, group, rules, monitor_driver, metric_kwargs=None,
+                  min_size=None, max_size=None):
+        """
+        Start managing a group.
+
+        :param group: The group.
+        :type group: :class:`AutoScaleGroup`
+
+        :param rules: Alarms and the policies which are applied when the
+                      alarms are triggered.
+        :type rules: ``list`` of (:class:`AutoScaleAlarm`,
+                     :class:`AutoScalePolicy`) tuples
+
+        :param monitor_driver: Driver which is used to retrieve the metrics.
+        :type monitor_driver: :class:`MonitorDriver`
+
+        :param metric_kwargs: Extra keyword arguments which are passed to
+                              ``get_metric_statistics`` (e.g.
+                              ``ex_dimensions``).
+        :type metric_kwargs: ``dict``
+
+        :param min_size: Minimum group size (defaults to ``group.min_size``).
+        :type min_size: ``int``
+
+        :param max_size: Maximum group size (defaults to ``group.max_size``).
+        :type max_size: ``int``
+        """
+        if not rules:
+            raise ValueError('At least one rule is required')
+
+        state = GroupState(
+            group=group,
+            rules=[ScalingRule(alarm=alarm, policy=policy)
+                   for alarm, policy in rules],
+            monitor_driver=monitor_driver,
+            metric_kwargs=metric_kwargs or {},
+            min_size=group.min_size if min_size is None else min_size,
+            max_size=group.max_size if max_size is None else max_size)
+
+        with self._condition:
+            if group.id in self._groups:
+                raise LibcloudError(value='Group %s is already managed' %
+                                    (group.id))
+
+            self._groups[group.id] = state
+            heapq.heappush(self._queue, (0, next(self._sequence),
+                                         state))
+            self._condition.notify()
+
+    def remove_group(self, group):
+        """
+        Stop managing a group.
+
+        :param group: The group.
+        :type group: :class:`AutoScaleGroup`
+        """
+        with self._condition:
+            state = self._groups.pop(group.id, None)
+
+            if state:
+                state.removed = True
+
+    def evaluate(self, now=None):
+        """
+        Evaluate the groups which are due.
+
+        :param now: Current time (defaults to ``clock()``).
+        :type now: ``float``
+
+        :return: Scaling activities (including failed ones).
+        :rtype: ``list`` of :class:`ScalingActivity`
+        """
+        now = self.clock() if now is None else now
+        due = []
+
+        with self._condition:
+            while self._queue and self._queue[0][0] <= now:
+                _, _, state = heapq.heappop(self._queue)
+
+                if not state.removed:
+                    due.append(state)
+
+        executor = BulkExecutor(max_concurrency=self.max_concurrency,
+                                max_retries=0)
+
+        try:
+            results = executor.map(
+                lambda state: self._evaluate_group(state, now), due)
+        except Exception:
+            # Groups still need to be rescheduled
+            e = sys.exc_info()[1]
+            results = [BulkResult(item=state, error=e) for state in due]
+
+        activities = []
+
+        with self._condition:
+            for state, result in zip(due, results):
+                if not state.removed:
+                    state.next_evaluation = now + self.evaluation_interval
+                    heapq.heappush(self._queue, (state.next_evaluation,
+                                                 next(self._sequence),
+                                                 state))
+
+                if result.error:
+                    activities.append(ScalingActivity(group=state.group,
+                                                      timestamp=now,
+                                                      error=result.error))
+                elif result.value:
+                    activities.append(result.value)
+
+        return activities
+
+    def start(self):
+        """
+        Start evaluating the groups in a background thread.
+        """
+        with self._condition:
+            if self._thread is not None:
+                return
+
+            self._running = True
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stop the background thread.
+        """
+        with self._condition:
+            thread = self._thread
+            self._running = False
+            self._condition.notify()
+
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self):
+        try:
+            while True:
+                with self._condition:
+                    if not self._running:
+                        return
+
+                    if not self._queue:
+                        self._condition.wait()
+                        continue
+
+                    delay = self._queue[0][0] - self.clock()
+
+                    if delay > 0:
+                        self._condition.wait(delay)
+                        continue
+
+                for activity in self.evaluate():
+                    self._notify(activity)
+        finally:
+            with self._condition:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _notify(self, activity):
+        if not self.callback:
+            return
+
+        try:
+            self.callback(activity)
+        except Exception:
+            # A failing callback must not stop the scheduler thread
+            if activity.error is None:
+                activity.error = sys.exc_info()[1]
+
+    def _evaluate_group(self, state, now):
+        self._update_windows(state, now)
+
+        if state.last_scaling is not None and \
+                now - state.last_scaling < (state.group.cooldown or 0):
+            return None
+
+        triggered = [rule for rule in state.rules if rule.is_triggered(now)]
+
+        if not triggered:
+            return None
+
+        driver = state.group.driver
+        current = len(driver.list_auto_scale_group_members(state.group))
+        decisions = [(self._get_capacity(state, rule.policy, current), rule)
+                     for rule in triggered]
+        capacity, rule = max(decisions, key=lambda decision: decision[0])
+
+        if capacity == current:
+            return None
+
+        activity = ScalingActivity(group=state.group, timestamp=now,
+                                   alarm=rule.alarm, policy=rule.policy,
+                                   previous_capacity=current,
+                                   capacity=capacity)
+
+        try:
+            driver.update_auto_scale_group(state.group, min_size=capacity,
+                                           max_size=capacity)
+        except Exception:
+            activity.error = sys.exc_info()[1]
+
+        # Cooldown also applies after a failed attempt so the provider is not
+        # flooded with requests
+        state.last_scaling = now
+        return activity
+
+    def _update_windows(self, state, now):
+        for metric, (length, statistics) in state.get_metrics().items():
+            last_sample = state.last_samples.get(metric)
+
+            if last_sample is None:
+                start = now - length - self.metric_period
+            else:
+                start = last_sample + self.metric_period
+
+            if now - start < self.metric_period:
+                continue
+
+            series = state.monitor_driver.get_metric_statistics(
+                metric=metric, start=start, end=now,
+                period=self.metric_period,
+                statistics=statistics, **state.metric_kwargs)
+
+            if not len(series):
+                continue
+
+            for rule in state.rules:
+                if rule.alarm.metric_name != metric:
+                    continue
+
+                values = series.get_values(rule.alarm.statistic)
+
+                for timestamp, value in zip(series.timestamps, values):
+                    rule.window.add(timestamp, value)
+
+            state.last_samples[metric] = series.timestamps[-1]
+
+    def _get_capacity(self, state, policy, current):
+        adjustment = policy.scaling_adjustment
+
+        if policy.adjustment_type == AutoScaleAdjustmentType.EXACT_CAPACITY:
+            capacity = adjustment
+        elif policy.adjustment_type == \
+                AutoScaleAdjustmentType.PERCENT_CHANGE_IN_CAPACITY:
+            change = int(current * adjustment / 100.0)
+
+            # Any non-zero percentage changes the capacity by at least one
+            if change == 0 and adjustment:
+                change = 1 if adjustment > 0 else -1
+
+            capacity = current + change
+        else:
+            capacity = current + adjustment
+
+        return max(state.min_size, min(state.max_size, capacity))
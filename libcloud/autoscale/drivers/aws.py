@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import base64
-import time
 
 from libcloud.utils.py3 import b
 
@@ -22,8 +21,8 @@ from libcloud.utils.xml import fixxpath, findtext, findall
 from libcloud.common.aws import AWSGenericResponse,\
     AWSObjectDoesntExist
 from libcloud.common.aws import DEFAULT_SIGNATURE_VERSION
-from libcloud.common.types import LibcloudError
 from libcloud.autoscale.providers import Provider
+from libcloud.autoscale.waiter import wait_for
 from libcloud.autoscale.base import AutoScaleDriver, AutoScaleGroup,\
     AutoScalePolicy
 from libcloud.compute.drivers.ec2 import EC2NodeDriver, EC2Connection
@@ -110,6 +109,7 @@ class AutoScaleConnection(EC2Connection):
 
     version = AUTOSCALE_API_VERSION
     host = AUTOSCALE_REGION_DETAILS['us-east-1']['endpoint']
+    service_name = 'autoscaling'
 
     responseCls = AutoScaleResponse
 
@@ -160,8 +160,8 @@ class AWSAutoScaleDriver(AutoScaleDriver):
 
         host = host or details['endpoint']
 
-        self.signature_version = details.pop('signature_version',
-                                             DEFAULT_SIGNATURE_VERSION)
+        self.signature_version = details.get('signature_version',
+                                             self.signature_version)
 
         if kwargs.get('ec2_driver'):
             self.ec2 = kwargs['ec2_driver']
@@ -173,6 +173,15 @@ class AWSAutoScaleDriver(AutoScaleDriver):
                                                  secure=secure, host=host,
                                                  port=port, **kwargs)
 
+    @classmethod
+    def list_regions(cls):
+        """
+        Return the names of the regions this driver can be used with.
+
+        :rtype: ``list`` of ``str``
+        """
+        return sorted(VALID_AUTOSCALE_REGIONS)
+
     def create_auto_scale_group(
             self, group_name, min_size, max_size, cooldown,
             termination_policies, balancer=None, ex_availability_zones=None,
@@ -339,6 +348,55 @@ class AWSAutoScaleDriver(AutoScaleDriver):
         return self._to_autoscale_policies(res, 'DescribePoliciesResult'
                                            '/ScalingPolicies/member')
 
+    def ex_list_auto_scale_policies_for_groups(self, groups):
+        """
+        Return policies of many groups.
+
+        Unlike calling :meth:`list_auto_scale_policies` for every group,
+        policies of all the groups in the region are retrieved using as few
+        (paginated) requests as possible.
+
+        :param groups: Group objects.
+        :type groups: ``list`` of :class:`.AutoScaleGroup`
+
+        :return: Policies keyed by the group id.
+        :rtype: ``dict``
+        """
+        names = dict([(group.name, group.id) for group in groups])
+        policies = dict([(group.id, []) for group in groups])
+
+        if not policies:
+            return policies
+
+        data = {}
+        data['Action'] = 'DescribePolicies'
+        data['MaxRecords'] = 100
+
+        while True:
+            res = self.connection.request(self.path, params=data).object
+
+            for element in res.findall(fixxpath(
+                    xpath='DescribePoliciesResult/ScalingPolicies/member',
+                    namespace=AUTOSCALE_NAMESPACE)):
+                group_name = findtext(element=element,
+                                      xpath='AutoScalingGroupName',
+                                      namespace=AUTOSCALE_NAMESPACE)
+
+                if group_name in names:
+                    policies[names[group_name]].append(
+                        self._to_autoscale_policy(element))
+
+            next_token = findtext(element=res,
+                                  xpath='DescribePoliciesResult/NextToken',
+                                  namespace=AUTOSCALE_NAMESPACE)
+
+            if not next_token:
+                break
+
+            data['NextToken'] = next_token
+
+        return policies
+
     def delete_auto_scale_policy(self, policy):
         data = {}
         data['Action'] = 'DeletePolicy'
@@ -347,44 +405,51 @@ class AWSAutoScaleDriver(AutoScaleDriver):
         self.connection.request(self.path, params=data)
         return True
 
-    def delete_auto_scale_group(self, group):
-        DEFAULT_TIMEOUT = 1200
+    def delete_auto_scale_group(self, group, ex_blocking=True):
+        """
+        @inherits: :class:`AutoScaleDriver.delete_auto_scale_group`
 
-        def _wait_for_deletion(group_name):
-            # 5 seconds
-            POLL_INTERVAL = 5
-
-            end = time.time() + DEFAULT_TIMEOUT
-            completed = False
-            while time.time() < end and not completed:
-                try:
-                    self._get_auto_scale_group(group_name)
-                    time.sleep(POLL_INTERVAL)
-                except AWSObjectDoesntExist:
-                    # did not find group
-                    completed = True
-            if not completed:
-                raise LibcloudError('Operation did not complete in %s seconds'
-                                    % (DEFAULT_TIMEOUT))
+        :keyword    ex_blocking: If ``False``, a future which is resolved once
+                                 the group and its launch configuration have
+                                 been deleted is returned right away.
+        :type       ex_blocking: ``bool``
+        """
+        DEFAULT_TIMEOUT = 1200
 
         # we need to manually remove launch_configuration as well.
         group = self._get_auto_scale_group(group.name)
         lc_name = group.extra['launch_configuration_name']
 
+        def check():
+            try:
+                self._get_auto_scale_group(group.name)
+            except AWSObjectDoesntExist:
+                # did not find group
+                return (True, None)
+
+            return (False, None)
+
+        def callback(result):
+            data = {}
+            data['LaunchConfigurationName'] = lc_name
+            data.update({'Action': 'DeleteLaunchConfiguration'})
+            self.connection.request(self.path, params=data).object
+            return True
+
         data = {}
         data['AutoScalingGroupName'] = group.name
         data.update({'Action': 'DeleteAutoScalingGroup',
                      'ForceDelete': 'true'})
         self.connection.request(self.path, params=data).object
 
-        _wait_for_deletion(group.name)
+        return wait_for(check=check, timeout=DEFAULT_TIMEOUT,
+                        callback=callback, description='Group deletion',
+                        blocking=ex_blocking, waiter=self.waiter)
 
-        data = {}
-        data['LaunchConfigurationName'] = lc_name
-        data.update({'Action': 'DeleteLaunchConfiguration'})
-        self.connection.request(self.path, params=data).object
-
-        return True
+    def _ex_connection_class_kwargs(self):
+        kwargs = super(AWSAutoScaleDriver, self)._ex_connection_class_kwargs()
+        kwargs['signature_version'] = self.signature_version
+        return kwargs
 
     def _get_auto_scale_group(self, group_name):
         data = {}
@@ -0,0 +1,205 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from libcloud.autoscale.base import AutoScaleDriver, AutoScaleGroup, \
+    AutoScalePolicy
+from libcloud.autoscale.types import Provider, AutoScaleAdjustmentType, \
+    AutoScaleTerminationPolicy
+from libcloud.common.types import LibcloudError
+from libcloud.compute.drivers.dummy import DummyConnection, DummyNodeDriver
+
+__all__ = [
+    'DummyAutoScaleDriver'
+]
+
+
+class DummyAutoScaleDriver(AutoScaleDriver):
+    """
+    Dummy auto scale driver.
+
+    Groups and policies are only kept in memory and group members are
+    created and destroyed using a compute driver (:class:`DummyNodeDriver`
+    by default).
+
+    >>> from libcloud.autoscale.drivers.dummy import DummyAutoScaleDriver
+    >>> driver = DummyAutoScaleDriver('key')
+    >>> group = driver.create_auto_scale_group(
+    ...     group_name='web', min_size=2, max_size=5, cooldown=300,
+    ...     termination_policies=[])
+    >>> len(driver.list_auto_scale_group_members(group))
+    2
+    >>> group = driver.update_auto_scale_group(group, min_size=3,
+    ...                                        max_size=5)
+    >>> len(driver.list_auto_scale_group_members(group))
+    3
+    """
+
+    name = 'Dummy Auto Scale Provider'
+    website = 'http://example.com'
+    type = Provider.DUMMY
+
+    _VALUE_TO_SCALE_ADJUSTMENT_TYPE_MAP = {
+        AutoScaleAdjustmentType.CHANGE_IN_CAPACITY:
+        AutoScaleAdjustmentType.CHANGE_IN_CAPACITY,
+        AutoScaleAdjustmentType.EXACT_CAPACITY:
+        AutoScaleAdjustmentType.EXACT_CAPACITY,
+        AutoScaleAdjustmentType.PERCENT_CHANGE_IN_CAPACITY:
+        AutoScaleAdjustmentType.PERCENT_CHANGE_IN_CAPACITY
+    }
+
+    _SCALE_ADJUSTMENT_TYPE_TO_VALUE_MAP = _VALUE_TO_SCALE_ADJUSTMENT_TYPE_MAP
+
+    def __init__(self, api_key, api_secret=None, compute_driver=None):
+        """
+        :param    api_key:    API key or username to used (required)
+        :type     api_key:    ``str``
+
+        :param    api_secret: Secret password to be used
+        :type     api_secret: ``str``
+
+        :param    compute_driver: Driver which is used to create and destroy
+                                  group members.
+        :type     compute_driver: :class:`NodeDriver`
+
+        :rtype: ``None``
+        """
+        self.compute_driver = compute_driver or DummyNodeDriver(0)
+        self.connection = DummyConnection(api_key)
+        self.connection.driver = self
+        self._groups = {}
+        self._group_count = 0
+        self._policy_count = 0
+
+    def create_auto_scale_group(
+            self, group_name, min_size, max_size, cooldown,
+            termination_policies, balancer=None, **kwargs):
+        """
+        @inherits: :class:`AutoScaleDriver.create_auto_scale_group`
+        """
+        self._validate_size(min_size, max_size)
+        self._group_count += 1
+        group = AutoScaleGroup(id='group-%s' % (self._group_count),
+                               name=group_name, min_size=min_size,
+                               max_size=max_size, cooldown=cooldown,
+                               region=None,
+                               termination_policies=termination_policies,
+                               driver=self)
+        self._groups[group.id] = {'group': group, 'members': [],
+                                  'policies': {}, 'node_kwargs': kwargs}
+        self._resize(group.id)
+        return group
+
+    def update_auto_scale_group(self, group, min_size=None, max_size=None):
+        """
+        Update size limits of the group and create or destroy members so the
+        group size is within the new limits.
+
+        @inherits: :class:`AutoScaleDriver.update_auto_scale_group`
+        """
+        stored = self._get_group(group.id)['group']
+
+        if min_size is None:
+            min_size = stored.min_size
+
+        if max_size is None:
+            max_size = stored.max_size
+
+        self._validate_size(min_size, max_size)
+        stored.min_size = min_size
+        stored.max_size = max_size
+        self._resize(group.id)
+        return stored
+
+    def list_auto_scale_groups(self):
+        """
+        @inherits: :class:`AutoScaleDriver.list_auto_scale_groups`
+        """
+        return [item['group'] for item in self._groups.values()]
+
+    def list_auto_scale_group_members(self, group):
+        """
+        @inherits: :class:`AutoScaleDriver.list_auto_scale_group_members`
+        """
+        return list(self._get_group(group.id)['members'])
+
+    def create_auto_scale_policy(self, group, name, adjustment_type,
+                                 scaling_adjustment):
+        """
+        @inherits: :class:`AutoScaleDriver.create_auto_scale_policy`
+        """
+        policies = self._get_group(group.id)['policies']
+        self._policy_count += 1
+        policy = AutoScalePolicy(id='policy-%s' % (self._policy_count),
+                                 name=name,
+                                 scaling_adjustment=scaling_adjustment,
+                                 adjustment_type=adjustment_type,
+                                 driver=self, extra={'group_id': group.id})
+        policies[policy.id] = policy
+        return policy
+
+    def list_auto_scale_policies(self, group):
+        """
+        @inherits: :class:`AutoScaleDriver.list_auto_scale_policies`
+        """
+        return list(self._get_group(group.id)['policies'].values())
+
+    def delete_auto_scale_policy(self, policy):
+        """
+        @inherits: :class:`AutoScaleDriver.delete_auto_scale_policy`
+        """
+        group = self._get_group(policy.extra['group_id'])
+        return group['policies'].pop(policy.id, None) is not None
+
+    def delete_auto_scale_group(self, group):
+        """
+        @inherits: :class:`AutoScaleDriver.delete_auto_scale_group`
+        """
+        members = self._get_group(group.id)['members']
+
+        for node in members:
+            self.compute_driver.destroy_node(node)
+
+        del self._groups[group.id]
+        return True
+
+    def _get_group(self, group_id):
+        if group_id not in self._groups:
+            raise LibcloudError(value='Group: %s not found' % (group_id),
+                                driver=self)
+
+        return self._groups[group_id]
+
+    def _validate_size(self, min_size, max_size):
+        if min_size > max_size:
+            raise LibcloudError(value='min_size must not be larger than '
+                                'max_size', driver=self)
+
+    def _resize(self, group_id):
+        item = self._groups[group_id]
+        group = item['group']
+        members = item['members']
+
+        while len(members) < group.min_size:
+            members.append(self.compute_driver.create_node(
+                **item['node_kwargs']))
+
+        while len(members) > group.max_size:
+            if AutoScaleTerminationPolicy.OLDEST_INSTANCE in \
+                    (group.termination_policies or []):
+                node = members.pop(0)
+            else:
+                node = members.pop()
+
+            self.compute_driver.destroy_node(node)
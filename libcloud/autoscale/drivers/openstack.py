@@ -13,19 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # import base64
-import time
+from __future__ import with_statement
+
+import threading
 
 from libcloud.autoscale.base import AutoScaleDriver, AutoScaleGroup, \
     AutoScalePolicy
 from libcloud.autoscale.types import Provider, AutoScaleAdjustmentType
+from libcloud.autoscale.waiter import wait_for
 from libcloud.common.types import LibcloudError
 
+from libcloud.compute.bulk import BulkExecutor
 from libcloud.compute.drivers.openstack import OpenStackNodeDriver
 from libcloud.compute.drivers.openstack import DEFAULT_API_VERSION as \
     DEFAULT_COMPUTE_API_VERSION
 
-from libcloud.utils.misc import find, get_new_obj, iso_to_datetime, \
-    reverse_dict
+from libcloud.utils.misc import find, get_new_obj, reverse_dict
 # from libcloud.utils.py3 import b
 
 """
@@ -82,6 +85,17 @@ class OpenStackAutoScaleDriver(AutoScaleDriver, OpenStackDriverMixin):
     _SCALE_ADJUSTMENT_TYPE_TO_VALUE_MAP = reverse_dict(
         _VALUE_TO_SCALE_ADJUSTMENT_TYPE_MAP)
 
+    # Maximum number of stacks which are looked up concurrently when listing
+    # groups
+    stack_lookup_concurrency = 10
+
+    # Depth of the nested stacks which are searched for group member servers
+    member_nested_depth = 2
+
+    # Members of groups with more servers than this are retrieved using a
+    # single server listing instead of a request per server
+    member_listing_threshold = 10
+
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
                  api_version=DEFAULT_API_VERSION, **kwargs):
         if api_version != '1.0':
@@ -89,6 +103,10 @@ class OpenStackAutoScaleDriver(AutoScaleDriver, OpenStackDriverMixin):
                 "No OpenStackAutoScaleDriver found for API version %s" %
                 (api_version))
 
+        # Groups keyed by the stack id, see _get_cached_auto_scale_group
+        self._groups_cache = {}
+        self._groups_cache_lock = threading.Lock()
+
         OpenStackDriverMixin.__init__(self, **kwargs)
 
         if kwargs.get('openstack_driver'):
@@ -144,27 +162,15 @@ class OpenStackAutoScaleDriver(AutoScaleDriver, OpenStackDriverMixin):
                                      server through a configuration drive.
         :type       ex_config_drive: ``bool``
 
+        :keyword    ex_blocking: If ``False``, a future which is resolved with
+                                 the group once the stack has been created is
+                                 returned right away.
+        :type       ex_blocking: ``bool``
+
         :return: The newly created scale group.
         :rtype: :class:`.AutoScaleGroup`
         """
-        def _wait_for_creation(stack_name, stack_id):
-            DEFAULT_TIMEOUT = 12000
-            # 5 seconds
-            POLL_INTERVAL = 5
-
-            end = time.time() + DEFAULT_TIMEOUT
-            completed = False
-            while time.time() < end and not completed:
-                stack = self.connection.get_stack(stack_name, stack_id)
-                stack_status = stack['stack_status']
-                if stack_status not in ['CREATE_COMPLETE', 'CREATE_FAILED']:
-                    time.sleep(POLL_INTERVAL)
-                else:
-                    completed = True
-
-            if not completed:
-                raise LibcloudError('Group creation did not complete in %s'
-                                    ' seconds' % (DEFAULT_TIMEOUT))
+        ex_blocking = kwargs.pop('ex_blocking', True)
 
         server_params = self._to_virtual_guest_template(**kwargs)
         server_params['metadata']['metering.stack'] = \
@@ -199,10 +205,27 @@ class OpenStackAutoScaleDriver(AutoScaleDriver, OpenStackDriverMixin):
         res = self.connection.request('/stacks', data=data,
                                       method='POST').object
         stack_id = res['stack']['id']
-        _wait_for_creation(group_name, stack_id)
-        return self._get_auto_scale_group(group_name, stack_id)
 
-    def update_auto_scale_group(self, group, min_size=None, max_size=None):
+        def check():
+            return self.connection.check_stack_creation(group_name, stack_id)
+
+        def callback(stack):
+            return self._get_auto_scale_group(group_name, stack_id)
+
+        return wait_for(check=check, timeout=12000, callback=callback,
+                        description='Group creation', blocking=ex_blocking,
+                        waiter=self.waiter)
+
+    def update_auto_scale_group(self, group, min_size=None, max_size=None,
+                                ex_blocking=True):
+        """
+        @inherits: :class:`AutoScaleDriver.update_auto_scale_group`
+
+        :keyword    ex_blocking: If ``False``, a future which is resolved with
+                                 the updated group once the stack update has
+                                 completed is returned right away.
+        :type       ex_blocking: ``bool``
+        """
         stack_name = group.name
         stack_id = group.id
 
@@ -216,28 +239,66 @@ class OpenStackAutoScaleDriver(AutoScaleDriver, OpenStackDriverMixin):
         template_res['resources'][group.name]['properties'].update(params)
         pre_update_ts = self.connection.stack_update(stack_name, stack_id,
                                                      template_res)
-        self._wait_for_update(stack_name, stack_id, pre_update_ts)
         updated_group = get_new_obj(obj=group, klass=AutoScaleGroup,
                                     attributes={'min_size': min_size,
                                                 'max_size': max_size})
-        return updated_group
+        return self._wait_for_update(stack_name, stack_id, pre_update_ts,
+                                     callback=lambda stack: updated_group,
+                                     blocking=ex_blocking)
 
     def list_auto_scale_groups(self):
         res = self.connection.request('/stacks').object
-        groups = []
         # filter auto-scale stacks
-        for s in [s for s in res['stacks'] if s['description'] ==
-                  SCALE_GROUP_RESOURCE_NAME]:
-            groups.append(self._get_auto_scale_group(
-                s['stack_name'], s['id']))
-        return groups
+        stacks = [s for s in res['stacks'] if s['description'] ==
+                  SCALE_GROUP_RESOURCE_NAME]
+
+        # Template and resources of the stacks are retrieved concurrently
+        executor = BulkExecutor(max_concurrency=self.stack_lookup_concurrency)
+        results = executor.map(self._get_cached_auto_scale_group, stacks)
+
+        for result in results:
+            if not result.success:
+                raise result.error
+
+        with self._groups_cache_lock:
+            stack_ids = set([s['id'] for s in stacks])
+
+            for stack_id in list(self._groups_cache.keys()):
+                if stack_id not in stack_ids:
+                    del self._groups_cache[stack_id]
+
+        return [result.value for result in results]
 
     def list_auto_scale_group_members(self, group):
+        stack_name = group.name
         stack_id = group.id
 
-        nodes = self.openstack.list_nodes()
-        return [n for n in nodes if n.extra.get(
-            'metadata', {}).get('metering.stack', '') == stack_id]
+        # Member servers are resources of the group nested stack so there is
+        # no need to list (and filter) all the servers of the tenant
+        resources = self.connection.get_stack_resources(
+            stack_name, stack_id, nested_depth=self.member_nested_depth)
+        # Servers which are being deleted are not members anymore
+        server_ids = [r['physical_resource_id'] for r in
+                      resources['resources'] if
+                      r['resource_type'] == 'OS::Nova::Server' and
+                      r.get('physical_resource_id') and
+                      not r['resource_status'].startswith('DELETE')]
+
+        if len(server_ids) > self.member_listing_threshold:
+            member_ids = set(server_ids)
+            return [node for node in self.openstack.list_nodes()
+                    if node.id in member_ids]
+
+        executor = self.openstack._get_bulk_executor()
+        results = executor.map(self.openstack.ex_get_node_details,
+                               server_ids)
+
+        for result in results:
+            if not result.success:
+                raise result.error
+
+        return [result.value for result in results
+                if result.value is not None]
 
     def create_auto_scale_policy(self, group, name, adjustment_type,
                                  scaling_adjustment):
@@ -295,26 +356,38 @@ class OpenStackAutoScaleDriver(AutoScaleDriver, OpenStackDriverMixin):
             {'stack_name': stack_name, 'stack_id': stack_id},
             method='DELETE').success()
 
-    def _wait_for_update(self, stack_name, stack_id, pre_update_ts):
-        DEFAULT_TIMEOUT = 600
-        POLL_INTERVAL = 5
-
-        end = time.time() + DEFAULT_TIMEOUT
-        completed = False
-        while time.time() < end and not completed:
-            stack = self.connection.get_stack(stack_name, stack_id)
-            stack_status = stack['stack_status']
-            ts_completed = iso_to_datetime(
-                stack.get('updated_time')) > pre_update_ts
-            if (stack_status == 'UPDATE_COMPLETE' and ts_completed) or \
-                    stack_status == 'UPDATE_FAILED':
-                completed = True
-            else:
-                time.sleep(POLL_INTERVAL)
-
-        if not completed:
-            raise LibcloudError('Stack update did not complete in %s'
-                                ' seconds' % (DEFAULT_TIMEOUT))
+    def _wait_for_update(self, stack_name, stack_id, pre_update_ts,
+                         callback=None, blocking=True):
+        def check():
+            return self.connection.check_stack_update(stack_name, stack_id,
+                                                      pre_update_ts)
+
+        return wait_for(check=check, timeout=600, callback=callback,
+                        description='Stack update', blocking=blocking,
+                        waiter=self.waiter)
+
+    def _get_cached_auto_scale_group(self, stack):
+        """
+        Return group for the provided stack (an item of the stack list).
+
+        Groups are cached per stack revision (update time and status), so
+        template and resources are only retrieved again once the stack has
+        changed.
+        """
+        revision = (stack.get('updated_time'), stack.get('stack_status'))
+
+        with self._groups_cache_lock:
+            cached = self._groups_cache.get(stack['id'])
+
+        if cached and cached[0] == revision:
+            return cached[1]
+
+        group = self._get_auto_scale_group(stack['stack_name'], stack['id'])
+
+        with self._groups_cache_lock:
+            self._groups_cache[stack['id']] = (revision, group)
+
+        return group
 
     def _get_auto_scale_group(self, stack_name, stack_id):
         template = self.connection.get_stack_template(stack_name, stack_id)
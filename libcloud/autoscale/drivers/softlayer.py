@@ -12,8 +12,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import time
-
 from libcloud.common.types import LibcloudError
 from libcloud.common.softlayer import SoftLayerException, \
     SoftLayerObjectDoesntExist, SoftLayerConnection
@@ -23,7 +21,9 @@ from libcloud.autoscale.base import AutoScaleDriver, AutoScalePolicy, \
 from libcloud.autoscale.types import AutoScaleTerminationPolicy, \
     AutoScaleAdjustmentType
 from libcloud.autoscale.types import Provider
+from libcloud.autoscale.waiter import wait_for
 from libcloud.utils.misc import find, get_new_obj, reverse_dict
+from libcloud.compute.bulk import BulkExecutor
 from libcloud.compute.drivers.softlayer import SoftLayerNodeDriver
 
 SL_REGIONS = [
@@ -34,6 +34,9 @@ SL_REGIONS = [
     'oc-aus-south-1'
 ]
 
+# Number of seconds to wait for a group operation to complete
+DEFAULT_TIMEOUT = 12000
+
 
 class SoftLayerAutoScaleDriver(AutoScaleDriver):
 
@@ -61,6 +64,10 @@ class SoftLayerAutoScaleDriver(AutoScaleDriver):
     website = 'http://www.softlayer.com/'
     type = Provider.SOFTLAYER
 
+    # Maximum number of concurrent requests used to look up virtual guests
+    # which weren't returned together with the scale group members
+    member_lookup_concurrency = 10
+
     def __init__(self, key, secret, secure=True, region='na-usa-east-1',
                  **kwargs):
         if region not in SL_REGIONS:
@@ -104,10 +111,15 @@ class SoftLayerAutoScaleDriver(AutoScaleDriver):
                                      members (valid when balancer supplied).
         :type       ex_service_port: ``int``
 
+        :keyword    ex_blocking: If ``False``, a future which is resolved with
+                                 the group once it is active is returned right
+                                 away.
+        :type       ex_blocking: ``bool``
+
         :return: The newly created scale group.
         :rtype: :class:`.AutoScaleGroup`
         """
-        DEFAULT_TIMEOUT = 12000
+        ex_blocking = kwargs.pop('ex_blocking', True)
         # hostname of the nodes either based on supplied name or group_name
         kwargs['name'] = kwargs.get('name') or group_name
         template = self.softlayer._to_virtual_guest_template(**kwargs)
@@ -115,23 +127,6 @@ class SoftLayerAutoScaleDriver(AutoScaleDriver):
         # http://sldn.softlayer.com/reference/datatypes/SoftLayer_Scale_Group
         template['hourlyBillingFlag'] = 'true'
 
-        def _wait_for_creation(group_id):
-            # 5 seconds
-            POLL_INTERVAL = 5
-
-            end = time.time() + DEFAULT_TIMEOUT
-            completed = False
-            while time.time() < end and not completed:
-                status_name = self._get_group_status(group_id)
-                if status_name != 'ACTIVE':
-                    time.sleep(POLL_INTERVAL)
-                else:
-                    completed = True
-
-            if not completed:
-                raise LibcloudError('Group creation did not complete in %s'
-                                    ' seconds' % (DEFAULT_TIMEOUT))
-
         # retrieve internal region id
         res = self.connection.request(
             'SoftLayer_Location_Group_Regional',
@@ -174,39 +169,35 @@ class SoftLayerAutoScaleDriver(AutoScaleDriver):
         res = self.connection.request('SoftLayer_Scale_Group',
                                       'createObject', data).object
 
-        _wait_for_creation(res['id'])
-        mask = {
-            'terminationPolicy': '',
-            'regionalGroup': {
-                'name': ''
-            },
-        }
+        group_id = res['id']
 
-        res = self.connection.request('SoftLayer_Scale_Group', 'getObject',
-                                      object_mask=mask, id=res['id']).object
-        group = self._to_autoscale_group(res)
+        def callback(status):
+            mask = {
+                'terminationPolicy': '',
+                'regionalGroup': {
+                    'name': ''
+                },
+            }
 
-        return group
+            res = self.connection.request('SoftLayer_Scale_Group',
+                                          'getObject', object_mask=mask,
+                                          id=group_id).object
+            return self._to_autoscale_group(res)
+
+        return self._wait_for_active(group_id, callback=callback,
+                                     description='Group creation',
+                                     blocking=ex_blocking)
 
-    def update_auto_scale_group(self, group, min_size=None, max_size=None):
-        def _wait_for_update(group_id):
-            DEFAULT_TIMEOUT = 12000
-            # 5 seconds
-            POLL_INTERVAL = 5
-
-            end = time.time() + DEFAULT_TIMEOUT
-            completed = False
-            while time.time() < end and not completed:
-                status_name = self._get_group_status(group_id)
-                if status_name != 'ACTIVE':
-                    time.sleep(POLL_INTERVAL)
-                else:
-                    completed = True
-
-            if not completed:
-                raise LibcloudError('Group creation did not complete in %s'
-                                    ' seconds' % (DEFAULT_TIMEOUT))
+    def update_auto_scale_group(self, group, min_size=None, max_size=None,
+                                ex_blocking=True):
+        """
+        @inherits: :class:`AutoScaleDriver.update_auto_scale_group`
 
+        :keyword    ex_blocking: If ``False``, a future which is resolved with
+                                 the updated group once it is active again is
+                                 returned right away.
+        :type       ex_blocking: ``bool``
+        """
         data = {}
         if min_size:
             data['minimumMemberCount'] = min_size
@@ -215,38 +206,46 @@ class SoftLayerAutoScaleDriver(AutoScaleDriver):
 
         self.connection.request('SoftLayer_Scale_Group', 'editObject',
                                 data, id=group.id)
-        _wait_for_update(group.id)
         updated_group = get_new_obj(obj=group, klass=AutoScaleGroup,
                                     attributes={'min_size': min_size,
                                                 'max_size': max_size})
-        return updated_group
+        return self._wait_for_active(group.id,
+                                     callback=lambda status: updated_group,
+                                     description='Group update',
+                                     blocking=ex_blocking)
 
     def list_auto_scale_group_members(self, group):
+        guest_mask = {
+            'billingItem': '',
+            'powerState': '',
+            'operatingSystem': {'passwords': ''},
+            'provisionDate': ''
+        }
+
+        # Members and their virtual guests are retrieved using a single call
         mask = {
-            'virtualGuest': {
-                'billingItem': '',
-                'powerState': '',
-                'operatingSystem': {'passwords': ''},
-                'provisionDate': ''
+            'virtualGuestMembers': {
+                'virtualGuest': guest_mask
             }
         }
 
         res = self.connection.request('SoftLayer_Scale_Group',
                                       'getVirtualGuestMembers',
-                                      id=group.id).object
+                                      id=group.id, object_mask=mask).object
 
-        nodes = []
-        for r in res:
-            # NOTE: r[id]  is ID of virtual guest member
-            # (not instance itself)
-            res_node = self.connection.request('SoftLayer_Scale_Member_'
-                                               'Virtual_Guest',
-                                               'getVirtualGuest', id=r['id'],
-                                               object_mask=mask).object
-            if res_node:
-                nodes.append(self.softlayer._to_node(res_node))
+        guests = [r.get('virtualGuest') for r in res]
 
-        return nodes
+        # NOTE: r[id]  is ID of virtual guest member
+        # (not instance itself)
+        missing = [r['id'] for r, guest in zip(res, guests) if not guest]
+
+        if missing:
+            member_guests = self._get_member_virtual_guests(missing,
+                                                            guest_mask)
+            guests = [guest or member_guests.get(r['id'])
+                      for r, guest in zip(res, guests)]
+
+        return [self.softlayer._to_node(guest) for guest in guests if guest]
 
     def create_auto_scale_policy(self, group, name, adjustment_type,
                                  scaling_adjustment):
@@ -312,32 +311,30 @@ class SoftLayerAutoScaleDriver(AutoScaleDriver):
                                 'deleteObject', id=policy.id).object
         return True
 
-    def delete_auto_scale_group(self, group):
-        DEFAULT_TIMEOUT = 12000
-
-        def _wait_for_deletion(group_name):
-            # 5 seconds
-            POLL_INTERVAL = 5
-
-            end = time.time() + DEFAULT_TIMEOUT
-            completed = False
-            while time.time() < end and not completed:
-                try:
-                    self._get_auto_scale_group(group_name)
-                    time.sleep(POLL_INTERVAL)
-                except SoftLayerObjectDoesntExist:
-                    # for now treat this as not found
-                    completed = True
-            if not completed:
-                raise LibcloudError('Operation did not complete in %s seconds'
-                                    % (DEFAULT_TIMEOUT))
+    def delete_auto_scale_group(self, group, ex_blocking=True):
+        """
+        @inherits: :class:`AutoScaleDriver.delete_auto_scale_group`
+
+        :keyword    ex_blocking: If ``False``, a future which is resolved once
+                                 the group has been deleted is returned right
+                                 away.
+        :type       ex_blocking: ``bool``
+        """
+        def check():
+            try:
+                self._get_auto_scale_group(group.name)
+            except SoftLayerObjectDoesntExist:
+                # for now treat this as not found
+                return (True, True)
+
+            return (False, None)
 
         self.connection.request(
             'SoftLayer_Scale_Group', 'forceDeleteObject', id=group.id).object
 
-        _wait_for_deletion(group.name)
-
-        return True
+        return wait_for(check=check, timeout=DEFAULT_TIMEOUT,
+                        description='Group deletion', blocking=ex_blocking,
+                        waiter=self.waiter)
 
     def ex_attach_balancer_to_auto_scale_group(self, group, balancer,
                                                ex_service_port=80):
@@ -455,6 +452,39 @@ class SoftLayerAutoScaleDriver(AutoScaleDriver):
                                              % group_name)
         return group
 
+    def _get_member_virtual_guests(self, member_ids, mask):
+        """
+        Retrieve virtual guests of the provided scale group members using
+        at most ``member_lookup_concurrency`` concurrent requests.
+
+        :return: Virtual guests keyed by the member id.
+        :rtype: ``dict``
+        """
+        def get_virtual_guest(member_id):
+            return self.connection.request('SoftLayer_Scale_Member_'
+                                           'Virtual_Guest',
+                                           'getVirtualGuest', id=member_id,
+                                           object_mask=mask).object
+
+        executor = BulkExecutor(max_concurrency=self.member_lookup_concurrency)
+        results = executor.map(get_virtual_guest, member_ids)
+
+        for result in results:
+            if not result.success:
+                raise result.error
+
+        return dict([(result.item, result.value) for result in results])
+
+    def _wait_for_active(self, group_id, callback, description,
+                         blocking=True):
+        def check():
+            status_name = self._get_group_status(group_id)
+            return (status_name == 'ACTIVE', status_name)
+
+        return wait_for(check=check, timeout=DEFAULT_TIMEOUT,
+                        callback=callback, description=description,
+                        blocking=blocking, waiter=self.waiter)
+
     def _get_group_status(self, group_id):
         res = self.connection.request('SoftLayer_Scale_Group',
                                       'getStatus', id=group_id).object
@@ -23,6 +23,8 @@ __all__ = [
 ]
 
 DRIVERS = {
+    Provider.DUMMY:
+    ('libcloud.autoscale.drivers.dummy', 'DummyAutoScaleDriver'),
     Provider.AWS_AUTOSCALE:
     ('libcloud.autoscale.drivers.aws', 'AWSAutoScaleDriver'),
     Provider.SOFTLAYER:
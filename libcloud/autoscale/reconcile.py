@@ -0,0 +1,470 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Converge auto scale groups, their policies and alarms to a desired state.
+
+Desired state is described using plain dictionaries (so it can be loaded
+from JSON or YAML)::
+
+    [
+        {
+            'name': 'web',
+            'min_size': 2,
+            'max_size': 10,
+            'cooldown': 300,
+            'termination_policies': [
+                AutoScaleTerminationPolicy.OLDEST_INSTANCE],
+            # keyword arguments passed to create_auto_scale_group
+            'create_kwargs': {'image': image, 'size': size},
+            'policies': [
+                {
+                    'name': 'scale-out',
+                    'adjustment_type':
+                        AutoScaleAdjustmentType.CHANGE_IN_CAPACITY,
+                    'scaling_adjustment': 2,
+                    'alarms': [
+                        {
+                            'name': 'cpu-high',
+                            'metric_name': AutoScaleMetric.CPU_UTIL,
+                            'operator': AutoScaleOperator.GT,
+                            'threshold': 80,
+                            'period': 120
+                        }
+                    ]
+                }
+            ]
+        }
+    ]
+"""
+
+import sys
+
+from libcloud.common.types import LibcloudError
+from libcloud.compute.bulk import BulkExecutor
+
+__all__ = [
+    'ReconcileAction',
+    'ReconcilePlan',
+    'Reconciler'
+]
+
+
+class ReconcileAction(object):
+    """
+    Single change which needs to be performed to reach the desired state.
+    """
+
+    CREATE = 'create'
+    UPDATE = 'update'
+    DELETE = 'delete'
+
+    GROUP = 'group'
+    POLICY = 'policy'
+    ALARM = 'alarm'
+
+    def __init__(self, action, resource_type, name, group_name,
+                 policy_name=None, spec=None, current=None):
+        """
+        :param action: One of ``CREATE``, ``UPDATE`` and ``DELETE``.
+        :type action: ``str``
+
+        :param resource_type: One of ``GROUP``, ``POLICY`` and ``ALARM``.
+        :type resource_type: ``str``
+
+        :param name: Name of the resource.
+        :type name: ``str``
+
+        :param group_name: Name of the group the resource belongs to.
+        :type group_name: ``str``
+
+        :param policy_name: Name of the policy the alarm belongs to.
+        :type policy_name: ``str``
+
+        :param spec: Desired state of the resource.
+        :type spec: ``dict``
+
+        :param current: Existing resource (group, policy or alarm object).
+        :type current: ``object``
+        """
+        self.action = action
+        self.resource_type = resource_type
+        self.name = name
+        self.group_name = group_name
+        self.policy_name = policy_name
+        self.spec = spec
+        self.current = current
+
+        # Set once the plan has been applied
+        self.applied = False
+        self.result = None
+        self.error = None
+
+    def __repr__(self):
+        return (('<ReconcileAction: action=%s, resource_type=%s, name=%s, '
+                 'group_name=%s, applied=%s, error=%r>') %
+                (self.action, self.resource_type, self.name,
+                 self.group_name, self.applied, self.error))
+
+
+class GroupPlan(object):
+    """
+    Changes of a single group (applied in order).
+    """
+
+    def __init__(self, name, group=None, policies=None):
+        self.name = name
+        self.group = group
+        self.policies = policies or []
+        self.actions = []
+
+    def add(self, *args, **kwargs):
+        self.actions.append(ReconcileAction(*args, group_name=self.name,
+                                            **kwargs))
+
+
+class ReconcilePlan(object):
+    """
+    Changes which are needed to reach the desired state.
+    """
+
+    def __init__(self, group_plans):
+        self.group_plans = group_plans
+
+    @property
+    def actions(self):
+        """
+        :rtype: ``list`` of :class:`ReconcileAction`
+        """
+        return [action for plan in self.group_plans
+                for action in plan.actions]
+
+    @property
+    def errors(self):
+        """
+        Actions which have failed while the plan was applied.
+
+        :rtype: ``list`` of :class:`ReconcileAction`
+        """
+        return [action for action in self.actions if action.error]
+
+    def is_empty(self):
+        """
+        Return ``True`` if the current state matches the desired state.
+
+        :rtype: ``bool``
+        """
+        return not self.actions
+
+    def __len__(self):
+        return len(self.actions)
+
+    def __repr__(self):
+        return '<ReconcilePlan: actions=%r>' % (self.actions)
+
+
+class Reconciler(object):
+    """
+    Computes and applies changes needed to converge auto scale groups,
+    policies and alarms to the desired state.
+
+    Current state is retrieved in bulk: groups with a single
+    ``list_auto_scale_groups`` call, policies and alarms using the
+    ``ex_list_auto_scale_policies_for_groups`` and
+    ``ex_list_auto_scale_alarms_for_policies`` methods if the drivers provide
+    them (falling back to concurrent per group / per policy calls).
+
+    Resources are matched by name. Group size limits are updated in place,
+    policies and alarms which differ from the desired state are recreated
+    (the drivers don't support updating them). Cooldown and termination
+    policies are only used when a group is created.
+
+    Changes of different groups are applied concurrently, changes of a
+    single group are applied in order and stop at the first error.
+    """
+
+    max_concurrency = 10
+
+    def __init__(self, driver, monitor_driver=None, prune=False,
+                 max_concurrency=None):
+        """
+        :param driver: Auto scale driver.
+        :type driver: :class:`AutoScaleDriver`
+
+        :param monitor_driver: Monitor driver used to manage the alarms. If
+                               not provided, alarms are ignored.
+        :type monitor_driver: :class:`MonitorDriver`
+
+        :param prune: Delete policies and alarms of the specified groups
+                      which are not part of the desired state. Groups which
+                      are not part of the desired state are never deleted.
+        :type prune: ``bool``
+
+        :param max_concurrency: Maximum number of concurrent requests.
+        :type max_concurrency: ``int``
+        """
+        self.driver = driver
+        self.monitor_driver = monitor_driver
+        self.prune = prune
+
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+
+    def plan(self, desired_spec):
+        """
+        Compute changes needed to reach the desired state.
+
+        :param desired_spec: Desired state of the groups.
+        :type desired_spec: ``list`` of ``dict``
+
+        :rtype: :class:`ReconcilePlan`
+        """
+        names = [spec['name'] for spec in desired_spec]
+
+        if len(set(names)) != len(names):
+            raise ValueError('Group names need to be unique')
+
+        groups = dict([(group.name, group)
+                       for group in self.driver.list_auto_scale_groups()])
+        existing = [groups[name] for name in names if name in groups]
+        policies = self._list_policies(existing)
+        alarms = self._list_alarms([policy for items in policies.values()
+                                    for policy in items])
+
+        group_plans = []
+
+        for spec in desired_spec:
+            group = groups.get(spec['name'])
+            current_policies = policies.get(group.id, []) if group else []
+            plan = GroupPlan(name=spec['name'], group=group,
+                             policies=current_policies)
+
+            if group is None:
+                plan.add(ReconcileAction.CREATE, ReconcileAction.GROUP,
+                         spec['name'], spec=spec)
+            elif (int(group.min_size) != int(spec['min_size']) or
+                  int(group.max_size) != int(spec['max_size'])):
+                plan.add(ReconcileAction.UPDATE, ReconcileAction.GROUP,
+                         spec['name'], spec=spec, current=group)
+
+            self._plan_policies(plan, spec.get('policies', []),
+                                current_policies, alarms)
+            group_plans.append(plan)
+
+        return ReconcilePlan(group_plans=group_plans)
+
+    def apply(self, plan):
+        """
+        Apply the changes.
+
+        Failures are recorded in the ``error`` attribute of the actions
+        instead of being raised.
+
+        :param plan: Plan returned by :meth:`plan`.
+        :type plan: :class:`ReconcilePlan`
+
+        :rtype: :class:`ReconcilePlan`
+        """
+        group_plans = [group_plan for group_plan in plan.group_plans
+                       if group_plan.actions]
+        executor = BulkExecutor(max_concurrency=self.max_concurrency)
+        executor.map(self._apply_group_plan, group_plans)
+        return plan
+
+    def reconcile(self, desired_spec, dry_run=False):
+        """
+        Compute the changes and apply them (unless ``dry_run`` is set).
+
+        :rtype: :class:`ReconcilePlan`
+        """
+        plan = self.plan(desired_spec)
+
+        if dry_run or plan.is_empty():
+            return plan
+
+        return self.apply(plan)
+
+    def _plan_policies(self, plan, specs, current_policies, alarms):
+        current = dict([(policy.name, policy) for policy in current_policies])
+        desired_names = set([spec['name'] for spec in specs])
+
+        if self.prune:
+            for name, policy in current.items():
+                if name not in desired_names:
+                    self._plan_alarms(plan, name, [],
+                                      alarms.get(policy.id, []), prune=True)
+                    plan.add(ReconcileAction.DELETE, ReconcileAction.POLICY,
+                             name, current=policy)
+
+        for spec in specs:
+            policy = current.get(spec['name'])
+            policy_alarms = alarms.get(policy.id, []) if policy else []
+
+            if policy is not None and not self._policy_matches(policy, spec):
+                # Alarms reference the policy, so they are recreated as well
+                self._plan_alarms(plan, spec['name'], [], policy_alarms,
+                                  prune=True)
+                plan.add(ReconcileAction.DELETE, ReconcileAction.POLICY,
+                         spec['name'], current=policy)
+                policy = None
+                policy_alarms = []
+
+            if policy is None:
+                plan.add(ReconcileAction.CREATE, ReconcileAction.POLICY,
+                         spec['name'], spec=spec)
+
+            self._plan_alarms(plan, spec['name'], spec.get('alarms', []),
+                              policy_alarms, prune=self.prune)
+
+    def _plan_alarms(self, plan, policy_name, specs, current_alarms, prune):
+        if self.monitor_driver is None:
+            return
+
+        current = dict([(alarm.name, alarm) for alarm in current_alarms])
+        desired_names = set([spec['name'] for spec in specs])
+
+        if prune:
+            for name, alarm in current.items():
+                if name not in desired_names:
+                    plan.add(ReconcileAction.DELETE, ReconcileAction.ALARM,
+                             name, policy_name=policy_name, current=alarm)
+
+        for spec in specs:
+            alarm = current.get(spec['name'])
+
+            if alarm is not None and self._alarm_matches(alarm, spec):
+                continue
+
+            if alarm is not None:
+                plan.add(ReconcileAction.DELETE, ReconcileAction.ALARM,
+                         spec['name'], policy_name=policy_name,
+                         current=alarm)
+
+            plan.add(ReconcileAction.CREATE, ReconcileAction.ALARM,
+                     spec['name'], policy_name=policy_name, spec=spec)
+
+    def _policy_matches(self, policy, spec):
+        return (policy.adjustment_type == spec['adjustment_type'] and
+                int(policy.scaling_adjustment) ==
+                int(spec['scaling_adjustment']))
+
+    def _alarm_matches(self, alarm, spec):
+        return (alarm.metric_name == spec['metric_name'] and
+                alarm.operator == spec['operator'] and
+                int(alarm.period) == int(spec['period']) and
+                float(alarm.threshold) == float(spec['threshold']))
+
+    def _list_policies(self, groups):
+        """
+        Return policies of the groups keyed by the group id.
+        """
+        bulk_method = getattr(self.driver,
+                              'ex_list_auto_scale_policies_for_groups', None)
+
+        if bulk_method is not None:
+            return bulk_method(groups)
+
+        return self._map(self.driver.list_auto_scale_policies, groups)
+
+    def _list_alarms(self, policies):
+        """
+        Return alarms of the policies keyed by the policy id.
+        """
+        if self.monitor_driver is None or not policies:
+            return {}
+
+        bulk_method = getattr(self.monitor_driver,
+                              'ex_list_auto_scale_alarms_for_policies', None)
+
+        if bulk_method is not None:
+            return bulk_method(policies)
+
+        return self._map(self.monitor_driver.list_auto_scale_alarms,
+                         policies)
+
+    def _map(self, func, items):
+        executor = BulkExecutor(max_concurrency=self.max_concurrency)
+        values = {}
+
+        for result in executor.map(func, items):
+            if result.error:
+                raise result.error
+
+            values[result.item.id] = result.value
+
+        return values
+
+    def _apply_group_plan(self, plan):
+        group = plan.group
+        policies = dict([(policy.name, policy) for policy in plan.policies])
+
+        for action in plan.actions:
+            try:
+                action.result = self._apply_action(action, group, policies)
+            except Exception:
+                action.error = sys.exc_info()[1]
+                return False
+
+            action.applied = True
+
+            if action.resource_type == ReconcileAction.GROUP:
+                group = action.result
+            elif action.resource_type == ReconcileAction.POLICY:
+                if action.action == ReconcileAction.CREATE:
+                    policies[action.name] = action.result
+                else:
+                    policies.pop(action.name, None)
+
+        return True
+
+    def _apply_action(self, action, group, policies):
+        spec = action.spec
+
+        if action.resource_type == ReconcileAction.GROUP:
+            if action.action == ReconcileAction.CREATE:
+                return self.driver.create_auto_scale_group(
+                    group_name=spec['name'], min_size=spec['min_size'],
+                    max_size=spec['max_size'],
+                    cooldown=spec.get('cooldown', 300),
+                    termination_policies=spec.get('termination_policies',
+                                                  []),
+                    **spec.get('create_kwargs', {}))
+
+            return self.driver.update_auto_scale_group(
+                group, min_size=spec['min_size'], max_size=spec['max_size'])
+
+        if action.resource_type == ReconcileAction.POLICY:
+            if action.action == ReconcileAction.CREATE:
+                return self.driver.create_auto_scale_policy(
+                    group=group, name=spec['name'],
+                    adjustment_type=spec['adjustment_type'],
+                    scaling_adjustment=spec['scaling_adjustment'])
+
+            return self.driver.delete_auto_scale_policy(action.current)
+
+        if action.action == ReconcileAction.CREATE:
+            policy = policies.get(action.policy_name)
+
+            if policy is None:
+                raise LibcloudError(value='Policy %s not found' %
+                                    (action.policy_name), driver=self.driver)
+
+            return self.monitor_driver.create_auto_scale_alarm(
+                name=spec['name'], policy=policy,
+                metric_name=spec['metric_name'], operator=spec['operator'],
+                threshold=spec['threshold'], period=spec['period'],
+                **spec.get('create_kwargs', {}))
+
+        return self.monitor_driver.delete_auto_scale_alarm(action.current)
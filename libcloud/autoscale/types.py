@@ -25,7 +25,9 @@ class Provider(object):
 
     :cvar AWS_AUTOSCALE: Amazon AutoScale
     :cvar SOFTLAYER: Softlayer
+    :cvar DUMMY: Dummy provider
     """
+    DUMMY = 'dummy'
     AWS_AUTOSCALE = 'aws_autoscale'
     SOFTLAYER = 'softlayer'
     OPENSTACK = 'openstack'
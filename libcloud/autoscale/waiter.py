@@ -0,0 +1,71 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers for waiting for long running auto scale and monitor operations.
+
+Operations are waited for by :class:`PollScheduler` so they share the
+background thread with the async jobs of the compute drivers.
+"""
+
+from libcloud.common.poll import PollScheduler, get_default_poll_scheduler
+
+__all__ = [
+    'Waiter',
+
+    'get_default_waiter',
+    'wait_for'
+]
+
+Waiter = PollScheduler
+
+
+def get_default_waiter():
+    """
+    Return the waiter which is shared by all the auto scale and monitor
+    drivers (the default poll scheduler).
+
+    :rtype: :class:`PollScheduler`
+    """
+    return get_default_poll_scheduler()
+
+
+def wait_for(check, timeout, poll_interval=5, callback=None,
+             description='Operation', blocking=True, waiter=None):
+    """
+    Wait for an operation to complete using :class:`PollScheduler`.
+
+    Takes the same arguments as :meth:`PollScheduler.wait` and:
+
+    :param blocking: If ``False``, a future is returned right away instead of
+                     waiting for the result.
+    :type blocking: ``bool``
+
+    :param waiter: Scheduler to use (defaults to the shared one).
+    :type waiter: :class:`PollScheduler`
+
+    :return: Result of the operation or a future if ``blocking`` is
+             ``False``.
+    :rtype: ``object`` or :class:`concurrent.futures.Future`
+    """
+    waiter = waiter or get_default_waiter()
+    future = waiter.wait(check=check, timeout=timeout,
+                         poll_interval=poll_interval, callback=callback,
+                         description=description)
+
+    if blocking:
+        return future.result()
+
+    return future
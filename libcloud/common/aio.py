@@ -0,0 +1,416 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+asyncio based transport for the Connection / Response stack.
+
+Note: This module uses the ``async`` / ``await`` syntax and requires
+Python 3.5 or above. It should only be imported lazily (e.g. by
+:meth:`libcloud.common.base.BaseDriver.get_async_connection`).
+"""
+
+import os
+import ssl
+import time
+import asyncio
+
+import libcloud.security
+from libcloud.utils.py3 import b
+from libcloud.utils.py3 import httplib
+from libcloud.common.types import LibcloudError
+from libcloud.common.base import Connection
+from libcloud.common.base import PollingConnection
+from libcloud.common.openstack import OpenStackBaseConnection
+
+__all__ = [
+    'AsyncHTTPResponse',
+    'AsyncConnection',
+    'AsyncPollingConnection',
+    'AsyncOpenStackConnection',
+
+    'get_async_connection_class',
+    'get_async_connection'
+]
+
+
+class AsyncHTTPResponse(object):
+    """
+    Fully buffered HTTP response which exposes the subset of the
+    :class:`httplib.HTTPResponse` API used by :class:`Response` classes.
+    """
+
+    def __init__(self, status, reason, headers, body):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    def read(self, amt=None):
+        if amt is None:
+            body, self.body = self.body, b('')
+        else:
+            body, self.body = self.body[:amt], self.body[amt:]
+
+        return body
+
+    def getheader(self, name, default=None):
+        name = name.lower()
+
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+
+        return default
+
+    def getheaders(self):
+        return list(self.headers)
+
+
+class AsyncConnection(Connection):
+    """
+    Connection class which performs requests using asyncio.
+
+    :meth:`request` is a coroutine which runs the same hooks as
+    :meth:`Connection.request` and returns an instance of the same
+    ``responseCls`` which means response parsing is shared with the blocking
+    transport.
+
+    Every request opens a new connection which is closed once the response
+    has been read. Raw requests and HTTP proxies are not supported.
+    """
+
+    _ssl_context = None
+
+    def connect(self, host=None, port=None, base_url=None, **kwargs):
+        # Connections are established per request inside request()
+        pass
+
+    async def request(self, action, params=None, data=None, headers=None,
+                      method='GET', raw=False):
+        """
+        Request a given `action`.
+
+        Coroutine counterpart of :meth:`Connection.request`.
+
+        :return: An :class:`Response` instance.
+        :rtype: :class:`Response` instance
+        """
+        if raw:
+            raise LibcloudError('Raw requests are not supported by '
+                                'AsyncConnection', driver=self.driver)
+
+        if self.proxy_url:
+            raise LibcloudError('HTTP proxies are not supported by '
+                                'AsyncConnection', driver=self.driver)
+
+        # Request hooks run synchronously so no other coroutine can touch
+        # request state until the request has been sent
+        url, data, headers = self._prepare_request(action=action,
+                                                   params=params, data=data,
+                                                   headers=headers,
+                                                   method=method)
+        state = (self.action, self.method, self.context)
+        self.reset_context()
+
+        host, port, secure = self._get_host_port_secure()
+
+        http_response = await self._send_request_async(
+            host=host, port=port, secure=secure, method=method, url=url,
+            body=data, headers=headers)
+
+        # Other coroutines could have used this connection while we were
+        # waiting for the response so the state of this request needs to be
+        # restored before the response is parsed
+        (self.action, self.method, self.context) = state
+
+        try:
+            response = self.responseCls(response=http_response,
+                                        connection=self)
+        finally:
+            self.reset_context()
+
+        return response
+
+    def _get_host_port_secure(self):
+        if getattr(self, 'base_url', None):
+            host, port, secure, _ = self._tuple_from_url(self.base_url)
+        else:
+            host, port, secure = self.host, self.port, self.secure
+
+        return host, int(port), secure
+
+    def _get_ssl_context(self):
+        if self._ssl_context is not None:
+            return self._ssl_context
+
+        if libcloud.security.VERIFY_SSL_CERT:
+            ca_certs = [path for path in libcloud.security.CA_CERTS_PATH
+                        if os.path.exists(path) and os.path.isfile(path)]
+            cafile = ca_certs[0] if ca_certs else None
+            context = ssl.create_default_context(cafile=cafile)
+        else:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+
+        self._ssl_context = context
+        return context
+
+    async def _open_connection(self, host, port, secure):
+        """
+        Open a new connection to the API server.
+
+        :return: (reader, writer) tuple
+        :rtype: ``tuple``
+        """
+        if secure:
+            return await asyncio.open_connection(
+                host, port, ssl=self._get_ssl_context(),
+                server_hostname=host)
+
+        return await asyncio.open_connection(host, port)
+
+    async def _send_request_async(self, host, port, secure, method, url,
+                                  body, headers):
+        """
+        Send a HTTP/1.1 request and return a buffered response.
+
+        :rtype: :class:`AsyncHTTPResponse`
+        """
+        coroutine = self._do_request(host=host, port=port, secure=secure,
+                                     method=method, url=url, body=body,
+                                     headers=headers)
+
+        if self.timeout:
+            return await asyncio.wait_for(coroutine, self.timeout)
+
+        return await coroutine
+
+    async def _do_request(self, host, port, secure, method, url, body,
+                          headers):
+        reader, writer = await self._open_connection(host=host, port=port,
+                                                     secure=secure)
+
+        try:
+            lines = ['%s %s HTTP/1.1' % (method, url)]
+            headers = dict(headers)
+            headers['Connection'] = 'close'
+
+            for key, value in headers.items():
+                lines.append('%s: %s' % (key, value))
+
+            writer.write(b('\r\n'.join(lines) + '\r\n\r\n'))
+
+            if body:
+                writer.write(b(body))
+
+            await writer.drain()
+            return await self._read_response(reader=reader, method=method)
+        finally:
+            writer.close()
+
+    async def _read_response(self, reader, method):
+        # Skip over informational (1xx) responses
+        while True:
+            status_line = await reader.readline()
+
+            if not status_line:
+                raise httplib.BadStatusLine(repr(status_line))
+
+            parts = status_line.decode('iso-8859-1').strip().split(' ', 2)
+
+            if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+                raise httplib.BadStatusLine(status_line)
+
+            status = int(parts[1])
+            reason = parts[2] if len(parts) > 2 else ''
+            headers = await self._read_headers(reader=reader)
+
+            if not 100 <= status < 200:
+                break
+
+        response_headers = dict((key.lower(), value)
+                                for key, value in headers)
+
+        if (method.upper() == 'HEAD' or
+                status in (httplib.NO_CONTENT, httplib.NOT_MODIFIED)):
+            body = b('')
+        elif response_headers.get('transfer-encoding') == 'chunked':
+            body = await self._read_chunked(reader=reader)
+        elif 'content-length' in response_headers:
+            length = int(response_headers['content-length'])
+            body = await reader.readexactly(length)
+        else:
+            body = await reader.read()
+
+        return AsyncHTTPResponse(status=status, reason=reason,
+                                 headers=headers, body=body)
+
+    async def _read_headers(self, reader):
+        headers = []
+
+        while True:
+            line = await reader.readline()
+
+            if line in (b('\r\n'), b('\n'), b('')):
+                break
+
+            key, value = line.decode('iso-8859-1').split(':', 1)
+            headers.append((key.strip(), value.strip()))
+
+        return headers
+
+    async def _read_chunked(self, reader):
+        chunks = []
+
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b(';'))[0].strip(), 16)
+
+            if size == 0:
+                # Consume (and ignore) optional trailers
+                await self._read_headers(reader=reader)
+                break
+
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+        return b('').join(chunks)
+
+
+class AsyncPollingConnection(AsyncConnection, PollingConnection):
+    """
+    Async counterpart of :class:`PollingConnection`.
+    """
+
+    async def async_request(self, action, params=None, data=None,
+                            headers=None, method='GET', context=None):
+        """
+        Coroutine counterpart of :meth:`PollingConnection.async_request`.
+
+        Poll requests are performed without blocking the event loop which
+        means a single loop can wait on many jobs at the same time.
+        """
+        request = getattr(self, self.request_method)
+        kwargs = self.get_request_kwargs(action=action, params=params,
+                                         data=data, headers=headers,
+                                         method=method,
+                                         context=context)
+        response = await request(**kwargs)
+        kwargs = self.get_poll_request_kwargs(response=response,
+                                              context=context,
+                                              request_kwargs=kwargs)
+
+        end = time.time() + self.timeout
+        completed = False
+        while time.time() < end and not completed:
+            response = await request(**kwargs)
+            completed = self.has_completed(response=response)
+            if not completed:
+                await asyncio.sleep(self.poll_interval)
+
+        if not completed:
+            raise LibcloudError('Job did not complete in %s seconds' %
+                                (self.timeout))
+
+        return response
+
+
+class AsyncOpenStackConnection(AsyncConnection):
+    """
+    Async connection mixin for :class:`OpenStackBaseConnection` sub-classes.
+
+    Authentication is performed using the blocking identity connection so it
+    is run in the default executor to avoid blocking the event loop.
+    """
+
+    async def request(self, action, params=None, data='', headers=None,
+                      method='GET', raw=False):
+        headers = headers or {}
+        params = params or {}
+
+        if not self._ex_force_auth_token:
+            osa = self.get_auth_class()
+
+            if not osa.is_token_valid():
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(
+                    None, self._populate_hosts_and_request_paths)
+
+        # Include default content-type for POST and PUT request (if available)
+        default_content_type = getattr(self, 'default_content_type', None)
+        if method.upper() in ['POST', 'PUT'] and default_content_type:
+            headers = {'Content-Type': default_content_type}
+
+        return await super(AsyncOpenStackConnection, self).request(
+            action=action, params=params, data=data, method=method,
+            headers=headers, raw=raw)
+
+
+# Async mixin classes which are used for sub-classes of a particular
+# connection class. First match wins.
+ASYNC_CONNECTION_MIXINS = [
+    (OpenStackBaseConnection, AsyncOpenStackConnection),
+    (PollingConnection, AsyncPollingConnection),
+    (Connection, AsyncConnection)
+]
+
+_ASYNC_CONNECTION_CLASSES = {}
+
+
+def get_async_connection_class(connection_cls):
+    """
+    Return an async counterpart of the provided connection class.
+
+    :param connection_cls: Blocking connection class.
+    :type connection_cls: ``type``
+
+    :rtype: ``type``
+    """
+    if issubclass(connection_cls, AsyncConnection):
+        return connection_cls
+
+    if connection_cls not in _ASYNC_CONNECTION_CLASSES:
+        for base_cls, mixin_cls in ASYNC_CONNECTION_MIXINS:
+            if issubclass(connection_cls, base_cls):
+                break
+
+        name = 'Async%s' % (connection_cls.__name__)
+        cls = type(name, (mixin_cls, connection_cls), {})
+        _ASYNC_CONNECTION_CLASSES[connection_cls] = cls
+
+    return _ASYNC_CONNECTION_CLASSES[connection_cls]
+
+
+def get_async_connection(connection):
+    """
+    Return an async connection which shares configuration and credentials
+    with the provided (already configured) blocking connection.
+
+    :param connection: Blocking connection instance.
+    :type connection: :class:`Connection`
+
+    :rtype: :class:`AsyncConnection`
+    """
+    cls = get_async_connection_class(connection.__class__)
+    async_connection = cls.__new__(cls)
+
+    for key, value in connection.__dict__.items():
+        # Request state is never shared
+        if key != '_thread_state':
+            async_connection.__dict__[key] = value
+
+    async_connection.ua = list(connection.ua)
+    return async_connection
@@ -240,6 +240,26 @@ class AWSRequestSignerAlgorithmV2(AWSRequestSigner):
 
 
 class AWSRequestSignerAlgorithmV4(AWSRequestSigner):
+    """
+    Signs requests using AWS Signature Version 4.
+
+    Derived signing keys only change per day, region and service so they are
+    cached.
+
+    :cvar max_cached_keys: Maximum number of cached signing keys.
+    :cvar payload_chunk_size: Size of the chunks in which file-like request
+                              bodies are read when hashing them.
+    """
+
+    max_cached_keys = 16
+    payload_chunk_size = 64 * 1024
+
+    def __init__(self, access_key, access_secret, version, connection):
+        super(AWSRequestSignerAlgorithmV4, self).__init__(
+            access_key=access_key, access_secret=access_secret,
+            version=version, connection=connection)
+        self._signing_keys = {}
+
     def get_request_params(self, params, method='GET', path='/'):
         params['Version'] = self.version
         return params
@@ -249,19 +269,18 @@ class AWSRequestSignerAlgorithmV4(AWSRequestSigner):
         headers['X-AMZ-Date'] = now.strftime('%Y%m%dT%H%M%SZ')
         headers['Authorization'] = \
             self._get_authorization_v4_header(params=params, headers=headers,
-                                              dt=now, method=method, path=path)
+                                              dt=now, method=method, path=path,
+                                              data=self.connection.data)
 
         return params, headers
 
     def _get_authorization_v4_header(self, params, headers, dt, method='GET',
-                                     path='/'):
-        assert method == 'GET', 'AWS Signature V4 not implemented for ' \
-                                'other methods than GET'
-
+                                     path='/', data=None):
         credentials_scope = self._get_credential_scope(dt=dt)
         signed_headers = self._get_signed_headers(headers=headers)
         signature = self._get_signature(params=params, headers=headers,
-                                        dt=dt, method=method, path=path)
+                                        dt=dt, method=method, path=path,
+                                        data=data)
 
         return 'AWS4-HMAC-SHA256 Credential=%(u)s/%(c)s, ' \
                'SignedHeaders=%(sh)s, Signature=%(s)s' % {
@@ -271,28 +290,46 @@ class AWSRequestSignerAlgorithmV4(AWSRequestSigner):
                    's': signature
                }
 
-    def _get_signature(self, params, headers, dt, method, path):
+    def _get_signature(self, params, headers, dt, method, path, data=None):
         key = self._get_key_to_sign_with(dt)
         string_to_sign = self._get_string_to_sign(params=params,
                                                   headers=headers, dt=dt,
-                                                  method=method, path=path)
+                                                  method=method, path=path,
+                                                  data=data)
         return _sign(key=key, msg=string_to_sign, hex=True)
 
     def _get_key_to_sign_with(self, dt):
-        return _sign(
-            _sign(
+        date = dt.strftime('%Y%m%d')
+        region = self.connection.driver.region_name
+        service = self.connection.service_name
+        cache_key = (date, region, service)
+
+        key = self._signing_keys.get(cache_key, None)
+
+        if key is None:
+            key = _sign(
                 _sign(
-                    _sign(('AWS4' + self.access_secret),
-                          dt.strftime('%Y%m%d')),
-                    self.connection.driver.region_name),
-                self.connection.service_name),
-            'aws4_request')
+                    _sign(
+                        _sign(('AWS4' + self.access_secret), date),
+                        region),
+                    service),
+                'aws4_request')
+
+            # Keys from the previous days are not needed anymore
+            if len(self._signing_keys) >= self.max_cached_keys:
+                self._signing_keys.clear()
+
+            self._signing_keys[cache_key] = key
 
-    def _get_string_to_sign(self, params, headers, dt, method, path):
+        return key
+
+    def _get_string_to_sign(self, params, headers, dt, method, path,
+                            data=None):
         canonical_request = self._get_canonical_request(params=params,
                                                         headers=headers,
                                                         method=method,
-                                                        path=path)
+                                                        path=path,
+                                                        data=data)
 
         return '\n'.join(['AWS4-HMAC-SHA256',
                           dt.strftime('%Y%m%dT%H%M%SZ'),
@@ -312,23 +349,49 @@ class AWSRequestSignerAlgorithmV4(AWSRequestSigner):
         return '\n'.join([':'.join([k.lower(), v.strip()])
                           for k, v in sorted(headers.items())]) + '\n'
 
-    def _get_payload_hash(self):
-        return _hash('')
+    def _get_payload_hash(self, data=None):
+        """
+        Return hex encoded SHA256 digest of the request body.
+
+        File-like bodies are hashed in chunks and rewound afterwards so they
+        can still be sent.
+        """
+        if not data:
+            return EMPTY_PAYLOAD_HASH
+
+        if not hasattr(data, 'read'):
+            return _hash(data)
+
+        position = data.tell()
+        digest = hashlib.sha256()
+
+        while True:
+            chunk = data.read(self.payload_chunk_size)
+
+            if not chunk:
+                break
+
+            digest.update(b(chunk))
+
+        data.seek(position)
+        return digest.hexdigest()
 
     def _get_request_params(self, params):
-        # For self.method == GET
+        # Parameters are always sent in the query string (also for POST and
+        # PUT requests)
         return '&'.join(["%s=%s" %
                          (urlquote(k, safe=''), urlquote(str(v), safe='~'))
                          for k, v in sorted(params.items())])
 
-    def _get_canonical_request(self, params, headers, method, path):
+    def _get_canonical_request(self, params, headers, method, path,
+                               data=None):
         return '\n'.join([
             method,
             path,
             self._get_request_params(params),
             self._get_canonical_headers(headers),
             self._get_signed_headers(headers),
-            self._get_payload_hash()
+            self._get_payload_hash(data)
         ])
 
 
@@ -380,6 +443,9 @@ def _hash(msg):
     return hashlib.sha256(b(msg)).hexdigest()
 
 
+EMPTY_PAYLOAD_HASH = _hash('')
+
+
 class AWSDriver(BaseDriver):
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
                  api_version=None, region=None, token=None, **kwargs):
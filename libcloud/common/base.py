@@ -13,11 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import with_statement
+
 import os
 import sys
 import ssl
 import copy
+import errno
+import socket
+import select
 import binascii
+import threading
 import time
 
 import xml.dom.minidom
@@ -46,11 +52,27 @@ from libcloud.utils.py3 import b
 
 from libcloud.utils.misc import lowercase_keys
 from libcloud.utils.compression import decompress_data
+from libcloud.utils.compression import DecompressedStream
 from libcloud.common.types import LibcloudError, MalformedResponseError
+from libcloud.common.poll import get_default_poll_scheduler
 
 from libcloud.httplib_ssl import LibcloudHTTPConnection
 from libcloud.httplib_ssl import LibcloudHTTPSConnection
 
+# Exceptions which indicate that a re-used keep-alive connection has been
+# closed by the remote end before a response was received
+STALE_CONNECTION_EXCEPTIONS = (socket.error, httplib.BadStatusLine,
+                               httplib.CannotSendRequest,
+                               httplib.ResponseNotReady)
+
+# Socket error codes which are raised when the remote end has closed the
+# connection (socket.timeout and other errors are never retried)
+STALE_CONNECTION_ERRNOS = (errno.ECONNRESET, errno.EPIPE, errno.ECONNABORTED)
+
+# Requests which fail on a stale connection are only retried for idempotent
+# methods since the remote end might have already processed the request
+RETRY_STALE_CONNECTION_METHODS = ('GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS')
+
 
 class HTTPResponse(httplib.HTTPResponse):
     # On python 2.6 some calls can hang because HEAD isn't quite properly
@@ -260,6 +282,76 @@ class RawResponse(Response):
         return self._reason
 
 
+class StreamingResponse(Response):
+    """
+    Response whose body is not read upfront.
+
+    The (decompressed) body is available as a file-like object in the
+    ``stream`` attribute which means large responses can be parsed
+    incrementally.
+
+    Once the caller is done with the body, :meth:`release` needs to be
+    called so the HTTP connection can be reused.
+    """
+
+    def __init__(self, response, connection):
+        """
+        :param response: HTTP response object.
+        :type response: :class:`httplib.HTTPResponse`
+
+        :param connection: Parent connection object.
+        :type connection: :class:`.Connection`
+        """
+        self.connection = connection
+        self.response = response
+
+        # Other requests might be performed before the body is consumed so
+        # the HTTP connection this response belongs to is stored here
+        self._http_connection = getattr(connection, 'connection', None)
+        self._pool_key = getattr(connection, '_pool_key', None)
+        self._released = False
+
+        self.headers = lowercase_keys(dict(response.getheaders()))
+        self.error = response.reason
+        self.status = response.status
+
+        # This attribute is set when using LoggingConnection which has
+        # already read and decompressed the body.
+        original_data = getattr(response, '_original_data', None)
+
+        if original_data:
+            from io import BytesIO
+            self.stream = DecompressedStream(BytesIO(b(original_data)))
+        else:
+            encoding = self.headers.get('content-encoding', None)
+
+            if encoding in ['zlib', 'deflate']:
+                compression_type = 'zlib'
+            elif encoding in ['gzip', 'x-gzip']:
+                compression_type = 'gzip'
+            else:
+                compression_type = None
+
+            self.stream = DecompressedStream(response,
+                                             compression_type=compression_type)
+
+    def read(self, size=-1):
+        return self.stream.read(size)
+
+    def release(self):
+        """
+        Hand the HTTP connection back to the connection pool if the body has
+        been fully read, otherwise the connection is closed.
+        """
+        if self._released:
+            return
+
+        self._released = True
+        self.connection._release_connection(
+            self.response, connection=self._http_connection,
+            pool_key=self._pool_key)
+
+
 # TODO: Move this to a better location/package
 class LoggingConnection():
     """
@@ -443,26 +535,262 @@ class LoggingHTTPConnection(LoggingConnection, LibcloudHTTPConnection):
                                               body, headers)
 
 
+class ConnectionPool(object):
+    """
+    A size-bounded pool of idle keep-alive HTTP(S) connections.
+
+    Connections are keyed by the connection class and the arguments which
+    were used to construct them (host, port, proxy, timeout, ...) so a
+    connection is only ever re-used for the endpoint it was opened to.
+
+    :cvar max_size: Maximum number of idle connections kept per key.
+    :cvar idle_timeout: Number of seconds after which an idle connection is
+                        closed instead of being re-used.
+    """
+
+    max_size = 10
+    idle_timeout = 60
+
+    def __init__(self, max_size=None, idle_timeout=None):
+        """
+        :param max_size: Maximum number of idle connections kept per host.
+        :type max_size: ``int``
+
+        :param idle_timeout: How many seconds an idle connection is kept
+                             around before it's closed.
+        :type idle_timeout: ``int``
+        """
+        if max_size is not None:
+            self.max_size = max_size
+
+        if idle_timeout is not None:
+            self.idle_timeout = idle_timeout
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def get_key(self, connection_cls, kwargs):
+        """
+        Return a pool key for the provided connection class and constructor
+        arguments.
+
+        :rtype: ``tuple``
+        """
+        return (connection_cls, tuple(sorted(kwargs.items())))
+
+    def acquire(self, key, factory):
+        """
+        Return an idle connection for the provided key or create a new one
+        using ``factory`` if no (live) idle connection is available.
+
+        :param key: Pool key as returned by ``get_key``.
+        :type key: ``tuple``
+
+        :param factory: Callable which returns a new connection.
+        :type factory: ``callable``
+
+        :return: ``(connection, reused)`` tuple.
+        :rtype: ``tuple``
+        """
+        now = time.time()
+
+        with self._lock:
+            idle = self._idle.get(key, [])
+
+            while idle:
+                connection, last_used = idle.pop()
+
+                if (now - last_used) > self.idle_timeout or \
+                   self._is_connection_dropped(connection):
+                    self.stale += 1
+                    self._close(connection)
+                    continue
+
+                self.hits += 1
+                return connection, True
+
+            self.misses += 1
+
+        return factory(), False
+
+    def release(self, key, connection):
+        """
+        Return a connection to the pool so it can be re-used by the following
+        requests to the same endpoint.
+
+        :param key: Pool key which was used to acquire the connection.
+        :type key: ``tuple``
+
+        :param connection: Connection to return to the pool.
+        :type connection: :class:`LibcloudHTTPConnection`
+        """
+        if getattr(connection, 'sock', None) is None:
+            # Connection has been closed (e.g. "Connection: close" response
+            # header) and there is nothing to keep alive
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+
+            if len(idle) >= self.max_size:
+                self._close(connection)
+                return
+
+            idle.append((connection, time.time()))
+
+    def discard(self, connection, stale=False):
+        """
+        Close a connection which shouldn't be returned to the pool.
+
+        :param stale: True if the connection has been closed by the remote
+                      end.
+        :type stale: ``bool``
+        """
+        if stale:
+            with self._lock:
+                self.stale += 1
+
+        self._close(connection)
+
+    def clear(self):
+        """
+        Close all the idle connections in the pool.
+        """
+        with self._lock:
+            for idle in self._idle.values():
+                for connection, _ in idle:
+                    self._close(connection)
+
+            self._idle = {}
+
+    def stats(self):
+        """
+        Return pool usage statistics.
+
+        :rtype: ``dict``
+        """
+        with self._lock:
+            idle = sum([len(value) for value in self._idle.values()])
+
+        return {'max_size': self.max_size, 'idle_timeout': self.idle_timeout,
+                'idle': idle, 'hits': self.hits, 'misses': self.misses,
+                'stale': self.stale}
+
+    def _is_connection_dropped(self, connection):
+        """
+        Return True if the remote end has closed the provided idle connection.
+
+        Idle keep-alive socket should never be readable. If it is, the server
+        either closed the connection (EOF) or sent unexpected data and the
+        connection can't be re-used.
+        """
+        sock = getattr(connection, 'sock', None)
+
+        if sock is None:
+            return True
+
+        try:
+            readable, _, _ = select.select([sock], [], [], 0.0)
+        except (select.error, socket.error, ValueError, TypeError):
+            return True
+
+        return bool(readable)
+
+    def _close(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+class RequestState(threading.local):
+    """
+    Request scoped state of a :class:`Connection` instance.
+
+    Each thread sees its own copy of this object which means a single
+    connection (and driver) instance can be shared between multiple threads
+    without requests stepping on each other's toes.
+    """
+
+    def __init__(self):
+        self.connection = None
+        self.action = None
+        self.method = None
+        self.data = None
+        self.context = {}
+        self.pool_key = None
+        self.connection_reused = False
+
+
+def _request_state_property(name, doc=None):
+    """
+    Return a property which proxies attribute access to the request state
+    of the current thread.
+    """
+    def getter(self):
+        return getattr(self._request_state, name)
+
+    def setter(self, value):
+        setattr(self._request_state, name, value)
+
+    return property(getter, setter, doc=doc)
+
+
 class Connection(object):
     """
     A Base Connection class to derive from.
+
+    Instances of this class can be shared between threads. State which is
+    bound to a single request (underlying HTTP connection, action, method
+    and context) is stored in a :class:`RequestState` object which is local
+    to the calling thread.
     """
     # conn_classes = (LoggingHTTPSConnection)
     conn_classes = (LibcloudHTTPConnection, LibcloudHTTPSConnection)
 
     responseCls = Response
     rawResponseCls = RawResponse
-    connection = None
+    streamingResponseCls = StreamingResponse
     host = '127.0.0.1'
     port = 443
     timeout = None
     secure = 1
     driver = None
-    action = None
     cache_busting = False
 
+    # Optional ConnectionPool instance. When set, keep-alive connections are
+    # re-used across requests instead of opening a new one for each request.
+    connection_pool = None
+
     allow_insecure = True
 
+    connection = _request_state_property(
+        'connection', doc='Underlying HTTP(S) connection object')
+    action = _request_state_property(
+        'action', doc='Action (path) of the current request')
+    method = _request_state_property(
+        'method', doc='HTTP method of the current request')
+    data = _request_state_property(
+        'data', doc='Encoded body of the current request')
+    context = _request_state_property(
+        'context', doc='Context dictionary of the current request')
+    _pool_key = _request_state_property('pool_key')
+    _connection_reused = _request_state_property('connection_reused')
+
+    @property
+    def _request_state(self):
+        state = self.__dict__.get('_thread_state')
+
+        if state is None:
+            state = self.__dict__.setdefault('_thread_state',
+                                             RequestState())
+
+        return state
+
     def __init__(self, secure=True, host=None, port=None, url=None,
                  timeout=None, proxy_url=None):
         self.secure = secure and 1 or 0
@@ -596,7 +924,16 @@ class Connection(object):
         if self.proxy_url:
             kwargs.update({'proxy_url': self.proxy_url})
 
-        connection = self.conn_classes[secure](**kwargs)
+        connection_cls = self.conn_classes[secure]
+
+        if self.connection_pool is not None:
+            pool = self.connection_pool
+            self._pool_key = pool.get_key(connection_cls, kwargs)
+            connection, self._connection_reused = \
+                pool.acquire(self._pool_key, lambda: connection_cls(**kwargs))
+        else:
+            self._connection_reused = False
+            connection = connection_cls(**kwargs)
         # You can uncoment this line, if you setup a reverse proxy server
         # which proxies to your endpoint, and lets you easily capture
         # connections in cleartext when you setup the proxy to do SSL
@@ -664,6 +1001,106 @@ class Connection(object):
         :return: An :class:`Response` instance.
         :rtype: :class:`Response` instance
 
+        """
+        url, data, headers = self._prepare_request(action=action,
+                                                   params=params, data=data,
+                                                   headers=headers,
+                                                   method=method, raw=raw)
+
+        # Removed terrible hack...this a less-bad hack that doesn't execute a
+        # request twice, but it's still a hack.
+        self.connect()
+        try:
+            # @TODO: Should we just pass File object as body to request method
+            # instead of dealing with splitting and sending the file ourselves?
+            if raw:
+                self.connection.putrequest(method, url)
+
+                for key, value in list(headers.items()):
+                    self.connection.putheader(key, str(value))
+
+                self.connection.endheaders()
+            else:
+                http_response = self._send_request(method=method, url=url,
+                                                   body=data, headers=headers)
+        except ssl.SSLError:
+            e = sys.exc_info()[1]
+            self.reset_context()
+            raise ssl.SSLError(str(e))
+
+        if raw:
+            responseCls = self.rawResponseCls
+            kwargs = {'connection': self}
+        else:
+            responseCls = self.responseCls
+            kwargs = {'connection': self, 'response': http_response}
+
+        try:
+            response = responseCls(**kwargs)
+        finally:
+            # Always reset the context after the request has completed
+            self.reset_context()
+
+            # Raw responses are read lazily by the caller which means the
+            # connection can't be handed over to the pool yet
+            if not raw:
+                self._release_connection(http_response)
+
+        return response
+
+    def request_stream(self, action, params=None, data=None, headers=None,
+                       method='GET'):
+        """
+        Request a given `action` and return a response whose body is read
+        lazily by the caller.
+
+        Arguments have the same meaning as in :meth:`request`. Error
+        responses are read and parsed by the ``responseCls`` class so the
+        same exceptions as with :meth:`request` are thrown.
+
+        :return: An :class:`StreamingResponse` instance.
+        :rtype: :class:`StreamingResponse` instance
+        """
+        url, data, headers = self._prepare_request(action=action,
+                                                   params=params, data=data,
+                                                   headers=headers,
+                                                   method=method)
+
+        self.connect()
+        try:
+            http_response = self._send_request(method=method, url=url,
+                                               body=data, headers=headers)
+        except ssl.SSLError:
+            e = sys.exc_info()[1]
+            self.reset_context()
+            raise ssl.SSLError(str(e))
+
+        try:
+            response = self.streamingResponseCls(response=http_response,
+                                                 connection=self)
+
+            if not response.success():
+                response = self.responseCls(response=http_response,
+                                            connection=self)
+                raise Exception(response.parse_error())
+        finally:
+            self.reset_context()
+
+        # Same as with raw responses, the body hasn't been read yet so the
+        # connection is handed over to the pool by StreamingResponse.release
+        return response
+
+    def _prepare_request(self, action, params=None, data=None, headers=None,
+                         method='GET', raw=False):
+        """
+        Run all the request hooks and return the final URL, encoded body and
+        headers for the request.
+
+        Request scoped state (action, method and encoded body) is also set
+        here so the hooks and the response class can access it.
+
+        :return: (url, data, headers) tuple
+        :rtype: ``tuple``
         """
         if params is None:
             params = {}
@@ -714,6 +1151,8 @@ class Connection(object):
             # "data" not being set.
             headers['Content-Length'] = '0'
 
+        self.data = data
+
         params, headers = self.pre_connect_hook(params, headers)
 
         if params:
@@ -724,42 +1163,73 @@ class Connection(object):
         else:
             url = action
 
-        # Removed terrible hack...this a less-bad hack that doesn't execute a
-        # request twice, but it's still a hack.
-        self.connect()
-        try:
-            # @TODO: Should we just pass File object as body to request method
-            # instead of dealing with splitting and sending the file ourselves?
-            if raw:
-                self.connection.putrequest(method, url)
+        return url, data, headers
 
-                for key, value in list(headers.items()):
-                    self.connection.putheader(key, str(value))
+    def _send_request(self, method, url, body, headers):
+        """
+        Send a request and return the underlying HTTP response.
 
-                self.connection.endheaders()
-            else:
-                self.connection.request(method=method, url=url, body=data,
-                                        headers=headers)
-        except ssl.SSLError:
+        If an idempotent request fails on a keep-alive connection which has
+        been re-used from the connection pool because the server closed it in
+        the mean time, the connection is discarded and the request is retried
+        once on a new connection.
+        """
+        try:
+            self.connection.request(method=method, url=url, body=body,
+                                    headers=headers)
+            return self.connection.getresponse()
+        except STALE_CONNECTION_EXCEPTIONS:
             e = sys.exc_info()[1]
-            self.reset_context()
-            raise ssl.SSLError(str(e))
 
-        if raw:
-            responseCls = self.rawResponseCls
-            kwargs = {'connection': self}
-        else:
-            responseCls = self.responseCls
-            kwargs = {'connection': self,
-                      'response': self.connection.getresponse()}
+            if not self._connection_reused or \
+                    method.upper() not in RETRY_STALE_CONNECTION_METHODS or \
+                    not self._is_stale_connection_error(e):
+                raise
 
-        try:
-            response = responseCls(**kwargs)
-        finally:
-            # Always reset the context after the request has completed
-            self.reset_context()
+            self.connection_pool.discard(self.connection, stale=True)
 
-        return response
+        self.connect()
+        self.connection.request(method=method, url=url, body=body,
+                                headers=headers)
+        return self.connection.getresponse()
+
+    def _is_stale_connection_error(self, error):
+        """
+        Return True if the provided exception means that the remote end closed
+        the connection before sending a response.
+        """
+        if isinstance(error, socket.timeout):
+            return False
+
+        # Includes RemoteDisconnected which is also a socket error on Python 3
+        if isinstance(error, (httplib.BadStatusLine,
+                              httplib.CannotSendRequest,
+                              httplib.ResponseNotReady)):
+            return True
+
+        return getattr(error, 'errno', None) in STALE_CONNECTION_ERRNOS
+
+    def _release_connection(self, response, connection=None,
+                            pool_key=None):
+        """
+        Hand the current connection (or the provided one) back to the
+        connection pool (if one is used) once the response has been fully
+        read.
+        """
+        pool = self.connection_pool
+        connection = connection or self.connection
+        pool_key = pool_key or self._pool_key
+
+        if pool is None or connection is None or pool_key is None:
+            return
+
+        is_closed = getattr(response, 'isclosed', None)
+        fully_read = is_closed() if is_closed else True
+
+        if fully_read and not getattr(response, 'will_close', False):
+            pool.release(pool_key, connection)
+        else:
+            pool.discard(connection)
 
     def morph_action_hook(self, action):
         return self.request_path + action
@@ -836,6 +1306,11 @@ class PollingConnection(Connection):
     timeout = 200
     request_method = 'request'
 
+    # Maximum number of jobs whose status can be retrieved using a single
+    # request (None means the API doesn't support it). See
+    # get_batch_poll_request_kwargs and get_batch_poll_responses.
+    poll_batch_size = None
+
     def async_request(self, action, params=None, data=None, headers=None,
                       method='GET', context=None):
         """
@@ -903,6 +1378,35 @@ class PollingConnection(Connection):
 
         return response
 
+    def async_request_future(self, action, params=None, data=None,
+                             headers=None, method='GET', context=None,
+                             callback=None, scheduler=None):
+        """
+        Non-blocking counterpart of :meth:`async_request`.
+
+        The initial request is performed right away and the job status is
+        then polled by a :class:`libcloud.common.poll.PollScheduler` which
+        waits for all the outstanding jobs using a single thread.
+
+        Takes the same arguments as :meth:`async_request` and:
+
+        :type callback: ``callable``
+        :param callback: Optional function which is called with the final
+                         poll response. The return value is used as the
+                         future result.
+
+        :type scheduler: :class:`libcloud.common.poll.PollScheduler`
+        :param scheduler: Scheduler to use (defaults to the shared one).
+
+        :return: Future which is resolved once the job has completed.
+        :rtype: :class:`concurrent.futures.Future`
+        """
+        scheduler = scheduler or get_default_poll_scheduler()
+        return scheduler.submit(connection=self, action=action,
+                                params=params, data=data, headers=headers,
+                                method=method, context=context,
+                                callback=callback)
+
     def get_request_kwargs(self, action, params=None, data=None, headers=None,
                            method='GET', context=None):
         """
@@ -940,6 +1444,57 @@ class PollingConnection(Connection):
         """
         raise NotImplementedError('has_completed not implemented')
 
+    def get_poll_batch_key(self, poll_request_kwargs):
+        """
+        Return a key which identifies jobs whose status can be retrieved
+        using the same batch request (e.g. jobs from the same zone).
+
+        :param poll_request_kwargs: Poll request keyword arguments of a job.
+        :type poll_request_kwargs: ``dict``
+
+        :return ``object`` Hashable key
+        """
+        return None
+
+    def get_batch_poll_request_kwargs(self, poll_request_kwargs,
+                                      start_time=None):
+        """
+        Return keyword arguments which are passed to the request() method when
+        polling for the status of multiple jobs.
+
+        Only used if ``poll_batch_size`` is set.
+
+        :param poll_request_kwargs: Poll request keyword arguments of the
+                                    jobs.
+        :type poll_request_kwargs: ``list`` of ``dict``
+
+        :param start_time: Timestamp of the earliest job submission.
+        :type start_time: ``float``
+
+        :return ``dict`` Keyword arguments or None if the status of the jobs
+                needs to be retrieved using regular poll requests.
+        """
+        raise NotImplementedError(
+            'get_batch_poll_request_kwargs not implemented')
+
+    def get_batch_poll_responses(self, response, poll_request_kwargs):
+        """
+        Split response of the batch poll request into per job responses
+        which can be passed to :meth:`has_completed`.
+
+        :param response: Response object returned by batch poll request.
+        :type response: :class:`HTTPResponse`
+
+        :param poll_request_kwargs: Poll request keyword arguments of the
+                                    jobs.
+        :type poll_request_kwargs: ``list`` of ``dict``
+
+        :return ``list`` Response for every job in the same order as
+                ``poll_request_kwargs``. ``None`` means the status of this
+                job needs to be retrieved using a regular poll request.
+        """
+        raise NotImplementedError('get_batch_poll_responses not implemented')
+
 
 class ConnectionKey(Connection):
     """
@@ -998,6 +1553,21 @@ class BaseDriver(object):
 
     connectionCls = ConnectionKey
 
+    # True if the driver can be used with the asyncio based transport
+    # (see get_async_connection)
+    supports_async = False
+    _async_connection = None
+
+    # Read-heavy methods which results are cached once enable_cache is called
+    cacheable_methods = ()
+
+    # Methods which invalidate cached results of other methods, e.g.
+    # {'create_image': ('list_images', )}
+    cache_invalidating_methods = {}
+
+    # ResultCache instance if caching is enabled
+    cache = None
+
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
                  api_version=None, region=None, **kwargs):
         """
@@ -1059,3 +1629,116 @@ class BaseDriver(object):
         Connection class constructor.
         """
         return {}
+
+    def get_async_connection(self):
+        """
+        Return an asyncio based counterpart of the driver connection.
+
+        The returned connection shares credentials and configuration with
+        the driver connection, but its ``request`` (and ``async_request``)
+        methods are coroutines which don't block the event loop.
+
+        Note: This requires Python 3.5 or above.
+
+        :rtype: :class:`libcloud.common.aio.AsyncConnection`
+        """
+        if not self.supports_async:
+            raise NotImplementedError(
+                'asyncio transport is not supported by this driver')
+
+        if sys.version_info < (3, 5):
+            raise LibcloudError('asyncio transport requires Python 3.5 or '
+                                'above', driver=self)
+
+        if self._async_connection is None:
+            from libcloud.common.aio import get_async_connection
+            self._async_connection = get_async_connection(self.connection)
+
+        return self._async_connection
+
+    def enable_cache(self, ttl=None, max_size=None, methods=None):
+        """
+        Cache results of read-heavy methods (e.g. ``list_images``).
+
+        Results are cached per method and arguments, entries expire after
+        ``ttl`` seconds and least recently used entries are evicted once
+        there are more than ``max_size`` of them.
+
+        :param ttl: Number of seconds after which cached results expire.
+        :type ttl: ``float``
+
+        :param max_size: Maximum number of cached results.
+        :type max_size: ``int``
+
+        :param methods: Names of the methods to cache (defaults to
+                        ``cacheable_methods``).
+        :type methods: ``list`` of ``str``
+
+        :return: The cache (see :meth:`ResultCache.get_stats`).
+        :rtype: :class:`libcloud.common.cache.ResultCache`
+        """
+        # Imported here so drivers which don't use the cache don't import it
+        from libcloud.common.cache import ResultCache, cached_method
+
+        self.disable_cache()
+
+        cache = ResultCache(ttl=ttl, max_size=max_size)
+        wrapped = []
+
+        if methods is None:
+            methods = self.cacheable_methods
+
+        for name in methods:
+            setattr(self, name, cached_method(cache, name,
+                                              getattr(self, name)))
+            wrapped.append(name)
+
+        for name, invalidated in self.cache_invalidating_methods.items():
+            if name in methods or not hasattr(self, name):
+                continue
+
+            setattr(self, name, self._get_invalidating_method(
+                cache, getattr(self, name), invalidated))
+            wrapped.append(name)
+
+        self.cache = cache
+        self._cache_wrapped_methods = wrapped
+        return cache
+
+    def disable_cache(self):
+        """
+        Stop caching the results and drop the cache.
+        """
+        for name in getattr(self, '_cache_wrapped_methods', []):
+            delattr(self, name)
+
+        self._cache_wrapped_methods = []
+        self.cache = None
+
+    def invalidate_cache(self, method_name=None):
+        """
+        Remove cached results.
+
+        :param method_name: Only remove results of this method (e.g.
+                            ``list_images``).
+        :type method_name: ``str``
+
+        :return: Number of removed results.
+        :rtype: ``int``
+        """
+        if self.cache is None:
+            return 0
+
+        return self.cache.invalidate(method_name)
+
+    def _get_invalidating_method(self, cache, func, method_names):
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                for method_name in method_names:
+                    cache.invalidate(method_name)
+
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
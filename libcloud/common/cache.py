@@ -0,0 +1,230 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cache for results of read-heavy driver calls (e.g. ``list_images``).
+"""
+
+from __future__ import with_statement
+
+import time
+import threading
+
+from functools import wraps
+
+__all__ = [
+    'ResultCache',
+
+    'get_cache_key',
+    'cached_method'
+]
+
+
+class ResultCache(object):
+    """
+    Size bounded cache with a TTL and LRU eviction.
+
+    :cvar ttl: Number of seconds after which an entry expires.
+    :cvar max_size: Maximum number of entries, least recently used entries
+                    are evicted once the limit is reached.
+    """
+
+    ttl = 300
+    max_size = 128
+
+    def __init__(self, ttl=None, max_size=None, clock=None):
+        """
+        :param ttl: Number of seconds after which an entry expires.
+        :type ttl: ``float``
+
+        :param max_size: Maximum number of entries.
+        :type max_size: ``int``
+
+        :param clock: Function which returns the current time (defaults to
+                      ``time.time``).
+        :type clock: ``callable``
+        """
+        if ttl is not None:
+            self.ttl = ttl
+
+        if max_size is not None:
+            self.max_size = max_size
+
+        if self.max_size < 1:
+            raise ValueError('max_size needs to be at least 1')
+
+        self.clock = clock or time.time
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Keys are kept in the least recently used first order (OrderedDict
+        # is not available on Python 2.5 and 2.6)
+        self._entries = {}
+        self._order = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self):
+        return (('<ResultCache: ttl=%s, max_size=%s, hits=%s, misses=%s, '
+                 'evictions=%s>') % (self.ttl, self.max_size, self.hits,
+                                     self.misses, self.evictions))
+
+    def get(self, key):
+        """
+        Return ``(found, value)`` tuple for the provided key.
+
+        :rtype: ``tuple``
+        """
+        now = self.clock()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._remove(key)
+
+                self.misses += 1
+                return (False, None)
+
+            # Mark entry as the most recently used one
+            self._order.remove(key)
+            self._order.append(key)
+            self.hits += 1
+            return (True, entry[1])
+
+    def set(self, key, value):
+        """
+        Store value in the cache.
+        """
+        expires = self.clock() + self.ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._order.remove(key)
+
+            self._entries[key] = (expires, value)
+            self._order.append(key)
+
+            while len(self._order) > self.max_size:
+                del self._entries[self._order.pop(0)]
+                self.evictions += 1
+
+    def invalidate(self, method_name=None):
+        """
+        Remove entries from the cache.
+
+        :param method_name: Only remove results of this method (all the
+                            entries are removed if not provided).
+        :type method_name: ``str``
+
+        :return: Number of removed entries.
+        :rtype: ``int``
+        """
+        with self._lock:
+            if method_name is None:
+                keys = list(self._entries.keys())
+            else:
+                keys = [key for key in self._entries
+                        if key[0] == method_name]
+
+            for key in keys:
+                self._remove(key)
+
+        return len(keys)
+
+    def get_stats(self):
+        """
+        Return cache statistics.
+
+        :rtype: ``dict``
+        """
+        with self._lock:
+            size = len(self._entries)
+
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'size': size,
+                'max_size': self.max_size, 'ttl': self.ttl}
+
+    def _remove(self, key):
+        del self._entries[key]
+        self._order.remove(key)
+
+
+def get_cache_key(method_name, args, kwargs):
+    """
+    Return cache key for a method call.
+
+    Libcloud objects (e.g. :class:`NodeLocation`) are represented by their
+    class and id so equal objects share the cache entry.
+
+    :rtype: ``tuple``
+    """
+    def to_key(value):
+        if hasattr(value, 'id') and hasattr(value, 'driver'):
+            return (value.__class__.__name__, value.id)
+
+        try:
+            hash(value)
+        except TypeError:
+            return repr(value)
+
+        return value
+
+    return (method_name,
+            tuple([to_key(value) for value in args]),
+            tuple(sorted([(name, to_key(value))
+                          for name, value in kwargs.items()])))
+
+
+def cached_method(cache, method_name, func):
+    """
+    Wrap a (bound) method so its results are stored in the cache.
+
+    Lists are copied before they are returned, so callers can't modify the
+    cached value.
+
+    :param cache: The cache.
+    :type cache: :class:`ResultCache`
+
+    :param method_name: Name of the method (used in the cache key).
+    :type method_name: ``str``
+
+    :param func: The method.
+    :type func: ``callable``
+
+    :rtype: ``callable``
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = get_cache_key(method_name, args, kwargs)
+        found, value = cache.get(key)
+
+        if not found:
+            value = func(*args, **kwargs)
+            cache.set(key, value)
+
+        if isinstance(value, list):
+            return list(value)
+
+        return value
+
+    wrapper.uncached = func
+    return wrapper
@@ -16,6 +16,7 @@
 import base64
 import hashlib
 import copy
+import time
 import hmac
 
 from libcloud.utils.py3 import httplib
@@ -53,6 +54,10 @@ class CloudStackConnection(ConnectionUserAndKey, PollingConnection):
     poll_interval = 1
     request_method = '_sync_request'
     timeout = 600
+    poll_batch_size = 100
+
+    # Maximum number of jobs returned by a single listAsyncJobs request
+    poll_batch_page_size = 500
 
     ASYNC_PENDING = 0
     ASYNC_SUCCESS = 1
@@ -112,6 +117,24 @@ class CloudStackConnection(ConnectionUserAndKey, PollingConnection):
             method=method, context=context)
         return result['jobresult']
 
+    def _async_request_future(self, command, action=None, params=None,
+                              data=None, headers=None, method='GET',
+                              context=None):
+        """
+        Non-blocking version of :meth:`_async_request` which returns a
+        future for the job result.
+        """
+        if params:
+            context = copy.deepcopy(params)
+        else:
+            context = {}
+
+        context['command'] = command
+        return self.async_request_future(
+            action=action, params=params, data=data, headers=headers,
+            method=method, context=context,
+            callback=lambda result: result['jobresult'])
+
     def get_request_kwargs(self, action, params=None, data='', headers=None,
                            method='GET', context=None):
         command = context['command']
@@ -126,6 +149,29 @@ class CloudStackConnection(ConnectionUserAndKey, PollingConnection):
         kwargs = {'command': 'queryAsyncJobResult', 'params': params}
         return kwargs
 
+    def get_batch_poll_request_kwargs(self, poll_request_kwargs,
+                                      start_time=None):
+        if len(poll_request_kwargs) > self.poll_batch_page_size:
+            return None
+
+        # listAsyncJobs returns status of all the jobs of the account, only
+        # jobs which were created after the batched ones are listed (with a
+        # margin for a clock skew between the client and the API server)
+        params = {'page': 1, 'pagesize': self.poll_batch_page_size}
+
+        if start_time is not None:
+            start_date = time.gmtime(start_time - 60)
+            params['startdate'] = time.strftime('%Y-%m-%dT%H:%M:%S+0000',
+                                                start_date)
+
+        return {'command': 'listAsyncJobs', 'params': params}
+
+    def get_batch_poll_responses(self, response, poll_request_kwargs):
+        jobs = dict([(job['jobid'], job)
+                     for job in response.get('asyncjobs', [])])
+        return [jobs.get(kwargs['params']['jobid'], None)
+                for kwargs in poll_request_kwargs]
+
     def has_completed(self, response):
         status = response.get('jobstatus', self.ASYNC_PENDING)
 
@@ -193,3 +239,13 @@ class CloudStackDriverMixIn(object):
                                               params=params, data=data,
                                               headers=headers, method=method,
                                               context=context)
+
+    def _async_request_future(self, command, action=None, params=None,
+                              data=None, headers=None, method='GET',
+                              context=None):
+        return self.connection._async_request_future(command=command,
+                                                     action=action,
+                                                     params=params, data=data,
+                                                     headers=headers,
+                                                     method=method,
+                                                     context=context)
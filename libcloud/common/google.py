@@ -77,9 +77,12 @@ import datetime
 import os
 import socket
 import sys
+import threading
 
 from libcloud.utils.connection import get_response_object
 from libcloud.utils.py3 import b, httplib, urlencode, urlparse, PY3
+from libcloud.common.token_cache import (JsonFile, TokenRefresher,
+                                         get_token_cache_key)
 from libcloud.common.base import (ConnectionUserAndKey, JsonResponse,
                                   PollingConnection)
 from libcloud.common.types import (ProviderError,
@@ -550,9 +553,12 @@ class GoogleBaseConnection(ConnectionUserAndKey, PollingConnection):
     host = 'www.googleapis.com'
     poll_interval = 2.0
     timeout = 180
+    token_cache = None
+    token_refresh_window = 300
 
     def __init__(self, user_id, key=None, auth_type=None,
-                 credential_file=None, scopes=None, **kwargs):
+                 credential_file=None, scopes=None, token_cache=None,
+                 **kwargs):
         """
         Determine authentication type, set up appropriate authentication
         connection and get initial authentication information.
@@ -585,8 +591,18 @@ class GoogleBaseConnection(ConnectionUserAndKey, PollingConnection):
         :keyword  scopes: List of OAuth2 scope URLs. The empty default sets
                           read/write access to Compute, Storage, and DNS.
         :type     scopes: ``list``
+
+        :keyword  token_cache: Cache for the authentication information
+                               which is used instead of the credential file.
+        :type     token_cache:
+                  :class:`libcloud.common.token_cache.BaseTokenCache`
         """
         self.credential_file = credential_file or '~/.gce_libcloud_auth'
+        self._token_lock = threading.Lock()
+        self._token_refresher = TokenRefresher(self._refresh_expiring_token)
+
+        if token_cache is not None:
+            self.token_cache = token_cache
 
         if auth_type is None:
             # Try to guess.
@@ -606,7 +622,9 @@ class GoogleBaseConnection(ConnectionUserAndKey, PollingConnection):
                 'https://www.googleapis.com/auth/devstorage.full_control',
                 'https://www.googleapis.com/auth/ndev.clouddns.readwrite',
             ]
-        self.token_info = self._get_token_info_from_file()
+        self._credential_file = JsonFile(self.credential_file)
+        self._token_cache_key = get_token_cache_key(user_id, *self.scopes)
+        self.token_info = self._get_stored_token_info()
 
         if auth_type == 'GCE':
             self.auth_conn = GoogleGCEServiceAcctAuthConnection(
@@ -624,11 +642,16 @@ class GoogleBaseConnection(ConnectionUserAndKey, PollingConnection):
             raise GoogleAuthError('Invalid auth_type: %s' % str(auth_type))
 
         if self.token_info is None:
-            self.token_info = self.auth_conn.get_new_token()
-            self._write_token_info_to_file()
+            with self._lock_token_info():
+                # Another process might have stored a token while we were
+                # waiting for the lock
+                self.token_info = self._get_stored_token_info()
 
-        self.token_expire_time = datetime.datetime.strptime(
-            self.token_info['expire_time'], TIMESTAMP_FORMAT)
+                if self.token_info is None:
+                    self.token_info = self.auth_conn.get_new_token()
+                    self._store_token_info()
+
+        self.token_expire_time = self._get_expire_time(self.token_info)
 
         super(GoogleBaseConnection, self).__init__(user_id, key, **kwargs)
 
@@ -653,14 +676,16 @@ class GoogleBaseConnection(ConnectionUserAndKey, PollingConnection):
         Check to make sure that token hasn't expired.  If it has, get an
         updated token.  Also, add the token to the headers.
 
+        Tokens which expire in less than ``token_refresh_window`` seconds are
+        refreshed in the background.
+
         @inherits: :class:`Connection.pre_connect_hook`
         """
-        now = self._now()
-        if self.token_expire_time < now:
-            self.token_info = self.auth_conn.refresh_token(self.token_info)
-            self.token_expire_time = datetime.datetime.strptime(
-                self.token_info['expire_time'], TIMESTAMP_FORMAT)
-            self._write_token_info_to_file()
+        if self._is_token_expiring():
+            self._refresh_token()
+        elif self._is_token_expiring(min_validity=self.token_refresh_window):
+            self._token_refresher.start()
+
         headers['Authorization'] = 'Bearer %s' % (
             self.token_info['access_token'])
 
@@ -691,6 +716,80 @@ class GoogleBaseConnection(ConnectionUserAndKey, PollingConnection):
         # One more time, then give up.
         return super(GoogleBaseConnection, self).request(*args, **kwargs)
 
+    def _is_token_expiring(self, min_validity=0):
+        expires = self._now() + datetime.timedelta(seconds=min_validity)
+        return self.token_expire_time < expires
+
+    def _get_expire_time(self, token_info):
+        return datetime.datetime.strptime(token_info['expire_time'],
+                                          TIMESTAMP_FORMAT)
+
+    def _refresh_expiring_token(self):
+        self._refresh_token(min_validity=self.token_refresh_window)
+
+    def _refresh_token(self, min_validity=0):
+        """
+        Refresh the token unless it has already been refreshed by another
+        thread or process (in which case the stored token is used).
+
+        :param min_validity: Number of seconds for which the token needs to
+                             be valid for.
+        :type min_validity: ``int``
+        """
+        with self._token_lock:
+            # Another thread might have already refreshed the token while
+            # we were waiting for the lock
+            if not self._is_token_expiring(min_validity=min_validity):
+                return
+
+            with self._lock_token_info():
+                token_info = self._get_stored_token_info()
+                expires = self._now() + \
+                    datetime.timedelta(seconds=min_validity)
+
+                if token_info is None or \
+                        self._get_expire_time(token_info) < expires:
+                    self.token_info = self.auth_conn.refresh_token(
+                        self.token_info)
+                    self._store_token_info()
+                else:
+                    self.token_info = token_info
+
+                self.token_expire_time = self._get_expire_time(
+                    self.token_info)
+
+    def _lock_token_info(self):
+        """
+        Return a context manager which makes sure only a single process at a
+        time requests a new token.
+        """
+        if self.token_cache is not None:
+            return self.token_cache.lock(self._token_cache_key)
+
+        return self._credential_file.lock()
+
+    def _get_stored_token_info(self):
+        """
+        Return token information from the token cache or the credential file
+        (if no token cache is used).
+
+        :rtype:   ``dict`` or ``None``
+        """
+        if self.token_cache is not None:
+            return self.token_cache.get(self._token_cache_key)
+
+        return self._get_token_info_from_file()
+
+    def _store_token_info(self):
+        """
+        Store token_info in the token cache or the credential file (if no
+        token cache is used).
+        """
+        if self.token_cache is not None:
+            self.token_cache.set(self._token_cache_key, self.token_info)
+        else:
+            self._write_token_info_to_file()
+
     def _get_token_info_from_file(self):
         """
         Read credential file and return token information.
@@ -698,25 +797,13 @@ class GoogleBaseConnection(ConnectionUserAndKey, PollingConnection):
         :return:  Token information dictionary, or None
         :rtype:   ``dict`` or ``None``
         """
-        token_info = None
-        filename = os.path.realpath(os.path.expanduser(self.credential_file))
-
-        try:
-            with open(filename, 'r') as f:
-                data = f.read()
-            token_info = json.loads(data)
-        except IOError:
-            pass
-        return token_info
+        return self._credential_file.read()
 
     def _write_token_info_to_file(self):
         """
-        Write token_info to credential file.
+        Atomically replace the credential file with token_info.
         """
-        filename = os.path.realpath(os.path.expanduser(self.credential_file))
-        data = json.dumps(self.token_info)
-        with open(filename, 'w') as f:
-            f.write(data)
+        self._credential_file.write(self.token_info)
 
     def has_completed(self, response):
         """
@@ -0,0 +1,266 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Facade which calls the same driver method in many regions concurrently.
+
+Example::
+
+    from libcloud.compute.drivers.ec2 import EC2NodeDriver
+    from libcloud.common.multiregion import MultiRegionDriver
+
+    driver = MultiRegionDriver(EC2NodeDriver, 'key', 'secret')
+
+    for result in driver.iterate('list_nodes'):
+        print(result.region, result.latency, result.error)
+
+    nodes = driver.list_nodes().items
+"""
+
+from __future__ import with_statement
+
+import sys
+import time
+import threading
+
+__all__ = [
+    'RegionResult',
+    'MultiRegionResults',
+    'MultiRegionDriver'
+]
+
+
+class RegionResult(object):
+    """
+    Result of a call in a single region.
+    """
+
+    def __init__(self, region, value=None, error=None, latency=None):
+        """
+        :param region: Region name.
+        :type region: ``str``
+
+        :param value: Value returned by the driver method.
+        :type value: ``object``
+
+        :param error: Exception raised by the driver method (if any).
+        :type error: ``Exception``
+
+        :param latency: Duration of the call (in seconds).
+        :type latency: ``float``
+        """
+        self.region = region
+        self.value = value
+        self.error = error
+        self.latency = latency
+
+    @property
+    def success(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.success:
+            return ('<RegionResult: region=%s, latency=%.3f, value=%r>' %
+                    (self.region, self.latency, self.value))
+
+        return ('<RegionResult: region=%s, latency=%.3f, error=%r>' %
+                (self.region, self.latency, self.error))
+
+
+class MultiRegionResults(list):
+    """
+    List of :class:`RegionResult` (one per region, in region order).
+    """
+
+    @property
+    def items(self):
+        """
+        Items returned by the successful calls merged into a single list
+        (e.g. nodes from all the regions for ``list_nodes``).
+
+        :rtype: ``list``
+        """
+        items = []
+
+        for result in self:
+            if result.success and result.value is not None:
+                items.extend(result.value)
+
+        return items
+
+    @property
+    def errors(self):
+        """
+        Exceptions of the failed calls keyed by region name.
+
+        :rtype: ``dict``
+        """
+        return dict([(result.region, result.error) for result in self
+                     if not result.success])
+
+
+class MultiRegionDriver(object):
+    """
+    Calls driver methods in multiple regions of a regional driver (e.g.
+    EC2, AWS Auto Scale or CloudWatch) using a bounded thread pool.
+
+    A single driver instance is created (on first use) for every region
+    and reused for all the following calls so the connections to the
+    regional endpoints are reused as well.
+
+    Driver methods can be called directly on the facade (e.g.
+    ``driver.list_nodes()``) which returns :class:`MultiRegionResults`.
+    """
+
+    max_concurrency = 10
+
+    def __init__(self, driver_cls, key, secret=None, regions=None,
+                 max_concurrency=None, **kwargs):
+        """
+        :param driver_cls: Driver class which accepts a ``region`` argument.
+        :type driver_cls: :class:`libcloud.common.base.BaseDriver`
+
+        :param key: API key or username.
+        :type key: ``str``
+
+        :param secret: Secret password or key.
+        :type secret: ``str``
+
+        :param regions: Names of the regions to use (defaults to all the
+                        regions returned by ``driver_cls.list_regions()``).
+        :type regions: ``list`` of ``str``
+
+        :param max_concurrency: Maximum number of concurrent calls.
+        :type max_concurrency: ``int``
+
+        Other keyword arguments are passed to the driver constructor.
+        """
+        if regions is None:
+            regions = driver_cls.list_regions()
+
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+
+        if self.max_concurrency < 1:
+            raise ValueError('max_concurrency needs to be at least 1')
+
+        self.driver_cls = driver_cls
+        self.key = key
+        self.secret = secret
+        self.regions = list(regions)
+        self.kwargs = kwargs
+
+        self._drivers = {}
+        self._lock = threading.Lock()
+
+    def get_driver(self, region):
+        """
+        Return the driver instance for the provided region.
+
+        :param region: Region name.
+        :type region: ``str``
+
+        :rtype: :class:`libcloud.common.base.BaseDriver`
+        """
+        with self._lock:
+            driver = self._drivers.get(region, None)
+
+            if driver is None:
+                driver = self.driver_cls(self.key, secret=self.secret,
+                                         region=region, **self.kwargs)
+                self._drivers[region] = driver
+
+        return driver
+
+    def iterate(self, method_name, *args, **kwargs):
+        """
+        Call the driver method in all the regions and yield the results as
+        soon as they are available (fastest region first).
+
+        :param method_name: Name of the driver method (e.g. ``list_nodes``).
+        :type method_name: ``str``
+
+        Other arguments are passed to the driver method.
+
+        :rtype: ``generator`` of :class:`RegionResult`
+        """
+        if not self.regions:
+            return
+
+        # Imported here so importing this module stays cheap
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        max_workers = min(self.max_concurrency, len(self.regions))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        futures = [executor.submit(self._call, region, method_name, args,
+                                   kwargs)
+                   for region in self.regions]
+
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Consumer might stop early, don't start calls which are not
+            # needed anymore
+            for future in futures:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+    def call(self, method_name, *args, **kwargs):
+        """
+        Call the driver method in all the regions and wait for all the
+        calls to finish.
+
+        :param method_name: Name of the driver method (e.g. ``list_nodes``).
+        :type method_name: ``str``
+
+        Other arguments are passed to the driver method.
+
+        :return: Results in the same order as :attr:`regions`.
+        :rtype: :class:`MultiRegionResults`
+        """
+        results = dict([(result.region, result) for result in
+                        self.iterate(method_name, *args, **kwargs)])
+
+        return MultiRegionResults([results[region]
+                                   for region in self.regions])
+
+    def __getattr__(self, name):
+        driver_cls = self.__dict__.get('driver_cls', None)
+
+        if name.startswith('_') or not hasattr(driver_cls, name):
+            raise AttributeError(name)
+
+        def method(*args, **kwargs):
+            return self.call(name, *args, **kwargs)
+
+        method.__name__ = name
+        return method
+
+    def _call(self, region, method_name, args, kwargs):
+        start = time.time()
+
+        try:
+            driver = self.get_driver(region)
+            value = getattr(driver, method_name)(*args, **kwargs)
+        except Exception:
+            e = sys.exc_info()[1]
+            return RegionResult(region=region, error=e,
+                                latency=time.time() - start)
+
+        return RegionResult(region=region, value=value,
+                            latency=time.time() - start)
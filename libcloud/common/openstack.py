@@ -17,6 +17,10 @@
 Common utilities for OpenStack
 """
 
+from __future__ import with_statement
+
+import threading
+
 try:
     from lxml import etree as ET
 except ImportError:
@@ -29,6 +33,7 @@ from libcloud.common.types import ProviderError
 from libcloud.compute.types import (LibcloudError, MalformedResponseError)
 from libcloud.compute.types import KeyPairDoesNotExistError
 from libcloud.common.openstack_identity import get_class_for_auth_version
+from libcloud.common.token_cache import TokenRefresher
 
 # Imports for backward compatibility reasons
 from libcloud.common.openstack_identity import OpenStackServiceCatalog
@@ -109,6 +114,15 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
     :param ex_force_service_region: Region to use when selecting an
     service.  If not specified, a provider specific default will be used.
     :type ex_force_service_region: ``str``
+
+    :param ex_token_cache: Cache in which the auth token and service catalog
+    are stored so they can be shared with other connections (and processes
+    when using :class:`libcloud.common.token_cache.FileTokenCache`).
+    :type ex_token_cache: :class:`libcloud.common.token_cache.BaseTokenCache`
+
+    :cvar token_cache: Default token cache used by all the connections.
+    :cvar token_refresh_window: A new token is requested in the background
+    once the current one expires in less than this number of seconds.
     """
 
     auth_url = None
@@ -119,6 +133,8 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
     service_type = None
     service_name = None
     service_region = None
+    token_cache = None
+    token_refresh_window = 300
     _auth_version = None
 
     def __init__(self, user_id, key, secure=True,
@@ -130,7 +146,8 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
                  ex_tenant_name=None,
                  ex_force_service_type=None,
                  ex_force_service_name=None,
-                 ex_force_service_region=None):
+                 ex_force_service_region=None,
+                 ex_token_cache=None):
         super(OpenStackBaseConnection, self).__init__(
             user_id, key, secure=secure, timeout=timeout)
 
@@ -145,6 +162,11 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
         self._ex_force_service_name = ex_force_service_name
         self._ex_force_service_region = ex_force_service_region
         self._osa = None
+        self._auth_lock = threading.Lock()
+        self._token_refresher = TokenRefresher(self._refresh_token)
+
+        if ex_token_cache is not None:
+            self.token_cache = ex_token_cache
 
         if ex_force_auth_token and not ex_force_base_url:
             raise LibcloudError(
@@ -276,28 +298,93 @@ class OpenStackBaseConnection(ConnectionUserAndKey):
             return
 
         if not osa.is_token_valid():
-            # Token is not available or it has expired. Need to retrieve a
-            # new one.
-            if self._auth_version == '2.0_apikey':
-                kwargs = {'auth_type': 'api_key'}
-            elif self._auth_version == '2.0_password':
-                kwargs = {'auth_type': 'password'}
-            else:
-                kwargs = {}
+            with self._auth_lock:
+                # Token might have already been refreshed by another thread
+                # while we were waiting for the lock
+                if not osa.is_token_valid():
+                    self._authenticate(osa=osa)
+        elif not osa.is_token_valid(min_validity=self.token_refresh_window):
+            # Token is about to expire, request a new one in the background
+            # so the requests don't need to wait for it
+            self._token_refresher.start()
 
-            osa = osa.authenticate(**kwargs)  # may throw InvalidCreds
+        url = self._ex_force_base_url or self.get_endpoint()
+        self._set_up_connection_info(url=url)
 
-            self.auth_token = osa.auth_token
-            self.auth_token_expires = osa.auth_token_expires
-            self.auth_user_info = osa.auth_user_info
+    def _refresh_token(self):
+        with self._auth_lock:
+            self._authenticate(osa=self.get_auth_class(),
+                               min_validity=self.token_refresh_window)
 
-            # Pull out and parse the service catalog
-            osc = OpenStackServiceCatalog(service_catalog=osa.urls,
-                                          auth_version=self._auth_version)
-            self.service_catalog = osc
+    def _authenticate(self, osa, min_validity=None):
+        """
+        Retrieve a new token and service catalog using the provided identity
+        connection.
 
-        url = self._ex_force_base_url or self.get_endpoint()
-        self._set_up_connection_info(url=url)
+        If a token cache is used, a valid token from the cache is used
+        instead and only a single connection at a time requests a new token
+        for the same credentials.
+
+        :param min_validity: Number of seconds for which a cached token needs
+                             to be valid for.
+        :type min_validity: ``int``
+        """
+        cache = self.token_cache
+
+        if cache is None or self._auth_version not in \
+                AUTH_VERSIONS_WITH_EXPIRES:
+            self._authenticate_with_identity_service(osa=osa)
+            return
+
+        key = osa.get_token_cache_key()
+
+        if self._load_cached_token(osa, key, min_validity):
+            return
+
+        with cache.lock(key):
+            # Another connection might have stored a new token while we were
+            # waiting for the lock
+            if self._load_cached_token(osa, key, min_validity):
+                return
+
+            osa = self._authenticate_with_identity_service(osa=osa)
+            cache.set(key, osa.get_token_info())
+
+    def _load_cached_token(self, osa, key, min_validity=None):
+        token_info = self.token_cache.get(key)
+
+        if not token_info:
+            return False
+
+        osa.set_token_info(token_info)
+
+        if not osa.is_token_valid(min_validity=min_validity):
+            return False
+
+        self._set_auth_info(osa=osa)
+        return True
+
+    def _authenticate_with_identity_service(self, osa):
+        if self._auth_version == '2.0_apikey':
+            kwargs = {'auth_type': 'api_key'}
+        elif self._auth_version == '2.0_password':
+            kwargs = {'auth_type': 'password'}
+        else:
+            kwargs = {}
+
+        osa = osa.authenticate(force=True, **kwargs)  # may throw InvalidCreds
+        self._set_auth_info(osa=osa)
+        return osa
+
+    def _set_auth_info(self, osa):
+        self.auth_token = osa.auth_token
+        self.auth_token_expires = osa.auth_token_expires
+        self.auth_user_info = osa.auth_user_info
+
+        # Pull out and parse the service catalog
+        osc = OpenStackServiceCatalog(service_catalog=osa.urls,
+                                      auth_version=self._auth_version)
+        self.service_catalog = osc
 
 
 class OpenStackException(ProviderError):
@@ -385,6 +472,7 @@ class OpenStackDriverMixin(object):
         self._ex_force_service_name = kwargs.get('ex_force_service_name', None)
         self._ex_force_service_region = kwargs.get('ex_force_service_region',
                                                    None)
+        self._ex_token_cache = kwargs.get('ex_token_cache', None)
 
     def openstack_connection_kwargs(self):
         """
@@ -408,4 +496,6 @@ class OpenStackDriverMixin(object):
             rv['ex_force_service_name'] = self._ex_force_service_name
         if self._ex_force_service_region:
             rv['ex_force_service_region'] = self._ex_force_service_region
+        if self._ex_token_cache is not None:
+            rv['ex_token_cache'] = self._ex_token_cache
         return rv
@@ -63,10 +63,18 @@ class OpenStackHeatConnection(OpenStackBaseConnection):
             '/stacks/%(stack_name)s/%(stack_id)s/template' %
             {'stack_name': stack_name, 'stack_id': stack_id}).object
 
-    def get_stack_resources(self, stack_name, stack_id):
+    def get_stack_resources(self, stack_name, stack_id, nested_depth=None):
+        params = {}
+
+        if nested_depth:
+            # Also include resources of the nested stacks (e.g. members of
+            # an OS::Heat::AutoScalingGroup)
+            params['nested_depth'] = nested_depth
+
         return self.request(
             '/stacks/%(stack_name)s/%(stack_id)s/resources' %
-            {'stack_name': stack_name, 'stack_id': stack_id}).object
+            {'stack_name': stack_name, 'stack_id': stack_id},
+            params=params).object
 
     def stack_update(self, stack_name, stack_id, template):
         DEFAULT_TIMEOUT = 600
@@ -85,3 +93,36 @@ class OpenStackHeatConnection(OpenStackBaseConnection):
             {'stack_name': stack_name, 'stack_id': stack_id},
             data=data, method='PUT')
         return pre_update_ts
+
+    def check_stack_creation(self, stack_name, stack_id):
+        """
+        Check whether creation of the stack has finished (successfully or
+        not).
+
+        :return: ``(completed, stack)`` tuple.
+        :rtype: ``tuple``
+        """
+        stack = self.get_stack(stack_name, stack_id)
+        completed = stack['stack_status'] in ['CREATE_COMPLETE',
+                                              'CREATE_FAILED']
+        return (completed, stack)
+
+    def check_stack_update(self, stack_name, stack_id, pre_update_ts):
+        """
+        Check whether update of the stack has finished (successfully or
+        not).
+
+        :param pre_update_ts: Update time of the stack before the update (as
+                              returned by :meth:`stack_update`).
+        :type pre_update_ts: :class:`datetime.datetime`
+
+        :return: ``(completed, stack)`` tuple.
+        :rtype: ``tuple``
+        """
+        stack = self.get_stack(stack_name, stack_id)
+        stack_status = stack['stack_status']
+        ts_completed = iso_to_datetime(
+            stack.get('updated_time')) > pre_update_ts
+        completed = (stack_status == 'UPDATE_COMPLETE' and ts_completed) or \
+            stack_status == 'UPDATE_FAILED'
+        return (completed, stack)
@@ -25,6 +25,7 @@ from libcloud.utils.py3 import httplib
 from libcloud.utils.iso8601 import parse_date
 
 from libcloud.common.base import ConnectionUserAndKey, Response
+from libcloud.common.token_cache import get_token_cache_key
 from libcloud.compute.types import (LibcloudError, InvalidCredsError,
                                     MalformedResponseError)
 
@@ -620,11 +621,16 @@ class OpenStackIdentityConnection(ConnectionUserAndKey):
         headers['Content-Type'] = 'application/json; charset=UTF-8'
         return headers
 
-    def is_token_valid(self):
+    def is_token_valid(self, min_validity=None):
         """
         Return True if the current auth token is already cached and hasn't
         expired yet.
 
+        :param min_validity: Number of seconds for which the token needs to
+                             be valid for (defaults to
+                             ``AUTH_TOKEN_EXPIRES_GRACE_SECONDS``).
+        :type min_validity: ``int``
+
         :return: ``True`` if the token is still valid, ``False`` otherwise.
         :rtype: ``bool``
         """
@@ -634,8 +640,11 @@ class OpenStackIdentityConnection(ConnectionUserAndKey):
         if not self.auth_token_expires:
             return False
 
+        if min_validity is None:
+            min_validity = AUTH_TOKEN_EXPIRES_GRACE_SECONDS
+
         expires = self.auth_token_expires - \
-            datetime.timedelta(seconds=AUTH_TOKEN_EXPIRES_GRACE_SECONDS)
+            datetime.timedelta(seconds=min_validity)
 
         time_tuple_expires = expires.utctimetuple()
         time_tuple_now = datetime.datetime.utcnow().utctimetuple()
@@ -655,6 +664,51 @@ class OpenStackIdentityConnection(ConnectionUserAndKey):
         """
         raise NotImplementedError('authenticate not implemented')
 
+    def get_token_cache_key(self):
+        """
+        Return key under which the token for these credentials and this
+        identity service is stored in a token cache.
+
+        :rtype: ``str``
+        """
+        return get_token_cache_key(self.auth_version, self.auth_url,
+                                   self.user_id, self.key, self.tenant_name)
+
+    def get_token_info(self):
+        """
+        Return the current token and service catalog as a dictionary which
+        can be stored in a token cache.
+
+        :rtype: ``dict``
+        """
+        expires = self.auth_token_expires
+
+        if expires is not None:
+            expires = expires.isoformat()
+
+        return {'auth_token': self.auth_token,
+                'auth_token_expires': expires,
+                'urls': self.urls,
+                'auth_user_info': self.auth_user_info}
+
+    def set_token_info(self, token_info):
+        """
+        Use the token and service catalog from a dictionary returned by
+        :meth:`get_token_info`.
+
+        :param token_info: Token information.
+        :type token_info: ``dict``
+        """
+        expires = token_info.get('auth_token_expires', None)
+
+        if expires is not None:
+            expires = parse_date(expires)
+
+        self.auth_token = token_info.get('auth_token', None)
+        self.auth_token_expires = expires
+        self.urls = token_info.get('urls', None)
+        self.auth_user_info = token_info.get('auth_user_info', None)
+
     def list_supported_versions(self):
         """
         Retrieve a list of all the identity versions which are supported by
@@ -962,6 +1016,26 @@ class OpenStackIdentity_3_0_Connection(OpenStackIdentityConnection):
         self.token_scope = token_scope
         self.auth_user_roles = None
 
+    def get_token_cache_key(self):
+        return get_token_cache_key(self.auth_version, self.auth_url,
+                                   self.user_id, self.key, self.tenant_name,
+                                   self.domain_name, self.token_scope)
+
+    def get_token_info(self):
+        token_info = super(OpenStackIdentity_3_0_Connection,
+                           self).get_token_info()
+        token_info['auth_user_roles'] = [
+            {'id': role.id, 'name': role.name,
+             'description': role.description, 'enabled': role.enabled}
+            for role in (self.auth_user_roles or [])]
+        return token_info
+
+    def set_token_info(self, token_info):
+        super(OpenStackIdentity_3_0_Connection,
+              self).set_token_info(token_info)
+        self.auth_user_roles = \
+            self._to_roles(token_info.get('auth_user_roles', []))
+
     def authenticate(self, force=False):
         """
         Perform authentication.
@@ -0,0 +1,408 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Scheduler which waits for many :class:`PollingConnection` jobs (and other
+long running operations) at once.
+"""
+
+from __future__ import with_statement
+
+import sys
+import time
+import threading
+
+from libcloud.common.types import LibcloudError
+from libcloud.utils.misc import get_backoff_delay
+
+__all__ = [
+    'PollScheduler',
+
+    'get_default_poll_scheduler'
+]
+
+
+class PollJob(object):
+    """
+    Operation which is being polled by a :class:`PollScheduler`.
+
+    Completion is determined by a ``check`` function which returns a
+    ``(completed, result)`` tuple.
+    """
+
+    # Connection of jobs which can be polled in batches
+    connection = None
+
+    def __init__(self, check, future, callback, timeout, poll_interval,
+                 description):
+        self.check = check
+        self.future = future
+        self.callback = callback
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.description = description
+        self.attempt = 0
+
+        now = time.time()
+        self.started = now
+        self.end = now + timeout
+        self.next_poll = now + poll_interval
+
+    def __repr__(self):
+        return ('<PollJob: description=%s, attempt=%s>' %
+                (self.description, self.attempt))
+
+
+class ConnectionPollJob(PollJob):
+    """
+    Async job of a :class:`PollingConnection`.
+    """
+
+    def __init__(self, connection, poll_kwargs, future, callback, timeout):
+        super(ConnectionPollJob, self).__init__(
+            check=self._check, future=future, callback=callback,
+            timeout=timeout, poll_interval=connection.poll_interval,
+            description='Job')
+        self.connection = connection
+        self.poll_kwargs = poll_kwargs
+
+    def __repr__(self):
+        return ('<ConnectionPollJob: poll_kwargs=%r, attempt=%s>' %
+                (self.poll_kwargs, self.attempt))
+
+    def get_result(self, response):
+        """
+        Return ``(completed, response)`` for a status check response.
+        """
+        return self.connection.has_completed(response=response), response
+
+    def _check(self):
+        request = getattr(self.connection, self.connection.request_method)
+        return self.get_result(request(**self.poll_kwargs))
+
+
+class PollScheduler(object):
+    """
+    Waits for many outstanding async jobs using a single background thread.
+
+    Jobs are either async jobs of a :class:`PollingConnection` (see
+    :meth:`submit`) or any other operations which are checked by calling a
+    function (see :meth:`wait`).
+
+    Poll interval of each job starts at ``poll_interval`` (e.g.
+    ``connection.poll_interval``) and grows exponentially (with jitter) up
+    to ``max_poll_interval`` seconds.
+
+    If the connection supports it (see
+    :attr:`PollingConnection.poll_batch_size`), status of many jobs is
+    retrieved with a single request.
+
+    The background thread is started on demand and exits once there are no
+    more outstanding jobs.
+    """
+
+    max_poll_interval = 30
+    backoff_factor = 1.5
+
+    def __init__(self, max_poll_interval=None, backoff_factor=None):
+        """
+        :param max_poll_interval: Maximum number of seconds between two
+                                  status checks of the same job.
+        :type max_poll_interval: ``float``
+
+        :param backoff_factor: Factor by which the poll interval grows after
+                               every status check.
+        :type backoff_factor: ``float``
+        """
+        if max_poll_interval is not None:
+            self.max_poll_interval = max_poll_interval
+
+        if backoff_factor is not None:
+            self.backoff_factor = backoff_factor
+
+        self._jobs = []
+        self._condition = threading.Condition()
+        self._thread = None
+
+    @property
+    def pending_jobs(self):
+        """
+        Number of jobs which haven't completed yet.
+        """
+        with self._condition:
+            return len(self._jobs)
+
+    def submit(self, connection, action, params=None, data=None,
+               headers=None, method='GET', context=None, callback=None):
+        """
+        Start an async job and return a future for its result.
+
+        The initial request is performed in the calling thread, status checks
+        are performed by the scheduler thread.
+
+        Arguments have the same meaning as the ones of
+        :meth:`PollingConnection.async_request`.
+
+        :param connection: Connection which is used to start and poll the job.
+        :type connection: :class:`PollingConnection`
+
+        :param callback: Optional function which is called with the final
+                         poll response. The return value is used as the
+                         future result.
+        :type callback: ``callable``
+
+        :return: Future which is resolved with the final poll response (or
+                 ``callback`` return value) once the job has completed.
+        :rtype: :class:`concurrent.futures.Future`
+        """
+        future = self._create_future()
+
+        request = getattr(connection, connection.request_method)
+
+        try:
+            kwargs = connection.get_request_kwargs(action=action,
+                                                   params=params, data=data,
+                                                   headers=headers,
+                                                   method=method,
+                                                   context=context)
+            response = request(**kwargs)
+            poll_kwargs = connection.get_poll_request_kwargs(
+                response=response, context=context, request_kwargs=kwargs)
+        except Exception:
+            future.set_exception(sys.exc_info()[1])
+            return future
+
+        job = ConnectionPollJob(connection=connection, poll_kwargs=poll_kwargs,
+                                future=future, callback=callback,
+                                timeout=connection.timeout)
+        self._add_job(job)
+        return future
+
+    def wait(self, check, timeout, poll_interval=5, callback=None,
+             description='Operation'):
+        """
+        Wait for an operation (e.g. creation of a scale group) to complete.
+
+        The first check is performed right away in the calling thread, the
+        following ones by the scheduler thread.
+
+        :param check: Function which returns a ``(completed, result)`` tuple.
+                      Exceptions raised by the function are propagated to
+                      the returned future.
+        :type check: ``callable``
+
+        :param timeout: Number of seconds after which the wait fails with
+                        :class:`LibcloudError`.
+        :type timeout: ``int``
+
+        :param poll_interval: Initial number of seconds between two checks.
+        :type poll_interval: ``float``
+
+        :param callback: Optional function which is called with the ``check``
+                         result once the operation has completed. The return
+                         value is used as the future result.
+        :type callback: ``callable``
+
+        :param description: Description of the operation used in the timeout
+                            error message.
+        :type description: ``str``
+
+        :return: Future which is resolved with the ``check`` result (or
+                 ``callback`` return value) once the operation has completed.
+        :rtype: :class:`concurrent.futures.Future`
+        """
+        future = self._create_future()
+
+        job = PollJob(check=check, future=future, callback=callback,
+                      timeout=timeout, poll_interval=poll_interval,
+                      description=description)
+        self._poll_job(job)
+
+        if not future.done():
+            self._add_job(job)
+
+        return future
+
+    def _create_future(self):
+        # Imported here since the compute drivers import this module
+        from concurrent.futures import Future
+
+        future = Future()
+        future.set_running_or_notify_cancel()
+        return future
+
+    def _add_job(self, job):
+        with self._condition:
+            self._jobs.append(job)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+
+            self._condition.notify()
+
+    def _run(self):
+        try:
+            while True:
+                with self._condition:
+                    if not self._jobs:
+                        self._thread = None
+                        return
+
+                    now = time.time()
+                    due = [job for job in self._jobs if job.next_poll <= now]
+
+                    if not due:
+                        next_poll = min([job.next_poll for job in self._jobs])
+                        self._condition.wait(next_poll - now)
+                        continue
+
+                    # Jobs which can be batched and are due soon are polled
+                    # early so their status is retrieved using the same
+                    # request
+                    due.extend([job for job in self._jobs
+                                if job.next_poll > now and
+                                job.connection is not None and
+                                job.connection.poll_batch_size and
+                                job.next_poll <= now + job.poll_interval])
+
+                try:
+                    self._poll_jobs(due)
+                except Exception:
+                    # Unexpected error (e.g. in the batching logic), fail
+                    # the affected jobs instead of leaving them pending
+                    self._fail_jobs(due, sys.exc_info()[1])
+
+                with self._condition:
+                    self._jobs = [job for job in self._jobs
+                                  if not job.future.done()]
+        finally:
+            with self._condition:
+                if self._thread is threading.current_thread():
+                    # Loop has exited unexpectedly, next submit() starts a
+                    # new thread
+                    self._thread = None
+
+    def _fail_jobs(self, jobs, error):
+        for job in jobs:
+            if not job.future.done():
+                job.future.set_exception(error)
+
+    def _poll_jobs(self, jobs):
+        groups = {}
+
+        for job in jobs:
+            connection = job.connection
+
+            if connection is not None and connection.poll_batch_size and \
+                    len(jobs) > 1:
+                key = (id(connection),
+                       connection.get_poll_batch_key(job.poll_kwargs))
+            else:
+                key = (id(job), None)
+
+            groups.setdefault(key, []).append(job)
+
+        for group in groups.values():
+            connection = group[0].connection
+            batch_size = 1
+
+            if connection is not None and connection.poll_batch_size:
+                batch_size = connection.poll_batch_size
+
+            for index in range(0, len(group), batch_size):
+                batch = group[index:index + batch_size]
+
+                if len(batch) == 1:
+                    self._poll_job(batch[0])
+                else:
+                    self._poll_batch(batch)
+
+    def _poll_batch(self, jobs):
+        connection = jobs[0].connection
+        poll_kwargs = [job.poll_kwargs for job in jobs]
+
+        try:
+            request = getattr(connection, connection.request_method)
+            kwargs = connection.get_batch_poll_request_kwargs(
+                poll_kwargs, start_time=min([job.started for job in jobs]))
+
+            if kwargs is None:
+                responses = [None] * len(jobs)
+            else:
+                responses = connection.get_batch_poll_responses(
+                    response=request(**kwargs),
+                    poll_request_kwargs=poll_kwargs)
+        except Exception:
+            # Fall back to the per job status checks
+            responses = [None] * len(jobs)
+
+        for job, response in zip(jobs, responses):
+            if response is None:
+                self._poll_job(job)
+            else:
+                self._handle_result(job, lambda: job.get_result(response))
+
+    def _poll_job(self, job):
+        self._handle_result(job, job.check)
+
+    def _handle_result(self, job, get_result):
+        try:
+            completed, result = get_result()
+
+            if completed:
+                if job.callback:
+                    result = job.callback(result)
+
+                job.future.set_result(result)
+                return
+        except Exception:
+            job.future.set_exception(sys.exc_info()[1])
+            return
+
+        now = time.time()
+
+        if now >= job.end:
+            error = LibcloudError('%s did not complete in %s seconds' %
+                                  (job.description, job.timeout))
+            job.future.set_exception(error)
+            return
+
+        delay = get_backoff_delay(attempt=job.attempt,
+                                  initial_delay=job.poll_interval,
+                                  max_delay=self.max_poll_interval,
+                                  factor=self.backoff_factor)
+        job.attempt += 1
+        job.next_poll = min(now + delay, job.end)
+
+
+_default_scheduler = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_poll_scheduler():
+    """
+    Return the poll scheduler which is shared by all the connections.
+
+    :rtype: :class:`PollScheduler`
+    """
+    global _default_scheduler
+
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = PollScheduler()
+
+    return _default_scheduler
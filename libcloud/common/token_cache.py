@@ -0,0 +1,325 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Caches for authentication tokens which can be shared between connections
+(and with :class:`FileTokenCache` also between processes).
+"""
+
+from __future__ import with_statement
+
+import os
+import sys
+import errno
+import hashlib
+import tempfile
+import threading
+
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, only threads are synchronized there
+    fcntl = None
+
+try:
+    import simplejson as json
+except ImportError:
+    import json
+
+from libcloud.utils.py3 import b
+
+__all__ = [
+    'BaseTokenCache',
+    'MemoryTokenCache',
+    'FileTokenCache',
+    'JsonFile',
+    'TokenRefresher',
+
+    'get_token_cache_key'
+]
+
+
+def get_token_cache_key(*parts):
+    """
+    Return a cache key for the provided parts (e.g. auth URL, user and key).
+
+    The key is a hash so secrets which are part of it are not exposed.
+
+    :rtype: ``str``
+    """
+    value = '\x00'.join([str(part) for part in parts])
+    return hashlib.sha256(b(value)).hexdigest()
+
+
+class BaseTokenCache(object):
+    """
+    Base class for token caches.
+
+    Values are dictionaries which can be serialized to JSON.
+    """
+
+    def get(self, key):
+        """
+        Return the cached value or ``None`` if there is no value for the key.
+
+        :rtype: ``dict``
+        """
+        raise NotImplementedError('get not implemented for this cache')
+
+    def set(self, key, value):
+        """
+        Store the value in the cache.
+        """
+        raise NotImplementedError('set not implemented for this cache')
+
+    def delete(self, key):
+        """
+        Remove the value from the cache.
+        """
+        raise NotImplementedError('delete not implemented for this cache')
+
+    def lock(self, key):
+        """
+        Return a context manager which holds an exclusive lock for the key.
+
+        It's used to make sure only a single client requests a new token
+        while others wait and then use the cached one.
+        """
+        raise NotImplementedError('lock not implemented for this cache')
+
+
+class MemoryTokenCache(BaseTokenCache):
+    """
+    Token cache which is shared by the connections in the current process.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._values.get(key, None)
+
+        if value is not None:
+            value = dict(value)
+
+        return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._values[key] = dict(value)
+
+    def delete(self, key):
+        with self._lock:
+            self._values.pop(key, None)
+
+    def lock(self, key):
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.RLock())
+
+        return lock
+
+
+class JsonFile(object):
+    """
+    JSON file which is written atomically and can be locked across
+    processes.
+
+    Files are only readable by the current user since they contain
+    authentication tokens.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Path to the file (``~`` is expanded).
+        :type path: ``str``
+        """
+        self.path = os.path.realpath(os.path.expanduser(path))
+        self._thread_lock = threading.RLock()
+
+    def read(self):
+        """
+        Return the parsed file content or ``None`` if the file doesn't exist
+        or is not valid.
+
+        :rtype: ``dict``
+        """
+        try:
+            with open(self.path, 'r') as fp:
+                return json.loads(fp.read())
+        except (IOError, OSError, ValueError):
+            return None
+
+    def write(self, data):
+        """
+        Atomically replace the file content.
+
+        :param data: Data which can be serialized to JSON.
+        :type data: ``dict``
+        """
+        directory = os.path.dirname(self.path)
+        self._create_directory(directory)
+
+        # Data is written to a temporary file which is then renamed so other
+        # processes never see a partially written file
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                fp.write(json.dumps(data))
+
+            _replace(temp_path, self.path)
+        except Exception:
+            e = sys.exc_info()[1]
+
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+            raise e
+
+    def delete(self):
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    @contextmanager
+    def lock(self):
+        """
+        Hold an exclusive lock on the file (a separate ``.lock`` file is used
+        since the file itself is replaced on write).
+        """
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+
+            self._create_directory(os.path.dirname(self.path))
+            fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 384)
+
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+    def _create_directory(self, directory):
+        try:
+            os.makedirs(directory, 448)
+        except OSError:
+            e = sys.exc_info()[1]
+
+            if e.errno != errno.EEXIST:
+                raise e
+
+
+class FileTokenCache(BaseTokenCache):
+    """
+    Token cache which stores every value in a separate file in the provided
+    directory so it can be shared by multiple processes.
+    """
+
+    directory = '~/.libcloud/tokens'
+
+    def __init__(self, directory=None):
+        """
+        :param directory: Directory where the tokens are stored.
+        :type directory: ``str``
+        """
+        if directory is not None:
+            self.directory = directory
+
+        self._files = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self._get_file(key).read()
+
+    def set(self, key, value):
+        self._get_file(key).write(value)
+
+    def delete(self, key):
+        self._get_file(key).delete()
+
+    def lock(self, key):
+        return self._get_file(key).lock()
+
+    def _get_file(self, key):
+        with self._lock:
+            if key not in self._files:
+                path = os.path.join(self.directory, '%s.json' % (key))
+                self._files[key] = JsonFile(path)
+
+            return self._files[key]
+
+
+class TokenRefresher(object):
+    """
+    Runs the provided function in a background thread, making sure only a
+    single refresh is in progress at a time.
+    """
+
+    def __init__(self, func):
+        """
+        :param func: Function which refreshes the token.
+        :type func: ``callable``
+        """
+        self.func = func
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Start the refresh unless one is already in progress.
+
+        :return: ``True`` if a new refresh has been started.
+        :rtype: ``bool``
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+
+        return True
+
+    def join(self, timeout=None):
+        thread = self._thread
+
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self):
+        try:
+            self.func()
+        except Exception:
+            # The current token is still valid. If the refresh keeps failing,
+            # the token is refreshed synchronously once it expires.
+            pass
+
+
+def _replace(source, destination):
+    # os.rename doesn't overwrite existing files on Windows
+    replace = getattr(os, 'replace', os.rename)
+    replace(source, destination)
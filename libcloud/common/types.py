@@ -21,6 +21,7 @@ __all__ = [
     "ProviderError",
     "InvalidCredsError",
     "InvalidCredsException",
+    "RateLimitReachedError",
     "LazyList"
 ]
 
@@ -100,6 +101,20 @@ class InvalidCredsError(ProviderError):
 InvalidCredsException = InvalidCredsError
 
 
+class RateLimitReachedError(ProviderError):
+    """
+    Exception used when a provider throttles requests because the API rate
+    limit has been reached.
+    """
+
+    def __init__(self, value='Rate limit reached', retry_after=None,
+                 driver=None):
+        # HTTP 429 Too Many Requests
+        super(RateLimitReachedError, self).__init__(value, http_code=429,
+                                                    driver=driver)
+        self.retry_after = retry_after
+
+
 class LazyList(object):
 
     def __init__(self, get_more, value_dict=None):
@@ -34,6 +34,7 @@ from libcloud.pricing import get_size_price
 from libcloud.compute.types import NodeState, StorageVolumeState,\
     DeploymentError
 from libcloud.compute.ssh import SSHClient
+from libcloud.compute.bulk import BulkExecutor
 from libcloud.common.base import ConnectionKey
 from libcloud.common.base import BaseDriver
 from libcloud.common.types import LibcloudError
@@ -41,6 +42,8 @@ from libcloud.compute.ssh import have_paramiko
 
 from libcloud.utils.networking import is_private_subnet
 from libcloud.utils.networking import is_valid_ip_address
+from libcloud.utils.misc import get_backoff_delay
+from libcloud.utils.misc import lazy_dict_property, SlotsMixin
 
 if have_paramiko:
     from paramiko.ssh_exception import SSHException
@@ -79,11 +82,18 @@ __all__ = [
 ]
 
 
-class UuidMixin(object):
+class UuidMixin(SlotsMixin):
     """
     Mixin class for get_uuid function.
+
+    The base classes store their attributes in ``__slots__`` to reduce the
+    memory usage when a lot of objects are kept around. Other attributes can
+    still be set on the objects, the ``__dict__`` is only created in that
+    case.
     """
 
+    __slots__ = ('_uuid', '__dict__', '__weakref__')
+
     def __init__(self):
         self._uuid = None
 
@@ -166,6 +176,11 @@ class Node(UuidMixin):
     {'foo': 'bar'}
     """
 
+    __slots__ = ('id', 'name', 'state', 'public_ips', 'private_ips',
+                 'driver', 'size', 'image', '_extra')
+
+    extra = lazy_dict_property('_extra')
+
     def __init__(self, id, name, state, public_ips, private_ips,
                  driver, size=None, image=None, extra=None):
         """
@@ -206,7 +221,7 @@ class Node(UuidMixin):
         self.driver = driver
         self.size = size
         self.image = image
-        self.extra = extra or {}
+        self._extra = extra or None
         UuidMixin.__init__(self)
 
     def reboot(self):
@@ -286,6 +301,11 @@ class NodeSize(UuidMixin):
     4
     """
 
+    __slots__ = ('id', 'name', 'ram', 'disk', 'bandwidth', 'price', 'driver',
+                 '_extra')
+
+    extra = lazy_dict_property('_extra')
+
     def __init__(self, id, name, ram, disk, bandwidth, price,
                  driver, extra=None):
         """
@@ -321,7 +341,7 @@ class NodeSize(UuidMixin):
         self.bandwidth = bandwidth
         self.price = price
         self.driver = driver
-        self.extra = extra or {}
+        self._extra = extra or None
         UuidMixin.__init__(self)
 
     def __repr__(self):
@@ -353,6 +373,10 @@ class NodeImage(UuidMixin):
     >>> node = driver.create_node(image=image)
     """
 
+    __slots__ = ('id', 'name', 'driver', '_extra')
+
+    extra = lazy_dict_property('_extra')
+
     def __init__(self, id, name, driver, extra=None):
         """
         :param id: Image ID.
@@ -371,7 +395,7 @@ class NodeImage(UuidMixin):
         self.id = str(id)
         self.name = name
         self.driver = driver
-        self.extra = extra or {}
+        self._extra = extra or None
         UuidMixin.__init__(self)
 
     def __repr__(self):
@@ -463,6 +487,8 @@ class StorageVolume(UuidMixin):
     A base StorageVolume class to derive from.
     """
 
+    __slots__ = ('id', 'name', 'size', 'driver', 'extra', 'state')
+
     def __init__(self, id, name, size, driver,
                  state=None, extra=None):
         """
@@ -662,6 +688,19 @@ class NodeDriver(BaseDriver):
 
     NODE_STATE_MAP = {}
 
+    # Maximum number of concurrent requests performed by the ex_bulk_*
+    # methods. Drivers for providers with strict API rate limits should
+    # lower it.
+    bulk_max_concurrency = 10
+
+    # Catalog methods which results are cached once enable_cache is called
+    cacheable_methods = ('list_sizes', 'list_images', 'list_locations')
+    cache_invalidating_methods = {
+        'create_image': ('list_images', ),
+        'delete_image': ('list_images', ),
+        'copy_image': ('list_images', )
+    }
+
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
                  api_version=None, **kwargs):
         super(NodeDriver, self).__init__(key=key, secret=secret, secure=secure,
@@ -978,6 +1017,67 @@ class NodeDriver(BaseDriver):
         raise NotImplementedError(
             'destroy_node not implemented for this driver')
 
+    def ex_bulk_create_nodes(self, nodes_kwargs, max_concurrency=None):
+        """
+        Create multiple nodes at once.
+
+        By default ``create_node`` is called for each node using a bounded
+        thread pool. Drivers for providers which support creating multiple
+        nodes in a single request can override this method.
+
+        :param nodes_kwargs: ``create_node`` keyword arguments for each node.
+        :type nodes_kwargs: ``list`` of ``dict``
+
+        :param max_concurrency: Maximum number of concurrent requests
+                                (defaults to ``bulk_max_concurrency``).
+        :type max_concurrency: ``int``
+
+        :return: Result for each node in the same order as ``nodes_kwargs``.
+                 ``value`` of a successful result is the created node.
+        :rtype: ``list`` of :class:`libcloud.compute.bulk.BulkResult`
+        """
+        executor = self._get_bulk_executor(max_concurrency=max_concurrency)
+        return executor.map(lambda kwargs: self.create_node(**kwargs),
+                            nodes_kwargs)
+
+    def ex_bulk_reboot_nodes(self, nodes, max_concurrency=None):
+        """
+        Reboot multiple nodes at once.
+
+        :param nodes: Nodes to be rebooted.
+        :type nodes: ``list`` of :class:`.Node`
+
+        :param max_concurrency: Maximum number of concurrent requests
+                                (defaults to ``bulk_max_concurrency``).
+        :type max_concurrency: ``int``
+
+        :return: Result for each node in the same order as ``nodes``.
+        :rtype: ``list`` of :class:`libcloud.compute.bulk.BulkResult`
+        """
+        executor = self._get_bulk_executor(max_concurrency=max_concurrency)
+        return executor.map(self.reboot_node, nodes)
+
+    def ex_bulk_destroy_nodes(self, nodes, max_concurrency=None):
+        """
+        Destroy multiple nodes at once.
+
+        :param nodes: Nodes to be destroyed.
+        :type nodes: ``list`` of :class:`.Node`
+
+        :param max_concurrency: Maximum number of concurrent requests
+                                (defaults to ``bulk_max_concurrency``).
+        :type max_concurrency: ``int``
+
+        :return: Result for each node in the same order as ``nodes``.
+        :rtype: ``list`` of :class:`libcloud.compute.bulk.BulkResult`
+        """
+        executor = self._get_bulk_executor(max_concurrency=max_concurrency)
+        return executor.map(self.destroy_node, nodes)
+
+    def _get_bulk_executor(self, max_concurrency=None):
+        max_concurrency = max_concurrency or self.bulk_max_concurrency
+        return BulkExecutor(max_concurrency=max_concurrency)
+
     ##
     # Volume and snapshot management methods
     ##
@@ -1261,7 +1361,8 @@ class NodeDriver(BaseDriver):
             'delete_key_pair not implemented for this driver')
 
     def wait_until_running(self, nodes, wait_period=3, timeout=600,
-                           ssh_interface='public_ips', force_ipv4=True):
+                           ssh_interface='public_ips', force_ipv4=True,
+                           max_wait_period=30):
         """
         Block until the provided nodes are considered running.
 
@@ -1271,8 +1372,10 @@ class NodeDriver(BaseDriver):
         :param nodes: List of nodes to wait for.
         :type nodes: ``list`` of :class:`.Node`
 
-        :param wait_period: How many seconds to wait between each loop
-                            iteration. (default is 3)
+        :param wait_period: How many seconds to wait before the first
+                            retry. The wait period grows exponentially
+                            (with jitter) up to ``max_wait_period`` seconds
+                            for every following iteration. (default is 3)
         :type wait_period: ``int``
 
         :param timeout: How many seconds to wait before giving up.
@@ -1287,10 +1390,43 @@ class NodeDriver(BaseDriver):
         :param force_ipv4: Ignore IPv6 addresses (default is True).
         :type force_ipv4: ``bool``
 
+        :param max_wait_period: Maximum number of seconds to wait between
+                                two iterations. (default is 30)
+        :type max_wait_period: ``int``
+
         :return: ``[(Node, ip_addresses)]`` list of tuple of Node instance and
                  list of ip_address on success.
         :rtype: ``list`` of ``tuple``
         """
+        uuids = [node.uuid for node in nodes]
+        result = self.iterate_until_running(nodes=nodes,
+                                            wait_period=wait_period,
+                                            timeout=timeout,
+                                            ssh_interface=ssh_interface,
+                                            force_ipv4=force_ipv4,
+                                            max_wait_period=max_wait_period)
+
+        # Preserve the order of the provided nodes
+        return sorted(result, key=lambda item: uuids.index(item[0].uuid))
+
+    def iterate_until_running(self, nodes, wait_period=3, timeout=600,
+                              ssh_interface='public_ips', force_ipv4=True,
+                              max_wait_period=30):
+        """
+        Wait until the provided nodes are considered running and yield each
+        node as soon as it's running.
+
+        Only the nodes which are still pending are queried on each iteration
+        (see :meth:`_refresh_nodes`). This means nodes which belong to many
+        different groups can be waited on at the same time.
+
+        Takes the same arguments as :meth:`wait_until_running`.
+
+        :return: Generator which yields ``(Node, ip_addresses)`` tuples.
+                 :class:`LibcloudError` is raised if some of the nodes are
+                 not running after ``timeout`` seconds.
+        :rtype: ``generator``
+        """
         def is_supported(address):
             """
             Return True for supported address.
@@ -1313,34 +1449,54 @@ class NodeDriver(BaseDriver):
         start = time.time()
         end = start + timeout
 
-        uuids = set([node.uuid for node in nodes])
+        pending = dict([(node.uuid, node) for node in nodes])
+        attempt = 0
 
         while time.time() < end:
-            all_nodes = self.list_nodes()
-            matching_nodes = list([node for node in all_nodes
-                                   if node.uuid in uuids])
+            matching_nodes = [node for node in
+                              self._refresh_nodes(list(pending.values()))
+                              if node.uuid in pending]
+            found_uuids = [node.uuid for node in matching_nodes]
 
-            if len(matching_nodes) > len(uuids):
-                found_uuids = [node.uuid for node in matching_nodes]
+            if len(found_uuids) != len(set(found_uuids)):
                 msg = ('Unable to match specified uuids ' +
-                       '(%s) with existing nodes. Found ' % (uuids) +
+                       '(%s) with existing nodes. Found ' % (set(pending)) +
                        'multiple nodes with same uuid: (%s)' % (found_uuids))
                 raise LibcloudError(value=msg, driver=self)
 
-            running_nodes = [node for node in matching_nodes
-                             if node.state == NodeState.RUNNING]
-            addresses = [filter_addresses(getattr(node, ssh_interface))
-                         for node in running_nodes]
+            for node in matching_nodes:
+                if node.state == NodeState.RUNNING:
+                    del pending[node.uuid]
+                    yield (node, filter_addresses(getattr(node,
+                                                          ssh_interface)))
 
-            if len(running_nodes) == len(uuids) == len(addresses):
-                return list(zip(running_nodes, addresses))
-            else:
-                time.sleep(wait_period)
-                continue
+            if not pending:
+                return
+
+            time.sleep(get_backoff_delay(attempt=attempt,
+                                         initial_delay=wait_period,
+                                         max_delay=max_wait_period))
+            attempt += 1
 
         raise LibcloudError(value='Timed out after %s seconds' % (timeout),
                             driver=self)
 
+    def _refresh_nodes(self, nodes):
+        """
+        Return up to date :class:`.Node` objects for the provided nodes.
+
+        The default implementation lists all the nodes and filters them on
+        the client side. Drivers which can retrieve only particular nodes
+        should override this method.
+
+        :param nodes: Nodes to refresh.
+        :type nodes: ``list`` of :class:`.Node`
+
+        :rtype: ``list`` of :class:`.Node`
+        """
+        uuids = set([node.uuid for node in nodes])
+        return [node for node in self.list_nodes() if node.uuid in uuids]
+
     def _get_and_check_auth(self, auth):
         """
         Helper function for providers supporting :class:`.NodeAuthPassword` or
@@ -0,0 +1,150 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers for performing the same driver operation on many items at once.
+"""
+
+from __future__ import with_statement
+
+import sys
+import time
+
+from libcloud.common.types import RateLimitReachedError
+
+__all__ = [
+    'BulkResult',
+    'BulkExecutor'
+]
+
+
+class BulkResult(object):
+    """
+    Result of a single item of a bulk operation.
+    """
+
+    def __init__(self, item, value=None, error=None):
+        """
+        :param item: Item (e.g. node or ``create_node`` keyword arguments)
+                     the operation was performed on.
+        :type item: ``object``
+
+        :param value: Value returned by the operation.
+        :type value: ``object``
+
+        :param error: Exception raised by the operation (if any).
+        :type error: ``Exception``
+        """
+        self.item = item
+        self.value = value
+        self.error = error
+
+    @property
+    def success(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.success:
+            return ('<BulkResult: item=%r, value=%r>' %
+                    (self.item, self.value))
+
+        return '<BulkResult: item=%r, error=%r>' % (self.item, self.error)
+
+
+class BulkExecutor(object):
+    """
+    Calls a function for many items using a bounded thread pool.
+
+    Calls which fail because the provider rate limit has been reached are
+    retried with an exponential back-off (or after the delay indicated by
+    the provider).
+    """
+
+    max_concurrency = 10
+    max_retries = 3
+    retry_delay = 1
+
+    def __init__(self, max_concurrency=None, max_retries=None,
+                 retry_delay=None):
+        """
+        :param max_concurrency: Maximum number of concurrent calls.
+        :type max_concurrency: ``int``
+
+        :param max_retries: Maximum number of retries for calls which fail
+                            with :class:`RateLimitReachedError`.
+        :type max_retries: ``int``
+
+        :param retry_delay: Initial retry delay (in seconds).
+        :type retry_delay: ``float``
+        """
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+
+        if max_retries is not None:
+            self.max_retries = max_retries
+
+        if retry_delay is not None:
+            self.retry_delay = retry_delay
+
+        if self.max_concurrency < 1:
+            raise ValueError('max_concurrency needs to be at least 1')
+
+    def map(self, func, items):
+        """
+        Call ``func`` for every item.
+
+        :param func: Function which is called with a single item.
+        :type func: ``callable``
+
+        :param items: Items to call the function for.
+        :type items: ``list``
+
+        :return: Results in the same order as the provided items.
+        :rtype: ``list`` of :class:`BulkResult`
+        """
+        items = list(items)
+
+        if not items:
+            return []
+
+        # Imported here since all the compute drivers import this module
+        from concurrent.futures import ThreadPoolExecutor
+
+        max_workers = min(self.max_concurrency, len(items))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._call, func, item)
+                       for item in items]
+
+        return [future.result() for future in futures]
+
+    def _call(self, func, item):
+        retries = 0
+
+        while True:
+            try:
+                return BulkResult(item=item, value=func(item))
+            except RateLimitReachedError:
+                e = sys.exc_info()[1]
+
+                if retries >= self.max_retries:
+                    return BulkResult(item=item, error=e)
+
+                delay = e.retry_after or self.retry_delay * (2 ** retries)
+                retries += 1
+                time.sleep(delay)
+            except Exception:
+                e = sys.exc_info()[1]
+                return BulkResult(item=item, error=e)
@@ -31,17 +31,19 @@ except ImportError:
 from libcloud.utils.py3 import b, basestring, ensure_string
 
 from libcloud.utils.xml import fixxpath, findtext, findattr, findall
+from libcloud.utils.xml import iterfindall
 from libcloud.utils.publickey import get_pubkey_ssh2_fingerprint
 from libcloud.utils.publickey import get_pubkey_comment
 from libcloud.utils.iso8601 import parse_date
 from libcloud.common.aws import AWSBaseResponse, SignedAWSConnection
 from libcloud.common.aws import DEFAULT_SIGNATURE_VERSION
 from libcloud.common.types import (InvalidCredsError, MalformedResponseError,
-                                   LibcloudError)
+                                   LibcloudError, RateLimitReachedError)
 from libcloud.compute.providers import Provider
 from libcloud.compute.base import Node, NodeDriver, NodeLocation, NodeSize
 from libcloud.compute.base import NodeImage, StorageVolume, VolumeSnapshot
 from libcloud.compute.base import KeyPair
+from libcloud.compute.bulk import BulkResult
 from libcloud.compute.types import NodeState, KeyPairDoesNotExistError, \
     StorageVolumeState
 
@@ -1754,6 +1756,9 @@ class EC2Response(AWSBaseResponse):
                 raise InvalidCredsError(err_list[-1])
             if code.text == 'IdempotentParameterMismatch':
                 raise IdempotentParamError(err_list[-1])
+            if code.text in ['RequestLimitExceeded', 'Throttling']:
+                raise RateLimitReachedError(err_list[-1],
+                                            driver=self.connection.driver)
             if code.text == 'InvalidKeyPair.NotFound':
                 # TODO: Use connection context instead
                 match = re.match(r'.*\'(.+?)\'.*', message.text)
@@ -2087,8 +2092,18 @@ class BaseEC2NodeDriver(NodeDriver):
     connectionCls = EC2Connection
     features = {'create_node': ['ssh_key']}
     path = '/'
+    supports_async = True
+
+    # Maximum number of instances which are launched, rebooted or terminated
+    # with a single request by the ex_bulk_* methods
+    bulk_batch_size = 100
     signature_version = DEFAULT_SIGNATURE_VERSION
 
+    # Number of items (MaxResults) requested per page by the list and iterate
+    # methods which support pagination. None means the API returns all the
+    # items in a single response.
+    page_size = None
+
     NODE_STATE_MAP = {
         'pending': NodeState.PENDING,
         'running': NodeState.RUNNING,
@@ -2124,29 +2139,59 @@ class BaseEC2NodeDriver(NodeDriver):
 
         :rtype: ``list`` of :class:`Node`
         """
+        nodes = list(self.ex_iterate_nodes(ex_node_ids=ex_node_ids,
+                                           ex_filters=ex_filters))
+
+        nodes_elastic_ips_mappings = self.ex_describe_addresses(nodes)
+
+        for node in nodes:
+            ips = nodes_elastic_ips_mappings[node.id]
+            node.public_ips.extend(ips)
+
+        return nodes
+
+    def ex_iterate_nodes(self, ex_node_ids=None, ex_filters=None,
+                         ex_page_size=None, ex_prefetch=False):
+        """
+        Return a generator which yields nodes as the response is parsed.
+
+        The response is parsed incrementally so the whole document is never
+        kept in memory and the following pages are requested as needed.
+        Unlike :meth:`list_nodes`, Elastic IP addresses are not looked up.
 
+        :param      ex_node_ids: List of ``node.id``
+        :type       ex_node_ids: ``list`` of ``str``
+
+        :param      ex_filters: The filters so that the response includes
+                             information for only certain nodes.
+        :type       ex_filters: ``dict``
+
+        :param      ex_page_size: Number of nodes requested per page
+                                  (defaults to ``page_size``). Ignored when
+                                  ``ex_node_ids`` is provided.
+        :type       ex_page_size: ``int``
+
+        :param      ex_prefetch: Request the next page in the background
+                                 while the current one is being consumed.
+        :type       ex_prefetch: ``bool``
+
+        :rtype: ``generator`` of :class:`Node`
+        """
         params = {'Action': 'DescribeInstances'}
 
         if ex_node_ids:
             params.update(self._pathlist('InstanceId', ex_node_ids))
+            ex_page_size = 0
 
         if ex_filters:
             params.update(self._build_filters(ex_filters))
 
-        elem = self.connection.request(self.path, params=params).object
-
-        nodes = []
-        for rs in findall(element=elem, xpath='reservationSet/item',
-                          namespace=NAMESPACE):
-            nodes += self._to_nodes(rs, 'instancesSet/item')
-
-        nodes_elastic_ips_mappings = self.ex_describe_addresses(nodes)
-
-        for node in nodes:
-            ips = nodes_elastic_ips_mappings[node.id]
-            node.public_ips.extend(ips)
-
-        return nodes
+        for rs in self._iterate_elements(params=params,
+                                         xpath='reservationSet/item',
+                                         page_size=ex_page_size,
+                                         prefetch=ex_prefetch):
+            for node in self._to_nodes(rs, 'instancesSet/item'):
+                yield node
 
     def list_sizes(self, location=None):
         available_types = REGION_DETAILS[self.region_name]['instance_types']
@@ -2201,6 +2246,20 @@ class BaseEC2NodeDriver(NodeDriver):
 
         :rtype: ``list`` of :class:`NodeImage`
         """
+        return list(self.ex_iterate_images(ex_image_ids=ex_image_ids,
+                                           ex_owner=ex_owner,
+                                           ex_executableby=ex_executableby,
+                                           ex_filters=ex_filters))
+
+    def ex_iterate_images(self, ex_image_ids=None, ex_owner=None,
+                          ex_executableby=None, ex_filters=None):
+        """
+        Return a generator which yields images as the response is parsed.
+
+        Arguments have the same meaning as in :meth:`list_images`.
+
+        :rtype: ``generator`` of :class:`NodeImage`
+        """
         params = {'Action': 'DescribeImages'}
 
         if ex_owner:
@@ -2217,10 +2276,9 @@ class BaseEC2NodeDriver(NodeDriver):
         if ex_filters:
             params.update(self._build_filters(ex_filters))
 
-        images = self._to_images(
-            self.connection.request(self.path, params=params).object
-        )
-        return images
+        for element in self._iterate_elements(params=params,
+                                              xpath='imagesSet/item'):
+            yield self._to_image(element)
 
     def get_image(self, image_id):
         """
@@ -2249,6 +2307,26 @@ class BaseEC2NodeDriver(NodeDriver):
         return locations
 
     def list_volumes(self, node=None):
+        return list(self.ex_iterate_volumes(node=node))
+
+    def ex_iterate_volumes(self, node=None, ex_page_size=None,
+                           ex_prefetch=False):
+        """
+        Return a generator which yields volumes as the response is parsed.
+
+        :param      node: Only return volumes attached to this node.
+        :type       node: :class:`Node`
+
+        :param      ex_page_size: Number of volumes requested per page
+                                  (defaults to ``page_size``).
+        :type       ex_page_size: ``int``
+
+        :param      ex_prefetch: Request the next page in the background
+                                 while the current one is being consumed.
+        :type       ex_prefetch: ``bool``
+
+        :rtype: ``generator`` of :class:`StorageVolume`
+        """
         params = {
             'Action': 'DescribeVolumes',
         }
@@ -2256,11 +2334,11 @@ class BaseEC2NodeDriver(NodeDriver):
             filters = {'attachment.instance-id': node.id}
             params.update(self._build_filters(filters))
 
-        response = self.connection.request(self.path, params=params).object
-        volumes = [self._to_volume(el) for el in response.findall(
-            fixxpath(xpath='volumeSet/item', namespace=NAMESPACE))
-        ]
-        return volumes
+        for element in self._iterate_elements(params=params,
+                                              xpath='volumeSet/item',
+                                              page_size=ex_page_size,
+                                              prefetch=ex_prefetch):
+            yield self._to_volume(element)
 
     def create_node(self, **kwargs):
         """
@@ -2313,6 +2391,26 @@ class BaseEC2NodeDriver(NodeDriver):
                                         launch the instance into.
         :type       ex_placement_group: ``str``
         """
+        params = self._get_run_instances_params(**kwargs)
+        object = self.connection.request(self.path, params=params).object
+        nodes = self._to_nodes(object, 'instancesSet/item')
+
+        for node in nodes:
+            self._set_node_name_and_tags(node=node, name=kwargs['name'],
+                                         metadata=kwargs.get('ex_metadata'))
+
+        if len(nodes) == 1:
+            return nodes[0]
+        else:
+            return nodes
+
+    def _get_run_instances_params(self, **kwargs):
+        """
+        Return RunInstances request parameters for the provided
+        ``create_node`` keyword arguments.
+
+        :rtype: ``dict``
+        """
         image = kwargs["image"]
         size = kwargs["size"]
         params = {
@@ -2403,26 +2501,25 @@ class BaseEC2NodeDriver(NodeDriver):
         if 'ex_placement_group' in kwargs and kwargs['ex_placement_group']:
             params['Placement.GroupName'] = kwargs['ex_placement_group']
 
-        object = self.connection.request(self.path, params=params).object
-        nodes = self._to_nodes(object, 'instancesSet/item')
+        return params
 
-        for node in nodes:
-            tags = {'Name': kwargs['name']}
-            if 'ex_metadata' in kwargs:
-                tags.update(kwargs['ex_metadata'])
+    def _set_node_name_and_tags(self, node, name, metadata=None):
+        """
+        Tag a newly created node with its name and metadata.
 
-            try:
-                self.ex_create_tags(resource=node, tags=tags)
-            except Exception:
-                continue
+        Failures are ignored and the node is left untouched.
+        """
+        tags = {'Name': name}
+        if metadata:
+            tags.update(metadata)
 
-            node.name = kwargs['name']
-            node.extra.update({'tags': tags})
+        try:
+            self.ex_create_tags(resource=node, tags=tags)
+        except Exception:
+            return
 
-        if len(nodes) == 1:
-            return nodes[0]
-        else:
-            return nodes
+        node.name = name
+        node.extra.update({'tags': tags})
 
     def reboot_node(self, node):
         params = {'Action': 'RebootInstances'}
@@ -2436,6 +2533,246 @@ class BaseEC2NodeDriver(NodeDriver):
         res = self.connection.request(self.path, params=params).object
         return self._get_terminate_boolean(res)
 
+    def ex_bulk_create_nodes(self, nodes_kwargs, max_concurrency=None):
+        """
+        Create multiple nodes at once.
+
+        Nodes which only differ in ``name`` and ``ex_metadata`` are launched
+        with a single RunInstances request (up to ``bulk_batch_size`` nodes
+        per request).
+
+        @inherits: :class:`NodeDriver.ex_bulk_create_nodes`
+        """
+        nodes_kwargs = list(nodes_kwargs)
+        executor = self._get_bulk_executor(max_concurrency=max_concurrency)
+
+        def run_instances(indexes):
+            kwargs = nodes_kwargs[indexes[0]]
+
+            if not self._can_batch_create_node(kwargs):
+                return [self.create_node(**kwargs)]
+
+            kwargs = dict(kwargs)
+            kwargs['ex_mincount'] = kwargs['ex_maxcount'] = len(indexes)
+            params = self._get_run_instances_params(**kwargs)
+            object = self.connection.request(self.path, params=params).object
+
+            # The instances already exist at this point so a shortfall is
+            # reported per item below instead of failing the whole batch
+            return self._to_nodes(object, 'instancesSet/item')
+
+        batches = self._get_create_node_batches(nodes_kwargs)
+        results = [None] * len(nodes_kwargs)
+        created = []
+
+        for batch_result in executor.map(run_instances, batches):
+            for position, index in enumerate(batch_result.item):
+                kwargs = nodes_kwargs[index]
+
+                if not batch_result.success:
+                    results[index] = BulkResult(item=kwargs,
+                                                error=batch_result.error)
+                elif position >= len(batch_result.value):
+                    error = LibcloudError('Expected %s nodes, got %s' %
+                                          (len(batch_result.item),
+                                           len(batch_result.value)),
+                                          driver=self)
+                    results[index] = BulkResult(item=kwargs, error=error)
+                else:
+                    node = batch_result.value[position]
+                    results[index] = BulkResult(item=kwargs, value=node)
+                    created.append((node, kwargs))
+
+        def tag_node(item):
+            node, kwargs = item
+            self._set_node_name_and_tags(node=node, name=kwargs['name'],
+                                         metadata=kwargs.get('ex_metadata'))
+
+        # Names are assigned using tags which need to be created per node.
+        # Nodes created using create_node() have already been tagged.
+        executor.map(tag_node, [item for item in created
+                                if self._can_batch_create_node(item[1])])
+
+        return results
+
+    def ex_bulk_reboot_nodes(self, nodes, max_concurrency=None):
+        """
+        Reboot multiple nodes at once.
+
+        Nodes are rebooted using RebootInstances requests with up to
+        ``bulk_batch_size`` instances per request.
+
+        @inherits: :class:`NodeDriver.ex_bulk_reboot_nodes`
+        """
+        def reboot_instances(nodes):
+            params = {'Action': 'RebootInstances'}
+            params.update(self._pathlist('InstanceId',
+                                         [node.id for node in nodes]))
+            res = self.connection.request(self.path, params=params).object
+            result = self._get_boolean(res)
+            return dict([(node.id, result) for node in nodes])
+
+        parent = super(BaseEC2NodeDriver, self)
+        return self._bulk_instances_request(
+            nodes=nodes, func=reboot_instances,
+            fallback=parent.ex_bulk_reboot_nodes,
+            max_concurrency=max_concurrency)
+
+    def ex_bulk_destroy_nodes(self, nodes, max_concurrency=None):
+        """
+        Destroy multiple nodes at once.
+
+        Nodes are terminated using TerminateInstances requests with up to
+        ``bulk_batch_size`` instances per request.
+
+        @inherits: :class:`NodeDriver.ex_bulk_destroy_nodes`
+        """
+        def terminate_instances(nodes):
+            params = {'Action': 'TerminateInstances'}
+            params.update(self._pathlist('InstanceId',
+                                         [node.id for node in nodes]))
+            res = self.connection.request(self.path, params=params).object
+            return self._get_terminate_booleans(res)
+
+        parent = super(BaseEC2NodeDriver, self)
+        return self._bulk_instances_request(
+            nodes=nodes, func=terminate_instances,
+            fallback=parent.ex_bulk_destroy_nodes,
+            max_concurrency=max_concurrency)
+
+    def _bulk_instances_request(self, nodes, func, fallback,
+                                max_concurrency=None):
+        """
+        Perform a request for batches of nodes.
+
+        :param func: Function which is called with a batch of nodes and
+                     returns a dictionary which maps instance id to result.
+        :type func: ``callable``
+
+        :param fallback: Function which is called with a batch of nodes if
+                         the batch request failed (e.g. because one of the
+                         instances doesn't exist). It should return a
+                         per-node result list.
+        :type fallback: ``callable``
+
+        :rtype: ``list`` of :class:`libcloud.compute.bulk.BulkResult`
+        """
+        nodes = list(nodes)
+        batches = [nodes[index:index + self.bulk_batch_size]
+                   for index in range(0, len(nodes), self.bulk_batch_size)]
+        executor = self._get_bulk_executor(max_concurrency=max_concurrency)
+        results = []
+
+        for batch_result in executor.map(func, batches):
+            batch = batch_result.item
+
+            if batch_result.success:
+                results.extend([
+                    BulkResult(item=node,
+                               value=batch_result.value.get(node.id, False))
+                    for node in batch])
+            elif (len(batch) > 1 and
+                  not isinstance(batch_result.error, RateLimitReachedError)):
+                results.extend(fallback(batch,
+                                        max_concurrency=max_concurrency))
+            else:
+                results.extend([BulkResult(item=node,
+                                           error=batch_result.error)
+                                for node in batch])
+
+        return results
+
+    def _refresh_nodes(self, nodes):
+        """
+        Retrieve only the provided nodes (up to ``bulk_batch_size`` nodes
+        per DescribeInstances request).
+        """
+        nodes = list(nodes)
+        batches = [[node.id for node in nodes[index:index +
+                                              self.bulk_batch_size]]
+                   for index in range(0, len(nodes), self.bulk_batch_size)]
+        executor = self._get_bulk_executor()
+        result = []
+
+        for batch_result in executor.map(self._describe_pending_nodes,
+                                         batches):
+            if not batch_result.success:
+                raise batch_result.error
+
+            result.extend(batch_result.value)
+
+        return result
+
+    def _describe_pending_nodes(self, node_ids):
+        try:
+            return self.list_nodes(ex_node_ids=node_ids)
+        except Exception:
+            e = sys.exc_info()[1]
+
+            if 'InvalidInstanceID.NotFound' not in str(e):
+                raise e
+
+        # Instances which have just been created might not be visible yet
+        # (eventual consistency), they will be queried again during the next
+        # iteration. The other instances of the batch are retrieved without
+        # them (or by splitting the batch if the error doesn't say which
+        # instances are missing).
+        missing = set(re.findall(r'i-[0-9a-f]+', str(e)))
+        remaining = [node_id for node_id in node_ids
+                     if node_id not in missing]
+
+        if len(remaining) == len(node_ids):
+            if len(node_ids) == 1:
+                return []
+
+            middle = len(node_ids) // 2
+            return (self._describe_pending_nodes(node_ids[:middle]) +
+                    self._describe_pending_nodes(node_ids[middle:]))
+
+        if not remaining:
+            return []
+
+        return self._describe_pending_nodes(remaining)
+
+    def _can_batch_create_node(self, kwargs):
+        """
+        Return True if the node can be launched together with other nodes
+        using a single RunInstances request.
+        """
+        keys = ['ex_mincount', 'ex_maxcount', 'ex_clienttoken']
+        return not [key for key in keys if key in kwargs]
+
+    def _get_create_node_batches(self, nodes_kwargs):
+        """
+        Group ``create_node`` keyword arguments which only differ in name
+        and metadata.
+
+        :return: Batches of indexes into ``nodes_kwargs``.
+        :rtype: ``list`` of ``list``
+        """
+        ignored_keys = ['name', 'ex_metadata']
+        batches = []
+        batch_keys = []
+
+        for index, kwargs in enumerate(nodes_kwargs):
+            key = dict([(name, value) for name, value in kwargs.items()
+                        if name not in ignored_keys])
+
+            if self._can_batch_create_node(kwargs):
+                for batch, batch_key in zip(batches, batch_keys):
+                    if (batch_key == key and
+                            len(batch) < self.bulk_batch_size):
+                        batch.append(index)
+                        break
+                else:
+                    batches.append([index])
+                    batch_keys.append(key)
+            else:
+                batches.append([index])
+                batch_keys.append(None)
+
+        return batches
+
     def create_volume(self, size, name, location=None, snapshot=None,
                       ex_volume_type='standard', ex_iops=None):
         """
@@ -2571,6 +2908,31 @@ class BaseEC2NodeDriver(NodeDriver):
 
         :rtype: ``list`` of :class:`VolumeSnapshot`
         """
+        return list(self.ex_iterate_snapshots(snapshot=snapshot,
+                                              owner=owner))
+
+    def ex_iterate_snapshots(self, snapshot=None, owner=None,
+                             ex_page_size=None, ex_prefetch=False):
+        """
+        Return a generator which yields snapshots as the response is parsed.
+
+        :param snapshot: If provided, only return snapshot information for the
+                         provided snapshot.
+
+        :param owner: Owner for snapshot: self|amazon|ID
+        :type owner: ``str``
+
+        :param      ex_page_size: Number of snapshots requested per page
+                                  (defaults to ``page_size``). Ignored when
+                                  ``snapshot`` is provided.
+        :type       ex_page_size: ``int``
+
+        :param      ex_prefetch: Request the next page in the background
+                                 while the current one is being consumed.
+        :type       ex_prefetch: ``bool``
+
+        :rtype: ``generator`` of :class:`VolumeSnapshot`
+        """
         params = {
             'Action': 'DescribeSnapshots',
         }
@@ -2578,13 +2940,17 @@ class BaseEC2NodeDriver(NodeDriver):
             params.update({
                 'SnapshotId.1': snapshot.id,
             })
+            ex_page_size = 0
         if owner:
             params.update({
                 'Owner.1': owner,
             })
-        response = self.connection.request(self.path, params=params).object
-        snapshots = self._to_snapshots(response)
-        return snapshots
+
+        for element in self._iterate_elements(params=params,
+                                              xpath='snapshotSet/item',
+                                              page_size=ex_page_size,
+                                              prefetch=ex_prefetch):
+            yield self._to_snapshot(element)
 
     def destroy_volume_snapshot(self, snapshot):
         params = {
@@ -3547,9 +3913,16 @@ class BaseEC2NodeDriver(NodeDriver):
 
         params.update(self._build_filters(filters))
 
-        result = self.connection.request(self.path, params=params).object
+        tags = {}
 
-        return self._get_resource_tags(result)
+        for element in self._iterate_elements(params=params,
+                                              xpath='tagSet/item'):
+            key = findtext(element=element, xpath='key', namespace=NAMESPACE)
+            value = findtext(element=element, xpath='value',
+                             namespace=NAMESPACE)
+            tags[key] = value
+
+        return tags
 
     def ex_create_tags(self, resource, tags):
         """
@@ -4727,6 +5100,90 @@ class BaseEC2NodeDriver(NodeDriver):
         kwargs['signature_version'] = self.signature_version
         return kwargs
 
+    def _iterate_elements(self, params, xpath, page_size=None,
+                          prefetch=False):
+        """
+        Perform a request and incrementally parse the response, yielding
+        the elements which match the provided path.
+
+        Following pages are requested using the returned ``nextToken``. If
+        ``prefetch`` is True, each page is requested in a background thread
+        while the elements from the previous one are being consumed.
+
+        :param page_size: Number of items per page (defaults to
+                          ``page_size``, 0 disables pagination).
+        :type page_size: ``int``
+        """
+        params = copy.copy(params)
+
+        if page_size is None:
+            page_size = self.page_size
+
+        if page_size:
+            params['MaxResults'] = page_size
+
+        if prefetch:
+            for element in self._iterate_prefetched_elements(params, xpath):
+                yield element
+            return
+
+        token_tag = fixxpath(xpath='nextToken', namespace=NAMESPACE)
+
+        while True:
+            response = self.connection.request_stream(self.path,
+                                                      params=params)
+            next_token = None
+
+            try:
+                for element in iterfindall(stream=response.stream,
+                                           xpath=[xpath, 'nextToken'],
+                                           namespace=NAMESPACE):
+                    if element.tag == token_tag:
+                        next_token = element.text
+                    else:
+                        yield element
+            finally:
+                # Connection is reused if the whole body has been read and
+                # closed if the consumer has stopped early
+                response.release()
+
+            if not next_token:
+                break
+
+            params['NextToken'] = next_token
+
+    def _iterate_prefetched_elements(self, params, xpath):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def get_page(params):
+            response = self.connection.request(self.path,
+                                               params=params).object
+            elements = findall(element=response, xpath=xpath,
+                               namespace=NAMESPACE)
+            next_token = findtext(element=response, xpath='nextToken',
+                                  namespace=NAMESPACE)
+            return elements, next_token
+
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        try:
+            future = executor.submit(get_page, params)
+
+            while future is not None:
+                elements, next_token = future.result()
+
+                if next_token:
+                    params = copy.copy(params)
+                    params['NextToken'] = next_token
+                    future = executor.submit(get_page, params)
+                else:
+                    future = None
+
+                for element in elements:
+                    yield element
+        finally:
+            executor.shutdown(wait=False)
+
     def _to_nodes(self, object, xpath):
         return [self._to_node(el)
                 for el in object.findall(fixxpath(xpath=xpath,
@@ -5423,6 +5880,21 @@ class BaseEC2NodeDriver(NodeDriver):
                     for term_status
                     in ('shutting-down', 'terminated')])
 
+    def _get_terminate_booleans(self, element):
+        """
+        Return a dictionary which maps instance id to the termination
+        status for a TerminateInstances response.
+        """
+        result = {}
+
+        for item in findall(element=element, xpath='instancesSet/item',
+                            namespace=NAMESPACE):
+            instance_id = findtext(element=item, xpath='instanceId',
+                                   namespace=NAMESPACE)
+            result[instance_id] = self._get_terminate_boolean(item)
+
+        return result
+
     def _add_instance_filter(self, params, node):
         """
         Add instance filter to the provided params dictionary.
@@ -5668,6 +6140,15 @@ class EC2NodeDriver(BaseEC2NodeDriver):
                                             secure=secure, host=host,
                                             port=port, **kwargs)
 
+    @classmethod
+    def list_regions(cls):
+        """
+        Return the names of the regions this driver can be used with.
+
+        :rtype: ``list`` of ``str``
+        """
+        return sorted(VALID_EC2_REGIONS)
+
 
 class IdempotentParamError(LibcloudError):
     """
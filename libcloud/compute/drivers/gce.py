@@ -17,6 +17,7 @@ Module for Google Compute Engine Driver.
 """
 from __future__ import with_statement
 
+import copy
 import datetime
 import time
 import sys
@@ -89,6 +90,10 @@ class GCEConnection(GoogleBaseConnection):
     host = 'www.googleapis.com'
     responseCls = GCEResponse
 
+    # Maximum number of operations from the same scope (zone, region or
+    # global) whose status is retrieved with a single list request
+    poll_batch_size = 50
+
     def __init__(self, user_id, key, secure, auth_type=None,
                  credential_file=None, project=None, **kwargs):
         super(GCEConnection, self).__init__(user_id, key, secure=secure,
@@ -130,6 +135,49 @@ class GCEConnection(GoogleBaseConnection):
 
         return response
 
+    def get_poll_batch_key(self, poll_request_kwargs):
+        """
+        Operations from the same scope can be listed using a single request.
+
+        @inherits: :class:`PollingConnection.get_poll_batch_key`
+        """
+        return poll_request_kwargs['action'].rsplit('/', 1)[0]
+
+    def get_batch_poll_request_kwargs(self, poll_request_kwargs,
+                                      start_time=None):
+        """
+        @inherits: :class:`PollingConnection.get_batch_poll_request_kwargs`
+        """
+        action = self.get_poll_batch_key(poll_request_kwargs[0])
+        names = [kwargs['action'].rsplit('/', 1)[1]
+                 for kwargs in poll_request_kwargs]
+        params = {'filter': 'name eq (%s)' % ('|'.join(names)),
+                  'maxResults': len(names)}
+        return {'action': action, 'params': params}
+
+    def get_batch_poll_responses(self, response, poll_request_kwargs):
+        """
+        @inherits: :class:`PollingConnection.get_batch_poll_responses`
+        """
+        operations = dict([(operation['selfLink'], operation)
+                           for operation in response.object.get('items', [])])
+        responses = []
+
+        for kwargs in poll_request_kwargs:
+            operation = operations.get(kwargs['action'], None)
+
+            # Failed operations are retrieved using a regular poll request
+            # so the error is raised by the response class
+            if operation is None or 'error' in operation:
+                responses.append(None)
+                continue
+
+            operation_response = copy.copy(response)
+            operation_response.object = operation
+            responses.append(operation_response)
+
+        return responses
+
 
 class GCEList(object):
     """
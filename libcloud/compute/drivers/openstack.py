@@ -82,6 +82,7 @@ class OpenStackNodeDriver(NodeDriver, OpenStackDriverMixin):
     api_name = 'openstack'
     name = 'OpenStack'
     website = 'http://openstack.org/'
+    supports_async = True
 
     NODE_STATE_MAP = {
         'BUILD': NodeState.PENDING,
@@ -1249,6 +1250,24 @@ class OpenStack_1_1_NodeDriver(OpenStackNodeDriver):
 
         return self._to_node(server_object)
 
+    def _refresh_nodes(self, nodes):
+        """
+        Retrieve only the provided nodes (one GET request per node).
+
+        Nodes which couldn't be retrieved (e.g. because they are not visible
+        yet) are skipped, unless all of the requests failed.
+        """
+        executor = self._get_bulk_executor()
+        results = executor.map(self.ex_get_node_details,
+                               [node.id for node in nodes])
+        errors = [result.error for result in results if not result.success]
+
+        if results and len(errors) == len(results):
+            raise errors[0]
+
+        return [result.value for result in results
+                if result.success and result.value is not None]
+
     def _to_images(self, obj, ex_only_active):
         images = []
         for image in obj['images']:
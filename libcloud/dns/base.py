@@ -157,6 +157,8 @@ class DNSDriver(BaseDriver):
     # Map libcloud record type enum to provider record type name
     RECORD_TYPE_MAP = {}
 
+    cacheable_methods = ('list_record_types', )
+
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
                  **kwargs):
         """
@@ -148,6 +148,8 @@ class Driver(BaseDriver):
     _ALGORITHM_TO_VALUE_MAP = {}
     _VALUE_TO_ALGORITHM_MAP = {}
 
+    cacheable_methods = ('list_protocols', 'list_supported_algorithms')
+
     def __init__(self, key, secret=None, secure=True, host=None,
                  port=None, **kwargs):
         super(Driver, self).__init__(key=key, secret=secret, secure=secure,
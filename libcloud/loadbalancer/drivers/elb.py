@@ -23,6 +23,7 @@ from libcloud.utils.xml import findtext, findall
 from libcloud.loadbalancer.types import State
 from libcloud.loadbalancer.base import Driver, LoadBalancer, Member
 from libcloud.common.aws import AWSGenericResponse, SignedAWSConnection
+from libcloud.common.aws import DEFAULT_SIGNATURE_VERSION
 
 
 VERSION = '2012-06-01'
@@ -51,10 +52,12 @@ class ElasticLBDriver(Driver):
     name = 'Amazon Elastic Load Balancing'
     website = 'http://aws.amazon.com/elasticloadbalancing/'
     connectionCls = ELBConnection
+    signature_version = DEFAULT_SIGNATURE_VERSION
 
     def __init__(self, access_id, secret, region):
         super(ElasticLBDriver, self).__init__(access_id, secret)
         self.region = region
+        self.region_name = region
         self.connection.host = HOST % (region)
 
     def list_protocols(self):
@@ -349,3 +352,8 @@ class ElasticLBDriver(Driver):
         for index, item in enumerate(items):
             params[label % (index + 1)] = item
         return params
+
+    def _ex_connection_class_kwargs(self):
+        kwargs = super(ElasticLBDriver, self)._ex_connection_class_kwargs()
+        kwargs['signature_version'] = self.signature_version
+        return kwargs
@@ -12,13 +12,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
+import operator
+from array import array
+
 from libcloud.common.base import ConnectionKey, BaseDriver, LibcloudError
+from libcloud.monitor.types import AutoScaleOperator, MetricStatistic
+from libcloud.utils.misc import to_timestamp
 
 __all__ = [
     'MonitorDriver',
-    'AutoScaleAlarm'
+    'AutoScaleAlarm',
+    'MetricSeries'
 ]
 
+OPERATOR_FUNCTIONS = {
+    AutoScaleOperator.LT: operator.lt,
+    AutoScaleOperator.LE: operator.le,
+    AutoScaleOperator.GT: operator.gt,
+    AutoScaleOperator.GE: operator.ge
+}
+
 
 class AutoScaleAlarm(object):
     """Base class for alarm triggering
@@ -64,6 +78,172 @@ class AutoScaleAlarm(object):
                                 self.statistic, self.driver.name))
 
 
+class MetricSeries(object):
+    """
+    Time series of metric statistics.
+
+    Datapoints are stored in columns - timestamps (seconds since epoch, UTC)
+    and one column of values per statistic. Columns are ``array.array``
+    objects of doubles which support the buffer protocol, so they can be
+    used without copying (e.g. ``numpy.frombuffer(series.timestamps)``).
+    """
+
+    def __init__(self, metric_name, period, statistics, driver, extra=None):
+        """
+        :param metric_name: The metric.
+        :type metric_name: value within :class:`AutoScaleMetric`
+
+        :param period: Number of seconds the datapoints are aggregated for.
+        :type period: ``int``
+
+        :param statistics: Statistics of the datapoints (one column each).
+        :type statistics: ``list`` of :class:`MetricStatistic`
+        """
+        self.metric_name = metric_name
+        self.period = period
+        self.statistics = list(statistics)
+        self.timestamps = array('d')
+        self.columns = dict([(statistic, array('d'))
+                             for statistic in self.statistics])
+
+        self.driver = driver
+        self.extra = extra or {}
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __repr__(self):
+        return (('<MetricSeries: metric_name=%s, period=%s, statistics=%s, '
+                 'datapoints=%s, provider=%s>') %
+                (self.metric_name, self.period, self.statistics, len(self),
+                 self.driver.name))
+
+    def append(self, timestamp, values):
+        """
+        Add a datapoint to the end of the series.
+
+        :param timestamp: Start of the datapoint period.
+        :type timestamp: ``float``
+
+        :param values: Value of every statistic (in the order of
+                       ``statistics``).
+        :type values: ``list`` of ``float``
+        """
+        self.timestamps.append(timestamp)
+
+        for statistic, value in zip(self.statistics, values):
+            self.columns[statistic].append(value)
+
+    def get_values(self, statistic=None):
+        """
+        Return the column of values of a statistic (the first one by
+        default).
+
+        :rtype: ``array.array``
+        """
+        return self.columns[statistic or self.statistics[0]]
+
+    def slice(self, start=None, end=None):
+        """
+        Return a series which only contains datapoints in the provided time
+        range.
+
+        :param start: Start of the range (inclusive).
+        :type start: :class:`datetime.datetime` or ``float``
+
+        :param end: End of the range (exclusive).
+        :type end: :class:`datetime.datetime` or ``float``
+
+        :rtype: :class:`MetricSeries`
+        """
+        first = 0
+        last = len(self.timestamps)
+
+        if start is not None:
+            first = bisect.bisect_left(self.timestamps, to_timestamp(start))
+
+        if end is not None:
+            last = bisect.bisect_left(self.timestamps, to_timestamp(end))
+
+        series = MetricSeries(metric_name=self.metric_name,
+                              period=self.period, statistics=self.statistics,
+                              driver=self.driver, extra=self.extra)
+        series.timestamps = self.timestamps[first:last]
+        series.columns = dict([(statistic, values[first:last])
+                               for statistic, values in self.columns.items()])
+        return series
+
+    def mean(self, statistic=None):
+        """
+        Return mean of the statistic values or ``None`` if the series is
+        empty.
+
+        :rtype: ``float``
+        """
+        values = self.get_values(statistic)
+        return sum(values) / len(values) if values else None
+
+    def minimum(self, statistic=None):
+        """
+        Return the smallest statistic value or ``None`` if the series is
+        empty.
+
+        :rtype: ``float``
+        """
+        values = self.get_values(statistic)
+        return min(values) if values else None
+
+    def maximum(self, statistic=None):
+        """
+        Return the largest statistic value or ``None`` if the series is
+        empty.
+
+        :rtype: ``float``
+        """
+        values = self.get_values(statistic)
+        return max(values) if values else None
+
+    def total(self, statistic=None):
+        """
+        Return sum of the statistic values.
+
+        :rtype: ``float``
+        """
+        return sum(self.get_values(statistic))
+
+    def count_breaches(self, operator, threshold, statistic=None):
+        """
+        Return number of datapoints for which ``value <operator> threshold``
+        is true (e.g. number of periods an alarm would be triggered for).
+
+        :param operator: The operator to use for comparison.
+        :type operator: value within :class:`AutoScaleOperator`
+
+        :param threshold: The value the statistic is compared against.
+        :type threshold: ``float``
+
+        :rtype: ``int``
+        """
+        func = OPERATOR_FUNCTIONS[operator]
+        return sum([1 for value in self.get_values(statistic)
+                    if func(value, threshold)])
+
+    def to_numpy(self, statistic=None):
+        """
+        Return timestamps and statistic values as NumPy arrays which share
+        memory with the series columns.
+
+        Note: This method requires NumPy.
+
+        :rtype: ``tuple`` of ``numpy.ndarray``
+        """
+        import numpy
+
+        return (numpy.frombuffer(self.timestamps, dtype=numpy.float64),
+                numpy.frombuffer(self.get_values(statistic),
+                                 dtype=numpy.float64))
+
+
 class MonitorDriver(BaseDriver):
     """
     A base MonitorDriver class to derive from.
@@ -83,6 +263,14 @@ class MonitorDriver(BaseDriver):
     _METRIC_TO_VALUE_MAP = {}
     _VALUE_TO_METRIC_MAP = {}
 
+    # Maximum number of datapoints which are retrieved with a single request
+    # by get_metric_statistics
+    metric_statistics_max_datapoints = 1440
+
+    # Waiter used for long running operations (defaults to the shared one,
+    # see libcloud.autoscale.waiter.get_default_waiter)
+    waiter = None
+
     def __init__(self, key, secret=None, secure=True, host=None,
                  port=None, api_version=None, **kwargs):
         super(MonitorDriver, self).__init__(
@@ -148,6 +336,72 @@ class MonitorDriver(BaseDriver):
         raise NotImplementedError(
             'delete_auto_scale_alarm not implemented for this driver')
 
+    def get_metric_statistics(self, metric, start, end, period,
+                              statistics=None, **kwargs):
+        """
+        Return statistics of the metric datapoints in the provided time
+        range.
+
+        The time range is retrieved in windows of at most
+        ``metric_statistics_max_datapoints`` periods and datapoints of each
+        window are added to the series as soon as they are retrieved.
+
+        :param metric: The metric.
+        :type metric: value within :class:`AutoScaleMetric`
+
+        :param start: Start of the time range (naive datetime objects are
+                      treated as UTC).
+        :type start: :class:`datetime.datetime` or ``float``
+
+        :param end: End of the time range.
+        :type end: :class:`datetime.datetime` or ``float``
+
+        :param period: Number of seconds the datapoints are aggregated for.
+        :type period: ``int``
+
+        :param statistics: Statistics to retrieve (defaults to average).
+        :type statistics: ``list`` of :class:`MetricStatistic`
+
+        :rtype: :class:`MetricSeries`
+        """
+        if period <= 0:
+            raise ValueError('period must be a positive number of seconds')
+
+        statistics = statistics or [MetricStatistic.AVG]
+        start = to_timestamp(start)
+        end = to_timestamp(end)
+
+        series = MetricSeries(metric_name=metric, period=period,
+                              statistics=statistics, driver=self)
+        window = period * self.metric_statistics_max_datapoints
+
+        while start < end:
+            window_end = min(start + window, end)
+            datapoints = self._get_metric_statistics(
+                metric=metric, start=start, end=window_end, period=period,
+                statistics=statistics, **kwargs)
+
+            for timestamp, values in sorted(datapoints,
+                                            key=lambda point: point[0]):
+                series.append(timestamp, values)
+
+            start = window_end
+
+        return series
+
+    def _get_metric_statistics(self, metric, start, end, period, statistics,
+                               **kwargs):
+        """
+        Return datapoints of a single window of
+        :meth:`get_metric_statistics`.
+
+        :return: ``(timestamp, values)`` tuples where values are in the
+                 order of ``statistics``.
+        :rtype: ``list`` of ``tuple``
+        """
+        raise NotImplementedError(
+            'get_metric_statistics not implemented for this driver')
+
     def list_supported_operator_types(self):
         """
         Return operator types supported by this driver.
@@ -12,14 +12,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+
 from libcloud.common.aws import SignedAWSConnection
+from libcloud.common.aws import DEFAULT_SIGNATURE_VERSION
 from libcloud.compute.drivers.ec2 import EC2Response
 
 from libcloud.monitor.base import AutoScaleAlarm, MonitorDriver
 from libcloud.monitor.providers import Provider
-from libcloud.monitor.types import AutoScaleOperator, AutoScaleMetric
+from libcloud.monitor.types import AutoScaleOperator, AutoScaleMetric, \
+    MetricStatistic
 
-from libcloud.utils.misc import reverse_dict
+from libcloud.utils.misc import reverse_dict, to_timestamp, timestamp_to_iso
 from libcloud.utils.xml import fixxpath, findtext
 
 CLOUDWATCH_API_VERSION = '2010-08-01'
@@ -93,6 +97,7 @@ class CloudWatchConnection(SignedAWSConnection):
 
     version = CLOUDWATCH_API_VERSION
     host = CLOUDWATCH_REGION_DETAILS['us-east-1']['endpoint']
+    service_name = 'monitoring'
     responseCls = EC2Response
 
 
@@ -115,12 +120,21 @@ class AWSCloudWatchDriver(MonitorDriver):
 
     _METRIC_TO_VALUE_MAP = reverse_dict(_VALUE_TO_METRIC_MAP)
 
+    _STATISTIC_TO_VALUE_MAP = {
+        MetricStatistic.AVG: 'Average',
+        MetricStatistic.MIN: 'Minimum',
+        MetricStatistic.MAX: 'Maximum',
+        MetricStatistic.SUM: 'Sum',
+        MetricStatistic.SAMPLE_COUNT: 'SampleCount'
+    }
+
     connectionCls = CloudWatchConnection
 
     type = Provider.AWS_CLOUDWATCH
     name = 'Amazon CloudWatch'
     website = 'http://aws.amazon.com/ec2/'
     path = '/'
+    signature_version = DEFAULT_SIGNATURE_VERSION
 
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
                  region='us-east-1', **kwargs):
@@ -141,6 +155,15 @@ class AWSCloudWatchDriver(MonitorDriver):
                                                   secure=secure, host=host,
                                                   port=port, **kwargs)
 
+    @classmethod
+    def list_regions(cls):
+        """
+        Return the names of the regions this driver can be used with.
+
+        :rtype: ``list`` of ``str``
+        """
+        return sorted(VALID_CLOUDWATCH_REGIONS)
+
     def create_auto_scale_alarm(self, name, policy, metric_name, operator,
                                 threshold, period, **kwargs):
         """
@@ -170,23 +193,116 @@ class AWSCloudWatchDriver(MonitorDriver):
 
         self.connection.request(self.path, params=data).object
 
-        data = {}
-        data['Action'] = 'DescribeAlarms'
-        data['AlarmNames.member.1'] = name or 'example_alarm'
-        res = self.connection.request(self.path, params=data).object
-        alarms = self._to_autoscale_alarms(
-            res, 'DescribeAlarmsResult/MetricAlarms/member')
-        return alarms[0]
+        alarm_id = self._get_alarm_arn(name=name, policy_id=policy.id)
+
+        if alarm_id is None:
+            alarms = list(self.iterate_auto_scale_alarms(
+                ex_alarm_names=[name]))
+            return alarms[0]
+
+        # PutMetricAlarm doesn't return the alarm, but everything apart from
+        # the alarm ARN is known already and the ARN is derived from the
+        # policy ARN, so there is no need to read the alarm back
+        extra = {'ex_namespace': data['Namespace'],
+                 'ex_policy_id': policy.id}
+        return AutoScaleAlarm(id=alarm_id, name=name, metric_name=metric_name,
+                              operator=operator, period=int(period),
+                              threshold=int(float(threshold)),
+                              driver=self.connection.driver, extra=extra)
 
     def list_auto_scale_alarms(self, policy):
+        alarms = self.iterate_auto_scale_alarms(ex_action_prefix=policy.id)
+
+        # return only alarms for this policy (ActionPrefix also matches
+        # policies with an ARN which starts with the ARN of this one)
+        return [a for a in alarms if a.extra.get('ex_policy_id') == policy.id]
+
+    def iterate_auto_scale_alarms(self, ex_action_prefix=None,
+                                  ex_alarm_name_prefix=None,
+                                  ex_alarm_names=None, ex_max_records=None):
+        """
+        Return a generator of alarms.
+
+        Alarms are filtered by the API and retrieved one page at a time.
+
+        :keyword    ex_action_prefix: Only return alarms with an action which
+                                      starts with this prefix (e.g. policy
+                                      ARN).
+        :type       ex_action_prefix: ``str``
+
+        :keyword    ex_alarm_name_prefix: Only return alarms with a name which
+                                          starts with this prefix.
+        :type       ex_alarm_name_prefix: ``str``
+
+        :keyword    ex_alarm_names: Only return alarms with these names (can't
+                                    be combined with the prefix filters).
+        :type       ex_alarm_names: ``list`` of ``str``
+
+        :keyword    ex_max_records: Maximum number of alarms per page
+                                    (1 - 100).
+        :type       ex_max_records: ``int``
+
+        :rtype: ``generator`` of :class:`AutoScaleAlarm`
+        """
         data = {}
         data['Action'] = 'DescribeAlarms'
-        res = self.connection.request(self.path, params=data).object
-        alarms = self._to_autoscale_alarms(
-            res, 'DescribeAlarmsResult/MetricAlarms/member')
 
-        # return only alarms for this policy
-        return [a for a in alarms if a.extra.get('ex_policy_id') == policy.id]
+        if ex_action_prefix:
+            data['ActionPrefix'] = ex_action_prefix
+
+        if ex_alarm_name_prefix:
+            data['AlarmNamePrefix'] = ex_alarm_name_prefix
+
+        for index, name in enumerate(ex_alarm_names or []):
+            data['AlarmNames.member.%s' % (index + 1)] = name
+
+        if ex_max_records:
+            data['MaxRecords'] = ex_max_records
+
+        while True:
+            res = self.connection.request(self.path, params=data).object
+
+            for alarm in self._to_autoscale_alarms(
+                    res, 'DescribeAlarmsResult/MetricAlarms/member'):
+                yield alarm
+
+            next_token = findtext(element=res,
+                                  xpath='DescribeAlarmsResult/NextToken',
+                                  namespace=CLOUDWATCH_NAMESPACE)
+
+            if not next_token:
+                break
+
+            data['NextToken'] = next_token
+
+    def ex_list_auto_scale_alarms_for_policies(self, policies):
+        """
+        Return alarms of many policies.
+
+        Unlike calling :meth:`list_auto_scale_alarms` for every policy, alarms
+        are retrieved in a single pass which only includes alarms with an
+        action that starts with the common prefix of the policy ARNs.
+
+        :param policies: Policy objects.
+        :type policies: ``list`` of :class:`.AutoScalePolicy`
+
+        :return: Alarms keyed by the policy id.
+        :rtype: ``dict``
+        """
+        alarms = dict([(policy.id, []) for policy in policies])
+
+        if not alarms:
+            return alarms
+
+        prefix = os.path.commonprefix(list(alarms.keys()))
+
+        for alarm in self.iterate_auto_scale_alarms(ex_action_prefix=prefix):
+            policy_id = alarm.extra.get('ex_policy_id')
+
+            if policy_id in alarms:
+                alarms[policy_id].append(alarm)
+
+        return alarms
 
     def delete_auto_scale_alarm(self, alarm):
         data = {}
@@ -195,6 +311,82 @@ class AWSCloudWatchDriver(MonitorDriver):
         self.connection.request(self.path, params=data)
         return True
 
+    def get_metric_statistics(self, metric, start, end, period,
+                              statistics=None, **kwargs):
+        """
+        @inherits: :class:`MonitorDriver.get_metric_statistics`
+
+        :keyword    ex_namespace: The namespace of the metric (defaults to
+                                  AWS/EC2).
+        :type       ex_namespace: ``str``
+
+        :keyword    ex_dimensions: Dimensions of the metric (e.g.
+                                   ``{'AutoScalingGroupName': 'name'}``).
+        :type       ex_dimensions: ``dict``
+        """
+        return super(AWSCloudWatchDriver, self).get_metric_statistics(
+            metric=metric, start=start, end=end, period=period,
+            statistics=statistics, **kwargs)
+
+    def _get_metric_statistics(self, metric, start, end, period, statistics,
+                               ex_namespace='AWS/EC2', ex_dimensions=None):
+        data = {}
+        data['Action'] = 'GetMetricStatistics'
+        data['Namespace'] = ex_namespace
+        data['MetricName'] = self._metric_to_value(metric)
+        data['StartTime'] = timestamp_to_iso(start)
+        data['EndTime'] = timestamp_to_iso(end)
+        data['Period'] = period
+
+        names = [self._STATISTIC_TO_VALUE_MAP[statistic]
+                 for statistic in statistics]
+
+        for index, name in enumerate(names):
+            data['Statistics.member.%s' % (index + 1)] = name
+
+        dimensions = sorted((ex_dimensions or {}).items())
+
+        for index, (name, value) in enumerate(dimensions):
+            data['Dimensions.member.%s.Name' % (index + 1)] = name
+            data['Dimensions.member.%s.Value' % (index + 1)] = value
+
+        res = self.connection.request(self.path, params=data).object
+        xpath = 'GetMetricStatisticsResult/Datapoints/member'
+        elements = res.findall(fixxpath(xpath=xpath,
+                                        namespace=CLOUDWATCH_NAMESPACE))
+
+        datapoints = []
+
+        for element in elements:
+            timestamp = findtext(element=element, xpath='Timestamp',
+                                 namespace=CLOUDWATCH_NAMESPACE)
+            values = [float(findtext(element=element, xpath=name,
+                                     namespace=CLOUDWATCH_NAMESPACE))
+                      for name in names]
+            datapoints.append((to_timestamp(timestamp), values))
+
+        return datapoints
+
+    def _ex_connection_class_kwargs(self):
+        kwargs = super(AWSCloudWatchDriver,
+                       self)._ex_connection_class_kwargs()
+        kwargs['signature_version'] = self.signature_version
+        return kwargs
+
+    def _get_alarm_arn(self, name, policy_id):
+        """
+        Return ARN of the alarm with the provided name (or ``None`` if the
+        account id can't be determined from the policy ARN).
+        """
+        parts = policy_id.split(':')
+
+        if len(parts) < 6 or parts[0] != 'arn':
+            return None
+
+        return 'arn:%s:cloudwatch:%s:%s:alarm:%s' % (parts[1],
+                                                     self.region_name,
+                                                     parts[4], name)
+
     def _to_autoscale_alarms(self, res, xpath):
         return [self._to_autoscale_alarm(el)
                 for el in res.findall(fixxpath(xpath=xpath,
@@ -12,22 +12,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import time
-
 from libcloud.monitor.base import MonitorDriver, AutoScaleAlarm
 from libcloud.monitor.types import Provider, AutoScaleMetric, \
-    AutoScaleOperator
+    AutoScaleOperator, MetricStatistic
 from libcloud.common.types import LibcloudError
+from libcloud.autoscale.waiter import wait_for
 
 from libcloud.common.openstack_heat import OpenStackHeatConnection, \
     OpenStackHeatResponse
-from libcloud.common.openstack import OpenStackDriverMixin
+from libcloud.common.openstack import OpenStackBaseConnection, \
+    OpenStackDriverMixin
 
-from libcloud.utils.misc import find, iso_to_datetime, reverse_dict
+from libcloud.utils.misc import find, reverse_dict, \
+    to_timestamp, timestamp_to_iso
 
 __all__ = [
     'MonitorResponse',
     'MonitorConnection',
+    'MeteringConnection',
     'OpenStackAutoScaleMonitorDriver',
 ]
 
@@ -46,6 +48,18 @@ class MonitorConnection(OpenStackHeatConnection):
     responseCls = MonitorResponse
 
 
+class MeteringConnection(OpenStackBaseConnection):
+    """
+    Connection to the OpenStack telemetry service (Ceilometer).
+    """
+    service_type = 'metering'
+    service_name = 'ceilometer'
+    service_region = 'RegionOne'
+
+    responseCls = MonitorResponse
+    accept_format = 'application/json'
+
+
 class OpenStackAutoScaleMonitorDriver(MonitorDriver, OpenStackDriverMixin):
     """
     OpenStack driver for auto-scale related monitoring such as:
@@ -63,11 +77,23 @@ class OpenStackAutoScaleMonitorDriver(MonitorDriver, OpenStackDriverMixin):
 
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
                  api_version=DEFAULT_API_VERSION, **kwargs):
+        """
+        @inherits: :class:`MonitorDriver.__init__`
+
+        :keyword    ex_metering_base_url: Base URL of the telemetry service
+                                          (required together with
+                                          ``ex_force_auth_token``, otherwise
+                                          the service catalog is used).
+        :type       ex_metering_base_url: ``str``
+        """
         if api_version != '1.0':
             raise NotImplementedError(
                 "No OpenStackAutoScaleDriver found for API version %s" %
                 (api_version))
 
+        self._ex_metering_base_url = kwargs.pop('ex_metering_base_url', None)
+        self._metering_connection = None
+
         OpenStackDriverMixin.__init__(self, **kwargs)
         super(OpenStackAutoScaleMonitorDriver, self).__init__(
             key=key, secret=secret, secure=secure, host=host,
@@ -90,32 +116,27 @@ class OpenStackAutoScaleMonitorDriver(MonitorDriver, OpenStackDriverMixin):
 
     _METRIC_TO_VALUE_MAP = reverse_dict(_VALUE_TO_METRIC_MAP)
 
+    _STATISTIC_TO_VALUE_MAP = {
+        MetricStatistic.AVG: 'avg',
+        MetricStatistic.MIN: 'min',
+        MetricStatistic.MAX: 'max',
+        MetricStatistic.SUM: 'sum',
+        MetricStatistic.SAMPLE_COUNT: 'count'
+    }
+
     def create_auto_scale_alarm(self, name, policy, metric_name, operator,
                                 threshold, period, **kwargs):
+        """
+        @inherits: :class:`MonitorDriver.create_auto_scale_alarm`
+
+        :keyword    ex_blocking: If ``False``, a future which is resolved with
+                                 the alarm once the stack update has
+                                 completed is returned right away.
+        :type       ex_blocking: ``bool``
+        """
         stack_name = policy.extra['stack_name']
         stack_id = policy.extra['stack_id']
 
-        def _wait_for_update(stack_name, stack_id, pre_update_ts):
-            DEFAULT_TIMEOUT = 600
-            POLL_INTERVAL = 5
-
-            end = time.time() + DEFAULT_TIMEOUT
-            completed = False
-            while time.time() < end and not completed:
-                stack = self.connection.get_stack(stack_name, stack_id)
-                stack_status = stack['stack_status']
-                ts_completed = iso_to_datetime(
-                    stack.get('updated_time')) > pre_update_ts
-                if (stack_status == 'UPDATE_COMPLETE' and ts_completed) or \
-                        stack_status == 'UPDATE_FAILED':
-                    completed = True
-                else:
-                    time.sleep(POLL_INTERVAL)
-
-            if not completed:
-                raise LibcloudError('Policy creation did not complete in %s'
-                                    ' seconds' % (DEFAULT_TIMEOUT))
-
         template_res = self.connection.get_stack_template(stack_name, stack_id)
         template = {
             name: {
@@ -139,9 +160,15 @@ class OpenStackAutoScaleMonitorDriver(MonitorDriver, OpenStackDriverMixin):
 
         pre_update_ts = self.connection.stack_update(stack_name, stack_id,
                                                      template_res)
-        _wait_for_update(stack_name, stack_id, pre_update_ts)
-        alarams = self.list_auto_scale_alarms(policy)
-        return [a for a in alarams if a.name == name][0]
+
+        def callback(stack):
+            alarms = self.list_auto_scale_alarms(policy)
+            return [a for a in alarms if a.name == name][0]
+
+        return self._wait_for_update(stack_name, stack_id, pre_update_ts,
+                                     callback=callback,
+                                     description='Alarm creation',
+                                     blocking=kwargs.get('ex_blocking', True))
 
     def list_auto_scale_alarms(self, policy):
         stack_name = policy.extra['stack_name']
@@ -151,28 +178,15 @@ class OpenStackAutoScaleMonitorDriver(MonitorDriver, OpenStackDriverMixin):
                 for k in template['resources'] if
                 template['resources'][k]['type'] == 'OS::Ceilometer::Alarm']
 
-    def delete_auto_scale_alarm(self, alarm):
-        def _wait_for_update(stack_name, stack_id, pre_update_ts):
-            DEFAULT_TIMEOUT = 600
-            POLL_INTERVAL = 5
-
-            end = time.time() + DEFAULT_TIMEOUT
-            completed = False
-            while time.time() < end and not completed:
-                stack = self.connection.get_stack(stack_name, stack_id)
-                stack_status = stack['stack_status']
-                ts_completed = iso_to_datetime(
-                    stack.get('updated_time')) > pre_update_ts
-                if (stack_status == 'UPDATE_COMPLETE' and ts_completed) or \
-                        stack_status == 'UPDATE_FAILED':
-                    completed = True
-                else:
-                    time.sleep(POLL_INTERVAL)
-
-            if not completed:
-                raise LibcloudError('Update operation did not complete in %s'
-                                    ' seconds' % (DEFAULT_TIMEOUT))
+    def delete_auto_scale_alarm(self, alarm, ex_blocking=True):
+        """
+        @inherits: :class:`MonitorDriver.delete_auto_scale_alarm`
 
+        :keyword    ex_blocking: If ``False``, a future which is resolved once
+                                 the stack update has completed is returned
+                                 right away.
+        :type       ex_blocking: ``bool``
+        """
         stack_name = alarm.extra['stack_name']
         stack_id = alarm.extra['stack_id']
 
@@ -182,9 +196,97 @@ class OpenStackAutoScaleMonitorDriver(MonitorDriver, OpenStackDriverMixin):
             template['resources'].pop(alarm.name)
             pre_update_ts = self.connection.stack_update(stack_name, stack_id,
                                                          template)
-            _wait_for_update(stack_name, stack_id, pre_update_ts)
+            return self._wait_for_update(stack_name, stack_id,
+                                         pre_update_ts,
+                                         callback=lambda stack: True,
+                                         description='Alarm deletion',
+                                         blocking=ex_blocking)
+
+        # Alarm is already gone, the operation completes right away
+        return wait_for(check=lambda: (True, True), timeout=0,
+                        description='Alarm deletion', blocking=ex_blocking,
+                        waiter=self.waiter)
+
+    def get_metric_statistics(self, metric, start, end, period,
+                              statistics=None, **kwargs):
+        """
+        @inherits: :class:`MonitorDriver.get_metric_statistics`
 
-        return True
+        Statistics are retrieved from the telemetry service (Ceilometer).
+
+        :keyword    ex_stack_id: Only include samples of the servers which
+                                 belong to this stack (e.g. scale group).
+        :type       ex_stack_id: ``str``
+
+        :keyword    ex_query: Additional Ceilometer query filters (e.g.
+                              ``[{'field': 'resource_id', 'op': 'eq',
+                              'value': node_id}]``).
+        :type       ex_query: ``list`` of ``dict``
+        """
+        return super(OpenStackAutoScaleMonitorDriver, self).\
+            get_metric_statistics(metric=metric, start=start, end=end,
+                                  period=period, statistics=statistics,
+                                  **kwargs)
+
+    def _get_metric_statistics(self, metric, start, end, period, statistics,
+                               ex_stack_id=None, ex_query=None):
+        query = [{'field': 'timestamp', 'op': 'ge',
+                  'value': timestamp_to_iso(start)},
+                 {'field': 'timestamp', 'op': 'lt',
+                  'value': timestamp_to_iso(end)}]
+
+        if ex_stack_id:
+            # Heat sets the metering.stack metadata item on the servers
+            query.append({'field': 'metadata.user_metadata.stack',
+                          'op': 'eq', 'value': ex_stack_id})
+
+        query.extend(ex_query or [])
+
+        params = {'period': period}
+
+        for key in ['field', 'op', 'value']:
+            params['q.%s' % (key)] = [item[key] for item in query]
+
+        connection = self._get_metering_connection()
+        res = connection.request('/v2/meters/%s/statistics' %
+                                 (self._metric_to_value(metric)),
+                                 params=params).object
+
+        names = [self._STATISTIC_TO_VALUE_MAP[statistic]
+                 for statistic in statistics]
+
+        return [(to_timestamp(item['period_start']),
+                 [float(item[name]) for name in names]) for item in res]
+
+    def _get_metering_connection(self):
+        if self._metering_connection is None:
+            kwargs = self.openstack_connection_kwargs()
+
+            # Base URL and service of the orchestration service don't apply
+            for key in ['ex_force_base_url', 'ex_force_service_type',
+                        'ex_force_service_name']:
+                kwargs.pop(key, None)
+
+            if self._ex_metering_base_url:
+                kwargs['ex_force_base_url'] = self._ex_metering_base_url
+
+            connection = MeteringConnection(self.key, self.secret,
+                                            secure=self.secure, **kwargs)
+            connection.driver = self
+            connection.connect()
+            self._metering_connection = connection
+
+        return self._metering_connection
+
+    def _wait_for_update(self, stack_name, stack_id, pre_update_ts, callback,
+                         description, blocking=True):
+        def check():
+            return self.connection.check_stack_update(stack_name, stack_id,
+                                                      pre_update_ts)
+
+        return wait_for(check=check, timeout=600, callback=callback,
+                        description=description, blocking=blocking,
+                        waiter=self.waiter)
 
     def _get_auto_scale_alarm(self, name, stack_name, stack_id):
         template = self.connection.get_stack_template(stack_name, stack_id)
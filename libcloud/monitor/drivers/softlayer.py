@@ -13,12 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from libcloud.common.softlayer import SoftLayerConnection
+from libcloud.common.types import LibcloudError
 
 from libcloud.monitor.base import AutoScaleAlarm, MonitorDriver
 from libcloud.monitor.types import AutoScaleOperator, AutoScaleMetric
-from libcloud.monitor.types import Provider
+from libcloud.monitor.types import MetricStatistic, Provider
 
-from libcloud.utils.misc import reverse_dict
+from libcloud.utils.misc import reverse_dict, to_timestamp, timestamp_to_iso
 
 
 class SoftLayerMonitorDriver(MonitorDriver):
@@ -98,6 +99,73 @@ class SoftLayerMonitorDriver(MonitorDriver):
                                 'deleteObject', id=alarm.id).object
         return True
 
+    def get_metric_statistics(self, metric, start, end, period,
+                              statistics=None, **kwargs):
+        """
+        @inherits: :class:`MonitorDriver.get_metric_statistics`
+
+        SoftLayer only provides raw samples, so they are aggregated into
+        periods by the driver.
+
+        :keyword    ex_guest_id: Id of the virtual guest (required).
+        :type       ex_guest_id: ``int``
+        """
+        return super(SoftLayerMonitorDriver, self).get_metric_statistics(
+            metric=metric, start=start, end=end, period=period,
+            statistics=statistics, **kwargs)
+
+    def _get_metric_statistics(self, metric, start, end, period, statistics,
+                               ex_guest_id=None):
+        if ex_guest_id is None:
+            raise LibcloudError(value='ex_guest_id argument is required',
+                                driver=self)
+
+        if metric != AutoScaleMetric.CPU_UTIL:
+            raise LibcloudError(value='Unsupported metric: %s' % (metric),
+                                driver=self)
+
+        res = self.connection.request('SoftLayer_Virtual_Guest',
+                                      'getCpuMetricDataByDate',
+                                      timestamp_to_iso(start),
+                                      timestamp_to_iso(end),
+                                      id=ex_guest_id).object
+
+        # [count, sum, min, max] of the samples keyed by the period start
+        periods = {}
+
+        for sample in res:
+            timestamp = to_timestamp(sample['dateTime'])
+
+            if not start <= timestamp < end:
+                continue
+
+            value = float(sample['counter'])
+            key = start + (timestamp - start) // period * period
+            aggregate = periods.get(key)
+
+            if aggregate is None:
+                periods[key] = [1, value, value, value]
+            else:
+                aggregate[0] += 1
+                aggregate[1] += value
+                aggregate[2] = min(aggregate[2], value)
+                aggregate[3] = max(aggregate[3], value)
+
+        datapoints = []
+
+        for timestamp, (count, total, minimum, maximum) in periods.items():
+            values = {
+                MetricStatistic.AVG: total / count,
+                MetricStatistic.MIN: minimum,
+                MetricStatistic.MAX: maximum,
+                MetricStatistic.SUM: total,
+                MetricStatistic.SAMPLE_COUNT: float(count)
+            }
+            datapoints.append((timestamp, [values[statistic]
+                                           for statistic in statistics]))
+
+        return datapoints
+
     def _to_autoscale_alarm(self, alrm):
 
         alrm_id = alrm['id']
@@ -16,7 +16,8 @@
 __all__ = [
     "Provider",
     "AutoScaleOperator",
-    "AutoScaleMetric"
+    "AutoScaleMetric",
+    "MetricStatistic"
 ]
 
 
@@ -55,3 +56,20 @@ class AutoScaleMetric(object):
     :cvar CPU_UTIL: The percent CPU a guest is using.
     """
     CPU_UTIL = 'CPU_UTIL'
+
+
+class MetricStatistic(object):
+    """
+    Statistic which is used to aggregate metric datapoints of a period.
+
+    :cvar AVG: Average value.
+    :cvar MIN: Minimum value.
+    :cvar MAX: Maximum value.
+    :cvar SUM: Sum of the values.
+    :cvar SAMPLE_COUNT: Number of datapoints.
+    """
+    AVG = 'AVG'
+    MIN = 'MIN'
+    MAX = 'MAX'
+    SUM = 'SUM'
+    SAMPLE_COUNT = 'SAMPLE_COUNT'
@@ -18,7 +18,12 @@ from __future__ import with_statement
 A class which handles loading the pricing files.
 """
 
+import os
 import os.path
+import mmap
+import struct
+import hashlib
+import threading
 from os.path import join as pjoin
 
 try:
@@ -28,6 +33,8 @@ except ImportError:
     import json
     JSONDecodeError = ValueError
 
+from libcloud.utils.py3 import b
+from libcloud.utils.py3 import basestring
 from libcloud.utils.connection import get_response_object
 
 __all__ = [
@@ -35,7 +42,9 @@ __all__ = [
     'get_size_price',
     'set_pricing',
     'clear_pricing_data',
-    'download_pricing_file'
+    'download_pricing_file',
+
+    'PricingIndex'
 ]
 
 # Default URL to the pricing file
@@ -45,6 +54,14 @@ CURRENT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_PRICING_FILE_PATH = pjoin(CURRENT_DIRECTORY, 'data/pricing.json')
 CUSTOM_PRICING_FILE_PATH = os.path.expanduser('~/.libcloud/pricing.json')
 
+# Directory where compiled pricing indexes are stored
+PRICING_INDEX_DIRECTORY = os.path.expanduser('~/.libcloud/')
+
+# True to use a compiled, memory-mapped index instead of loading the whole
+# pricing file. Disabled by default since the index is written to
+# PRICING_INDEX_DIRECTORY (the JSON file is used if it can't be written).
+USE_PRICING_INDEX = False
+
 # Pricing data cache
 PRICING_DATA = {
     'compute': {},
@@ -53,6 +70,309 @@ PRICING_DATA = {
 
 VALID_PRICING_DRIVER_TYPES = ['compute', 'storage']
 
+# Opened pricing indexes keyed by the pricing file path
+PRICING_INDEXES = {}
+PRICING_INDEXES_LOCK = threading.Lock()
+
+
+class PricingIndex(object):
+    """
+    Compiled, memory-mapped index of a pricing file.
+
+    The index contains two open addressing hash tables, one which maps
+    (driver_type, driver_name) to a range of entries and one which maps
+    (driver_type, driver_name, size_id) to a single entry. This means a
+    single price can be looked up without loading any other prices and the
+    pages which are never accessed are never read from disk.
+
+    Prices are stored as JSON values so they have the same type as the
+    values in the pricing file.
+    """
+
+    MAGIC = b('LCPRIDX1')
+
+    # magic, source mtime, source size, driver slot count, entry slot count,
+    # entry count, driver table offset, entry table offset, entry slot table
+    # offset
+    HEADER = struct.Struct('<8sdQIIIQQQ')
+
+    # key hash, key offset, key length, first entry, entry count
+    DRIVER_SLOT = struct.Struct('<QIIII')
+
+    # key offset, key length, value offset, value length
+    ENTRY = struct.Struct('<IIII')
+
+    # key hash, entry index + 1 (0 means empty slot)
+    ENTRY_SLOT = struct.Struct('<QI')
+
+    def __init__(self, index_path):
+        """
+        :param index_path: Path to a compiled index file.
+        :type index_path: ``str``
+        """
+        self.index_path = index_path
+
+        with open(index_path, 'rb') as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = self.HEADER.unpack_from(self._mmap, 0)
+
+        if header[0] != self.MAGIC:
+            self.close()
+            raise ValueError('%s is not a valid pricing index' % (index_path))
+
+        (_, self.source_mtime, self.source_size, self._driver_slots,
+         self._entry_slots, self._entry_count, self._drivers_offset,
+         self._entries_offset, self._entry_slots_offset) = header
+
+    @classmethod
+    def build(cls, pricing_file_path, index_path):
+        """
+        Compile the pricing file into an index file.
+
+        :param pricing_file_path: Path to the JSON pricing file.
+        :type pricing_file_path: ``str``
+
+        :param index_path: Path where the index is written to.
+        :type index_path: ``str``
+        """
+        with open(pricing_file_path, 'rb') as fp:
+            stat = os.fstat(fp.fileno())
+            pricing_data = json.loads(fp.read().decode('utf-8'))
+
+        data = []
+        data_size = [cls.HEADER.size]
+
+        def add_data(value):
+            offset = data_size[0]
+            data.append(value)
+            data_size[0] += len(value)
+            return offset, len(value)
+
+        drivers = []
+        entries = []
+
+        for driver_type in VALID_PRICING_DRIVER_TYPES:
+            for driver_name, pricing in \
+                    sorted((pricing_data.get(driver_type) or {}).items()):
+                key = b('%s\x00%s' % (driver_type, driver_name))
+                drivers.append((key, len(entries), len(pricing)))
+
+                for size_id, price in sorted(pricing.items()):
+                    entry_key = key + b('\x00%s' % (size_id))
+                    entries.append((entry_key, b(json.dumps(price))))
+
+        driver_slots = [None] * max(len(drivers) * 2, 1)
+        entry_slots = [None] * max(len(entries) * 2, 1)
+        entry_records = []
+
+        for key, first_entry, entry_count in drivers:
+            key_offset, key_length = add_data(key)
+            cls._insert(driver_slots, key,
+                        (key_offset, key_length, first_entry, entry_count))
+
+        for index, (key, value) in enumerate(entries):
+            key_offset, key_length = add_data(key)
+            value_offset, value_length = add_data(value)
+            entry_records.append((key_offset, key_length, value_offset,
+                                  value_length))
+            cls._insert(entry_slots, key, index + 1)
+
+        drivers_offset = data_size[0]
+        entries_offset = drivers_offset + (len(driver_slots) *
+                                           cls.DRIVER_SLOT.size)
+        entry_slots_offset = entries_offset + (len(entry_records) *
+                                               cls.ENTRY.size)
+
+        for slot in driver_slots:
+            if slot is None:
+                data.append(cls.DRIVER_SLOT.pack(0, 0, 0, 0, 0))
+            else:
+                data.append(cls.DRIVER_SLOT.pack(slot[0], *slot[1]))
+
+        for record in entry_records:
+            data.append(cls.ENTRY.pack(*record))
+
+        for slot in entry_slots:
+            if slot is None:
+                data.append(cls.ENTRY_SLOT.pack(0, 0))
+            else:
+                data.append(cls.ENTRY_SLOT.pack(*slot))
+
+        header = cls.HEADER.pack(cls.MAGIC, stat.st_mtime, stat.st_size,
+                                 len(driver_slots), len(entry_slots),
+                                 len(entry_records), drivers_offset,
+                                 entries_offset, entry_slots_offset)
+
+        # Write to a temporary file first so other processes never see a
+        # partially written index
+        tmp_path = '%s.%s.tmp' % (index_path, os.getpid())
+
+        with open(tmp_path, 'wb') as fp:
+            fp.write(header)
+            fp.write(b('').join(data))
+
+        try:
+            os.rename(tmp_path, index_path)
+        except OSError:
+            # Index has been written by a different process (Windows)
+            os.remove(tmp_path)
+
+    @staticmethod
+    def _hash(key):
+        return struct.unpack('<Q', hashlib.md5(key).digest()[:8])[0]
+
+    @classmethod
+    def _insert(cls, slots, key, value):
+        key_hash = cls._hash(key)
+        position = key_hash % len(slots)
+
+        while slots[position] is not None:
+            position = (position + 1) % len(slots)
+
+        slots[position] = (key_hash, value)
+
+    def is_stale(self, pricing_file_path):
+        """
+        Return True if the pricing file has changed since the index has been
+        built.
+
+        :rtype: ``bool``
+        """
+        stat = os.stat(pricing_file_path)
+        return (stat.st_mtime != self.source_mtime or
+                stat.st_size != self.source_size)
+
+    def get_pricing(self, driver_type, driver_name):
+        """
+        Return pricing for the provided driver.
+
+        :rtype: ``dict``
+        """
+        key = b('%s\x00%s' % (driver_type, driver_name))
+        _, _, _, first_entry, entry_count = self._find_driver(key)
+        pricing = {}
+
+        for index in range(first_entry, first_entry + entry_count):
+            entry_key, value = self._read_entry(index)
+            size_id = entry_key.split(b('\x00'), 2)[2].decode('utf-8')
+            pricing[size_id] = value
+
+        return pricing
+
+    def get_size_price(self, driver_type, driver_name, size_id):
+        """
+        Return price for the provided size (as stored in the pricing file).
+
+        :raises: ``KeyError`` if the driver or the size doesn't exist.
+        """
+        if not isinstance(size_id, basestring):
+            # Keys in the pricing file are always strings
+            raise KeyError(size_id)
+
+        key = b('%s\x00%s\x00%s' % (driver_type, driver_name, size_id))
+        key_hash = self._hash(key)
+        position = key_hash % self._entry_slots
+
+        while True:
+            offset = self._entry_slots_offset + (position *
+                                                 self.ENTRY_SLOT.size)
+            slot_hash, index = self.ENTRY_SLOT.unpack_from(self._mmap,
+                                                           offset)
+
+            if index == 0:
+                raise KeyError(size_id)
+
+            if slot_hash == key_hash:
+                entry_key, value = self._read_entry(index - 1)
+
+                if entry_key == key:
+                    return value
+
+            position = (position + 1) % self._entry_slots
+
+    def close(self):
+        self._mmap.close()
+
+    def _find_driver(self, key):
+        key_hash = self._hash(key)
+        position = key_hash % self._driver_slots
+
+        while True:
+            offset = self._drivers_offset + (position *
+                                             self.DRIVER_SLOT.size)
+            slot = self.DRIVER_SLOT.unpack_from(self._mmap, offset)
+
+            if slot[2] == 0:
+                raise KeyError(key.split(b('\x00'))[1].decode('utf-8'))
+
+            if slot[0] == key_hash and \
+                    self._mmap[slot[1]:slot[1] + slot[2]] == key:
+                return slot
+
+            position = (position + 1) % self._driver_slots
+
+    def _read_entry(self, index):
+        offset = self._entries_offset + (index * self.ENTRY.size)
+        key_offset, key_length, value_offset, value_length = \
+            self.ENTRY.unpack_from(self._mmap, offset)
+        key = self._mmap[key_offset:key_offset + key_length]
+        value = self._mmap[value_offset:value_offset + value_length]
+        return key, json.loads(value.decode('utf-8'))
+
+
+def get_pricing_index(pricing_file_path):
+    """
+    Return (and compile if needed) the index for the provided pricing file.
+
+    :return: Pricing index or ``None`` if the index can't be written.
+    :rtype: :class:`PricingIndex`
+    """
+    pricing_file_path = os.path.abspath(pricing_file_path)
+    index = PRICING_INDEXES.get(pricing_file_path, None)
+
+    if index is not None:
+        return index
+
+    with PRICING_INDEXES_LOCK:
+        index = PRICING_INDEXES.get(pricing_file_path, None)
+
+        if index is not None:
+            return index
+
+        name = hashlib.md5(b(pricing_file_path)).hexdigest()[:16]
+        index_path = pjoin(PRICING_INDEX_DIRECTORY, 'pricing-%s.idx' % (name))
+
+        try:
+            index = PricingIndex(index_path)
+        except (IOError, OSError, ValueError, struct.error):
+            index = None
+
+        if index is not None and index.is_stale(pricing_file_path):
+            index.close()
+            index = None
+
+        if index is None:
+            if not os.path.exists(pricing_file_path):
+                raise IOError('Pricing file %s doesn\'t exist' %
+                              (pricing_file_path))
+
+            try:
+                if not os.path.exists(PRICING_INDEX_DIRECTORY):
+                    os.makedirs(PRICING_INDEX_DIRECTORY)
+
+                PricingIndex.build(pricing_file_path=pricing_file_path,
+                                   index_path=index_path)
+                index = PricingIndex(index_path)
+            except (IOError, OSError):
+                # Index directory is not writable, fall back to the JSON
+                # pricing file
+                return None
+
+        PRICING_INDEXES[pricing_file_path] = index
+
+    return index
+
 
 def get_pricing_file_path(file_path=None):
     if os.path.exists(CUSTOM_PRICING_FILE_PATH) and \
@@ -90,6 +410,15 @@ def get_pricing(driver_type, driver_name, pricing_file_path=None):
     if not pricing_file_path:
         pricing_file_path = get_pricing_file_path(file_path=pricing_file_path)
 
+    index = USE_PRICING_INDEX and get_pricing_index(pricing_file_path)
+
+    if index:
+        # Only the pricing for the requested driver is loaded
+        size_pricing = index.get_pricing(driver_type=driver_type,
+                                         driver_name=driver_name)
+        PRICING_DATA[driver_type][driver_name] = size_pricing
+        return size_pricing
+
     with open(pricing_file_path) as fp:
         content = fp.read()
 
@@ -139,6 +468,14 @@ def get_size_price(driver_type, driver_name, size_id):
     :rtype: ``float``
     :return: Size price.
     """
+    if driver_name not in PRICING_DATA[driver_type] and USE_PRICING_INDEX:
+        index = get_pricing_index(get_pricing_file_path())
+
+        if index:
+            return float(index.get_size_price(driver_type=driver_type,
+                                              driver_name=driver_name,
+                                              size_id=size_id))
+
     pricing = get_pricing(driver_type=driver_type, driver_name=driver_name)
     price = float(pricing[size_id])
     return price
@@ -151,6 +488,12 @@ def invalidate_pricing_cache():
     PRICING_DATA['compute'] = {}
     PRICING_DATA['storage'] = {}
 
+    with PRICING_INDEXES_LOCK:
+        for index in PRICING_INDEXES.values():
+            index.close()
+
+        PRICING_INDEXES.clear()
+
 
 def clear_pricing_data():
     """
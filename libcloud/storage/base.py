@@ -21,9 +21,20 @@ Provides base classes for working with storage
 from __future__ import with_statement
 
 import os.path                          # pylint: disable-msg=W0404
+import ssl
+import sys
+import socket
+import time
+import string
 import hashlib
+import threading
 from os.path import join as pjoin
 
+try:
+    import simplejson as json
+except ImportError:
+    import json
+
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import next
 from libcloud.utils.py3 import b
@@ -31,6 +42,8 @@ from libcloud.utils.py3 import b
 import libcloud.utils.files
 from libcloud.common.types import LibcloudError
 from libcloud.common.base import ConnectionUserAndKey, BaseDriver
+from libcloud.utils.misc import get_backoff_delay
+from libcloud.utils.misc import lazy_dict_property, SlotsMixin
 from libcloud.storage.types import ObjectDoesNotExistError
 
 __all__ = [
@@ -49,11 +62,20 @@ CHUNK_SIZE = 8096
 DEFAULT_CONTENT_TYPE = 'application/octet-stream'
 
 
-class Object(object):
+class Object(SlotsMixin):
     """
     Represents an object (BLOB).
+
+    Attributes are stored in ``__slots__`` since listing large containers
+    can return a lot of objects.
     """
 
+    __slots__ = ('name', 'size', 'hash', 'container', 'driver', '_extra',
+                 '_meta_data', '__dict__', '__weakref__')
+
+    extra = lazy_dict_property('_extra')
+    meta_data = lazy_dict_property('_meta_data')
+
     def __init__(self, name, size, hash, extra, meta_data, container,
                  driver):
         """
@@ -83,8 +105,8 @@ class Object(object):
         self.size = size
         self.hash = hash
         self.container = container
-        self.extra = extra or {}
-        self.meta_data = meta_data or {}
+        self._extra = extra or None
+        self._meta_data = meta_data or None
         self.driver = driver
 
     def get_cdn_url(self):
@@ -110,11 +132,15 @@ class Object(object):
                 (self.name, self.size, self.hash, self.driver.name))
 
 
-class Container(object):
+class Container(SlotsMixin):
     """
     Represents a container (bucket) which can hold multiple objects.
     """
 
+    __slots__ = ('name', 'driver', '_extra', '__dict__', '__weakref__')
+
+    extra = lazy_dict_property('_extra')
+
     def __init__(self, name, extra, driver):
         """
         :param name: Container name (must be unique).
@@ -128,7 +154,7 @@ class Container(object):
         """
 
         self.name = name
-        self.extra = extra or {}
+        self._extra = extra or None
         self.driver = driver
 
     def iterate_objects(self):
@@ -190,6 +216,18 @@ class StorageDriver(BaseDriver):
     # provided and none can be detected when uploading an object
     strict_mode = False
 
+    # Default size of a single range and default number of ranges which are
+    # downloaded in parallel by drivers which support parallel downloads
+    download_part_size = 8 * 1024 * 1024
+    download_max_workers = 4
+
+    # Failed range downloads are retried with an exponential back-off
+    download_max_retries = 3
+    download_retry_delay = 1
+
+    # Use socket.sendfile when uploading a file over a plain HTTP connection
+    use_sendfile = True
+
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
                  **kwargs):
         super(StorageDriver, self).__init__(key=key, secret=secret,
@@ -544,18 +582,7 @@ class StorageDriver(BaseDriver):
         """
 
         chunk_size = chunk_size or CHUNK_SIZE
-
-        base_name = os.path.basename(destination_path)
-
-        if not base_name and not os.path.exists(destination_path):
-            raise LibcloudError(
-                value='Path %s does not exist' % (destination_path),
-                driver=self)
-
-        if not base_name:
-            file_path = pjoin(destination_path, obj.name)
-        else:
-            file_path = destination_path
+        file_path = self._get_destination_file_path(obj, destination_path)
 
         if os.path.exists(file_path) and not overwrite_existing:
             raise LibcloudError(
@@ -595,6 +622,258 @@ class StorageDriver(BaseDriver):
 
         return True
 
+    def _save_object_parallel(self, obj, request_path, destination_path,
+                              overwrite_existing=False,
+                              delete_on_failure=True, part_size=None,
+                              max_workers=None, resume=False,
+                              chunk_size=None):
+        """
+        Save object to the provided path using multiple concurrent ``Range``
+        requests.
+
+        The destination file is preallocated and every range is written
+        directly to its offset. Completed ranges are recorded in a
+        ``<file>.parts`` file so an interrupted download can be resumed.
+        Once all the ranges have been downloaded, the file hash is compared
+        with the object hash (if known, see :meth:`_get_object_checksum`).
+
+        :param obj: Object instance.
+        :type obj: :class:`Object`
+
+        :param request_path: Path which is used to download the object.
+        :type request_path: ``str``
+
+        :param destination_path: Destination directory.
+        :type destination_path: ``str``
+
+        :param overwrite_existing: True to overwrite a local path if it already
+                                   exists.
+        :type overwrite_existing: ``bool``
+
+        :param delete_on_failure: True to delete partially downloaded object if
+                                  the download fails. Ignored when ``resume``
+                                  is True and the download is interrupted.
+        :type delete_on_failure: ``bool``
+
+        :param part_size: Size of a single range in bytes (defaults to
+                          ``download_part_size``).
+        :type part_size: ``int``
+
+        :param max_workers: Number of ranges downloaded in parallel (defaults
+                            to ``download_max_workers``).
+        :type max_workers: ``int``
+
+        :param resume: True to continue a previously interrupted download
+                       and keep the partially downloaded file if this
+                       download is interrupted.
+        :type resume: ``bool``
+
+        :param chunk_size: Optional chunk size
+            (defaults to ``libcloud.storage.base.CHUNK_SIZE``, 8kb)
+        :type chunk_size: ``int``
+
+        :return: ``True`` on success, ``False`` otherwise.
+        :rtype: ``bool``
+        """
+        # Imported here since all the storage drivers import this module
+        from concurrent.futures import ThreadPoolExecutor
+
+        part_size = part_size or self.download_part_size
+        max_workers = max_workers or self.download_max_workers
+        file_path = self._get_destination_file_path(obj, destination_path)
+        state_path = file_path + '.parts'
+        size = int(obj.size)
+
+        state = {'size': size, 'hash': obj.hash, 'part_size': part_size,
+                 'completed': []}
+
+        if resume:
+            previous_state = self._read_download_state(state_path)
+
+            if previous_state and os.path.exists(file_path) and \
+                    previous_state['completed'] and \
+                    dict(previous_state, completed=[]) == state:
+                state = previous_state
+
+        if not state['completed']:
+            if os.path.exists(file_path) and not overwrite_existing:
+                raise LibcloudError(
+                    value='File %s already exists, but ' % (file_path) +
+                    'overwrite_existing=False',
+                    driver=self)
+
+            # Preallocate the file so every range can be written to its offset
+            with open(file_path, 'wb') as file_handle:
+                file_handle.truncate(size)
+
+        completed = set(state['completed'])
+        ranges = [(start, min(start + part_size, size) - 1)
+                  for start in range(0, size, part_size)
+                  if start not in completed]
+        lock = threading.Lock()
+
+        def download_range(byte_range):
+            self._download_object_range(obj=obj, request_path=request_path,
+                                        file_path=file_path,
+                                        start=byte_range[0],
+                                        end=byte_range[1],
+                                        chunk_size=chunk_size)
+
+            with lock:
+                state['completed'].append(byte_range[0])
+                self._write_download_state(state_path, state)
+
+        try:
+            if ranges:
+                workers = min(max_workers, len(ranges))
+
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(download_range, byte_range)
+                               for byte_range in ranges]
+
+                    try:
+                        for future in futures:
+                            future.result()
+                    except Exception:
+                        # Don't start downloading the remaining ranges
+                        for future in futures:
+                            future.cancel()
+                        raise
+        except Exception:
+            e = sys.exc_info()[1]
+
+            if delete_on_failure and not resume:
+                self._remove_download_files(file_path, state_path)
+
+            raise e
+
+        checksum = self._get_object_checksum(obj)
+
+        if checksum and self._get_file_checksum(file_path) != checksum:
+            if delete_on_failure:
+                self._remove_download_files(file_path, state_path)
+
+            return False
+
+        self._remove_download_files(state_path)
+        return True
+
+    def _download_object_range(self, obj, request_path, file_path, start,
+                               end, chunk_size=None):
+        """
+        Download a single byte range of an object and write it to the same
+        offset of the destination file.
+
+        Failed requests are retried up to ``download_max_retries`` times.
+        """
+        chunk_size = chunk_size or CHUNK_SIZE
+        headers = {'Range': 'bytes=%s-%s' % (start, end)}
+        attempt = 0
+
+        while True:
+            try:
+                response = self.connection.request(request_path,
+                                                   method='GET',
+                                                   headers=headers, raw=True)
+
+                if response.status == httplib.NOT_FOUND:
+                    raise ObjectDoesNotExistError(object_name=obj.name,
+                                                  value='', driver=self)
+                elif response.status != httplib.PARTIAL_CONTENT:
+                    raise LibcloudError(value='Unexpected status code: %s' %
+                                        (response.status), driver=self)
+
+                stream = libcloud.utils.files.read_in_chunks(
+                    response.response, chunk_size)
+                bytes_transferred = 0
+
+                with open(file_path, 'r+b') as file_handle:
+                    file_handle.seek(start)
+
+                    for data in stream:
+                        file_handle.write(b(data))
+                        bytes_transferred += len(data)
+
+                if bytes_transferred != end - start + 1:
+                    raise LibcloudError(
+                        value='Range %s-%s is incomplete (%s bytes)' %
+                        (start, end, bytes_transferred), driver=self)
+
+                return bytes_transferred
+            except ObjectDoesNotExistError:
+                raise
+            except Exception:
+                e = sys.exc_info()[1]
+
+                if attempt >= self.download_max_retries:
+                    raise e
+
+                time.sleep(get_backoff_delay(
+                    attempt=attempt, initial_delay=self.download_retry_delay,
+                    factor=2))
+                attempt += 1
+
+    def _get_object_checksum(self, obj):
+        """
+        Return hex digest of the object data which is used to verify parallel
+        downloads or None if it's not known.
+
+        By default ``obj.hash`` is used if it looks like a digest produced by
+        the driver hash function (e.g. it's not an ETag of a multipart
+        upload).
+
+        :rtype: ``str``
+        """
+        checksum = (obj.hash or '').replace('"', '').lower()
+        digest_size = self._get_hash_function().digest_size
+
+        if len(checksum) != digest_size * 2 or \
+                not all([c in string.hexdigits for c in checksum]):
+            return None
+
+        return checksum
+
+    def _get_file_checksum(self, file_path, chunk_size=None):
+        chunk_size = chunk_size or 1024 * 1024
+        file_hash = self._get_hash_function()
+
+        with open(file_path, 'rb') as file_handle:
+            for data in iter(lambda: file_handle.read(chunk_size), b('')):
+                file_hash.update(data)
+
+        return file_hash.hexdigest()
+
+    def _get_destination_file_path(self, obj, destination_path):
+        base_name = os.path.basename(destination_path)
+
+        if not base_name and not os.path.exists(destination_path):
+            raise LibcloudError(
+                value='Path %s does not exist' % (destination_path),
+                driver=self)
+
+        if not base_name:
+            return pjoin(destination_path, obj.name)
+
+        return destination_path
+
+    def _read_download_state(self, state_path):
+        try:
+            with open(state_path, 'r') as file_handle:
+                return json.load(file_handle)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _write_download_state(self, state_path, state):
+        with open(state_path, 'w') as file_handle:
+            json.dump(state, file_handle)
+
+    def _remove_download_files(self, *paths):
+        for path in paths:
+            try:
+                os.unlink(path)
+            except Exception:
+                pass
+
     def _upload_object(self, object_name, content_type, upload_func,
                        upload_func_kwargs, request_path, request_method='PUT',
                        headers=None, file_path=None, iterator=None):
@@ -743,34 +1022,20 @@ class StorageDriver(BaseDriver):
             data_hash = self._get_hash_function()
 
         generator = libcloud.utils.files.read_in_chunks(iterator, chunk_size,
-                                                        fill_size=True)
-
+                                                        fill_size=True,
+                                                        yield_empty=True)
+        send = response.connection.connection.send
         bytes_transferred = 0
-        try:
-            chunk = next(generator)
-        except StopIteration:
-            # Special case when StopIteration is thrown on the first iteration
-            # create a 0-byte long object
-            chunk = ''
-            if chunked:
-                response.connection.connection.send(b('%X\r\n' %
-                                                      (len(chunk))))
-                response.connection.connection.send(chunk)
-                response.connection.connection.send(b('\r\n'))
-                response.connection.connection.send(b('0\r\n\r\n'))
-            else:
-                response.connection.connection.send(chunk)
-            return True, data_hash.hexdigest(), bytes_transferred
 
-        while len(chunk) > 0:
+        for chunk in generator:
             try:
-                if chunked:
-                    response.connection.connection.send(b('%X\r\n' %
-                                                          (len(chunk))))
-                    response.connection.connection.send(b(chunk))
-                    response.connection.connection.send(b('\r\n'))
-                else:
-                    response.connection.connection.send(b(chunk))
+                if not chunked:
+                    send(chunk)
+                elif len(chunk) > 0:
+                    # Chunk header, data and trailer are sent using a single
+                    # call (the last chunk is sent below)
+                    send(b('').join([b('%X\r\n' % (len(chunk))), chunk,
+                                     b('\r\n')]))
             except Exception:
                 # TODO: let this exception propagate
                 # Timeout, etc.
@@ -778,15 +1043,10 @@ class StorageDriver(BaseDriver):
 
             bytes_transferred += len(chunk)
             if calculate_hash:
-                data_hash.update(b(chunk))
-
-            try:
-                chunk = next(generator)
-            except StopIteration:
-                chunk = ''
+                data_hash.update(chunk)
 
         if chunked:
-            response.connection.connection.send(b('0\r\n\r\n'))
+            send(b('0\r\n\r\n'))
 
         if calculate_hash:
             data_hash = data_hash.hexdigest()
@@ -814,15 +1074,73 @@ class StorageDriver(BaseDriver):
                  is the number of transferred bytes.
         """
         with open(file_path, 'rb') as file_handle:
+            sock = self._get_sendfile_socket(response)
+
+            if sock is not None and not chunked:
+                return self._send_file(sock=sock, file_handle=file_handle,
+                                       calculate_hash=calculate_hash)
+
             success, data_hash, bytes_transferred = (
                 self._stream_data(
                     response=response,
-                    iterator=iter(file_handle),
+                    iterator=file_handle,
                     chunked=chunked,
                     calculate_hash=calculate_hash))
 
         return success, data_hash, bytes_transferred
 
+    def _get_sendfile_socket(self, response):
+        """
+        Return socket which can be used to upload a file using
+        ``socket.sendfile`` or None if sendfile can't be used.
+
+        The file data is copied to the socket by the kernel which is only
+        possible for plain (non-TLS) sockets on Python 3.5 and later.
+        """
+        if not self.use_sendfile:
+            return None
+
+        sock = getattr(response.connection.connection, 'sock', None)
+
+        if not isinstance(sock, socket.socket) or \
+                not hasattr(sock, 'sendfile') or \
+                isinstance(sock, ssl.SSLSocket):
+            return None
+
+        return sock
+
+    def _send_file(self, sock, file_handle, calculate_hash=True):
+        """
+        Upload a file using ``socket.sendfile``.
+
+        :rtype: ``tuple``
+        :return: First item is a boolean indicator of success, second
+                 one is the uploaded data hash and the third one
+                 is the number of transferred bytes.
+        """
+        data_hash = None
+
+        if calculate_hash:
+            # Hash is calculated using a single reusable buffer, the data
+            # is usually served from the page cache when it's sent below
+            data_hash = self._get_hash_function()
+            buf = bytearray(1024 * 1024)
+            view = memoryview(buf)
+
+            for size in iter(lambda: file_handle.readinto(buf), 0):
+                data_hash.update(view[:size])
+
+            del view
+            data_hash = data_hash.hexdigest()
+            file_handle.seek(0)
+
+        try:
+            bytes_transferred = sock.sendfile(file_handle)
+        except Exception:
+            return False, None, file_handle.tell()
+
+        return True, data_hash, bytes_transferred
+
     def _get_hash_function(self):
         """
         Return instantiated hash function for the hash type supported by
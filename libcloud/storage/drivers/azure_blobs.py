@@ -543,11 +543,40 @@ class AzureBlobsStorageDriver(StorageDriver):
         return False
 
     def download_object(self, obj, destination_path, overwrite_existing=False,
-                        delete_on_failure=True):
+                        delete_on_failure=True, ex_parallel=False,
+                        ex_part_size=None, ex_max_workers=None,
+                        ex_resume=False):
         """
         @inherits: :class:`StorageDriver.download_object`
+
+        :param ex_parallel: True to download the object using multiple
+                            concurrent ``Range`` requests.
+        :type ex_parallel: ``bool``
+
+        :param ex_part_size: Size of a single range in bytes (defaults to
+                             ``download_part_size``).
+        :type ex_part_size: ``int``
+
+        :param ex_max_workers: Number of ranges which are downloaded in
+                               parallel (defaults to
+                               ``download_max_workers``).
+        :type ex_max_workers: ``int``
+
+        :param ex_resume: True to resume a previously interrupted parallel
+                          download and to keep the partially downloaded file
+                          if this download is interrupted.
+        :type ex_resume: ``bool``
         """
         obj_path = self._get_object_path(obj.container, obj.name)
+
+        if ex_parallel:
+            return self._save_object_parallel(
+                obj=obj, request_path=obj_path,
+                destination_path=destination_path,
+                overwrite_existing=overwrite_existing,
+                delete_on_failure=delete_on_failure, part_size=ex_part_size,
+                max_workers=ex_max_workers, resume=ex_resume)
+
         response = self.connection.request(obj_path, raw=True, data=None)
 
         return self._get_object(obj=obj, callback=self._save_object,
@@ -573,6 +602,11 @@ class AzureBlobsStorageDriver(StorageDriver):
                                                  'chunk_size': chunk_size},
                                 success_status_code=httplib.OK)
 
+    def _get_object_checksum(self, obj):
+        # Blob ETag is not a hash of the content, Content-MD5 is only
+        # available if it was provided when the blob was uploaded
+        return (obj.extra or {}).get('md5_hash', None)
+
     def _upload_in_chunks(self, response, data, iterator, object_path,
                           blob_type, lease, calculate_hash=True):
         """
@@ -384,12 +384,43 @@ class CloudFilesStorageDriver(StorageDriver, OpenStackDriverMixin):
                                            container_name=name, driver=self)
 
     def download_object(self, obj, destination_path, overwrite_existing=False,
-                        delete_on_failure=True):
+                        delete_on_failure=True, ex_parallel=False,
+                        ex_part_size=None, ex_max_workers=None,
+                        ex_resume=False):
+        """
+        @inherits: :class:`StorageDriver.download_object`
+
+        :param ex_parallel: True to download the object using multiple
+                            concurrent ``Range`` requests.
+        :type ex_parallel: ``bool``
+
+        :param ex_part_size: Size of a single range in bytes (defaults to
+                             ``download_part_size``).
+        :type ex_part_size: ``int``
+
+        :param ex_max_workers: Number of ranges which are downloaded in
+                               parallel (defaults to
+                               ``download_max_workers``).
+        :type ex_max_workers: ``int``
+
+        :param ex_resume: True to resume a previously interrupted parallel
+                          download and to keep the partially downloaded file
+                          if this download is interrupted.
+        :type ex_resume: ``bool``
+        """
         container_name = obj.container.name
         object_name = obj.name
-        response = self.connection.request('/%s/%s' % (container_name,
-                                                       object_name),
-                                           method='GET', raw=True)
+        object_path = '/%s/%s' % (container_name, object_name)
+
+        if ex_parallel:
+            return self._save_object_parallel(
+                obj=obj, request_path=object_path,
+                destination_path=destination_path,
+                overwrite_existing=overwrite_existing,
+                delete_on_failure=delete_on_failure, part_size=ex_part_size,
+                max_workers=ex_max_workers, resume=ex_resume)
+
+        response = self.connection.request(object_path, method='GET', raw=True)
 
         return self._get_object(
             obj=obj, callback=self._save_object, response=response,
@@ -874,10 +905,26 @@ class CloudFilesStorageDriver(StorageDriver, OpenStackDriverMixin):
 
         extra = {'content_type': content_type, 'last_modified': last_modified}
 
+        if 'x-object-manifest' in headers:
+            extra['object_manifest'] = headers['x-object-manifest']
+
+        if headers.get('x-static-large-object', '').lower() == 'true':
+            extra['static_large_object'] = True
+
         obj = Object(name=name, size=size, hash=etag, extra=extra,
                      meta_data=meta_data, container=container, driver=self)
         return obj
 
+    def _get_object_checksum(self, obj):
+        # ETag of a DLO / SLO manifest is a hash of the segment ETags and
+        # not of the object content
+        extra = obj.extra or {}
+
+        if 'object_manifest' in extra or extra.get('static_large_object'):
+            return None
+
+        return super(CloudFilesStorageDriver, self)._get_object_checksum(obj)
+
     def _ex_connection_class_kwargs(self):
         kwargs = self.openstack_connection_kwargs()
         kwargs['ex_force_service_region'] = self.region
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import with_statement
+
 import time
 import copy
 import base64
@@ -20,6 +22,7 @@ import hmac
 import sys
 
 from hashlib import sha1
+from binascii import unhexlify
 
 try:
     from lxml.etree import Element, SubElement
@@ -34,6 +37,7 @@ from libcloud.utils.py3 import tostring
 
 from libcloud.utils.xml import fixxpath, findtext
 from libcloud.utils.files import read_in_chunks
+from libcloud.utils.misc import get_backoff_delay
 from libcloud.common.types import InvalidCredsError, LibcloudError
 from libcloud.common.base import ConnectionUserAndKey, RawResponse
 from libcloud.common.aws import AWSBaseResponse, AWSDriver, AWSTokenConnection
@@ -229,6 +233,15 @@ class BaseS3StorageDriver(StorageDriver):
     namespace = NAMESPACE
     http_vendor_prefix = 'x-amz'
 
+    # Default size of a single part and default number of parts which are
+    # uploaded in parallel during a multipart upload
+    multipart_part_size = CHUNK_SIZE
+    multipart_max_workers = 1
+
+    # Failed part uploads are retried with an exponential back-off
+    multipart_max_retries = 3
+    multipart_retry_delay = 1
+
     def iterate_containers(self):
         response = self.connection.request('/')
         if response.status == httplib.OK:
@@ -404,9 +417,40 @@ class BaseS3StorageDriver(StorageDriver):
         return False
 
     def download_object(self, obj, destination_path, overwrite_existing=False,
-                        delete_on_failure=True):
+                        delete_on_failure=True, ex_parallel=False,
+                        ex_part_size=None, ex_max_workers=None,
+                        ex_resume=False):
+        """
+        @inherits: :class:`StorageDriver.download_object`
+
+        :param ex_parallel: True to download the object using multiple
+                            concurrent ``Range`` requests.
+        :type ex_parallel: ``bool``
+
+        :param ex_part_size: Size of a single range in bytes (defaults to
+                             ``download_part_size``).
+        :type ex_part_size: ``int``
+
+        :param ex_max_workers: Number of ranges which are downloaded in
+                               parallel (defaults to
+                               ``download_max_workers``).
+        :type ex_max_workers: ``int``
+
+        :param ex_resume: True to resume a previously interrupted parallel
+                          download and to keep the partially downloaded file
+                          if this download is interrupted.
+        :type ex_resume: ``bool``
+        """
         obj_path = self._get_object_path(obj.container, obj.name)
 
+        if ex_parallel:
+            return self._save_object_parallel(
+                obj=obj, request_path=obj_path,
+                destination_path=destination_path,
+                overwrite_existing=overwrite_existing,
+                delete_on_failure=delete_on_failure, part_size=ex_part_size,
+                max_workers=ex_max_workers, resume=ex_resume)
+
         response = self.connection.request(obj_path, method='GET', raw=True)
 
         return self._get_object(obj=obj, callback=self._save_object,
@@ -430,13 +474,57 @@ class BaseS3StorageDriver(StorageDriver):
                                 success_status_code=httplib.OK)
 
     def upload_object(self, file_path, container, object_name, extra=None,
-                      verify_hash=True, ex_storage_class=None):
+                      verify_hash=True, ex_storage_class=None,
+                      ex_multipart=False, ex_part_size=None,
+                      ex_max_workers=None):
         """
         @inherits: :class:`StorageDriver.upload_object`
 
         :param ex_storage_class: Storage class
         :type ex_storage_class: ``str``
+
+        :param ex_multipart: True to upload the file using the multipart
+                             upload mechanism. Parts are read from the file
+                             only once and up to ``ex_max_workers`` parts
+                             are uploaded in parallel.
+        :type ex_multipart: ``bool``
+
+        :param ex_part_size: Size of a single part in bytes (defaults to
+                             ``multipart_part_size``). Note: Amazon requires
+                             parts (except the last one) to be at least 5 MB.
+        :type ex_part_size: ``int``
+
+        :param ex_max_workers: Number of parts which are uploaded in
+                               parallel (defaults to
+                               ``multipart_max_workers``).
+        :type ex_max_workers: ``int``
         """
+        if ex_multipart:
+            if not self.supports_s3_multipart_upload:
+                raise LibcloudError('Multipart uploads are not supported by '
+                                    'this driver', driver=self)
+
+            part_size = ex_part_size or self.multipart_part_size
+
+            with open(file_path, 'rb') as fp:
+                iterator = iter(lambda: fp.read(part_size), b(''))
+                upload_func_kwargs = {'iterator': iterator,
+                                      'container': container,
+                                      'object_name': object_name,
+                                      'part_size': part_size,
+                                      'max_workers': ex_max_workers,
+                                      'verify_hash': verify_hash}
+
+                return self._put_object(container=container,
+                                        object_name=object_name,
+                                        upload_func=self._upload_multipart,
+                                        upload_func_kwargs=upload_func_kwargs,
+                                        extra=extra, method='POST',
+                                        query_args='uploads',
+                                        file_path=file_path,
+                                        iterator=iter(''), verify_hash=False,
+                                        storage_class=ex_storage_class)
+
         upload_func = self._upload_file
         upload_func_kwargs = {'file_path': file_path}
 
@@ -448,7 +536,8 @@ class BaseS3StorageDriver(StorageDriver):
                                 storage_class=ex_storage_class)
 
     def _upload_multipart(self, response, data, iterator, container,
-                          object_name, calculate_hash=True):
+                          object_name, calculate_hash=True, part_size=None,
+                          max_workers=None, verify_hash=False):
         """
         Callback invoked for uploading data to S3 using Amazon's
         multipart upload mechanism
@@ -472,6 +561,16 @@ class BaseS3StorageDriver(StorageDriver):
         :keyword calculate_hash: Indicates if we must calculate the data hash
         :type calculate_hash: ``bool``
 
+        :keyword part_size: Size of a single part in bytes.
+        :type part_size: ``int``
+
+        :keyword max_workers: Number of parts uploaded in parallel.
+        :type max_workers: ``int``
+
+        :keyword verify_hash: Verify the ETag of every part and the ETag of
+                              the resulting object.
+        :type verify_hash: ``bool``
+
         :return: A tuple of (status, checksum, bytes transferred)
         :rtype: ``tuple``
         """
@@ -487,11 +586,20 @@ class BaseS3StorageDriver(StorageDriver):
         try:
             # Upload the data through the iterator
             result = self._upload_from_iterator(iterator, object_path,
-                                                upload_id, calculate_hash)
+                                                upload_id, calculate_hash,
+                                                part_size=part_size,
+                                                max_workers=max_workers,
+                                                verify_hash=verify_hash)
             (chunks, data_hash, bytes_transferred) = result
 
             # Commit the chunk info and complete the upload
             etag = self._commit_multipart(object_path, upload_id, chunks)
+
+            if verify_hash and \
+                    etag.replace('"', '') != self._get_multipart_etag(chunks):
+                raise ObjectHashMismatchError(
+                    value='MD5 hash checksum does not match',
+                    object_name=object_name, driver=self)
         except Exception:
             exc = sys.exc_info()[1]
             # Amazon provides a mechanism for aborting an upload.
@@ -505,10 +613,15 @@ class BaseS3StorageDriver(StorageDriver):
         return (True, data_hash, bytes_transferred)
 
     def _upload_from_iterator(self, iterator, object_path, upload_id,
-                              calculate_hash=True):
+                              calculate_hash=True, part_size=None,
+                              max_workers=None, verify_hash=False):
         """
         Uploads data from an interator in fixed sized chunks to S3
 
+        Up to ``max_workers`` parts are uploaded in parallel. Reading from the
+        iterator is paused while all the workers are busy which means at most
+        ``max_workers + 1`` parts are held in memory at the same time.
+
         :param iterator: The generator for fetching the upload data
         :type iterator: ``generator``
 
@@ -521,9 +634,24 @@ class BaseS3StorageDriver(StorageDriver):
         :keyword calculate_hash: Indicates if we must calculate the data hash
         :type calculate_hash: ``bool``
 
+        :keyword part_size: Size of a single part in bytes.
+        :type part_size: ``int``
+
+        :keyword max_workers: Number of parts uploaded in parallel.
+        :type max_workers: ``int``
+
+        :keyword verify_hash: Verify that the ETag returned for every part
+                              matches the part MD5 hash.
+        :type verify_hash: ``bool``
+
         :return: A tuple of (chunk info, checksum, bytes transferred)
         :rtype: ``tuple``
         """
+        from concurrent.futures import ThreadPoolExecutor, wait
+        from concurrent.futures import FIRST_COMPLETED
+
+        part_size = part_size or self.multipart_part_size
+        max_workers = max_workers or self.multipart_max_workers
 
         data_hash = None
         if calculate_hash:
@@ -532,44 +660,129 @@ class BaseS3StorageDriver(StorageDriver):
         bytes_transferred = 0
         count = 1
         chunks = []
-        params = {'uploadId': upload_id}
+        pending = {}
+        executor = None
+
+        if max_workers > 1:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        try:
+            # Read the input data in chunk sizes suitable for AWS
+            for data in read_in_chunks(iterator, chunk_size=part_size,
+                                       fill_size=True, yield_empty=True):
+                bytes_transferred += len(data)
 
-        # Read the input data in chunk sizes suitable for AWS
-        for data in read_in_chunks(iterator, chunk_size=CHUNK_SIZE,
-                                   fill_size=True, yield_empty=True):
-            bytes_transferred += len(data)
+                if calculate_hash:
+                    data_hash.update(data)
 
-            if calculate_hash:
-                data_hash.update(data)
+                # Part hash is calculated while the data is in memory so the
+                # data never needs to be read again
+                part_hash = self._get_hash_function()
+                part_hash.update(data)
 
-            chunk_hash = self._get_hash_function()
-            chunk_hash.update(data)
-            chunk_hash = base64.b64encode(chunk_hash.digest()).decode('utf-8')
+                kwargs = {'object_path': object_path,
+                          'upload_id': upload_id, 'part_number': count,
+                          'data': data, 'part_hash': part_hash,
+                          'verify_hash': verify_hash}
 
-            # This provides an extra level of data check and is recommended
-            # by amazon
-            headers = {'Content-MD5': chunk_hash}
-            params['partNumber'] = count
+                if executor is None:
+                    chunks.append((count, self._upload_part(**kwargs)))
+                else:
+                    while len(pending) >= max_workers:
+                        done, _ = wait(list(pending.keys()),
+                                       return_when=FIRST_COMPLETED)
 
-            request_path = '?'.join((object_path, urlencode(params)))
+                        for future in done:
+                            chunks.append((pending.pop(future),
+                                           future.result()))
 
-            resp = self.connection.request(request_path, method='PUT',
-                                           data=data, headers=headers)
+                    future = executor.submit(self._upload_part, **kwargs)
+                    pending[future] = count
 
-            if resp.status != httplib.OK:
-                raise LibcloudError('Error uploading chunk', driver=self)
+                count += 1
 
-            server_hash = resp.headers['etag']
+            for future, part_number in list(pending.items()):
+                chunks.append((part_number, future.result()))
+        finally:
+            if executor is not None:
+                for future in pending:
+                    future.cancel()
 
-            # Keep this data for a later commit
-            chunks.append((count, server_hash))
-            count += 1
+                executor.shutdown(wait=True)
+
+        chunks.sort(key=lambda chunk: chunk[0])
 
         if calculate_hash:
             data_hash = data_hash.hexdigest()
 
         return (chunks, data_hash, bytes_transferred)
 
+    def _upload_part(self, object_path, upload_id, part_number, data,
+                     part_hash, verify_hash=False):
+        """
+        Upload a single part of a multipart upload.
+
+        Failed uploads are retried up to ``multipart_max_retries`` times.
+
+        :param part_hash: MD5 hash object of the part data.
+        :type part_hash: ``object``
+
+        :return: ETag returned by the server.
+        :rtype: ``str``
+        """
+        # This provides an extra level of data check and is recommended
+        # by amazon
+        headers = {'Content-MD5': base64.b64encode(part_hash.digest())
+                   .decode('utf-8')}
+        params = {'uploadId': upload_id, 'partNumber': part_number}
+        request_path = '?'.join((object_path, urlencode(params)))
+        attempt = 0
+
+        while True:
+            try:
+                resp = self.connection.request(request_path, method='PUT',
+                                               data=data, headers=headers)
+
+                if resp.status != httplib.OK:
+                    raise LibcloudError('Error uploading chunk', driver=self)
+
+                server_hash = resp.headers['etag']
+
+                if verify_hash and \
+                        server_hash.replace('"', '') != part_hash.hexdigest():
+                    raise ObjectHashMismatchError(
+                        value='MD5 hash checksum of part %s does not match' %
+                        (part_number), object_name=object_path, driver=self)
+
+                return server_hash
+            except InvalidCredsError:
+                raise
+            except Exception:
+                e = sys.exc_info()[1]
+
+                if attempt >= self.multipart_max_retries:
+                    raise e
+
+                time.sleep(get_backoff_delay(
+                    attempt=attempt, initial_delay=self.multipart_retry_delay,
+                    factor=2))
+                attempt += 1
+
+    def _get_multipart_etag(self, chunks):
+        """
+        Calculate the ETag of an object uploaded using multipart upload.
+
+        :param chunks: A list of (chunk_number, chunk_hash) tuples.
+        :type chunks: ``list``
+
+        :rtype: ``str``
+        """
+        digests = [unhexlify(b(etag.replace('"', '')))
+                   for (_, etag) in chunks]
+        etag = self._get_hash_function()
+        etag.update(b('').join(digests))
+        return '%s-%s' % (etag.hexdigest(), len(chunks))
+
     def _commit_multipart(self, object_path, upload_id, chunks):
         """
         Makes a final commit of the data.
@@ -634,12 +847,23 @@ class BaseS3StorageDriver(StorageDriver):
                                 (resp.status), driver=self)
 
     def upload_object_via_stream(self, iterator, container, object_name,
-                                 extra=None, ex_storage_class=None):
+                                 extra=None, ex_storage_class=None,
+                                 ex_part_size=None, ex_max_workers=None):
         """
         @inherits: :class:`StorageDriver.upload_object_via_stream`
 
         :param ex_storage_class: Storage class
         :type ex_storage_class: ``str``
+
+        :param ex_part_size: Size of a single part in bytes (defaults to
+                             ``multipart_part_size``). Only used by drivers
+                             which support multipart uploads.
+        :type ex_part_size: ``int``
+
+        :param ex_max_workers: Number of parts which are uploaded in
+                               parallel (defaults to
+                               ``multipart_max_workers``).
+        :type ex_max_workers: ``int``
         """
 
         method = 'PUT'
@@ -653,7 +877,9 @@ class BaseS3StorageDriver(StorageDriver):
             upload_func = self._upload_multipart
             upload_func_kwargs = {'iterator': iterator,
                                   'container': container,
-                                  'object_name': object_name}
+                                  'object_name': object_name,
+                                  'part_size': ex_part_size,
+                                  'max_workers': ex_max_workers}
             method = 'POST'
             iterator = iter('')
             params = 'uploads'
@@ -929,6 +1155,7 @@ class BaseS3StorageDriver(StorageDriver):
 
 class S3StorageDriver(AWSDriver, BaseS3StorageDriver):
     connectionCls = S3Connection
+    supports_async = True
 
 
 class S3USWestConnection(S3Connection):
@@ -15,7 +15,12 @@
 
 from __future__ import with_statement
 
+import re
+from datetime import datetime
+
 from libcloud.utils.py3 import httplib
+from libcloud.utils.py3 import parse_qs
+from libcloud.utils.py3 import urlparse
 
 from libcloud.compute.base import NodeImage, NodeSize
 from libcloud.compute.drivers.ec2 import EC2NodeDriver
@@ -27,10 +32,11 @@ from libcloud.autoscale.types import AutoScaleAdjustmentType
 
 from libcloud.monitor.base import AutoScaleAlarm
 from libcloud.monitor.drivers.aws import AWSCloudWatchDriver
-from libcloud.monitor.types import AutoScaleMetric, AutoScaleOperator
+from libcloud.monitor.types import AutoScaleMetric, AutoScaleOperator, \
+    MetricStatistic
 
 from libcloud.test import MockHttpTestCase, LibcloudTestCase
-from libcloud.test.file_fixtures import ComputeFileFixtures
+from libcloud.test.file_fixtures import AutoScaleFileFixtures
 from libcloud.test.compute.test_ec2 import EC2MockHttp
 
 from libcloud.test.secrets import EC2_PARAMS
@@ -143,6 +149,11 @@ class AutoScaleTests(LibcloudTestCase):
         self.assertEqual(alarm.operator, AutoScaleOperator.GT)
         self.assertEqual(alarm.threshold, 80)
         self.assertEqual(alarm.period, 120)
+        self.assertEqual(alarm.id, self.ALARM_ID)
+        self.assertEqual(alarm.extra['ex_policy_id'], self.POLICY_ID)
+
+        # alarm is not read back after it has been created
+        self.assertEqual(self._executed_mock_methods, ['_PutMetricAlarm'])
 
     def test_list_auto_scale_alarms(self):
 
@@ -150,6 +161,112 @@ class AutoScaleTests(LibcloudTestCase):
                                  self.cw_driver)
         alarms = self.cw_driver.list_auto_scale_alarms(policy)
         self.assertEqual(len(alarms), 1)
+        self.assertTrue('ActionPrefix=' in self._visited_urls[0])
+
+    def test_list_auto_scale_alarms_paginated(self):
+
+        AutoScaleMockHttp.type = 'PAGINATED'
+        policy = AutoScalePolicy(self.POLICY_ID, None, None, None,
+                                 self.cw_driver)
+        alarms = self.cw_driver.list_auto_scale_alarms(policy)
+
+        # alarm of the libcloud-testing-policy-2 policy is filtered out
+        self.assertEqual([a.name for a in alarms],
+                         ['libcloud-testing-alarm',
+                          'libcloud-testing-alarm-3'])
+        self.assertEqual(len(self._visited_urls), 2)
+
+    def test_iterate_auto_scale_alarms(self):
+
+        AutoScaleMockHttp.type = 'PAGINATED'
+        alarms = self.cw_driver.iterate_auto_scale_alarms(
+            ex_alarm_name_prefix='libcloud-testing', ex_max_records=2)
+
+        self.assertEqual(next(alarms).name, 'libcloud-testing-alarm')
+        # next page is only retrieved once the first one is consumed
+        self.assertEqual(len(self._visited_urls), 1)
+        self.assertEqual(len(list(alarms)), 3)
+        self.assertEqual(len(self._visited_urls), 2)
+        self.assertTrue('AlarmNamePrefix=libcloud-testing' in
+                        self._visited_urls[1])
+
+    def test_ex_list_auto_scale_alarms_for_policies(self):
+
+        AutoScaleMockHttp.type = 'PAGINATED'
+        policies = [AutoScalePolicy(self.POLICY_ID + suffix, None, None,
+                                    None, self.cw_driver)
+                    for suffix in ['', '-2', '-5']]
+        alarms = self.cw_driver.ex_list_auto_scale_alarms_for_policies(
+            policies)
+
+        self.assertEqual([a.name for a in alarms[self.POLICY_ID]],
+                         ['libcloud-testing-alarm',
+                          'libcloud-testing-alarm-3'])
+        self.assertEqual([a.name for a in alarms[self.POLICY_ID + '-2']],
+                         ['libcloud-testing-alarm-2'])
+        self.assertEqual(alarms[self.POLICY_ID + '-5'], [])
+        self.assertEqual(len(self._visited_urls), 2)
+
+    def test_get_metric_statistics(self):
+
+        series = self.cw_driver.get_metric_statistics(
+            metric=AutoScaleMetric.CPU_UTIL,
+            start=datetime(2015, 3, 10, 11, 0),
+            end=datetime(2015, 3, 10, 11, 5),
+            period=60, statistics=[MetricStatistic.AVG, MetricStatistic.MAX],
+            ex_dimensions={'AutoScalingGroupName': 'libcloud-testing'})
+
+        self.assertEqual(len(series), 5)
+        self.assertEqual(series.timestamps[0], 1425985200.0)
+        # datapoints are sorted by the timestamp
+        self.assertEqual(list(series.get_values()),
+                         [10.0, 20.0, 30.0, 40.5, 50.0])
+        self.assertEqual(series.maximum(MetricStatistic.MAX), 55.0)
+        self.assertEqual(len(self._visited_urls), 1)
+
+        url = self._visited_urls[0]
+        self.assertTrue('Statistics.member.1=Average' in url)
+        self.assertTrue('Statistics.member.2=Maximum' in url)
+        self.assertTrue('Dimensions.member.1.Value=libcloud-testing' in url)
+
+    def test_get_metric_statistics_windows(self):
+
+        self.cw_driver.metric_statistics_max_datapoints = 2
+        series = self.cw_driver.get_metric_statistics(
+            metric=AutoScaleMetric.CPU_UTIL,
+            start=datetime(2015, 3, 10, 11, 0),
+            end=datetime(2015, 3, 10, 11, 5),
+            period=60)
+
+        self.assertEqual(list(series.get_values()),
+                         [10.0, 20.0, 30.0, 40.5, 50.0])
+        self.assertEqual(len(self._visited_urls), 3)
+
+    def test_ex_list_auto_scale_policies_for_groups(self):
+        AutoScaleMockHttp.type = 'PAGINATED'
+        groups = [AutoScaleGroup(id=name + '-id', name=name, min_size=1,
+                                 max_size=5, cooldown=300,
+                                 region=self.region, termination_policies=[],
+                                 driver=self.as_driver)
+                  for name in ['libcloud-testing', 'libcloud-other',
+                               'libcloud-empty']]
+
+        policies = self.as_driver.ex_list_auto_scale_policies_for_groups(
+            groups)
+
+        self.assertEqual(sorted(policies.keys()),
+                         ['libcloud-empty-id', 'libcloud-other-id',
+                          'libcloud-testing-id'])
+        self.assertEqual([p.name for p in policies['libcloud-testing-id']],
+                         ['libcloud-testing-policy'])
+        self.assertEqual(policies['libcloud-other-id'][0].adjustment_type,
+                         AutoScaleAdjustmentType.EXACT_CAPACITY)
+        self.assertEqual(policies['libcloud-empty-id'], [])
+
+        # policies of all the groups are listed with two requests
+        self.assertEqual(len(self._visited_urls), 2)
+        self.assertTrue('AutoScalingGroupName' not in self._visited_urls[0])
+        self.assertTrue('NextToken=page-2' in self._visited_urls[1])
 
     def test_delete_alarm(self):
 
@@ -159,7 +276,7 @@ class AutoScaleTests(LibcloudTestCase):
 
 
 class AutoScaleMockHttp(MockHttpTestCase):
-    fixtures = ComputeFileFixtures('aws_autoscaling')
+    fixtures = AutoScaleFileFixtures('aws_autoscaling')
 
     def _CreateLaunchConfiguration(self, method, url, body, headers):
         body = self.fixtures.load('create_launchconfiguration.xml')
@@ -199,6 +316,13 @@ class AutoScaleMockHttp(MockHttpTestCase):
         body = self.fixtures.load('describe_policies.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _PAGINATED_DescribePolicies(self, method, url, body, headers):
+        if 'NextToken=page-2' in url:
+            body = self.fixtures.load('describe_policies.xml')
+        else:
+            body = self.fixtures.load('describe_policies_page_1.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _DeletePolicy(self, method, url, body, headers):
         body = self.fixtures.load('delete_policy.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
@@ -211,6 +335,30 @@ class AutoScaleMockHttp(MockHttpTestCase):
         body = self.fixtures.load('describe_alarms.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _PAGINATED_DescribeAlarms(self, method, url, body, headers):
+        if 'NextToken=page-2' in url:
+            body = self.fixtures.load('describe_alarms_page_2.xml')
+        else:
+            body = self.fixtures.load('describe_alarms_page_1.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _GetMetricStatistics(self, method, url, body, headers):
+        params = parse_qs(urlparse.urlparse(url).query)
+        start = params['StartTime'][0]
+        end = params['EndTime'][0]
+
+        # only return datapoints of the requested time range
+        body = self.fixtures.load('get_metric_statistics.xml')
+        members = re.findall(r'\s*<member>.*?</member>', body, re.DOTALL)
+
+        for member in members:
+            timestamp = re.search('<Timestamp>(.*)</Timestamp>',
+                                  member).group(1)
+            if not start <= timestamp < end:
+                body = body.replace(member, '')
+
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _DeleteAlarms(self, method, url, body, headers):
         body = self.fixtures.load('delete_alarms.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
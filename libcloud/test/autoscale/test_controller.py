@@ -0,0 +1,383 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import time
+import threading
+import unittest
+
+from libcloud.autoscale.controller import SlidingWindow, AutoScaleController
+from libcloud.autoscale.drivers.dummy import DummyAutoScaleDriver
+from libcloud.autoscale.types import AutoScaleAdjustmentType, \
+    AutoScaleTerminationPolicy
+from libcloud.common.types import LibcloudError
+from libcloud.monitor.base import AutoScaleAlarm, MonitorDriver
+from libcloud.monitor.types import AutoScaleMetric, AutoScaleOperator, \
+    MetricStatistic
+
+
+class SamplesMonitorDriver(MonitorDriver):
+    """
+    Driver which returns samples from a dictionary keyed by the group id.
+    """
+    name = 'Samples'
+
+    def __init__(self):
+        super(SamplesMonitorDriver, self).__init__(key=None)
+        self.samples = {}
+        self.requests = []
+        self.statistics = []
+
+    def add_sample(self, group, timestamp, value):
+        self.samples.setdefault(group.id, []).append((timestamp, value))
+
+    def _get_metric_statistics(self, metric, start, end, period, statistics,
+                               ex_group_id=None):
+        self.requests.append((ex_group_id, start, end))
+        self.statistics.append(statistics)
+        return [(timestamp, [value] * len(statistics))
+                for timestamp, value in self.samples.get(ex_group_id, [])
+                if start <= timestamp < end]
+
+
+class SlidingWindowTestCase(unittest.TestCase):
+    def test_aggregates(self):
+        window = SlidingWindow(length=180)
+
+        for timestamp, value in [(0, 50), (60, 20), (120, 90), (180, 40)]:
+            self.assertTrue(window.add(timestamp, value))
+
+        self.assertEqual(len(window), 4)
+        self.assertEqual(window.get_value(MetricStatistic.AVG), 50)
+        self.assertEqual(window.get_value(MetricStatistic.MIN), 20)
+        self.assertEqual(window.get_value(MetricStatistic.MAX), 90)
+        self.assertEqual(window.get_value(MetricStatistic.SUM), 200)
+        self.assertEqual(window.get_value(MetricStatistic.SAMPLE_COUNT), 4)
+
+    def test_expire(self):
+        window = SlidingWindow(length=120)
+
+        for timestamp, value in [(0, 10), (60, 90), (120, 30), (180, 40)]:
+            window.add(timestamp, value)
+
+        window.expire(now=240)
+        self.assertEqual(len(window), 2)
+        self.assertEqual(window.get_value(MetricStatistic.MAX), 40)
+        self.assertEqual(window.get_value(MetricStatistic.MIN), 30)
+        self.assertEqual(window.get_value(MetricStatistic.AVG), 35)
+
+        window.expire(now=1000)
+        self.assertEqual(window.get_value(MetricStatistic.AVG), None)
+        self.assertEqual(window.total, 0)
+
+    def test_old_samples_are_ignored(self):
+        window = SlidingWindow(length=120)
+
+        self.assertTrue(window.add(60, 10))
+        self.assertFalse(window.add(60, 20))
+        self.assertFalse(window.add(0, 20))
+        self.assertEqual(window.get_value(MetricStatistic.SUM), 10)
+
+    def test_invalid_statistic(self):
+        window = SlidingWindow(length=120)
+        window.add(0, 1)
+        self.assertRaises(ValueError, window.get_value, 'MEDIAN')
+
+
+class AutoScaleControllerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.driver = DummyAutoScaleDriver('key')
+        self.monitor = SamplesMonitorDriver()
+        self.controller = AutoScaleController(evaluation_interval=60,
+                                              metric_period=60)
+
+    def _create_group(self, name='web', min_size=1, max_size=5, cooldown=300,
+                      termination_policies=None):
+        return self.driver.create_auto_scale_group(
+            group_name=name, min_size=min_size, max_size=max_size,
+            cooldown=cooldown,
+            termination_policies=termination_policies or [])
+
+    def _get_rule(self, group, operator, threshold, adjustment,
+                  adjustment_type=AutoScaleAdjustmentType.CHANGE_IN_CAPACITY,
+                  statistic=MetricStatistic.AVG):
+        policy = self.driver.create_auto_scale_policy(
+            group=group, name='policy', adjustment_type=adjustment_type,
+            scaling_adjustment=adjustment)
+        alarm = AutoScaleAlarm(id=None, name='alarm',
+                               metric_name=AutoScaleMetric.CPU_UTIL,
+                               period=180, operator=operator,
+                               threshold=threshold, driver=self.monitor)
+        alarm.statistic = statistic
+        return (alarm, policy)
+
+    def _add_group(self, group, rules, **kwargs):
+        self.controller.add_group(group=group, rules=rules,
+                                  monitor_driver=self.monitor,
+                                  metric_kwargs={'ex_group_id': group.id},
+                                  **kwargs)
+
+    def _members(self, group):
+        return len(self.driver.list_auto_scale_group_members(group))
+
+    def test_scale_out(self):
+        group = self._create_group()
+        self._add_group(group, [self._get_rule(group, AutoScaleOperator.GT,
+                                               80, 2)])
+
+        for timestamp, value in [(0, 70), (60, 90), (120, 95)]:
+            self.monitor.add_sample(group, timestamp, value)
+
+        # average of the window is 85
+        activities = self.controller.evaluate(now=180)
+
+        self.assertEqual(len(activities), 1)
+        activity = activities[0]
+        self.assertTrue(activity.success)
+        self.assertEqual(activity.group, group)
+        self.assertEqual(activity.previous_capacity, 1)
+        self.assertEqual(activity.capacity, 3)
+        self.assertEqual(self._members(group), 3)
+
+    def test_samples_are_retrieved_incrementally(self):
+        group = self._create_group()
+        self._add_group(group, [self._get_rule(group, AutoScaleOperator.GT,
+                                               80, 1)])
+
+        self.monitor.add_sample(group, 0, 10)
+        self.monitor.add_sample(group, 60, 10)
+        self.assertEqual(self.controller.evaluate(now=120), [])
+
+        # group is not due yet
+        self.assertEqual(self.controller.evaluate(now=150), [])
+
+        self.monitor.add_sample(group, 120, 10)
+        self.assertEqual(self.controller.evaluate(now=180), [])
+
+        self.assertEqual(self.monitor.requests,
+                         [(group.id, -120, 120), (group.id, 120, 180)])
+
+    def test_cooldown(self):
+        group = self._create_group(cooldown=300)
+        self._add_group(group, [self._get_rule(group, AutoScaleOperator.GT,
+                                               80, 1)])
+
+        for timestamp in range(0, 600, 60):
+            self.monitor.add_sample(group, timestamp, 90)
+
+        self.assertEqual(len(self.controller.evaluate(now=180)), 1)
+        self.assertEqual(self.controller.evaluate(now=240), [])
+        self.assertEqual(self.controller.evaluate(now=420), [])
+        self.assertEqual(self._members(group), 2)
+
+        self.assertEqual(len(self.controller.evaluate(now=480)), 1)
+        self.assertEqual(self._members(group), 3)
+
+    def test_capacity_is_limited_by_group_size(self):
+        group = self._create_group(min_size=2, max_size=4, cooldown=0)
+        self._add_group(group, [
+            self._get_rule(group, AutoScaleOperator.GT, 80, 300,
+                           AutoScaleAdjustmentType.PERCENT_CHANGE_IN_CAPACITY)
+        ])
+
+        for timestamp in range(0, 300, 60):
+            self.monitor.add_sample(group, timestamp, 90)
+
+        activities = self.controller.evaluate(now=180)
+        self.assertEqual(activities[0].capacity, 4)
+
+        # group is at its maximum size, nothing to do
+        self.assertEqual(self.controller.evaluate(now=240), [])
+        self.assertEqual(self._members(group), 4)
+
+    def test_scale_in(self):
+        group = self._create_group(
+            min_size=3, max_size=3, cooldown=0,
+            termination_policies=[AutoScaleTerminationPolicy.OLDEST_INSTANCE])
+        members = self.driver.list_auto_scale_group_members(group)
+        self._add_group(group, [
+            self._get_rule(group, AutoScaleOperator.LT, 20, 1,
+                           AutoScaleAdjustmentType.EXACT_CAPACITY)
+        ], min_size=1, max_size=5)
+
+        for timestamp in range(0, 180, 60):
+            self.monitor.add_sample(group, timestamp, 5)
+
+        activities = self.controller.evaluate(now=180)
+
+        self.assertEqual(activities[0].capacity, 1)
+        self.assertEqual(self.driver.list_auto_scale_group_members(group),
+                         members[2:])
+
+    def test_largest_capacity_wins(self):
+        group = self._create_group(min_size=2, cooldown=0)
+        self._add_group(group, [
+            self._get_rule(group, AutoScaleOperator.GT, 50, 1),
+            self._get_rule(group, AutoScaleOperator.GT, 80, 3),
+            self._get_rule(group, AutoScaleOperator.LT, 95, -1)
+        ])
+
+        for timestamp in range(0, 180, 60):
+            self.monitor.add_sample(group, timestamp, 90)
+
+        activities = self.controller.evaluate(now=180)
+
+        self.assertEqual(activities[0].capacity, 5)
+        self.assertEqual(activities[0].policy.scaling_adjustment, 3)
+
+    def test_many_groups(self):
+        groups = [self._create_group(name='group-%s' % (index))
+                  for index in range(20)]
+
+        for index, group in enumerate(groups):
+            self._add_group(group, [self._get_rule(
+                group, AutoScaleOperator.GT, 80, 1)])
+            self.monitor.add_sample(group, 60, 90 if index % 2 else 10)
+
+        activities = self.controller.evaluate(now=120)
+
+        self.assertEqual(sorted(activity.group.name
+                                for activity in activities),
+                         sorted('group-%s' % (index)
+                                for index in range(1, 20, 2)))
+        self.assertEqual(len(self.controller.groups), 20)
+
+    def test_failed_update(self):
+        group = self._create_group(cooldown=0)
+        self._add_group(group, [self._get_rule(group, AutoScaleOperator.GT,
+                                               80, 1)])
+        self.monitor.add_sample(group, 60, 90)
+
+        def update_auto_scale_group(group, min_size=None, max_size=None):
+            raise LibcloudError(value='failed', driver=self.driver)
+
+        self.driver.update_auto_scale_group = update_auto_scale_group
+        activities = self.controller.evaluate(now=120)
+
+        self.assertFalse(activities[0].success)
+        self.assertTrue(isinstance(activities[0].error, LibcloudError))
+
+    def test_alarm_statistic_is_retrieved(self):
+        group = self._create_group(cooldown=0)
+        self._add_group(group, [
+            self._get_rule(group, AutoScaleOperator.GT, 25, 1,
+                           statistic=MetricStatistic.SAMPLE_COUNT),
+            self._get_rule(group, AutoScaleOperator.GT, 100, 2,
+                           statistic=MetricStatistic.SUM)])
+
+        # Value of every statistic is 10 in every period
+        for timestamp in [0, 60, 120]:
+            self.monitor.add_sample(group, timestamp, 10)
+
+        activities = self.controller.evaluate(now=180)
+
+        self.assertEqual(self.monitor.statistics,
+                         [[MetricStatistic.SAMPLE_COUNT,
+                           MetricStatistic.SUM]])
+        # Sample count of the window is 30 (not 3 periods) and triggers the
+        # first alarm, sum of the window (30) doesn't trigger the second one
+        self.assertEqual(activities[0].capacity, 2)
+
+    def test_failed_metric_retrieval(self):
+        group = self._create_group(cooldown=0)
+        self._add_group(group, [self._get_rule(group, AutoScaleOperator.GT,
+                                               80, 1)])
+
+        def get_metric_statistics(*args, **kwargs):
+            raise LibcloudError(value='failed', driver=self.monitor)
+
+        self.monitor.get_metric_statistics = get_metric_statistics
+        activities = self.controller.evaluate(now=120)
+
+        self.assertTrue(isinstance(activities[0].error, LibcloudError))
+
+        # Group is still evaluated
+        del self.monitor.get_metric_statistics
+        self.monitor.add_sample(group, 120, 90)
+        activities = self.controller.evaluate(now=180)
+        self.assertTrue(activities[0].success)
+
+    def test_remove_group(self):
+        group = self._create_group()
+        self._add_group(group, [self._get_rule(group, AutoScaleOperator.GT,
+                                               80, 1)])
+        self.assertRaises(LibcloudError, self._add_group, group,
+                          [self._get_rule(group, AutoScaleOperator.GT, 80, 1)])
+
+        self.controller.remove_group(group)
+        self.monitor.add_sample(group, 60, 90)
+
+        self.assertEqual(self.controller.evaluate(now=120), [])
+        self.assertEqual(self.monitor.requests, [])
+        self.assertEqual(self.controller.groups, [])
+
+    def test_background_thread(self):
+        group = self._create_group()
+        now = time.time()
+        self.monitor.add_sample(group, now - 30, 90)
+
+        event = threading.Event()
+        activities = []
+
+        def callback(activity):
+            activities.append(activity)
+            event.set()
+
+        self.controller.callback = callback
+        self.controller.start()
+        try:
+            self._add_group(group, [self._get_rule(
+                group, AutoScaleOperator.GT, 80, 1)])
+            event.wait(5)
+        finally:
+            self.controller.stop(timeout=5)
+
+        self.assertEqual(len(activities), 1)
+        self.assertEqual(self._members(group), 2)
+
+    def test_background_thread_survives_errors(self):
+        group = self._create_group(cooldown=0)
+        now = time.time()
+        self.monitor.add_sample(group, now - 90, 90)
+        self.monitor.add_sample(group, now - 30, 90)
+
+        event = threading.Event()
+        activities = []
+
+        def callback(activity):
+            activities.append(activity)
+
+            if len(activities) == 2:
+                event.set()
+
+            raise ValueError('Callback failed')
+
+        self.controller.evaluation_interval = 0.1
+        self.controller.callback = callback
+        self.controller.start()
+        try:
+            self._add_group(group, [self._get_rule(
+                group, AutoScaleOperator.GT, 80, 1)])
+            event.wait(5)
+        finally:
+            self.controller.stop(timeout=5)
+
+        self.assertEqual(len(activities), 2)
+        self.assertTrue(isinstance(activities[0].error, ValueError))
+        self.assertEqual(self.controller._thread, None)
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
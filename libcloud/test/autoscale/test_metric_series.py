@@ -0,0 +1,139 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from libcloud.monitor.base import MetricSeries, MonitorDriver
+from libcloud.monitor.types import AutoScaleMetric, AutoScaleOperator, \
+    MetricStatistic
+
+
+class WindowMonitorDriver(MonitorDriver):
+    """
+    Driver which returns a datapoint for every period and records the
+    requested windows.
+    """
+    name = 'Window'
+
+    def __init__(self):
+        super(WindowMonitorDriver, self).__init__(key=None)
+        self.windows = []
+
+    def _get_metric_statistics(self, metric, start, end, period, statistics,
+                               ex_scale=1):
+        self.windows.append((start, end))
+        timestamps = range(int(start), int(end), period)
+        return [(timestamp, [timestamp * ex_scale] * len(statistics))
+                for timestamp in reversed(timestamps)]
+
+
+class MetricSeriesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.series = MetricSeries(
+            metric_name=AutoScaleMetric.CPU_UTIL, period=60,
+            statistics=[MetricStatistic.AVG, MetricStatistic.MAX],
+            driver=WindowMonitorDriver())
+
+        for index, value in enumerate([10, 80, 30, 90, 40]):
+            self.series.append(index * 60, [value, value + 5])
+
+    def test_columns(self):
+        self.assertEqual(len(self.series), 5)
+        self.assertEqual(list(self.series.timestamps),
+                         [0, 60, 120, 180, 240])
+        self.assertEqual(list(self.series.get_values()),
+                         [10, 80, 30, 90, 40])
+        self.assertEqual(list(self.series.get_values(MetricStatistic.MAX)),
+                         [15, 85, 35, 95, 45])
+        self.assertEqual(self.series.timestamps.typecode, 'd')
+
+    def test_aggregation(self):
+        self.assertEqual(self.series.mean(), 50.0)
+        self.assertEqual(self.series.minimum(), 10.0)
+        self.assertEqual(self.series.maximum(MetricStatistic.MAX), 95.0)
+        self.assertEqual(self.series.total(), 250.0)
+        self.assertEqual(self.series.count_breaches(AutoScaleOperator.GT,
+                                                    80), 1)
+        self.assertEqual(self.series.count_breaches(AutoScaleOperator.GE,
+                                                    80), 2)
+        self.assertEqual(self.series.count_breaches(AutoScaleOperator.LT,
+                                                    35, MetricStatistic.MAX),
+                         1)
+
+    def test_slice(self):
+        series = self.series.slice(start=60, end=180)
+
+        self.assertEqual(list(series.timestamps), [60, 120])
+        self.assertEqual(list(series.get_values(MetricStatistic.MAX)),
+                         [85, 35])
+        self.assertEqual(len(self.series.slice(start=300)), 0)
+        self.assertEqual(len(self.series.slice(end=61)), 2)
+
+    def test_empty_series(self):
+        series = self.series.slice(start=1000)
+
+        self.assertEqual(series.mean(), None)
+        self.assertEqual(series.minimum(), None)
+        self.assertEqual(series.maximum(), None)
+        self.assertEqual(series.total(), 0)
+
+    @unittest.skipIf(numpy is None, 'numpy is not available')
+    def test_to_numpy(self):
+        timestamps, values = self.series.to_numpy()
+
+        self.assertEqual(values.mean(), 50.0)
+        self.assertEqual(list(timestamps), [0, 60, 120, 180, 240])
+
+        # arrays share memory with the series columns
+        values[0] = 20
+        self.assertEqual(self.series.get_values()[0], 20)
+
+
+class GetMetricStatisticsTestCase(unittest.TestCase):
+    def test_time_range_is_retrieved_in_windows(self):
+        driver = WindowMonitorDriver()
+        driver.metric_statistics_max_datapoints = 4
+
+        series = driver.get_metric_statistics(
+            metric=AutoScaleMetric.CPU_UTIL, start=0, end=600, period=60,
+            ex_scale=2)
+
+        self.assertEqual(driver.windows, [(0, 240), (240, 480), (480, 600)])
+        self.assertEqual(series.statistics, [MetricStatistic.AVG])
+        self.assertEqual(list(series.timestamps), list(range(0, 600, 60)))
+        self.assertEqual(list(series.get_values()),
+                         list(range(0, 1200, 120)))
+
+    def test_invalid_period(self):
+        self.assertRaises(ValueError,
+                          WindowMonitorDriver().get_metric_statistics,
+                          metric=AutoScaleMetric.CPU_UTIL, start=0, end=600,
+                          period=0)
+
+    def test_not_implemented(self):
+        driver = MonitorDriver(key=None)
+        self.assertRaises(NotImplementedError, driver.get_metric_statistics,
+                          metric=AutoScaleMetric.CPU_UTIL, start=0, end=600,
+                          period=60)
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -0,0 +1,316 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import json
+import unittest
+
+from libcloud.utils.py3 import httplib
+from libcloud.utils.py3 import parse_qs
+from libcloud.utils.py3 import urlparse
+
+from libcloud.autoscale.drivers.openstack import OpenStackAutoScaleDriver
+from libcloud.autoscale.waiter import Waiter
+from libcloud.compute.drivers.openstack import OpenStack_1_1_NodeDriver
+from libcloud.monitor.drivers.openstack import MeteringConnection
+from libcloud.monitor.drivers.openstack import \
+    OpenStackAutoScaleMonitorDriver
+from libcloud.monitor.base import AutoScaleAlarm
+from libcloud.monitor.types import AutoScaleMetric, AutoScaleOperator, \
+    MetricStatistic
+
+from libcloud.test import MockHttp
+from libcloud.test.file_fixtures import AutoScaleFileFixtures
+from libcloud.test.file_fixtures import ComputeFileFixtures
+
+DRIVER_KWARGS = {
+    'ex_force_auth_token': 'auth-token',
+    'ex_force_auth_url': 'http://auth.example.com:5000',
+    'ex_force_auth_version': '2.0'
+}
+
+
+class OpenStackAutoScaleTests(unittest.TestCase):
+
+    def setUp(self):
+        OpenStackAutoScaleDriver.connectionCls.conn_classes = (
+            OpenStackAutoScaleMockHttp, OpenStackAutoScaleMockHttp)
+        OpenStack_1_1_NodeDriver.connectionCls.conn_classes = (
+            OpenStackAutoScaleMockHttp, OpenStackAutoScaleMockHttp)
+        OpenStackAutoScaleMockHttp.type = None
+        OpenStackAutoScaleMockHttp.calls = []
+
+        compute = OpenStack_1_1_NodeDriver(
+            'user', 'key', ex_force_base_url='http://nova:8774/v2/tenant',
+            **DRIVER_KWARGS)
+        self.driver = OpenStackAutoScaleDriver(
+            'user', 'key', ex_force_base_url='http://heat:8004/v1/tenant',
+            openstack_driver=compute, **DRIVER_KWARGS)
+
+    def test_list_auto_scale_groups(self):
+        groups = self.driver.list_auto_scale_groups()
+
+        self.assertEqual(len(groups), 2)
+        self.assertEqual([g.id for g in groups], ['stack1', 'stack2'])
+        self.assertEqual([g.name for g in groups], ['group1', 'group2'])
+        self.assertEqual(groups[0].min_size, 1)
+        self.assertEqual(groups[0].max_size, 5)
+        self.assertEqual(groups[0].cooldown, 300)
+        self.assertEqual(groups[0].extra['state'], 'CREATE_COMPLETE')
+
+        # Template and resources of the non-group stack are never retrieved
+        self.assertFalse([c for c in OpenStackAutoScaleMockHttp.calls
+                          if 'database' in c])
+
+    def test_list_auto_scale_groups_uses_cache(self):
+        groups = self.driver.list_auto_scale_groups()
+        OpenStackAutoScaleMockHttp.calls = []
+
+        cached_groups = self.driver.list_auto_scale_groups()
+
+        self.assertEqual(OpenStackAutoScaleMockHttp.calls,
+                         ['/v1/tenant/stacks'])
+        self.assertEqual([g.id for g in cached_groups],
+                         [g.id for g in groups])
+
+    def test_list_auto_scale_groups_updated_stack(self):
+        self.driver.list_auto_scale_groups()
+        OpenStackAutoScaleMockHttp.calls = []
+        OpenStackAutoScaleMockHttp.type = 'UPDATED'
+
+        groups = self.driver.list_auto_scale_groups()
+
+        # Only the stack which has changed is retrieved again
+        self.assertEqual(len(groups), 2)
+        self.assertEqual(sorted(OpenStackAutoScaleMockHttp.calls),
+                         ['/v1/tenant/stacks',
+                          '/v1/tenant/stacks/group2/stack2/resources',
+                          '/v1/tenant/stacks/group2/stack2/template'])
+
+    def test_list_auto_scale_groups_removed_stack(self):
+        self.driver.list_auto_scale_groups()
+        OpenStackAutoScaleMockHttp.type = 'REMOVED'
+
+        groups = self.driver.list_auto_scale_groups()
+
+        self.assertEqual([g.id for g in groups], ['stack1'])
+        self.assertEqual(list(self.driver._groups_cache.keys()), ['stack1'])
+
+    def test_list_auto_scale_group_members(self):
+        group = self.driver.list_auto_scale_groups()[0]
+        OpenStackAutoScaleMockHttp.calls = []
+
+        nodes = self.driver.list_auto_scale_group_members(group)
+
+        # Server 12066 is being deleted and the last resource doesn't have
+        # a server yet
+        self.assertEqual(sorted([n.id for n in nodes]), ['12064', '12065'])
+
+        calls = OpenStackAutoScaleMockHttp.calls
+        self.assertTrue('/v1/tenant/stacks/group1/stack1/resources' in calls)
+        self.assertFalse('/v2/tenant/servers/detail' in calls)
+        self.assertEqual(len(calls), 3)
+
+    def test_list_auto_scale_group_members_of_large_group(self):
+        self.driver.member_listing_threshold = 1
+        group = self.driver.list_auto_scale_groups()[0]
+        OpenStackAutoScaleMockHttp.calls = []
+
+        nodes = self.driver.list_auto_scale_group_members(group)
+
+        # Servers are retrieved using a single listing and the servers which
+        # are not group members are filtered out
+        self.assertEqual(sorted([n.id for n in nodes]), ['12064', '12065'])
+        self.assertEqual(OpenStackAutoScaleMockHttp.calls,
+                         ['/v1/tenant/stacks/group1/stack1/resources',
+                          '/v2/tenant/servers/detail'])
+
+    def test_update_auto_scale_group_non_blocking(self):
+        OpenStackAutoScaleMockHttp.stack_statuses = [
+            ('CREATE_COMPLETE', None),
+            ('UPDATE_IN_PROGRESS', None),
+            ('UPDATE_COMPLETE', '2015-06-04T10:00:00Z')
+        ]
+        self.driver.waiter = Waiter(max_poll_interval=0.01)
+        group = self.driver.list_auto_scale_groups()[0]
+
+        future = self.driver.update_auto_scale_group(group, min_size=2,
+                                                     max_size=4,
+                                                     ex_blocking=False)
+        updated_group = future.result(timeout=5)
+
+        self.assertEqual(updated_group.min_size, 2)
+        self.assertEqual(updated_group.max_size, 4)
+        self.assertEqual(OpenStackAutoScaleMockHttp.stack_statuses, [])
+
+        template = OpenStackAutoScaleMockHttp.updated_template
+        properties = template['resources']['group1']['properties']
+        self.assertEqual(properties['min_size'], 2)
+        self.assertEqual(properties['max_size'], 4)
+
+
+class OpenStackMonitorTests(unittest.TestCase):
+
+    def setUp(self):
+        MeteringConnection.conn_classes = (OpenStackAutoScaleMockHttp,
+                                           OpenStackAutoScaleMockHttp)
+        OpenStackAutoScaleMonitorDriver.connectionCls.conn_classes = (
+            OpenStackAutoScaleMockHttp, OpenStackAutoScaleMockHttp)
+        OpenStackAutoScaleMockHttp.type = None
+        OpenStackAutoScaleMockHttp.calls = []
+
+        self.driver = OpenStackAutoScaleMonitorDriver(
+            'user', 'key', ex_force_base_url='http://heat:8004/v1/tenant',
+            ex_metering_base_url='http://ceilometer:8777', **DRIVER_KWARGS)
+
+    def test_get_metric_statistics(self):
+        series = self.driver.get_metric_statistics(
+            metric=AutoScaleMetric.CPU_UTIL, start='2015-06-02T11:00:00Z',
+            end='2015-06-02T11:20:00Z', period=600,
+            statistics=[MetricStatistic.AVG, MetricStatistic.MAX],
+            ex_stack_id='stack1')
+
+        self.assertEqual(list(series.timestamps),
+                         [1433242800.0, 1433243400.0])
+        self.assertEqual(list(series.get_values()), [12.5, 42.0])
+        self.assertEqual(list(series.get_values(MetricStatistic.MAX)),
+                         [20.0, 70.5])
+        self.assertEqual(OpenStackAutoScaleMockHttp.calls,
+                         ['/v2/meters/cpu_util/statistics'])
+
+    def test_delete_removed_auto_scale_alarm_non_blocking(self):
+        alarm = AutoScaleAlarm(id=None, name='removed',
+                               metric_name=AutoScaleMetric.CPU_UTIL,
+                               period=60, operator=AutoScaleOperator.GT,
+                               threshold=80, driver=self.driver,
+                               extra={'stack_name': 'group1',
+                                      'stack_id': 'stack1'})
+
+        future = self.driver.delete_auto_scale_alarm(alarm, ex_blocking=False)
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), True)
+        self.assertTrue(self.driver.delete_auto_scale_alarm(alarm))
+
+
+class OpenStackAutoScaleMockHttp(MockHttp):
+    fixtures = AutoScaleFileFixtures('openstack')
+    compute_fixtures = ComputeFileFixtures('openstack_v1.1')
+
+    calls = []
+    json_headers = {'content-type': 'application/json'}
+
+    # (stack_status, updated_time) returned by the subsequent stack requests
+    stack_statuses = []
+    updated_template = None
+
+    def request(self, method, url, body=None, headers=None, raw=False):
+        self.calls.append(url.split('?')[0])
+        return super(OpenStackAutoScaleMockHttp, self).request(
+            method, url, body=body, headers=headers, raw=raw)
+
+    def _response(self, body):
+        return (httplib.OK, body, self.json_headers,
+                httplib.responses[httplib.OK])
+
+    def _load_stack_fixture(self, file_name, stack_name):
+        body = self.fixtures.load(file_name) % {'name': stack_name}
+        return self._response(body)
+
+    def _v1_tenant_stacks(self, method, url, body, headers):
+        body = self.fixtures.load('_stacks.json')
+        return self._response(body)
+
+    def _v1_tenant_stacks_UPDATED(self, method, url, body, headers):
+        stacks = json.loads(self.fixtures.load('_stacks.json'))
+        stacks['stacks'][1]['updated_time'] = '2015-06-04T10:00:00Z'
+        return self._response(json.dumps(stacks))
+
+    def _v1_tenant_stacks_REMOVED(self, method, url, body, headers):
+        stacks = json.loads(self.fixtures.load('_stacks.json'))
+        del stacks['stacks'][1]
+        return self._response(json.dumps(stacks))
+
+    def _v1_tenant_stacks_group1_stack1(self, method, url, body, headers):
+        if method == 'PUT':
+            OpenStackAutoScaleMockHttp.updated_template = \
+                json.loads(body)['template']
+            return (httplib.ACCEPTED, '', {},
+                    httplib.responses[httplib.ACCEPTED])
+
+        stack = json.loads(self.fixtures.load('_stacks.json'))['stacks'][0]
+        stack['stack_status'], stack['updated_time'] = \
+            self.stack_statuses.pop(0)
+        return self._response(json.dumps({'stack': stack}))
+
+    def _v1_tenant_stacks_group1_stack1_template(self, method, url, body,
+                                                 headers):
+        return self._load_stack_fixture('_stack_template.json', 'group1')
+
+    def _v1_tenant_stacks_group2_stack2_template(self, method, url, body,
+                                                 headers):
+        return self._load_stack_fixture('_stack_template.json', 'group2')
+
+    _v1_tenant_stacks_group2_stack2_template_UPDATED = \
+        _v1_tenant_stacks_group2_stack2_template
+
+    def _v1_tenant_stacks_group1_stack1_resources(self, method, url, body,
+                                                  headers):
+        if 'nested_depth=2' in url:
+            body = self.fixtures.load('_stack_resources_nested.json')
+            return self._response(body)
+
+        return self._load_stack_fixture('_stack_resources.json', 'group1')
+
+    def _v1_tenant_stacks_group2_stack2_resources(self, method, url, body,
+                                                  headers):
+        return self._load_stack_fixture('_stack_resources.json', 'group2')
+
+    _v1_tenant_stacks_group2_stack2_resources_UPDATED = \
+        _v1_tenant_stacks_group2_stack2_resources
+
+    def _v2_meters_cpu_util_statistics(self, method, url, body, headers):
+        query = parse_qs(urlparse.urlparse(url).query)
+
+        assert query['period'] == ['600']
+        assert query['q.field'] == ['timestamp', 'timestamp',
+                                    'metadata.user_metadata.stack']
+        assert query['q.op'] == ['ge', 'lt', 'eq']
+        assert query['q.value'] == ['2015-06-02T11:00:00Z',
+                                    '2015-06-02T11:20:00Z', 'stack1']
+
+        body = self.fixtures.load('_meters_cpu_util_statistics.json')
+        return self._response(body)
+
+    def _get_server(self, server_id):
+        server = json.loads(self.compute_fixtures.load('_servers_12064.json'))
+        server['server']['id'] = server_id
+        return self._response(json.dumps(server))
+
+    def _v2_tenant_servers_detail(self, method, url, body, headers):
+        server = json.loads(
+            self.compute_fixtures.load('_servers_12064.json'))['server']
+        servers = [dict(server, id=server_id)
+                   for server_id in ['12064', '12065', '12067']]
+        return self._response(json.dumps({'servers': servers}))
+
+    def _v2_tenant_servers_12064(self, method, url, body, headers):
+        return self._get_server('12064')
+
+    def _v2_tenant_servers_12065(self, method, url, body, headers):
+        return self._get_server('12065')
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
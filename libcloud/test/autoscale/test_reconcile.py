@@ -0,0 +1,285 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import with_statement
+
+import sys
+import threading
+import unittest
+
+from libcloud.autoscale.drivers.dummy import DummyAutoScaleDriver
+from libcloud.autoscale.reconcile import ReconcileAction, Reconciler
+from libcloud.autoscale.types import AutoScaleAdjustmentType
+from libcloud.common.types import LibcloudError
+from libcloud.monitor.base import AutoScaleAlarm, MonitorDriver
+from libcloud.monitor.types import AutoScaleMetric, AutoScaleOperator
+
+
+class CountingAutoScaleDriver(DummyAutoScaleDriver):
+    """
+    Dummy driver which records the called methods.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(CountingAutoScaleDriver, self).__init__(*args, **kwargs)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _record(self, name):
+        with self.lock:
+            self.calls.append(name)
+
+    def list_auto_scale_groups(self):
+        self._record('list_auto_scale_groups')
+        return super(CountingAutoScaleDriver, self).list_auto_scale_groups()
+
+    def list_auto_scale_policies(self, group):
+        self._record('list_auto_scale_policies')
+        return super(CountingAutoScaleDriver,
+                     self).list_auto_scale_policies(group)
+
+
+class MemoryMonitorDriver(MonitorDriver):
+    """
+    Driver which keeps alarms in memory.
+    """
+    name = 'Memory'
+
+    def __init__(self):
+        super(MemoryMonitorDriver, self).__init__(key=None)
+        self.alarms = {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def create_auto_scale_alarm(self, name, policy, metric_name, operator,
+                                threshold, period, **kwargs):
+        alarm = AutoScaleAlarm(id=name, name=name, metric_name=metric_name,
+                               operator=operator, threshold=threshold,
+                               period=period, driver=self,
+                               extra={'policy_id': policy.id})
+
+        with self.lock:
+            self.calls.append('create_auto_scale_alarm')
+            self.alarms[(policy.id, name)] = alarm
+
+        return alarm
+
+    def list_auto_scale_alarms(self, policy):
+        with self.lock:
+            self.calls.append('list_auto_scale_alarms')
+            return [alarm for (policy_id, _), alarm in self.alarms.items()
+                    if policy_id == policy.id]
+
+    def delete_auto_scale_alarm(self, alarm):
+        with self.lock:
+            self.calls.append('delete_auto_scale_alarm')
+            del self.alarms[(alarm.extra['policy_id'], alarm.name)]
+
+        return True
+
+
+class ReconcilerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.driver = CountingAutoScaleDriver('key')
+        self.monitor = MemoryMonitorDriver()
+        self.reconciler = Reconciler(driver=self.driver,
+                                     monitor_driver=self.monitor)
+
+    def _get_spec(self, name='web', min_size=1, max_size=5, adjustment=1,
+                  threshold=80):
+        return {
+            'name': name,
+            'min_size': min_size,
+            'max_size': max_size,
+            'cooldown': 300,
+            'policies': [
+                {
+                    'name': 'scale-out',
+                    'adjustment_type':
+                        AutoScaleAdjustmentType.CHANGE_IN_CAPACITY,
+                    'scaling_adjustment': adjustment,
+                    'alarms': [
+                        {
+                            'name': 'cpu-high',
+                            'metric_name': AutoScaleMetric.CPU_UTIL,
+                            'operator': AutoScaleOperator.GT,
+                            'threshold': threshold,
+                            'period': 120
+                        }
+                    ]
+                }
+            ]
+        }
+
+    def _get_actions(self, plan):
+        return [(action.action, action.resource_type, action.name)
+                for action in plan.actions]
+
+    def test_create(self):
+        plan = self.reconciler.reconcile([self._get_spec()])
+
+        self.assertEqual(self._get_actions(plan), [
+            (ReconcileAction.CREATE, ReconcileAction.GROUP, 'web'),
+            (ReconcileAction.CREATE, ReconcileAction.POLICY, 'scale-out'),
+            (ReconcileAction.CREATE, ReconcileAction.ALARM, 'cpu-high')
+        ])
+        self.assertEqual(plan.errors, [])
+        self.assertTrue(all(action.applied for action in plan.actions))
+
+        group = self.driver.list_auto_scale_groups()[0]
+        policy = self.driver.list_auto_scale_policies(group)[0]
+        alarm = self.monitor.list_auto_scale_alarms(policy)[0]
+
+        self.assertEqual(group.max_size, 5)
+        self.assertEqual(policy.name, 'scale-out')
+        self.assertEqual(alarm.threshold, 80)
+
+    def test_converged_state(self):
+        specs = [self._get_spec(name='group-%s' % (index))
+                 for index in range(10)]
+        self.reconciler.reconcile(specs)
+        self.driver.calls = []
+        self.monitor.calls = []
+
+        plan = self.reconciler.reconcile(specs)
+
+        self.assertTrue(plan.is_empty())
+        self.assertEqual(self.driver.calls.count('list_auto_scale_groups'),
+                         1)
+        self.assertEqual(len(self.driver.calls), 11)
+        self.assertEqual(self.monitor.calls,
+                         ['list_auto_scale_alarms'] * 10)
+
+    def test_bulk_listing(self):
+        specs = [self._get_spec(name='group-%s' % (index))
+                 for index in range(3)]
+        self.reconciler.reconcile(specs)
+        self.driver.calls = []
+
+        def list_alarms(policies):
+            self.monitor.calls.append('bulk')
+            return dict([(policy.id, self.monitor.list_auto_scale_alarms(
+                policy)) for policy in policies])
+
+        def list_policies(groups):
+            self.driver.calls.append('bulk')
+            return dict([(group.id, self.driver._groups[group.id]
+                          ['policies'].values()) for group in groups])
+
+        self.monitor.ex_list_auto_scale_alarms_for_policies = list_alarms
+        self.driver.ex_list_auto_scale_policies_for_groups = list_policies
+
+        self.assertTrue(self.reconciler.plan(specs).is_empty())
+        self.assertEqual(self.driver.calls,
+                         ['list_auto_scale_groups', 'bulk'])
+        self.assertEqual(self.monitor.calls.count('bulk'), 1)
+
+    def test_update_group_size(self):
+        self.reconciler.reconcile([self._get_spec(min_size=1)])
+        plan = self.reconciler.reconcile([self._get_spec(min_size=3)])
+
+        self.assertEqual(self._get_actions(plan), [
+            (ReconcileAction.UPDATE, ReconcileAction.GROUP, 'web')
+        ])
+        group = self.driver.list_auto_scale_groups()[0]
+        self.assertEqual(group.min_size, 3)
+        self.assertEqual(
+            len(self.driver.list_auto_scale_group_members(group)), 3)
+
+    def test_changed_policy_is_recreated(self):
+        self.reconciler.reconcile([self._get_spec(adjustment=1)])
+        plan = self.reconciler.reconcile([self._get_spec(adjustment=2)])
+
+        self.assertEqual(self._get_actions(plan), [
+            (ReconcileAction.DELETE, ReconcileAction.ALARM, 'cpu-high'),
+            (ReconcileAction.DELETE, ReconcileAction.POLICY, 'scale-out'),
+            (ReconcileAction.CREATE, ReconcileAction.POLICY, 'scale-out'),
+            (ReconcileAction.CREATE, ReconcileAction.ALARM, 'cpu-high')
+        ])
+
+        group = self.driver.list_auto_scale_groups()[0]
+        policies = self.driver.list_auto_scale_policies(group)
+        self.assertEqual([p.scaling_adjustment for p in policies], [2])
+        self.assertEqual(len(self.monitor.alarms), 1)
+
+    def test_changed_alarm_is_recreated(self):
+        self.reconciler.reconcile([self._get_spec(threshold=80)])
+        plan = self.reconciler.reconcile([self._get_spec(threshold=90)])
+
+        self.assertEqual(self._get_actions(plan), [
+            (ReconcileAction.DELETE, ReconcileAction.ALARM, 'cpu-high'),
+            (ReconcileAction.CREATE, ReconcileAction.ALARM, 'cpu-high')
+        ])
+        self.assertEqual([alarm.threshold for alarm
+                          in self.monitor.alarms.values()], [90])
+
+    def test_prune(self):
+        self.reconciler.reconcile([self._get_spec(), self._get_spec('db')])
+        spec = self._get_spec()
+        spec['policies'] = []
+
+        self.assertTrue(self.reconciler.plan([spec]).is_empty())
+
+        self.reconciler.prune = True
+        plan = self.reconciler.reconcile([spec])
+
+        # groups which are not part of the desired state are kept
+        self.assertEqual(self._get_actions(plan), [
+            (ReconcileAction.DELETE, ReconcileAction.ALARM, 'cpu-high'),
+            (ReconcileAction.DELETE, ReconcileAction.POLICY, 'scale-out')
+        ])
+        self.assertEqual(len(self.driver.list_auto_scale_groups()), 2)
+        self.assertEqual(len(self.monitor.alarms), 1)
+
+    def test_dry_run(self):
+        plan = self.driver.reconcile([self._get_spec()],
+                                     monitor_driver=self.monitor,
+                                     dry_run=True)
+
+        self.assertEqual(len(plan), 3)
+        self.assertFalse(any(action.applied for action in plan.actions))
+        self.assertEqual(self.driver.list_auto_scale_groups(), [])
+
+    def test_without_monitor_driver(self):
+        plan = self.driver.reconcile([self._get_spec()])
+
+        self.assertEqual([action.resource_type for action in plan.actions],
+                         [ReconcileAction.GROUP, ReconcileAction.POLICY])
+
+    def test_failed_group_does_not_stop_other_groups(self):
+        specs = [self._get_spec(name='web'),
+                 self._get_spec(name='db', min_size=6, max_size=5)]
+        self.driver.reconcile(specs[:1], monitor_driver=self.monitor)
+        specs[0]['max_size'] = 10
+
+        plan = self.driver.reconcile(specs, monitor_driver=self.monitor)
+
+        self.assertEqual(len(plan.errors), 1)
+        error = plan.errors[0]
+        self.assertEqual(error.group_name, 'db')
+        self.assertTrue(isinstance(error.error, LibcloudError))
+        self.assertFalse(plan.group_plans[1].actions[1].applied)
+
+        group = [group for group in self.driver.list_auto_scale_groups()
+                 if group.name == 'web'][0]
+        self.assertEqual(group.max_size, 10)
+
+    def test_duplicate_group_names(self):
+        self.assertRaises(ValueError, self.reconciler.plan,
+                          [self._get_spec(), self._get_spec()])
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -23,6 +23,7 @@ try:
 except ImportError:
     crypto = False
 
+from libcloud.common.types import LibcloudError
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import xmlrpclib
 
@@ -37,10 +38,12 @@ from libcloud.compute.drivers.softlayer import SoftLayerNodeDriver as SoftLayer
 from libcloud.monitor.base import AutoScaleAlarm
 from libcloud.monitor.drivers.softlayer import SoftLayerMonitorDriver as \
     monSoftlayer
-from libcloud.monitor.types import AutoScaleMetric, AutoScaleOperator
+from libcloud.monitor.types import AutoScaleMetric, AutoScaleOperator, \
+    MetricStatistic
 
 from libcloud.test import MockHttp               # pylint: disable-msg=E0611
 from libcloud.test.file_fixtures import ComputeFileFixtures
+from libcloud.test.file_fixtures import AutoScaleFileFixtures
 from libcloud.test.secrets import SOFTLAYER_PARAMS
 
 null_fingerprint = '00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:' + \
@@ -55,6 +58,7 @@ class SoftLayerTests(unittest.TestCase):
             SoftLayerMockHttp, SoftLayerMockHttp)
         SoftLayerMockHttp.type = None
         SoftLayerMockHttp.test = self
+        SoftLayerMockHttp.calls = []
         self.driver = SoftLayer(*SOFTLAYER_PARAMS)
 
         asSoftlayer.connectionCls.conn_classes = (
@@ -161,17 +165,86 @@ class SoftLayerTests(unittest.TestCase):
         DELETE_GROUP_CALLS = 0
         self.as_driver.delete_auto_scale_group(group)
 
+    def _get_group(self):
+        return AutoScaleGroup(id=145955, name='libcloud-testing',
+                              min_size=None, max_size=None, cooldown=None,
+                              region=None, termination_policies=None,
+                              driver=self.as_driver)
+
+    def test_list_auto_scale_group_members(self):
+        group = self._get_group()
+        SoftLayerMockHttp.type = 'ALL_GUESTS'
+
+        nodes = self.as_driver.list_auto_scale_group_members(group=group)
+
+        self.assertEqual([node.id for node in nodes], ['2905761', '2905762'])
+        self.assertEqual(nodes[0].name, 'libcloud-testing-1.example.com')
+        self.assertEqual(nodes[0].public_ips, ['169.54.0.1'])
+        self.assertEqual(nodes[0].extra['password'], 'LibcloudTest1')
+        self.assertEqual(SoftLayerMockHttp.calls,
+                         ['SoftLayer_Scale_Group_getVirtualGuestMembers'])
+
+    def test_list_auto_scale_group_members_missing_guests(self):
+        group = self._get_group()
+
+        nodes = self.as_driver.list_auto_scale_group_members(group=group)
+
+        # Guest of the third member is retrieved using a separate call
+        self.assertEqual([node.id for node in nodes],
+                         ['2905761', '2905762', '2905763'])
+        self.assertEqual(
+            SoftLayerMockHttp.calls,
+            ['SoftLayer_Scale_Group_getVirtualGuestMembers',
+             'SoftLayer_Scale_Member_Virtual_Guest_getVirtualGuest'])
+
+    def test_list_auto_scale_group_members_large_group(self):
+        group = self._get_group()
+        SoftLayerMockHttp.type = 'LARGE'
+
+        nodes = self.as_driver.list_auto_scale_group_members(group=group)
+
+        self.assertEqual(len(nodes), 300)
+        self.assertEqual(len(set([node.id for node in nodes])), 300)
+        self.assertEqual(len(SoftLayerMockHttp.calls), 1)
+
+    def test_get_metric_statistics(self):
+        series = self.mon_driver.get_metric_statistics(
+            metric=AutoScaleMetric.CPU_UTIL, start='2015-06-02T15:00:00Z',
+            end='2015-06-02T15:20:00Z', period=600,
+            statistics=[MetricStatistic.AVG, MetricStatistic.MAX,
+                        MetricStatistic.SAMPLE_COUNT], ex_guest_id=2905761)
+
+        # samples of both CPUs are aggregated into 10 minute periods, the
+        # sample at the end of the time range is ignored
+        self.assertEqual(list(series.timestamps),
+                         [1433257200.0, 1433257800.0])
+        self.assertEqual(list(series.get_values()), [35.0, 55.0])
+        self.assertEqual(list(series.get_values(MetricStatistic.MAX)),
+                         [60.0, 80.0])
+        self.assertEqual(
+            list(series.get_values(MetricStatistic.SAMPLE_COUNT)),
+            [4.0, 4.0])
+        self.assertEqual(SoftLayerMockHttp.calls,
+                         ['SoftLayer_Virtual_Guest_getCpuMetricDataByDate'])
+
+    def test_get_metric_statistics_guest_id_is_required(self):
+        self.assertRaises(LibcloudError, self.mon_driver.get_metric_statistics,
+                          metric=AutoScaleMetric.CPU_UTIL, start=0, end=600,
+                          period=60)
+
 
 class SoftLayerMockHttp(MockHttp):
     fixtures = ComputeFileFixtures('softlayer')
+    as_fixtures = AutoScaleFileFixtures('softlayer')
+    calls = []
 
     def _get_method_name(self, type, use_param, qs, path):
         return "_xmlrpc"
 
     def _xmlrpc(self, method, url, body, headers):
         params, meth_name = xmlrpclib.loads(body)
-        url = url.replace("/", "_")
-        meth_name = "%s_%s" % (url, meth_name)
+        self.calls.append('%s_%s' % (url.split('/')[-1], meth_name))
+        meth_name = "%s_%s" % (url.replace("/", "_"), meth_name)
         return getattr(self, meth_name)(method, url, body, headers)
 
     def _xmlrpc_v3_SoftLayer_Account_getVirtualGuests(
@@ -266,5 +339,44 @@ class SoftLayerMockHttp(MockHttp):
         body = self.fixtures.load('v3__SoftLayer_Scale_Policy_Trigger_ResourceUse_deleteObject.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _xmlrpc_v3_SoftLayer_Scale_Group_getVirtualGuestMembers(
+            self, method, url, body, headers):
+        params, _ = xmlrpclib.loads(body)
+        mask = params[0]['headers']['SoftLayer_Scale_GroupObjectMask']['mask']
+        self.test.assertTrue('virtualGuest' in mask['virtualGuestMembers'])
+
+        body = self.as_fixtures.load(
+            'v3__SoftLayer_Scale_Group_getVirtualGuestMembers.xml')
+        members = xmlrpclib.loads(body)[0][0]
+
+        if self.type == 'ALL_GUESTS':
+            members = members[:2]
+        elif self.type == 'LARGE':
+            template = members[0]
+            members = []
+
+            for index in range(300):
+                member = dict(template, id=template['id'] + index)
+                member['virtualGuest'] = dict(
+                    template['virtualGuest'],
+                    id=template['virtualGuest']['id'] + index)
+                members.append(member)
+
+        body = xmlrpclib.dumps((members, ), methodresponse=True)
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _xmlrpc_v3_SoftLayer_Scale_Member_Virtual_Guest_getVirtualGuest(
+            self, method, url, body, headers):
+        body = self.as_fixtures.load(
+            'v3__SoftLayer_Scale_Member_Virtual_Guest_getVirtualGuest.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _xmlrpc_v3_SoftLayer_Virtual_Guest_getCpuMetricDataByDate(
+            self, method, url, body, headers):
+        body = self.as_fixtures.load(
+            'v3__SoftLayer_Virtual_Guest_getCpuMetricDataByDate.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+
 if __name__ == '__main__':
     sys.exit(unittest.main())
@@ -0,0 +1,124 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import threading
+
+from libcloud.test import unittest
+from libcloud.autoscale.waiter import Waiter, get_default_waiter, wait_for
+from libcloud.common.poll import get_default_poll_scheduler
+from libcloud.common.types import LibcloudError
+
+
+class Operation(object):
+    """
+    Operation which completes after the given number of checks.
+    """
+
+    def __init__(self, checks_needed, result='done'):
+        self.checks_needed = checks_needed
+        self.result = result
+        self.threads = []
+
+    def check(self):
+        self.threads.append(threading.current_thread())
+        return (len(self.threads) >= self.checks_needed, self.result)
+
+
+class WaiterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.waiter = Waiter(max_poll_interval=0.01)
+
+    def test_completed_operation(self):
+        operation = Operation(checks_needed=1)
+        future = self.waiter.wait(check=operation.check, timeout=10)
+
+        # first check is performed in the calling thread
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), 'done')
+        self.assertEqual(operation.threads, [threading.current_thread()])
+        self.assertEqual(self.waiter.pending_jobs, 0)
+
+    def test_many_operations(self):
+        operations = [Operation(checks_needed=index + 2, result=index)
+                      for index in range(20)]
+        futures = [self.waiter.wait(check=operation.check, timeout=10,
+                                    poll_interval=0.01)
+                   for operation in operations]
+
+        results = [future.result(timeout=10) for future in futures]
+
+        self.assertEqual(results, list(range(20)))
+        self.assertEqual(self.waiter.pending_jobs, 0)
+
+        # all the operations are checked by the same thread
+        threads = set()
+
+        for operation in operations:
+            threads.update(operation.threads[1:])
+
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads.pop(), threading.current_thread())
+
+    def test_callback(self):
+        operation = Operation(checks_needed=2, result=2)
+        future = self.waiter.wait(check=operation.check, timeout=10,
+                                  poll_interval=0.01,
+                                  callback=lambda result: result * 10)
+
+        self.assertEqual(future.result(timeout=10), 20)
+
+    def test_timeout(self):
+        operation = Operation(checks_needed=1000)
+        future = self.waiter.wait(check=operation.check, timeout=0.05,
+                                  poll_interval=0.01,
+                                  description='Group creation')
+
+        try:
+            future.result(timeout=10)
+        except LibcloudError:
+            e = sys.exc_info()[1]
+            self.assertTrue('Group creation did not complete' in str(e))
+        else:
+            self.fail('Exception was not thrown')
+
+    def test_check_exception(self):
+        def check():
+            raise ValueError('invalid')
+
+        future = self.waiter.wait(check=check, timeout=10)
+        self.assertRaises(ValueError, future.result)
+
+    def test_wait_for(self):
+        operation = Operation(checks_needed=2)
+
+        self.assertEqual(wait_for(check=operation.check, timeout=10,
+                                  poll_interval=0.01, waiter=self.waiter),
+                         'done')
+
+        future = wait_for(check=Operation(checks_needed=2).check, timeout=10,
+                          poll_interval=0.01, blocking=False,
+                          waiter=self.waiter)
+        self.assertEqual(future.result(timeout=10), 'done')
+
+    def test_get_default_waiter(self):
+        self.assertTrue(get_default_waiter() is get_default_waiter())
+
+        # Operations share the thread with the async compute jobs
+        self.assertTrue(get_default_waiter() is get_default_poll_scheduler())
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -0,0 +1,266 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import gzip
+import json
+import threading
+
+from io import BytesIO
+
+from libcloud.test import unittest
+from libcloud.utils.py3 import b
+from libcloud.utils.py3 import httplib
+from libcloud.utils.py3 import urlparse
+from libcloud.utils.py3 import parse_qs
+from libcloud.common.base import JsonResponse
+from libcloud.common.base import PollingConnection
+from libcloud.common.openstack import OpenStackBaseConnection
+from libcloud.compute.drivers.ec2 import EC2NodeDriver
+from libcloud.compute.drivers.dummy import DummyNodeDriver
+from libcloud.test.file_fixtures import ComputeFileFixtures
+from libcloud.test.secrets import EC2_PARAMS
+
+ASYNCIO_SUPPORTED = sys.version_info >= (3, 5)
+
+if ASYNCIO_SUPPORTED:
+    import asyncio
+
+    from socketserver import ThreadingMixIn
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+
+    from libcloud.common.aio import AsyncConnection
+    from libcloud.common.aio import AsyncPollingConnection
+    from libcloud.common.aio import AsyncOpenStackConnection
+    from libcloud.common.aio import get_async_connection_class
+
+    class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+        daemon_threads = True
+
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        jobs = {}
+        lock = threading.Lock()
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body, headers=None, chunked=False):
+            self.send_response(status)
+
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+
+            if chunked:
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+
+                for index in range(0, len(body), 7):
+                    chunk = body[index:index + 7]
+                    self.wfile.write(b('%X\r\n' % len(chunk)) + chunk +
+                                     b('\r\n'))
+
+                self.wfile.write(b('0\r\n\r\n'))
+            else:
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        def _handle(self):
+            parsed = urlparse.urlparse(self.path)
+            qs = dict((k, v[0]) for k, v in parse_qs(parsed.query).items())
+            length = int(self.headers.get('Content-Length', 0))
+            data = self.rfile.read(length).decode('utf-8')
+
+            if parsed.path == '/echo':
+                body = json.dumps({'method': self.command, 'query': qs,
+                                   'data': data,
+                                   'user_agent': self.headers['User-Agent']})
+                self._send(httplib.OK, b(body),
+                           {'Content-Type': 'application/json'},
+                           chunked='chunked' in qs)
+            elif parsed.path == '/gzip':
+                buf = BytesIO()
+                fp = gzip.GzipFile(fileobj=buf, mode='wb')
+                fp.write(b(json.dumps({'compressed': True})))
+                fp.close()
+                self._send(httplib.OK, buf.getvalue(),
+                           {'Content-Encoding': 'gzip'})
+            elif parsed.path == '/job':
+                self._send(httplib.OK, b(json.dumps({'job_id': qs['id']})))
+            elif parsed.path == '/job/status':
+                with self.lock:
+                    polls = self.jobs.get(qs['id'], 0) + 1
+                    self.jobs[qs['id']] = polls
+
+                body = json.dumps({'job_id': qs['id'], 'done': polls >= 3})
+                self._send(httplib.OK, b(body))
+            elif parsed.path == '/' and qs.get('Action'):
+                fixtures = ComputeFileFixtures('ec2')
+                body = fixtures.load('describe_instances.xml')
+                self._send(httplib.OK, b(body))
+            else:
+                self._send(httplib.NOT_FOUND, b('{"error": "not found"}'))
+
+        do_GET = do_POST = do_DELETE = _handle
+
+    class EchoConnection(AsyncConnection):
+        responseCls = JsonResponse
+        secure = 0
+
+    class JobConnection(PollingConnection):
+        responseCls = JsonResponse
+        secure = 0
+        poll_interval = 0.01
+
+        def get_poll_request_kwargs(self, response, context, request_kwargs):
+            return {'action': '/job/status',
+                    'params': {'id': response.object['job_id']}}
+
+        def has_completed(self, response):
+            return response.object['done']
+
+
+@unittest.skipIf(not ASYNCIO_SUPPORTED, 'asyncio requires Python 3.5+')
+class AsyncConnectionTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockHandler)
+        cls.port = cls.server.server_address[1]
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        MockHandler.jobs = {}
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.connection = EchoConnection(host='127.0.0.1', port=self.port,
+                                         secure=False)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def _run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_request_reuses_response_classes(self):
+        response = self._run(self.connection.request(
+            '/echo', params={'foo': 'bar'}, data='payload', method='POST'))
+
+        self.assertTrue(isinstance(response, JsonResponse))
+        self.assertEqual(response.status, httplib.OK)
+        self.assertEqual(response.object['method'], 'POST')
+        self.assertEqual(response.object['query'], {'foo': 'bar'})
+        self.assertEqual(response.object['data'], 'payload')
+        self.assertTrue('libcloud/' in response.object['user_agent'])
+
+    def test_chunked_and_compressed_responses(self):
+        response = self._run(self.connection.request(
+            '/echo', params={'chunked': '1'}))
+        self.assertEqual(response.object['query'], {'chunked': '1'})
+
+        response = self._run(self.connection.request('/gzip'))
+        self.assertEqual(response.object, {'compressed': True})
+
+    def test_error_response(self):
+        self.assertRaises(Exception, self._run,
+                          self.connection.request('/missing'))
+
+    def test_raw_requests_are_not_supported(self):
+        self.assertRaises(Exception, self._run,
+                          self.connection.request('/echo', raw=True))
+
+    def test_concurrent_requests_keep_their_own_context(self):
+        test = self
+
+        class ContextResponse(JsonResponse):
+            def parse_body(self):
+                body = super(ContextResponse, self).parse_body()
+                test.assertEqual(self.connection.context['id'],
+                                 body['query']['id'])
+                return body
+
+        class ContextConnection(EchoConnection):
+            responseCls = ContextResponse
+
+            def _prepare_request(self, action, params=None, **kwargs):
+                # Drivers usually set the context right before the request
+                self.set_context({'id': params['id']})
+                return super(ContextConnection, self)._prepare_request(
+                    action, params=params, **kwargs)
+
+        connection = ContextConnection(host='127.0.0.1', port=self.port,
+                                       secure=False)
+        coroutines = [connection.request('/echo', params={'id': str(index)})
+                      for index in range(50)]
+        responses = self._run(asyncio.gather(*coroutines))
+
+        self.assertEqual([r.object['query']['id'] for r in responses],
+                         [str(index) for index in range(50)])
+        self.assertEqual(connection.context, {})
+
+    def test_async_request_polls_without_blocking(self):
+        cls = get_async_connection_class(JobConnection)
+        self.assertTrue(issubclass(cls, AsyncPollingConnection))
+
+        connection = cls(host='127.0.0.1', port=self.port, secure=False)
+        coroutines = [connection.async_request('/job', params={'id': str(i)})
+                      for i in range(20)]
+        responses = self._run(asyncio.gather(*coroutines))
+
+        self.assertTrue(all(r.object['done'] for r in responses))
+        self.assertEqual(len(MockHandler.jobs), 20)
+        self.assertTrue(all(polls == 3 for polls in
+                            MockHandler.jobs.values()))
+
+    def test_driver_opt_in(self):
+        driver = EC2NodeDriver(*EC2_PARAMS)
+        connection = driver.get_async_connection()
+        self.assertTrue(isinstance(connection, AsyncConnection))
+        self.assertTrue(isinstance(connection, driver.connectionCls))
+        self.assertTrue(connection is driver.get_async_connection())
+        self.assertTrue(connection.driver is driver)
+
+        connection.host = '127.0.0.1'
+        connection.port = self.port
+        connection.secure = 0
+
+        response = self._run(connection.request(
+            '/', params={'Action': 'DescribeInstances'}))
+        nodes = driver._to_nodes(response.object,
+                                 'reservationSet/item/instancesSet/item')
+        self.assertEqual(len(nodes), 2)
+        self.assertEqual(nodes[0].id, 'i-4382922a')
+
+    def test_unsupported_driver(self):
+        driver = DummyNodeDriver(0)
+        self.assertRaises(NotImplementedError, driver.get_async_connection)
+
+    def test_openstack_connection_class(self):
+        cls = get_async_connection_class(OpenStackBaseConnection)
+        self.assertTrue(issubclass(cls, AsyncOpenStackConnection))
+        self.assertTrue(issubclass(cls, OpenStackBaseConnection))
+        self.assertTrue(get_async_connection_class(cls) is cls)
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -1,11 +1,14 @@
 import sys
+import hashlib
 import unittest
 from datetime import datetime
+from io import BytesIO
 
 import mock
 
 from libcloud.common.aws import SignedAWSConnection
 from libcloud.common.aws import AWSRequestSignerAlgorithmV4
+from libcloud.utils.py3 import b
 from libcloud.test import LibcloudTestCase
 
 
@@ -53,10 +56,20 @@ class AWSRequestSignerAlgorithmV4TestCase(LibcloudTestCase):
                               'SignedHeaders=accept-encoding;host;user-agent;x-amz-date, '
                               'Signature=f9868f8414b3c3f856c7955019cc1691265541f5162b9b772d26044280d39bd3')
 
-    def test_v4_signature_raises_error_if_request_method_not_GET(self):
-        with self.assertRaises(Exception):
-            self.signer._get_authorization_v4_header(params={}, headers={},
-                                                     dt=self.now, method='POST')
+    def test_v4_signature_post_request(self):
+        headers = {
+            'Host': 'ec2.eu-west-1.amazonaws.com',
+            'X-AMZ-Date': '20150304T173452Z'
+        }
+        get_sig = self.signer._get_authorization_v4_header(
+            params={}, headers=headers, dt=self.now, method='GET')
+        post_sig = self.signer._get_authorization_v4_header(
+            params={}, headers=headers, dt=self.now, method='POST')
+        post_data_sig = self.signer._get_authorization_v4_header(
+            params={}, headers=headers, dt=self.now, method='POST',
+            data='Action=DescribeInstances')
+
+        self.assertEqual(len(set([get_sig, post_sig, post_data_sig])), 3)
 
     def test_v4_signature_contains_user_id(self):
         sig = self.signer._get_authorization_v4_header(params={}, headers={},
@@ -122,6 +135,31 @@ class AWSRequestSignerAlgorithmV4TestCase(LibcloudTestCase):
 
         self.assertEqual(key, 'AWS4my_secret|20150304|my_region|my_service|aws4_request')
 
+    def test_get_key_to_sign_with_is_cached(self):
+        key = self.signer._get_key_to_sign_with(self.now)
+
+        with mock.patch('libcloud.common.aws._sign') as mock_sign:
+            self.assertEqual(self.signer._get_key_to_sign_with(self.now),
+                             key)
+            self.assertEqual(mock_sign.call_count, 0)
+
+            self.signer._get_key_to_sign_with(datetime(2015, 3, 5))
+            self.assertEqual(mock_sign.call_count, 4)
+
+        self.connection.service_name = 'other_service'
+        self.assertNotEqual(self.signer._get_key_to_sign_with(self.now), key)
+
+    def test_get_request_headers_signs_request_body(self):
+        self.connection.data = 'Action=DescribeInstances'
+
+        with mock.patch.object(self.signer,
+                               '_get_payload_hash') as mock_hash:
+            mock_hash.return_value = 'hash'
+            self.signer.get_request_headers(params={}, headers={},
+                                            method='POST')
+
+        mock_hash.assert_called_once_with('Action=DescribeInstances')
+
     def test_get_signed_headers_contains_all_headers_lowercased(self):
         headers = {'Content-Type': 'text/plain', 'Host': 'my_host', 'X-Special-Header': ''}
         signed_headers = self.signer._get_signed_headers(headers)
@@ -219,6 +257,21 @@ class AWSRequestSignerAlgorithmV4TestCase(LibcloudTestCase):
         self.assertEqual(self.signer._get_payload_hash(),
                          'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855')
 
+    def test_get_payload_hash_of_request_body(self):
+        data = 'Action=DescribeInstances'
+        self.assertEqual(self.signer._get_payload_hash(data),
+                         hashlib.sha256(b(data)).hexdigest())
+
+    def test_get_payload_hash_of_file_like_body_is_streamed(self):
+        data = b('a') * 1000
+        body = BytesIO(data)
+        body.seek(10)
+        self.signer.payload_chunk_size = 100
+
+        self.assertEqual(self.signer._get_payload_hash(body),
+                         hashlib.sha256(data[10:]).hexdigest())
+        self.assertEqual(body.tell(), 10)
+
     def test_get_canonical_request(self):
         req = self.signer._get_canonical_request(
             {'Action': 'DescribeInstances', 'Version': '2013-10-15'},
@@ -0,0 +1,183 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+from libcloud.test import unittest
+from libcloud.common.cache import ResultCache, get_cache_key
+from libcloud.compute.base import NodeImage, NodeLocation
+from libcloud.compute.drivers.dummy import DummyNodeDriver
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingDummyNodeDriver(DummyNodeDriver):
+    def __init__(self, *args, **kwargs):
+        super(CountingDummyNodeDriver, self).__init__(*args, **kwargs)
+        self.calls = []
+
+    def list_images(self, location=None):
+        self.calls.append(('list_images', location))
+        return super(CountingDummyNodeDriver, self).list_images(
+            location=location)
+
+    def create_image(self, node, name, description=None):
+        return NodeImage(id='new', name=name, driver=self)
+
+
+class ResultCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.cache = ResultCache(ttl=60, max_size=2, clock=self.clock)
+
+    def test_get_set(self):
+        self.assertEqual(self.cache.get(('list_images',)), (False, None))
+        self.cache.set(('list_images',), [1, 2])
+        self.assertEqual(self.cache.get(('list_images',)), (True, [1, 2]))
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['size'], 1)
+
+    def test_ttl(self):
+        self.cache.set(('list_sizes',), [])
+        self.clock.now += 59
+        self.assertTrue(self.cache.get(('list_sizes',))[0])
+        self.clock.now += 1
+        self.assertFalse(self.cache.get(('list_sizes',))[0])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru_eviction(self):
+        self.cache.set(('a',), 1)
+        self.cache.set(('b',), 2)
+
+        # "a" is now the most recently used entry
+        self.cache.get(('a',))
+        self.cache.set(('c',), 3)
+
+        self.assertTrue(self.cache.get(('a',))[0])
+        self.assertFalse(self.cache.get(('b',))[0])
+        self.assertTrue(self.cache.get(('c',))[0])
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_set_existing_key(self):
+        self.cache.set(('a',), 1)
+        self.cache.set(('a',), 2)
+        self.cache.set(('b',), 3)
+
+        self.assertEqual(self.cache.get(('a',)), (True, 2))
+        self.assertEqual(self.cache.evictions, 0)
+
+        # Expired entry is removed once it's accessed
+        self.clock.now += 60
+        self.assertFalse(self.cache.get(('a',))[0])
+        self.cache.set(('c',), 4)
+        self.assertEqual(self.cache.evictions, 0)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_invalidate(self):
+        cache = ResultCache()
+        cache.set(get_cache_key('list_images', (), {}), 1)
+        cache.set(get_cache_key('list_images', (1,), {}), 2)
+        cache.set(get_cache_key('list_sizes', (), {}), 3)
+
+        self.assertEqual(cache.invalidate('list_images'), 2)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.invalidate(), 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_max_size(self):
+        self.assertRaises(ValueError, ResultCache, max_size=0)
+
+    def test_get_cache_key(self):
+        driver = DummyNodeDriver(0)
+        location1 = NodeLocation(id='1', name='a', country='US',
+                                 driver=driver)
+        location2 = NodeLocation(id='1', name='b', country='US',
+                                 driver=driver)
+
+        self.assertEqual(get_cache_key('list_sizes', (location1,), {}),
+                         get_cache_key('list_sizes', (location2,), {}))
+        self.assertEqual(
+            get_cache_key('list_images', (), {'ex_filters': {'a': 1},
+                                              'location': None}),
+            ('list_images', (), (('ex_filters', "{'a': 1}"),
+                                 ('location', None))))
+
+
+class DriverCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.driver = CountingDummyNodeDriver(0)
+
+    def test_cache_is_opt_in(self):
+        self.driver.list_images()
+        self.driver.list_images()
+        self.assertEqual(len(self.driver.calls), 2)
+        self.assertEqual(self.driver.invalidate_cache(), 0)
+
+    def test_enable_cache(self):
+        cache = self.driver.enable_cache(ttl=60, max_size=10)
+
+        images = self.driver.list_images()
+        images.append('modified')
+        self.assertEqual(self.driver.list_images(), images[:-1])
+        self.driver.list_images(location='loc')
+
+        self.assertEqual(self.driver.calls, [('list_images', None),
+                                             ('list_images', 'loc')])
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertTrue(self.driver.cache is cache)
+
+    def test_invalidate_cache(self):
+        self.driver.enable_cache()
+        self.driver.list_images()
+        self.driver.list_sizes()
+
+        self.assertEqual(self.driver.invalidate_cache('list_images'), 1)
+        self.driver.list_images()
+        self.assertEqual(len(self.driver.calls), 2)
+
+    def test_create_image_invalidates_images(self):
+        self.driver.enable_cache()
+        self.driver.list_images()
+        self.driver.list_sizes()
+
+        self.driver.create_image(node=None, name='image')
+        self.driver.list_images()
+
+        self.assertEqual(len(self.driver.calls), 2)
+        self.assertEqual(len(self.driver.cache), 2)
+
+    def test_disable_cache(self):
+        self.driver.enable_cache(methods=['list_images'])
+        self.driver.list_images()
+        self.driver.disable_cache()
+        self.driver.list_images()
+
+        self.assertEqual(len(self.driver.calls), 2)
+        self.assertEqual(self.driver.cache, None)
+        self.assertFalse('list_images' in self.driver.__dict__)
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
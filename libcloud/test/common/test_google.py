@@ -25,9 +25,12 @@ try:
 except ImportError:
     import json
 
+from mock import patch
+
 from libcloud.utils.py3 import httplib
 
 from libcloud.test import MockHttp, LibcloudTestCase
+from libcloud.common.token_cache import MemoryTokenCache
 from libcloud.common.google import (GoogleAuthError,
                                     GoogleBaseAuthConnection,
                                     GoogleInstalledAppAuthConnection,
@@ -201,6 +204,44 @@ class GoogleBaseConnectionTest(LibcloudTestCase):
         self.assertEqual(new_params, new_expected_params)
         self.assertEqual(new_headers, new_expected_headers)
 
+    def test_token_cache(self):
+        token_cache = MemoryTokenCache()
+        kwargs = {'scopes': self.mock_scopes, 'auth_type': 'IA',
+                  'token_cache': token_cache}
+        conn1 = GoogleBaseConnection(*GCE_PARAMS, **kwargs)
+
+        # Second connection uses the cached token instead of requesting a
+        # new one
+        with patch.object(GoogleInstalledAppAuthConnection,
+                          'get_new_token') as get_new_token:
+            conn2 = GoogleBaseConnection(*GCE_PARAMS, **kwargs)
+
+        self.assertEqual(get_new_token.call_count, 0)
+        self.assertEqual(conn2.token_info, conn1.token_info)
+
+        # Expired token is replaced by a token which was stored by another
+        # connection in the meantime
+        token_info = dict(conn1.token_info, access_token='stored',
+                          expire_time='2013-06-26T21:00:00Z')
+        token_cache.set(conn1._token_cache_key, token_info)
+        conn1.token_expire_time = datetime.datetime(2013, 6, 26, 18, 0, 0)
+
+        with patch.object(GoogleInstalledAppAuthConnection,
+                          'refresh_token') as refresh_token:
+            params, headers = conn1.pre_connect_hook({}, {})
+
+        self.assertEqual(refresh_token.call_count, 0)
+        self.assertEqual(headers, {'Authorization': 'Bearer stored'})
+
+    def test_pre_connect_hook_refreshes_expiring_token_in_background(self):
+        self.conn.token_refresh_window = 2 * 60 * 60
+        params, headers = self.conn.pre_connect_hook({}, {})
+        self.conn._token_refresher.join()
+
+        self.assertEqual(headers, {'Authorization': 'Bearer installedapp'})
+        self.assertEqual(self.conn.token_info['access_token'],
+                         'refreshrefresh')
+
     def test_encode_data(self):
         data = {'key': 'value'}
         json_data = '{"key": "value"}'
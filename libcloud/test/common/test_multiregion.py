@@ -0,0 +1,141 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import with_statement
+
+import sys
+import time
+import threading
+
+from libcloud.test import unittest
+from libcloud.common.multiregion import MultiRegionDriver
+from libcloud.compute.drivers.ec2 import EC2NodeDriver
+from libcloud.autoscale.drivers.aws import AWSAutoScaleDriver
+from libcloud.monitor.drivers.aws import AWSCloudWatchDriver
+
+
+class FakeRegionalDriver(object):
+    instances = []
+    delays = {'region-1': 0.2}
+
+    def __init__(self, key, secret=None, region='region-1', **kwargs):
+        if region == 'invalid':
+            raise ValueError('Invalid region: %s' % (region))
+
+        self.region_name = region
+        self.kwargs = kwargs
+        self.instances.append(self)
+
+    @classmethod
+    def list_regions(cls):
+        return ['region-1', 'region-2', 'region-3']
+
+    def list_nodes(self, prefix='node'):
+        time.sleep(self.delays.get(self.region_name, 0))
+
+        if self.region_name == 'region-3':
+            raise Exception('Service unavailable')
+
+        return ['%s-%s' % (prefix, self.region_name)]
+
+
+class MultiRegionDriverTestCase(unittest.TestCase):
+    def setUp(self):
+        FakeRegionalDriver.instances = []
+        self.driver = MultiRegionDriver(FakeRegionalDriver, 'key', 'secret',
+                                        ex_option=True)
+
+    def test_call(self):
+        results = self.driver.list_nodes(prefix='vm')
+
+        self.assertEqual([result.region for result in results],
+                         ['region-1', 'region-2', 'region-3'])
+        self.assertEqual(results.items, ['vm-region-1', 'vm-region-2'])
+        self.assertEqual(list(results.errors.keys()), ['region-3'])
+        self.assertEqual(str(results.errors['region-3']),
+                         'Service unavailable')
+        self.assertTrue(results[0].latency >= 0.2)
+
+    def test_calls_are_concurrent(self):
+        start = time.time()
+        self.driver.call('list_nodes')
+        self.assertTrue(time.time() - start < 0.4)
+
+    def test_iterate_yields_fastest_region_first(self):
+        regions = [result.region for result in
+                   self.driver.iterate('list_nodes')]
+
+        self.assertEqual(len(regions), 3)
+        self.assertEqual(regions[-1], 'region-1')
+
+    def test_drivers_are_reused(self):
+        self.driver.list_nodes()
+        self.driver.list_nodes()
+
+        self.assertEqual(len(FakeRegionalDriver.instances), 3)
+        self.assertTrue(self.driver.get_driver('region-2') is
+                        self.driver.get_driver('region-2'))
+        self.assertEqual(self.driver.get_driver('region-2').kwargs,
+                         {'ex_option': True})
+
+    def test_regions(self):
+        driver = MultiRegionDriver(FakeRegionalDriver, 'key', 'secret',
+                                   regions=['region-2', 'invalid'])
+        results = driver.list_nodes()
+
+        self.assertEqual(results.items, ['node-region-2'])
+        self.assertTrue(isinstance(results.errors['invalid'], ValueError))
+
+    def test_unknown_method(self):
+        self.assertRaises(AttributeError, getattr, self.driver, 'foo')
+
+    def test_max_concurrency(self):
+        active = []
+        maximum = []
+        lock = threading.Lock()
+
+        class Driver(FakeRegionalDriver):
+            def list_nodes(self):
+                with lock:
+                    active.append(True)
+                    maximum.append(len(active))
+
+                time.sleep(0.05)
+
+                with lock:
+                    active.pop()
+
+        driver = MultiRegionDriver(Driver, 'key', 'secret',
+                                   max_concurrency=1)
+        results = driver.list_nodes()
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(max(maximum), 1)
+        self.assertRaises(ValueError, MultiRegionDriver, Driver, 'key',
+                          max_concurrency=0)
+
+    def test_aws_drivers(self):
+        for driver_cls in [EC2NodeDriver, AWSAutoScaleDriver,
+                           AWSCloudWatchDriver]:
+            driver = MultiRegionDriver(driver_cls, 'key', 'secret')
+
+            self.assertTrue('us-east-1' in driver.regions)
+            self.assertTrue('eu-west-1' in driver.regions)
+            self.assertEqual(driver.get_driver('eu-west-1').region_name,
+                             'eu-west-1')
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -31,6 +31,7 @@ from libcloud.common.openstack_identity import OpenStackServiceCatalog
 from libcloud.common.openstack_identity import OpenStackIdentity_2_0_Connection
 from libcloud.common.openstack_identity import OpenStackIdentity_3_0_Connection
 from libcloud.common.openstack_identity import OpenStackIdentityUser
+from libcloud.common.token_cache import MemoryTokenCache
 from libcloud.compute.drivers.openstack import OpenStack_1_0_NodeDriver
 
 from libcloud.test import unittest
@@ -206,6 +207,62 @@ class OpenStackIdentityConnectionTestCase(unittest.TestCase):
 
         self.assertEqual(mocked_auth_method.call_count, 1)
 
+    def test_token_cache_is_shared_between_connections(self):
+        token_cache = MemoryTokenCache()
+        connection1 = self._get_cached_connection(token_cache)
+        connection2 = self._get_cached_connection(token_cache)
+
+        connection1._populate_hosts_and_request_paths()
+        connection2._populate_hosts_and_request_paths()
+
+        self.assertEqual(self._get_auth_call_count(connection1), 1)
+        self.assertEqual(self._get_auth_call_count(connection2), 0)
+        self.assertEqual(connection2.auth_token,
+                         'aaaaaaaaaaaa-bbb-cccccccccccccc')
+        self.assertEqual(connection2.auth_token_expires,
+                         connection1.auth_token_expires)
+        self.assertEqual(connection2.service_catalog.get_service_types(),
+                         connection1.service_catalog.get_service_types())
+
+        # Expired token in the cache is not used
+        osa = connection1.get_auth_class()
+        osa.auth_token_expires = datetime.datetime(2010, 1, 1)
+        token_cache.set(osa.get_token_cache_key(), osa.get_token_info())
+
+        connection3 = self._get_cached_connection(token_cache)
+        connection3._populate_hosts_and_request_paths()
+        self.assertEqual(self._get_auth_call_count(connection3), 1)
+
+    def test_token_which_is_about_to_expire_is_refreshed_in_background(self):
+        connection = self._get_cached_connection(MemoryTokenCache())
+        connection._populate_hosts_and_request_paths()
+
+        # All the tokens expire within the refresh window
+        connection.token_refresh_window = 100 * 365 * 24 * 60 * 60
+        connection._populate_hosts_and_request_paths()
+        connection._token_refresher.join()
+
+        self.assertEqual(self._get_auth_call_count(connection), 2)
+
+    def _get_cached_connection(self, token_cache):
+        OpenStackBaseConnection.conn_classes = (OpenStack_2_0_MockHttp,
+                                                OpenStack_2_0_MockHttp)
+        OpenStackBaseConnection.auth_url = 'https://auth.api.example.com'
+        connection = OpenStackBaseConnection(
+            *OPENSTACK_PARAMS, ex_force_auth_version='2.0',
+            ex_force_base_url='https://www.foo.com',
+            ex_token_cache=token_cache)
+        connection.driver = OpenStack_1_0_NodeDriver(*OPENSTACK_PARAMS)
+
+        osa = connection.get_auth_class()
+        osa._authenticate_2_0_with_body = \
+            Mock(wraps=osa._authenticate_2_0_with_body)
+        return connection
+
+    def _get_auth_call_count(self, connection):
+        return connection.get_auth_class()._authenticate_2_0_with_body \
+            .call_count
+
     def _get_mock_connection(self, mock_http_class, auth_url=None):
         OpenStackBaseConnection.conn_classes = (mock_http_class,
                                                 mock_http_class)
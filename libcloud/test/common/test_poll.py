@@ -0,0 +1,218 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import with_statement
+
+import sys
+import time
+import threading
+
+from libcloud.test import unittest
+from libcloud.common.base import PollingConnection
+from libcloud.common.poll import PollScheduler
+from libcloud.common.poll import get_default_poll_scheduler
+from libcloud.common.types import LibcloudError
+
+
+class JobConnection(PollingConnection):
+    """
+    Connection which simulates an API with async jobs without performing
+    any HTTP requests.
+    """
+    poll_interval = 0.05
+    timeout = 10
+
+    def __init__(self, polls_needed=3):
+        super(JobConnection, self).__init__(host='localhost')
+        self.polls_needed = polls_needed
+        self.polls = {}
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def request(self, action, params=None, data=None, headers=None,
+                method='GET', raw=False):
+        with self.lock:
+            self.requests.append(action)
+
+        if action == '/start':
+            return {'job_id': params['id']}
+        elif action == '/status':
+            return self._get_status(params['id'])
+        elif action == '/status/batch':
+            return [self._get_status(job_id) for job_id in params['ids']
+                    if job_id != 'hidden']
+
+    def _get_status(self, job_id):
+        with self.lock:
+            polls = self.polls.get(job_id, 0) + 1
+            self.polls[job_id] = polls
+
+        return {'id': job_id, 'done': polls >= self.polls_needed}
+
+    def get_poll_request_kwargs(self, response, context, request_kwargs):
+        return {'action': '/status', 'params': {'id': response['job_id']}}
+
+    def has_completed(self, response):
+        if response['id'] == 'failed':
+            raise LibcloudError('Job failed')
+
+        return response['done']
+
+
+class BatchJobConnection(JobConnection):
+    poll_batch_size = 10
+
+    def get_batch_poll_request_kwargs(self, poll_request_kwargs,
+                                      start_time=None):
+        ids = [kwargs['params']['id'] for kwargs in poll_request_kwargs]
+        return {'action': '/status/batch', 'params': {'ids': ids}}
+
+    def get_batch_poll_responses(self, response, poll_request_kwargs):
+        jobs = dict([(job['id'], job) for job in response])
+        return [jobs.get(kwargs['params']['id'], None)
+                for kwargs in poll_request_kwargs]
+
+
+class PollSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = PollScheduler(max_poll_interval=0.1)
+
+    def _submit(self, connection, job_id, **kwargs):
+        return self.scheduler.submit(connection=connection, action='/start',
+                                     params={'id': job_id}, **kwargs)
+
+    def test_many_jobs_use_a_single_thread(self):
+        connection = JobConnection()
+        thread_count = threading.active_count()
+
+        futures = [self._submit(connection, str(index))
+                   for index in range(200)]
+
+        self.assertTrue(threading.active_count() <= thread_count + 1)
+
+        results = [future.result(timeout=10) for future in futures]
+        self.assertEqual([result['id'] for result in results],
+                         [str(index) for index in range(200)])
+        self.assertTrue(all([result['done'] for result in results]))
+        self.assertEqual(set(connection.polls.values()), set([3]))
+
+    def test_scheduler_thread_exits_when_idle(self):
+        future = self._submit(JobConnection(polls_needed=1), 'a')
+        future.result(timeout=10)
+
+        for _ in range(100):
+            if self.scheduler._thread is None:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(self.scheduler._thread, None)
+        self.assertEqual(self.scheduler.pending_jobs, 0)
+
+    def test_status_is_retrieved_in_batches(self):
+        connection = BatchJobConnection()
+        futures = [self._submit(connection, str(index))
+                   for index in range(25)]
+        futures.append(self._submit(connection, 'hidden'))
+
+        results = [future.result(timeout=10) for future in futures]
+
+        self.assertTrue(all([result['done'] for result in results]))
+        self.assertEqual(connection.polls['hidden'], 3)
+        self.assertTrue(len(connection.requests) < 26 + 26 * 3 / 2)
+
+    def test_batch_falls_back_to_job_status_requests(self):
+        connection = BatchJobConnection()
+        start_times = []
+
+        def get_batch_poll_request_kwargs(poll_kwargs, start_time=None):
+            start_times.append(start_time)
+            return None
+
+        connection.get_batch_poll_request_kwargs = \
+            get_batch_poll_request_kwargs
+        start = time.time()
+        futures = [self._submit(connection, str(index))
+                   for index in range(3)]
+
+        results = [future.result(timeout=10) for future in futures]
+
+        self.assertTrue(all([result['done'] for result in results]))
+        self.assertFalse('/status/batch' in connection.requests)
+        self.assertTrue(start_times)
+        self.assertTrue(all([start_time >= start
+                             for start_time in start_times]))
+
+    def test_scheduler_error_fails_affected_jobs(self):
+        connection = BatchJobConnection()
+
+        def get_poll_batch_key(poll_kwargs):
+            raise ValueError('Invalid job')
+
+        connection.get_poll_batch_key = get_poll_batch_key
+        futures = [self._submit(connection, str(index))
+                   for index in range(2)]
+
+        for future in futures:
+            self.assertRaises(ValueError, future.result, timeout=10)
+
+        # Scheduler keeps working
+        future = self._submit(JobConnection(), 'a')
+        self.assertTrue(future.result(timeout=10)['done'])
+
+    def test_callback(self):
+        future = self._submit(JobConnection(), 'a',
+                              callback=lambda response: response['id'] * 2)
+        self.assertEqual(future.result(timeout=10), 'aa')
+
+    def test_job_failure(self):
+        future = self._submit(JobConnection(), 'failed')
+        self.assertRaises(LibcloudError, future.result, timeout=10)
+
+    def test_initial_request_failure(self):
+        future = self.scheduler.submit(connection=JobConnection(),
+                                       action='/start', params=None)
+        self.assertRaises(TypeError, future.result, timeout=10)
+
+    def test_timeout(self):
+        connection = JobConnection(polls_needed=1000)
+        connection.timeout = 0.2
+        future = self._submit(connection, 'a')
+
+        try:
+            future.result(timeout=10)
+        except LibcloudError:
+            e = sys.exc_info()[1]
+            self.assertTrue('did not complete in 0.2 seconds' in str(e))
+        else:
+            self.fail('Exception was not thrown')
+
+        # Poll interval grows so the job is not polled every 50ms
+        self.assertTrue(connection.polls['a'] < 0.2 / 0.05 + 1)
+
+    def test_async_request_future(self):
+        connection = JobConnection()
+        future = connection.async_request_future('/start', params={'id': 'a'},
+                                                 scheduler=self.scheduler)
+        self.assertEqual(future.result(timeout=10)['id'], 'a')
+
+    def test_default_scheduler(self):
+        self.assertTrue(isinstance(get_default_poll_scheduler(),
+                                   PollScheduler))
+        self.assertTrue(get_default_poll_scheduler() is
+                        get_default_poll_scheduler())
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
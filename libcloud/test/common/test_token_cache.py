@@ -0,0 +1,173 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import with_statement
+
+import os
+import sys
+import stat
+import shutil
+import tempfile
+import threading
+
+from libcloud.test import unittest
+from libcloud.common.token_cache import (MemoryTokenCache, FileTokenCache,
+                                         JsonFile, TokenRefresher,
+                                         get_token_cache_key)
+
+
+class MemoryTokenCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = MemoryTokenCache()
+
+    def test_get_set_delete(self):
+        self.assertEqual(self.cache.get('key'), None)
+
+        value = {'auth_token': 'token'}
+        self.cache.set('key', value)
+        value['auth_token'] = 'modified'
+        self.assertEqual(self.cache.get('key'), {'auth_token': 'token'})
+
+        self.cache.delete('key')
+        self.assertEqual(self.cache.get('key'), None)
+
+    def test_lock(self):
+        self.assertTrue(self.cache.lock('a') is self.cache.lock('a'))
+        self.assertFalse(self.cache.lock('a') is self.cache.lock('b'))
+
+        with self.cache.lock('a'):
+            # Lock is reentrant
+            with self.cache.lock('a'):
+                pass
+
+
+class FileTokenCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = FileTokenCache(
+            directory=os.path.join(self.directory, 'tokens'))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_get_set_delete(self):
+        key = get_token_cache_key('https://auth', 'user', 'secret')
+        self.assertEqual(self.cache.get(key), None)
+
+        self.cache.set(key, {'auth_token': 'token'})
+        self.assertEqual(self.cache.get(key), {'auth_token': 'token'})
+
+        # Other instances (processes) see the same value
+        cache = FileTokenCache(directory=self.cache.directory)
+        self.assertEqual(cache.get(key), {'auth_token': 'token'})
+
+        path = os.path.join(self.cache.directory, '%s.json' % (key))
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 384)
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache.directory).st_mode)
+                         & 63, 0)
+
+        self.cache.delete(key)
+        self.assertEqual(cache.get(key), None)
+
+    def test_lock(self):
+        entered = []
+
+        def lock():
+            with FileTokenCache(directory=self.cache.directory).lock('key'):
+                entered.append(True)
+
+        with self.cache.lock('key'):
+            thread = threading.Thread(target=lock)
+            thread.start()
+            thread.join(0.2)
+            self.assertEqual(entered, [])
+
+        thread.join()
+        self.assertEqual(entered, [True])
+
+
+class JsonFileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'auth.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_read_invalid_file(self):
+        with open(self.path, 'w') as fp:
+            fp.write('{"access_token": ')
+
+        self.assertEqual(JsonFile(self.path).read(), None)
+
+    def test_write_is_atomic(self):
+        json_file = JsonFile(self.path)
+        json_file.write({'access_token': 'a'})
+        json_file.write({'access_token': 'b'})
+
+        self.assertEqual(json_file.read(), {'access_token': 'b'})
+        self.assertEqual(sorted(os.listdir(self.directory)), ['auth.json'])
+
+    def test_failed_write_keeps_file(self):
+        json_file = JsonFile(self.path)
+        json_file.write({'access_token': 'a'})
+
+        self.assertRaises(TypeError, json_file.write,
+                          {'access_token': object()})
+        self.assertEqual(json_file.read(), {'access_token': 'a'})
+        self.assertEqual(sorted(os.listdir(self.directory)), ['auth.json'])
+
+
+class TokenRefresherTestCase(unittest.TestCase):
+    def test_single_refresh_at_a_time(self):
+        event = threading.Event()
+        calls = []
+
+        def refresh():
+            calls.append(True)
+            event.wait()
+
+        refresher = TokenRefresher(refresh)
+        self.assertTrue(refresher.start())
+        self.assertFalse(refresher.start())
+        event.set()
+        refresher.join()
+
+        self.assertEqual(len(calls), 1)
+
+    def test_errors_are_ignored(self):
+        def refresh():
+            raise ValueError('Refresh failed')
+
+        refresher = TokenRefresher(refresh)
+        refresher.start()
+        refresher.join()
+        self.assertTrue(refresher.start())
+        refresher.join()
+
+
+class GetTokenCacheKeyTestCase(unittest.TestCase):
+    def test_get_token_cache_key(self):
+        key = get_token_cache_key('2.0', 'https://auth', 'user', 'secret')
+        self.assertEqual(len(key), 64)
+        self.assertFalse('secret' in key)
+        self.assertEqual(key, get_token_cache_key('2.0', 'https://auth',
+                                                  'user', 'secret'))
+        self.assertNotEqual(key, get_token_cache_key('2.0', 'https://auth',
+                                                     'user', 'other'))
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import sys
+import copy
+import pickle
 import unittest
 
 from libcloud.common.base import Response
@@ -45,6 +47,37 @@ class BaseTests(unittest.TestCase):
     def test_base_storage_volume(self):
         StorageVolume(id="0", name="0", size=10, driver=FakeDriver(), state=StorageVolumeState.AVAILABLE)
 
+    def test_model_attributes_are_stored_in_slots(self):
+        node = Node(id=1, name='node', state=0, public_ips=['1.2.3.4'],
+                    private_ips=[], driver=FakeDriver())
+
+        self.assertEqual(node._extra, None)
+        self.assertEqual(node.extra, {})
+        node.extra['key'] = 'value'
+        self.assertEqual(node.extra, {'key': 'value'})
+
+        # Other attributes can still be set
+        node.custom = 'custom'
+        self.assertEqual(node.__dict__, {'custom': 'custom'})
+
+        uuid = node.uuid
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            node2 = pickle.loads(pickle.dumps(node, protocol))
+            self.assertEqual(node2.id, '1')
+            self.assertEqual(node2.public_ips, ['1.2.3.4'])
+            self.assertEqual(node2.extra, {'key': 'value'})
+            self.assertEqual(node2.custom, 'custom')
+            self.assertEqual(node2.uuid, uuid)
+
+        node3 = copy.copy(node)
+        self.assertTrue(node3.extra is node.extra)
+        self.assertEqual(node3.custom, 'custom')
+
+        size = NodeSize(id=0, name=0, ram=0, disk=0, bandwidth=0, price=0,
+                        driver=FakeDriver(), extra={'cpu': 1})
+        self.assertEqual(copy.deepcopy(size).extra, {'cpu': 1})
+
     def test_base_response(self):
         Response(MockResponse(status=200, body='foo'), ConnectionKey('foo'))
 
@@ -0,0 +1,139 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import with_statement
+
+import sys
+import time
+import threading
+
+from mock import patch
+
+from libcloud.test import unittest
+from libcloud.common.types import LibcloudError
+from libcloud.common.types import RateLimitReachedError
+from libcloud.compute.bulk import BulkExecutor
+from libcloud.compute.drivers.dummy import DummyNodeDriver
+
+
+class BulkExecutorTestCase(unittest.TestCase):
+    def test_results_are_returned_in_order(self):
+        def func(item):
+            time.sleep((10 - item) / 1000.0)
+            return item * 2
+
+        results = BulkExecutor(max_concurrency=5).map(func, range(10))
+
+        self.assertEqual([result.item for result in results], list(range(10)))
+        self.assertEqual([result.value for result in results],
+                         [item * 2 for item in range(10)])
+        self.assertTrue(all([result.success for result in results]))
+
+    def test_errors_are_reported_per_item(self):
+        def func(item):
+            if item % 2:
+                raise LibcloudError('odd item')
+            return item
+
+        results = BulkExecutor().map(func, range(4))
+
+        self.assertEqual([result.success for result in results],
+                         [True, False, True, False])
+        self.assertTrue(isinstance(results[1].error, LibcloudError))
+        self.assertEqual(results[1].value, None)
+
+    def test_concurrency_is_bounded(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'max_running': 0}
+
+        def func(item):
+            with lock:
+                state['running'] += 1
+                state['max_running'] = max(state['max_running'],
+                                           state['running'])
+            time.sleep(0.005)
+            with lock:
+                state['running'] -= 1
+
+        results = BulkExecutor(max_concurrency=3).map(func, range(20))
+
+        self.assertEqual(len(results), 20)
+        self.assertTrue(1 < state['max_running'] <= 3)
+
+    def test_invalid_max_concurrency(self):
+        self.assertRaises(ValueError, BulkExecutor, max_concurrency=0)
+
+    def test_no_items(self):
+        self.assertEqual(BulkExecutor().map(lambda item: item, []), [])
+
+    @patch('libcloud.compute.bulk.time.sleep')
+    def test_rate_limited_calls_are_retried(self, mock_sleep):
+        calls = []
+
+        def func(item):
+            calls.append(item)
+            if len(calls) < 3:
+                raise RateLimitReachedError(retry_after=None)
+            return item
+
+        results = BulkExecutor(retry_delay=1).map(func, ['a'])
+
+        self.assertTrue(results[0].success)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list],
+                         [1, 2])
+
+    @patch('libcloud.compute.bulk.time.sleep')
+    def test_retries_are_limited(self, mock_sleep):
+        def func(item):
+            raise RateLimitReachedError(retry_after=5)
+
+        results = BulkExecutor(max_retries=2).map(func, ['a'])
+
+        self.assertFalse(results[0].success)
+        self.assertTrue(isinstance(results[0].error, RateLimitReachedError))
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list],
+                         [5, 5])
+
+
+class NodeDriverBulkTestCase(unittest.TestCase):
+    def setUp(self):
+        self.driver = DummyNodeDriver(0)
+
+    def test_ex_bulk_create_nodes(self):
+        # Dummy driver assigns node ids based on the node count so the
+        # nodes are created one at a time
+        results = self.driver.ex_bulk_create_nodes([{}, {}, {}],
+                                                   max_concurrency=1)
+
+        self.assertTrue(all([result.success for result in results]))
+        self.assertEqual(len(set([result.value.id for result in results])),
+                         3)
+
+    def test_ex_bulk_reboot_and_destroy_nodes(self):
+        nodes = list(self.driver.list_nodes())
+
+        results = self.driver.ex_bulk_reboot_nodes(nodes, max_concurrency=1)
+        self.assertEqual([result.value for result in results],
+                         [True] * len(nodes))
+
+        results = self.driver.ex_bulk_destroy_nodes(nodes)
+        self.assertEqual([result.item for result in results], nodes)
+        self.assertEqual([result.value for result in results],
+                         [True] * len(nodes))
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -633,6 +633,50 @@ class CloudStackCommonTestCase(TestCaseMixin):
         res = node.reboot()
         self.assertTrue(res)
 
+    def test_async_request_future(self):
+        node = self.driver.list_nodes()[0]
+        futures = [
+            self.driver._async_request_future(
+                command='rebootVirtualMachine', params={'id': node.id}),
+            self.driver._async_request_future(
+                command='destroyVirtualMachine', params={'id': node.id})]
+
+        results = [future.result(timeout=10) for future in futures]
+        self.assertEqual(results[0]['virtualmachine']['state'], 'Running')
+        self.assertEqual(results[1]['virtualmachine']['state'], 'Destroyed')
+
+    def test_batch_poll_responses(self):
+        connection = self.driver.connection
+        poll_kwargs = [{'command': 'queryAsyncJobResult',
+                        'params': {'jobid': job_id}}
+                       for job_id in [17165, 17167, 17168]]
+
+        kwargs = connection.get_batch_poll_request_kwargs(
+            poll_kwargs, start_time=1308808111)
+        self.assertEqual(kwargs['command'], 'listAsyncJobs')
+        self.assertEqual(kwargs['params'],
+                         {'startdate': '2011-06-23T05:47:31+0000',
+                          'page': 1, 'pagesize': 500})
+
+        request = getattr(connection, connection.request_method)
+        responses = connection.get_batch_poll_responses(
+            response=request(**kwargs), poll_request_kwargs=poll_kwargs)
+
+        self.assertTrue(connection.has_completed(responses[0]))
+        self.assertFalse(connection.has_completed(responses[1]))
+        self.assertEqual(responses[2], None)
+
+    def test_batch_poll_request_larger_than_page(self):
+        connection = self.driver.connection
+        connection.poll_batch_page_size = 2
+        poll_kwargs = [{'command': 'queryAsyncJobResult',
+                        'params': {'jobid': job_id}}
+                       for job_id in [17165, 17167, 17168]]
+
+        # Jobs are polled one by one
+        self.assertEqual(connection.get_batch_poll_request_kwargs(
+            poll_kwargs, start_time=1308808111), None)
+
     def test_list_key_pairs(self):
         keypairs = self.driver.list_key_pairs()
         fingerprint = '00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:' + \
@@ -297,6 +297,44 @@ class DeploymentTests(unittest.TestCase):
         self.assertEqual(['67.23.21.33'], nodes[0][1])
         self.assertEqual(['67.23.21.34'], nodes[1][1])
 
+    @patch('libcloud.compute.base.time.sleep')
+    def test_iterate_until_running_yields_nodes_as_they_become_running(
+            self, mock_sleep):
+        pending = Node(id=12345, name='test', state=NodeState.PENDING,
+                       public_ips=['1.2.3.4'], private_ips=[],
+                       driver=Rackspace)
+        refreshed = [[pending, self.node2], [self.node]]
+        self.driver._refresh_nodes = Mock(side_effect=refreshed)
+
+        result = self.driver.iterate_until_running(
+            nodes=[self.node, self.node2], wait_period=1, timeout=10)
+
+        self.assertEqual(next(result), (self.node2, ['1.2.3.4']))
+        self.assertEqual(next(result), (self.node, ['1.2.3.4']))
+        self.assertRaises(StopIteration, next, result)
+
+        # Nodes which are already running are not queried again
+        self.assertEqual(self.driver._refresh_nodes.call_args_list[1][0][0],
+                         [self.node])
+        self.assertEqual(mock_sleep.call_count, 1)
+
+    @patch('libcloud.compute.base.time.sleep')
+    def test_wait_until_running_backs_off(self, mock_sleep):
+        RackspaceMockHttp.type = 'TIMEOUT'
+        self.driver._refresh_nodes = Mock(return_value=[])
+
+        with patch('libcloud.compute.base.time.time') as mock_time:
+            mock_time.side_effect = list(range(8))
+            self.assertRaises(LibcloudError, self.driver.wait_until_running,
+                              nodes=[self.node], wait_period=1, timeout=5,
+                              max_wait_period=2)
+
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 4)
+        self.assertTrue(0.75 <= delays[0] <= 1.25)
+        self.assertTrue(all([delay <= 2.5 for delay in delays]))
+        self.assertTrue(delays[-1] >= 1.5)
+
     def test_ssh_client_connect_success(self):
         mock_ssh_client = Mock()
         mock_ssh_client.return_value = None
@@ -20,6 +20,8 @@ import sys
 from datetime import datetime
 from libcloud.utils.iso8601 import UTC
 
+from mock import patch
+
 from libcloud.utils.py3 import httplib
 
 from libcloud.compute.drivers.ec2 import EC2NodeDriver
@@ -40,6 +42,8 @@ from libcloud.compute.drivers.ec2 import EC2NetworkSubnet
 from libcloud.compute.base import Node, NodeImage, NodeSize, NodeLocation
 from libcloud.compute.base import StorageVolume, VolumeSnapshot
 from libcloud.compute.types import KeyPairDoesNotExistError, StorageVolumeState
+from libcloud.common.base import StreamingResponse
+from libcloud.common.types import InvalidCredsError
 
 from libcloud.test import MockHttpTestCase, LibcloudTestCase
 from libcloud.test.compute import TestCaseMixin
@@ -353,6 +357,134 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         ret = self.driver.destroy_node(node)
         self.assertTrue(ret)
 
+    def test_ex_bulk_destroy_nodes(self):
+        EC2MockHttp.test = self
+        EC2MockHttp.type = 'bulk'
+        nodes = [Node('i-4382922a', None, None, None, None, self.driver),
+                 Node('i-8474834a', None, None, None, None, self.driver)]
+        results = self.driver.ex_bulk_destroy_nodes(nodes)
+
+        self.assertEqual([result.item for result in results], nodes)
+        self.assertEqual([result.value for result in results], [True, True])
+        self.assertEqual(self._executed_mock_methods.count(
+            '_bulk_TerminateInstances'), 1)
+
+    def test_ex_bulk_destroy_nodes_falls_back_to_single_requests(self):
+        EC2MockHttp.type = 'bulk_fallback'
+        nodes = [Node('i-4382922a', None, None, None, None, self.driver),
+                 Node('i-doesnotexist', None, None, None, None, self.driver)]
+        results = self.driver.ex_bulk_destroy_nodes(nodes)
+
+        self.assertEqual([result.item for result in results], nodes)
+        self.assertTrue(results[0].success)
+        self.assertTrue(results[0].value)
+        self.assertFalse(results[1].success)
+
+    def test_ex_bulk_reboot_nodes(self):
+        EC2MockHttp.test = self
+        EC2MockHttp.type = 'bulk'
+        self.driver.bulk_batch_size = 2
+        nodes = [Node('i-%s' % (index), None, None, None, None, self.driver)
+                 for index in range(5)]
+        results = self.driver.ex_bulk_reboot_nodes(nodes)
+
+        self.assertEqual([result.item for result in results], nodes)
+        self.assertTrue(all([result.value for result in results]))
+        self.assertEqual(self._executed_mock_methods.count(
+            '_bulk_RebootInstances'), 3)
+
+    def test_ex_bulk_create_nodes(self):
+        EC2MockHttp.test = self
+        EC2MockHttp.type = 'bulk'
+        image = NodeImage(id='ami-be3adfd7', name=self.image_name,
+                          driver=self.driver)
+        size = NodeSize('m1.small', 'Small Instance', None, None, None, None,
+                        driver=self.driver)
+        nodes_kwargs = [{'name': 'foo-%s' % (index), 'image': image,
+                         'size': size} for index in range(2)]
+        results = self.driver.ex_bulk_create_nodes(nodes_kwargs)
+
+        self.assertEqual([result.item for result in results], nodes_kwargs)
+        self.assertEqual([result.value.id for result in results],
+                         ['i-2ba64342', 'i-2ba64343'])
+        self.assertEqual([result.value.name for result in results],
+                         ['foo-0', 'foo-1'])
+        self.assertEqual(self._executed_mock_methods.count(
+            '_bulk_RunInstances'), 1)
+
+    def test_ex_bulk_create_nodes_fewer_instances_than_requested(self):
+        EC2MockHttp.test = self
+        EC2MockHttp.type = 'bulk_shortfall'
+        image = NodeImage(id='ami-be3adfd7', name=self.image_name,
+                          driver=self.driver)
+        size = NodeSize('m1.small', 'Small Instance', None, None, None, None,
+                        driver=self.driver)
+        nodes_kwargs = [{'name': 'foo-%s' % (index), 'image': image,
+                         'size': size} for index in range(3)]
+        results = self.driver.ex_bulk_create_nodes(nodes_kwargs)
+
+        self.assertEqual([result.success for result in results],
+                         [True, True, False])
+        self.assertEqual([result.value.name for result in results[:2]],
+                         ['foo-0', 'foo-1'])
+        self.assertEqual(results[2].error.value, 'Expected 3 nodes, got 2')
+
+    def test_refresh_nodes_only_describes_provided_nodes(self):
+        EC2MockHttp.test = self
+        EC2MockHttp.type = 'refresh'
+        self.driver.bulk_batch_size = 1
+        nodes = [Node('i-4382922a', None, None, None, None, self.driver),
+                 Node('i-8474834a', None, None, None, None, self.driver)]
+        refreshed = self.driver._refresh_nodes(nodes)
+
+        self.assertEqual(set([node.id for node in refreshed]),
+                         set(['i-4382922a', 'i-8474834a']))
+        self.assertEqual(self._executed_mock_methods.count(
+            '_refresh_DescribeInstances'), 2)
+
+    def test_refresh_nodes_skips_nodes_which_are_not_visible_yet(self):
+        requests = []
+
+        def list_nodes(ex_node_ids):
+            requests.append(ex_node_ids)
+
+            if 'i-0000000f' in ex_node_ids:
+                raise Exception("InvalidInstanceID.NotFound: The instance ID "
+                                "'i-0000000f' does not exist")
+            elif 'i-0000001f' in ex_node_ids:
+                raise Exception('InvalidInstanceID.NotFound')
+
+            return [Node(node_id, None, None, None, None, self.driver)
+                    for node_id in ex_node_ids]
+
+        self.driver.list_nodes = list_nodes
+        node_ids = ['i-00000001', 'i-0000000f', 'i-00000002', 'i-0000001f']
+        nodes = [Node(node_id, None, None, None, None, self.driver)
+                 for node_id in node_ids]
+        refreshed = self.driver._refresh_nodes(nodes)
+
+        self.assertEqual([node.id for node in refreshed],
+                         ['i-00000001', 'i-00000002'])
+        # Missing instance is removed from the batch, the batch is split if
+        # the error doesn't contain the instance id
+        self.assertEqual(requests, [node_ids,
+                                    ['i-00000001', 'i-00000002',
+                                     'i-0000001f'],
+                                    ['i-00000001'],
+                                    ['i-00000002', 'i-0000001f'],
+                                    ['i-00000002'], ['i-0000001f']])
+
+    def test_iterate_nodes_releases_streaming_response(self):
+        with patch.object(StreamingResponse, 'release') as release:
+            self.driver.list_nodes()
+            self.assertEqual(release.call_count, 1)
+
+            # Consumer stops before the whole response has been read
+            nodes = self.driver.ex_iterate_nodes()
+            next(nodes)
+            nodes.close()
+            self.assertEqual(release.call_count, 2)
+
     def test_list_sizes(self):
         region_old = self.driver.region_name
 
@@ -788,6 +920,45 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         self.assertEqual('snap-30d37269', volumes[2].extra['snapshot_id'])
         self.assertEqual(StorageVolumeState.UNKNOWN, volumes[2].state)
 
+    def test_ex_iterate_volumes(self):
+        volumes = self.driver.ex_iterate_volumes()
+
+        self.assertEqual(next(volumes).id, 'vol-10ae5e2b')
+        self.assertEqual([volume.id for volume in volumes],
+                         ['vol-v24bfh75', 'vol-b6c851ec'])
+
+    def test_ex_iterate_nodes(self):
+        nodes = list(self.driver.ex_iterate_nodes())
+
+        # Elastic IP addresses are not looked up
+        self.assertEqual([node.id for node in nodes],
+                         ['i-4382922a', 'i-8474834a'])
+        self.assertEqual(nodes[0].public_ips, ['1.2.3.4'])
+
+    def test_list_volumes_paginated(self):
+        EC2MockHttp.type = 'paginated'
+        self.driver.page_size = 5
+
+        volumes = self.driver.list_volumes()
+
+        self.assertEqual([volume.id for volume in volumes],
+                         ['vol-4282672b', 'vol-10ae5e2b', 'vol-v24bfh75',
+                          'vol-b6c851ec'])
+
+    def test_ex_iterate_volumes_prefetch(self):
+        EC2MockHttp.type = 'paginated'
+
+        volumes = self.driver.ex_iterate_volumes(ex_page_size=5,
+                                                 ex_prefetch=True)
+
+        self.assertEqual(next(volumes).id, 'vol-4282672b')
+        self.assertEqual(len(list(volumes)), 3)
+
+    def test_list_nodes_streaming_error(self):
+        EC2MockHttp.type = 'forbidden'
+
+        self.assertRaises(InvalidCredsError, self.driver.list_nodes)
+
     def test_create_volume(self):
         location = self.driver.list_locations()[0]
         vol = self.driver.create_volume(10, 'vol', location)
@@ -1197,6 +1368,10 @@ class EC2MockHttp(MockHttpTestCase):
         body = self.fixtures.load('describe_instances.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _forbidden_DescribeInstances(self, method, url, body, headers):
+        return (httplib.FORBIDDEN, 'Failure: 403 Forbidden', {},
+                httplib.responses[httplib.FORBIDDEN])
+
     def _DescribeReservedInstances(self, method, url, body, headers):
         body = self.fixtures.load('describe_reserved_instances.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
@@ -1289,6 +1464,55 @@ class EC2MockHttp(MockHttpTestCase):
         body = self.fixtures.load('terminate_instances.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _bulk_TerminateInstances(self, method, url, body, headers):
+        self.assertUrlContainsQueryParams(url, {'InstanceId.1': 'i-4382922a',
+                                                'InstanceId.2': 'i-8474834a'})
+        body = self.fixtures.load('terminate_instances_multiple.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _bulk_fallback_TerminateInstances(self, method, url, body, headers):
+        if 'i-doesnotexist' in url:
+            body = self.fixtures.load('terminate_instances_not_found.xml')
+            return (httplib.BAD_REQUEST, body, {},
+                    httplib.responses[httplib.BAD_REQUEST])
+
+        body = self.fixtures.load('terminate_instances.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _bulk_RebootInstances(self, method, url, body, headers):
+        body = self.fixtures.load('reboot_instances.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _bulk_RunInstances(self, method, url, body, headers):
+        self.assertUrlContainsQueryParams(url, {'MinCount': '2',
+                                                'MaxCount': '2'})
+        body = self.fixtures.load('run_instances_multiple.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _bulk_CreateTags(self, method, url, body, headers):
+        body = self.fixtures.load('create_tags.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _bulk_shortfall_RunInstances(self, method, url, body, headers):
+        self.assertUrlContainsQueryParams(url, {'MinCount': '3',
+                                                'MaxCount': '3'})
+        body = self.fixtures.load('run_instances_multiple.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _bulk_shortfall_CreateTags(self, method, url, body, headers):
+        body = self.fixtures.load('create_tags.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _refresh_DescribeInstances(self, method, url, body, headers):
+        self.assertTrue('InstanceId.1=' in url)
+        self.assertFalse('InstanceId.2=' in url)
+        body = self.fixtures.load('describe_instances.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _refresh_DescribeAddresses(self, method, url, body, headers):
+        body = self.fixtures.load('describe_addresses_multi.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _DescribeKeyPairs(self, method, url, body, headers):
         body = self.fixtures.load('describe_key_pairs.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
@@ -1388,6 +1612,17 @@ class EC2MockHttp(MockHttpTestCase):
         body = self.fixtures.load('describe_volumes.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _paginated_DescribeVolumes(self, method, url, body, headers):
+        if 'NextToken' in url:
+            self.assertUrlContainsQueryParams(url, {'MaxResults': '5',
+                                                    'NextToken': 'token-1'})
+            body = self.fixtures.load('describe_volumes.xml')
+        else:
+            self.assertUrlContainsQueryParams(url, {'MaxResults': '5'})
+            body = self.fixtures.load('describe_volumes_page_1.xml')
+
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _CreateSnapshot(self, method, url, body, headers):
         body = self.fixtures.load('create_snapshot.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
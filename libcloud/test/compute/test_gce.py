@@ -66,6 +66,28 @@ class GCENodeDriverTest(LibcloudTestCase, TestCaseMixin):
         kwargs['datacenter'] = self.datacenter
         self.driver = GCENodeDriver(*GCE_PARAMS, **kwargs)
 
+    def test_batch_poll_responses(self):
+        connection = self.driver.connection
+        base = ('https://www.googleapis.com/compute/v1/projects/project_name/'
+                'zones/us-central1-a/operations')
+        poll_kwargs = [{'action': '%s/operation-%s' % (base, name)}
+                       for name in ['startnode', 'stopnode', 'missing']]
+
+        self.assertEqual(set([connection.get_poll_batch_key(kwargs)
+                              for kwargs in poll_kwargs]), set([base]))
+
+        kwargs = connection.get_batch_poll_request_kwargs(poll_kwargs)
+        self.assertEqual(kwargs['action'], base)
+
+        responses = connection.get_batch_poll_responses(
+            response=connection.request(**kwargs),
+            poll_request_kwargs=poll_kwargs)
+
+        self.assertEqual(responses[0].object['name'], 'operation-startnode')
+        self.assertTrue(connection.has_completed(responses[0]))
+        # Failed and missing operations need to be polled individually
+        self.assertEqual(responses[1:], [None, None])
+
     def test_default_scopes(self):
         self.assertEqual(self.driver.scopes, None)
 
@@ -1410,6 +1432,13 @@ class GCEMockHttp(MockHttpTestCase):
             body = self.fixtures.load('setUsageExportBucket_post.json')
         return (httplib.OK, body, self.json_hdr, httplib.responses[httplib.OK])
 
+    def _zones_us_central1_a_operations(self, method, url, body, headers):
+        self.assertUrlContainsQueryParams(url, {
+            'filter': 'name eq (operation-startnode|operation-stopnode|'
+                      'operation-missing)'})
+        body = self.fixtures.load('zones_us_central1_a_operations.json')
+        return (httplib.OK, body, self.json_hdr, httplib.responses[httplib.OK])
+
     def _zones_us_central1_a_operations_operation_startnode(self, method, url, body, header):
         body = self.fixtures.load('zones_us_central1_a_operations_operation_startnode.json')
         return (httplib.OK, body, self.json_hdr, httplib.responses[httplib.OK])
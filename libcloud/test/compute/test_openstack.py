@@ -1091,6 +1091,17 @@ class OpenStack_1_1_Tests(unittest.TestCase, TestCaseMixin):
         self.assertEqual(node.id, '12064')
         self.assertEqual(node.name, 'lc-test')
 
+    def test_refresh_nodes(self):
+        nodes = [Node(id='12064', name=None, state=None, public_ips=None,
+                      private_ips=None, driver=self.driver),
+                 Node(id='26f7fbee-8ce1-4c28-887a-bfe8e4bb10fe', name=None,
+                      state=None, public_ips=None, private_ips=None,
+                      driver=self.driver)]
+        refreshed = self.driver._refresh_nodes(nodes)
+
+        self.assertEqual(sorted([node.id for node in refreshed]),
+                         sorted([node.id for node in nodes]))
+
     def test_ex_get_size(self):
         size_id = '7'
         size = self.driver.ex_get_size(size_id)
@@ -28,6 +28,7 @@ FIXTURES_ROOT = {
     'loadbalancer': 'loadbalancer/fixtures',
     'dns': 'dns/fixtures',
     'openstack': 'compute/fixtures/openstack',
+    'autoscale': 'autoscale/fixtures',
 }
 
 
@@ -76,6 +77,12 @@ class DNSFileFixtures(FileFixtures):
                                               sub_dir=sub_dir)
 
 
+class AutoScaleFileFixtures(FileFixtures):
+    def __init__(self, sub_dir=''):
+        super(AutoScaleFileFixtures, self).__init__(fixtures_type='autoscale',
+                                                    sub_dir=sub_dir)
+
+
 class OpenStackFixtures(FileFixtures):
     def __init__(self, sub_dir=''):
         super(OpenStackFixtures, self).__init__(fixtures_type='openstack',
@@ -13,8 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
+import pickle
+import socket
 import hashlib
+import tempfile
+import threading
 
 from mock import Mock
 
@@ -25,6 +30,7 @@ from libcloud.utils.py3 import b
 if PY3:
     from io import FileIO as file
 
+from libcloud.storage.base import Object
 from libcloud.storage.base import StorageDriver
 from libcloud.storage.base import DEFAULT_CONTENT_TYPE
 
@@ -46,6 +52,19 @@ class BaseStorageTests(unittest.TestCase):
         self.driver1.strict_mode = False
         self.driver1.strict_mode = False
 
+    def test_object_extra_and_meta_data_are_created_lazily(self):
+        obj = Object(name='a', size=1, hash=None, extra=None, meta_data=None,
+                     container=None, driver=None)
+
+        self.assertEqual(obj._extra, None)
+        self.assertEqual(obj._meta_data, None)
+        obj.meta_data['key'] = 'value'
+
+        obj = pickle.loads(pickle.dumps(obj, 0))
+        self.assertEqual(obj.name, 'a')
+        self.assertEqual(obj.extra, {})
+        self.assertEqual(obj.meta_data, {'key': 'value'})
+
     def test__upload_object_iterator_must_have_next_method(self):
         class Iterator(object):
 
@@ -93,8 +112,11 @@ class BaseStorageTests(unittest.TestCase):
         else:
             iterator.next.side_effect = StopIteration()
 
+        sent = []
+
         def mock_send(data):
             self.send_called += 1
+            sent.append(data)
 
         response = Mock()
         response.connection.connection.send = mock_send
@@ -119,7 +141,68 @@ class BaseStorageTests(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(data_hash, hashlib.md5(b('')).hexdigest())
         self.assertEqual(bytes_transferred, 0)
-        self.assertEqual(self.send_called, 5)
+        self.assertEqual(self.send_called, 2)
+        self.assertEqual(sent[-1], b('0\r\n\r\n'))
+
+    def test__stream_data_chunked(self):
+        sent = []
+
+        response = Mock()
+        response.connection.connection.send = sent.append
+
+        iterator = iter([b('a') * 10, b('b') * 5])
+        success, data_hash, bytes_transferred = \
+            self.driver1._stream_data(response=response, iterator=iterator,
+                                      chunked=True, chunk_size=8)
+
+        self.assertTrue(success)
+        self.assertEqual(bytes_transferred, 15)
+        self.assertEqual(data_hash,
+                         hashlib.md5(b('a') * 10 + b('b') * 5).hexdigest())
+
+        # Chunk header, data and trailer are sent using a single call
+        self.assertEqual(sent, [b('8\r\naaaaaaaa\r\n'),
+                                b('7\r\naabbbbb\r\n'),
+                                b('0\r\n\r\n')])
+
+    @unittest.skipIf(not hasattr(socket.socket, 'sendfile'),
+                     'socket.sendfile is not available')
+    def test__upload_file_sendfile(self):
+        data = os.urandom(100 * 1024)
+        fd, file_path = tempfile.mkstemp()
+        os.write(fd, data)
+        os.close(fd)
+
+        sock, peer = socket.socketpair()
+        received = []
+
+        def read():
+            chunk = peer.recv(65536)
+            while chunk:
+                received.append(chunk)
+                chunk = peer.recv(65536)
+
+        thread = threading.Thread(target=read)
+        thread.start()
+
+        response = Mock()
+        response.connection.connection.sock = sock
+
+        try:
+            success, data_hash, bytes_transferred = \
+                self.driver1._upload_file(response=response,
+                                          file_path=file_path)
+        finally:
+            sock.close()
+            thread.join()
+            peer.close()
+            os.remove(file_path)
+
+        self.assertTrue(success)
+        self.assertEqual(bytes_transferred, len(data))
+        self.assertEqual(data_hash, hashlib.md5(data).hexdigest())
+        self.assertEqual(b('').join(received), data)
+        self.assertFalse(response.connection.connection.send.called)
 
     def test__upload_data(self):
         def mock_send(data):
@@ -155,6 +238,22 @@ class BaseStorageTests(unittest.TestCase):
         else:
             self.fail('Invalid hash type but exception was not thrown')
 
+    def test__get_object_checksum(self):
+        obj = Object(name='test', size=1, hash=None, extra={},
+                     meta_data={}, container=None, driver=self.driver1)
+        md5_hash = hashlib.md5(b('test')).hexdigest()
+
+        obj.hash = md5_hash
+        self.assertEqual(self.driver1._get_object_checksum(obj), md5_hash)
+
+        obj.hash = '"%s"' % (md5_hash.upper())
+        self.assertEqual(self.driver1._get_object_checksum(obj), md5_hash)
+
+        # Missing hash, ETag of a multipart upload or not a hex digest
+        for value in [None, '%s-2' % (md5_hash), 'x' * 32, md5_hash[:-1]]:
+            obj.hash = value
+            self.assertEqual(self.driver1._get_object_checksum(obj), None)
+
     def test_upload_no_content_type_supplied_or_detected(self):
         iterator = StringIO()
 
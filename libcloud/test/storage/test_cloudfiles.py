@@ -230,6 +230,21 @@ class CloudFilesTests(unittest.TestCase):
         self.assertEqual(obj.meta_data['foo-bar'], 'test 1')
         self.assertEqual(obj.meta_data['bar-foo'], 'test 2')
 
+    def test_get_object_checksum_of_manifest(self):
+        md5_hash = '6b21c4a111ac178feacf9ec9d0c71f17'
+        obj = self.driver._headers_to_object(
+            name='test_object', container=None,
+            headers={'etag': md5_hash})
+        self.assertEqual(self.driver._get_object_checksum(obj), md5_hash)
+
+        # Manifest ETag is not a hash of the object content
+        for headers in [{'x-object-manifest': 'test_container/test_object/'},
+                        {'x-static-large-object': 'True'}]:
+            headers['etag'] = '"%s"' % (md5_hash)
+            obj = self.driver._headers_to_object(
+                name='test_object', container=None, headers=headers)
+            self.assertEqual(self.driver._get_object_checksum(obj), None)
+
     def test_get_object_object_name_encoding(self):
         obj = self.driver.get_object(container_name='test_container',
                                      object_name='~/test_object/')
@@ -695,14 +710,12 @@ class CloudFilesTests(unittest.TestCase):
         bytes_blob = ''.join(['\0' for _ in range(CHUNK_SIZE + 1)])
         hex_chunk_size = ('%X' % CHUNK_SIZE).encode('utf8')
         expected = [
-            # Chunk 1
-            hex_chunk_size + b'\r\n',
-            bytes(bytes_blob[:CHUNK_SIZE].encode('utf8')),
-            b'\r\n',
+            # Chunk 1 (header, data and trailer are sent using a single call)
+            hex_chunk_size + b'\r\n' +
+            bytes(bytes_blob[:CHUNK_SIZE].encode('utf8')) + b'\r\n',
 
             # Chunk 2
-            b'1\r\n',
-            bytes(bytes_blob[CHUNK_SIZE:].encode('utf8')),
+            b'1\r\n' + bytes(bytes_blob[CHUNK_SIZE:].encode('utf8')) +
             b'\r\n',
 
             # If chunked, also send a final message
@@ -13,21 +13,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import with_statement
+
 import os
 import sys
+import time
+import hashlib
+import tempfile
+import threading
 import unittest
+from binascii import unhexlify
+
+try:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
 
 try:
     from lxml import etree as ET
 except ImportError:
     from xml.etree import ElementTree as ET
 
+from libcloud.utils.py3 import b
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import urlparse
 from libcloud.utils.py3 import parse_qs
 
 from libcloud.common.types import InvalidCredsError
 from libcloud.common.types import LibcloudError, MalformedResponseError
+from libcloud.httplib_ssl import LibcloudHTTPConnection
+from libcloud.httplib_ssl import LibcloudHTTPSConnection
 from libcloud.storage.base import Container, Object
 from libcloud.storage.types import ContainerDoesNotExistError
 from libcloud.storage.types import ContainerIsNotEmptyError
@@ -39,6 +56,8 @@ from libcloud.storage.drivers.s3 import S3EUWestStorageDriver
 from libcloud.storage.drivers.s3 import S3APSEStorageDriver
 from libcloud.storage.drivers.s3 import S3APNEStorageDriver
 from libcloud.storage.drivers.s3 import CHUNK_SIZE
+from libcloud.storage.drivers.s3 import S3Connection, S3RawResponse
+from libcloud.storage.drivers.s3 import NAMESPACE
 from libcloud.storage.drivers.dummy import DummyIterator
 
 from libcloud.test import StorageMockHttp, MockRawResponse  # pylint: disable-msg=E0611
@@ -959,6 +978,369 @@ class S3Tests(unittest.TestCase):
         self.assertTrue(result)
 
 
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class S3StandInHandler(BaseHTTPRequestHandler):
+    """
+    Minimal S3 stand-in which implements the multipart upload API.
+
+    State is stored on the server object.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body='', headers=None):
+        body = b(body)
+        self.send_response(status)
+
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length)
+
+    def _parse_path(self):
+        parsed = urlparse.urlparse(self.path)
+        return parsed.path, parse_qs(parsed.query, keep_blank_values=True)
+
+    def do_POST(self):
+        server = self.server
+        path, query = self._parse_path()
+        body = self._read_body()
+
+        if 'uploads' in query:
+            with server.lock:
+                upload_id = 'upload-%s' % (len(server.uploads) + 1)
+                server.uploads[upload_id] = {}
+
+            self._send(httplib.OK,
+                       '<InitiateMultipartUploadResult xmlns="%s">'
+                       '<UploadId>%s</UploadId>'
+                       '</InitiateMultipartUploadResult>' %
+                       (NAMESPACE, upload_id))
+            return
+
+        upload_id = query['uploadId'][0]
+        root = ET.XML(body)
+        part_numbers = [int(part.find('PartNumber').text)
+                        for part in root.findall('Part')]
+        parts = server.uploads.pop(upload_id)
+        data = b('').join([parts[number] for number in part_numbers])
+        digests = [hashlib.md5(parts[number]).digest()
+                   for number in part_numbers]
+        etag = '%s-%s' % (hashlib.md5(b('').join(digests)).hexdigest(),
+                          len(part_numbers))
+        server.objects[path] = data
+
+        self._send(httplib.OK,
+                   '<CompleteMultipartUploadResult xmlns="%s">'
+                   '<ETag>"%s"</ETag></CompleteMultipartUploadResult>' %
+                   (NAMESPACE, etag))
+
+    def do_PUT(self):
+        server = self.server
+        path, query = self._parse_path()
+        data = self._read_body()
+        part_number = int(query['partNumber'][0])
+
+        with server.lock:
+            server.running += 1
+            server.max_running = max(server.max_running, server.running)
+            server.attempts[part_number] = \
+                server.attempts.get(part_number, 0) + 1
+            fail = server.failures.get(part_number, 0)
+            server.failures[part_number] = fail - 1
+
+        # Give other workers a chance to start uploading their parts
+        time.sleep(0.01)
+
+        with server.lock:
+            server.running -= 1
+
+        if fail > 0:
+            self._send(httplib.INTERNAL_SERVER_ERROR)
+            return
+
+        server.uploads[query['uploadId'][0]][part_number] = data
+        self._send(httplib.OK,
+                   headers={'ETag': '"%s"' % (hashlib.md5(data).hexdigest())})
+
+    def do_GET(self):
+        server = self.server
+        path, query = self._parse_path()
+        data = server.objects.get(path, None)
+
+        if data is None:
+            self._send(httplib.NOT_FOUND)
+            return
+
+        start, end = self.headers['Range'][len('bytes='):].split('-')
+        start, end = int(start), int(end)
+
+        with server.lock:
+            server.ranges.append(start)
+            fail = server.failures.get(start, 0)
+            server.failures[start] = fail - 1
+
+        if fail > 0:
+            self._send(httplib.INTERNAL_SERVER_ERROR)
+            return
+
+        self._send(httplib.PARTIAL_CONTENT, data[start:end + 1],
+                   headers={'Content-Range': 'bytes %s-%s/%s' %
+                            (start, end, len(data))})
+
+    def do_DELETE(self):
+        path, query = self._parse_path()
+        self.server.aborted.append(query['uploadId'][0])
+        self._send(httplib.NO_CONTENT)
+
+
+class S3StandInConnection(S3Connection):
+    conn_classes = (LibcloudHTTPConnection, LibcloudHTTPSConnection)
+    rawResponseCls = S3RawResponse
+
+
+class S3StandInStorageDriver(S3StorageDriver):
+    connectionCls = S3StandInConnection
+    multipart_retry_delay = 0
+    download_retry_delay = 0
+
+
+class S3StandInTestCase(unittest.TestCase):
+    part_size = 1024
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), S3StandInHandler)
+        cls.server.lock = threading.Lock()
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.uploads = {}
+        self.server.objects = {}
+        self.server.aborted = []
+        self.server.attempts = {}
+        self.server.failures = {}
+        self.server.ranges = []
+        self.server.running = 0
+        self.server.max_running = 0
+
+        self.driver = S3StandInStorageDriver(
+            *STORAGE_S3_PARAMS, secure=False, host='127.0.0.1',
+            port=self.server.server_address[1])
+        self.container = Container(name='container', extra={},
+                                   driver=self.driver)
+
+        # 10 full parts and a partial last part
+        self.data = os.urandom(self.part_size * 10 + 100)
+        fd, self.file_path = tempfile.mkstemp()
+
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(self.data)
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+
+class S3ParallelMultipartUploadTests(S3StandInTestCase):
+    def _get_expected_etag(self):
+        digests = [hashlib.md5(self.data[i:i + self.part_size]).digest()
+                   for i in range(0, len(self.data), self.part_size)]
+        return '%s-%s' % (hashlib.md5(b('').join(digests)).hexdigest(),
+                          len(digests))
+
+    def test_upload_object_multipart(self):
+        obj = self.driver.upload_object(self.file_path, self.container,
+                                        'object', ex_multipart=True,
+                                        ex_part_size=self.part_size,
+                                        ex_max_workers=4)
+
+        self.assertEqual(self.server.objects['/container/object'], self.data)
+        self.assertEqual(obj.size, len(self.data))
+        self.assertEqual(obj.hash, self._get_expected_etag())
+        self.assertEqual(len(self.server.attempts), 11)
+        self.assertTrue(1 < self.server.max_running <= 4)
+
+    def test_upload_object_multipart_single_worker(self):
+        self.driver.upload_object(self.file_path, self.container, 'object',
+                                  ex_multipart=True,
+                                  ex_part_size=self.part_size,
+                                  ex_max_workers=1)
+
+        self.assertEqual(self.server.objects['/container/object'], self.data)
+        self.assertEqual(self.server.max_running, 1)
+
+    def test_upload_object_via_stream_parallel(self):
+        def iterator():
+            for i in range(0, len(self.data), 300):
+                yield self.data[i:i + 300]
+
+        obj = self.driver.upload_object_via_stream(
+            iterator(), self.container, 'object',
+            ex_part_size=self.part_size, ex_max_workers=3)
+
+        self.assertEqual(self.server.objects['/container/object'], self.data)
+        self.assertEqual(obj.hash, self._get_expected_etag())
+        self.assertTrue(1 < self.server.max_running <= 3)
+
+    def test_failed_part_is_retried(self):
+        self.server.failures[3] = 2
+
+        self.driver.upload_object(self.file_path, self.container, 'object',
+                                  ex_multipart=True,
+                                  ex_part_size=self.part_size,
+                                  ex_max_workers=4)
+
+        self.assertEqual(self.server.objects['/container/object'], self.data)
+        self.assertEqual(self.server.attempts[3], 3)
+        self.assertEqual(self.server.attempts[4], 1)
+
+    def test_upload_is_aborted_when_retries_are_exhausted(self):
+        self.server.failures[3] = 100
+        self.driver.multipart_max_retries = 1
+
+        self.assertRaises(LibcloudError, self.driver.upload_object,
+                          self.file_path, self.container, 'object',
+                          ex_multipart=True, ex_part_size=self.part_size,
+                          ex_max_workers=4)
+
+        self.assertEqual(self.server.attempts[3], 2)
+        self.assertEqual(self.server.aborted, ['upload-1'])
+        self.assertEqual(self.server.objects, {})
+
+    def test_get_multipart_etag(self):
+        chunks = [(1, '"%s"' % (hashlib.md5(b('a')).hexdigest())),
+                  (2, '"%s"' % (hashlib.md5(b('b')).hexdigest()))]
+        digests = unhexlify(chunks[0][1][1:-1]) + unhexlify(chunks[1][1][1:-1])
+        expected = '%s-2' % (hashlib.md5(digests).hexdigest())
+
+        self.assertEqual(self.driver._get_multipart_etag(chunks), expected)
+
+
+class S3ParallelDownloadTests(S3StandInTestCase):
+    def setUp(self):
+        super(S3ParallelDownloadTests, self).setUp()
+        self.server.objects['/container/object'] = self.data
+        self.obj = Object(name='object', size=len(self.data),
+                          hash=hashlib.md5(self.data).hexdigest(), extra={},
+                          meta_data={}, container=self.container,
+                          driver=self.driver)
+        self.destination_path = self.file_path + '.download'
+
+    def tearDown(self):
+        super(S3ParallelDownloadTests, self).tearDown()
+
+        for path in [self.destination_path, self.destination_path + '.parts']:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _download(self, **kwargs):
+        return self.driver.download_object(self.obj, self.destination_path,
+                                           ex_parallel=True,
+                                           ex_part_size=self.part_size,
+                                           ex_max_workers=4, **kwargs)
+
+    def _read_destination(self):
+        with open(self.destination_path, 'rb') as fp:
+            return fp.read()
+
+    def test_download_object_parallel(self):
+        self.assertTrue(self._download())
+
+        self.assertEqual(self._read_destination(), self.data)
+        self.assertEqual(sorted(self.server.ranges),
+                         list(range(0, len(self.data), self.part_size)))
+        self.assertFalse(os.path.exists(self.destination_path + '.parts'))
+
+    def test_download_object_parallel_existing_file(self):
+        open(self.destination_path, 'wb').close()
+
+        self.assertRaises(LibcloudError, self._download)
+        self.assertTrue(self._download(overwrite_existing=True))
+
+    def test_download_object_parallel_hash_mismatch(self):
+        self.obj.hash = hashlib.md5(b('foo')).hexdigest()
+
+        self.assertFalse(self._download())
+        self.assertFalse(os.path.exists(self.destination_path))
+
+    def test_download_object_parallel_multipart_etag_is_not_verified(self):
+        self.obj.hash = '%s-11' % (hashlib.md5(b('foo')).hexdigest())
+        self.assertTrue(self._download())
+
+    def test_download_object_parallel_does_not_exist(self):
+        self.obj.name = 'missing'
+
+        self.assertRaises(ObjectDoesNotExistError, self._download)
+        self.assertFalse(os.path.exists(self.destination_path))
+
+    def test_failed_range_is_retried(self):
+        self.server.failures[self.part_size * 2] = 2
+
+        self.assertTrue(self._download())
+        self.assertEqual(self._read_destination(), self.data)
+        self.assertEqual(self.server.ranges.count(self.part_size * 2), 3)
+
+    def test_interrupted_download_is_resumed(self):
+        self.driver.download_max_retries = 0
+        self.server.failures[self.part_size * 2] = 1
+
+        self.assertRaises(LibcloudError, self._download, ex_resume=True)
+        self.assertTrue(os.path.exists(self.destination_path))
+        self.assertTrue(os.path.exists(self.destination_path + '.parts'))
+
+        requested = set(self.server.ranges)
+        self.server.ranges = []
+
+        self.assertTrue(self._download(ex_resume=True))
+        self.assertEqual(self._read_destination(), self.data)
+
+        # Only the ranges which weren't downloaded are requested again
+        self.assertTrue(self.part_size * 2 in self.server.ranges)
+        self.assertEqual(len(self.server.ranges),
+                         11 - len(requested) + 1)
+
+    def test_resume_is_ignored_when_object_has_changed(self):
+        self.driver.download_max_retries = 0
+        self.server.failures[self.part_size * 2] = 1
+        self.assertRaises(LibcloudError, self._download, ex_resume=True)
+
+        self.data = self.data[::-1]
+        self.server.objects['/container/object'] = self.data
+        self.obj.hash = hashlib.md5(self.data).hexdigest()
+        self.server.ranges = []
+
+        self.assertTrue(self._download(ex_resume=True,
+                                       overwrite_existing=True))
+        self.assertEqual(self._read_destination(), self.data)
+        self.assertEqual(len(self.server.ranges), 11)
+
+    def test_interrupted_download_is_deleted(self):
+        self.driver.download_max_retries = 0
+        self.server.failures[0] = 1
+
+        self.assertRaises(LibcloudError, self._download)
+        self.assertFalse(os.path.exists(self.destination_path))
+        self.assertFalse(os.path.exists(self.destination_path + '.parts'))
+
+
 class S3USWestTests(S3Tests):
     driver_type = S3USWestStorageDriver
 
@@ -17,11 +17,24 @@
 import os
 import sys
 import ssl
+import errno
+import time
+import random
+import socket
+import threading
 
 from mock import Mock, call
 
 from libcloud.test import unittest
+from libcloud.test import MockHttp
+from libcloud.utils.py3 import httplib
+from libcloud.utils.py3 import urlparse
+from libcloud.utils.py3 import parse_qs
 from libcloud.common.base import Connection
+from libcloud.common.base import PollingConnection
+from libcloud.common.base import Response
+from libcloud.common.base import StreamingResponse
+from libcloud.common.base import ConnectionPool
 from libcloud.common.base import LoggingConnection
 from libcloud.httplib_ssl import LibcloudBaseConnection
 from libcloud.httplib_ssl import LibcloudHTTPConnection
@@ -278,5 +291,306 @@ class ConnectionClassTestCase(unittest.TestCase):
         cmd = con._log_curl(method='HEAD', url=url, body=body, headers=headers)
         self.assertEqual(cmd, 'curl -i --head --compress http://example.com:80/test/path')
 
+
+class ConnectionPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.sockets = []
+        self.created = []
+
+        def connection_cls(**kwargs):
+            connection = Mock()
+            connection.kwargs = kwargs
+            connection.sock, connection.remote = self._get_socket_pair()
+            connection.getresponse.return_value = self._get_response()
+            self.created.append(connection)
+            return connection
+
+        self.pool = ConnectionPool(max_size=2, idle_timeout=60)
+        self.con = Connection(host='example.com')
+        self.con.conn_classes = (connection_cls, connection_cls)
+        self.con.responseCls = Mock()
+        self.con.connection_pool = self.pool
+
+    def tearDown(self):
+        for sock in self.sockets:
+            sock.close()
+
+    def _get_socket_pair(self):
+        local, remote = socket.socketpair()
+        self.sockets.extend([local, remote])
+        return local, remote
+
+    def _get_response(self):
+        response = Mock()
+        response.isclosed.return_value = True
+        response.will_close = False
+        response.status = httplib.OK
+        response.reason = 'OK'
+        response.getheaders.return_value = []
+        response._original_data = None
+        return response
+
+    def test_connection_is_reused(self):
+        self.con.request('/a')
+        self.con.request('/b')
+        self.con.request('/c')
+
+        self.assertEqual(len(self.created), 1)
+        stats = self.pool.stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['idle'], 1)
+
+    def test_connection_is_not_reused_for_a_different_host(self):
+        self.con.request('/a')
+        self.con.host = 'example.org'
+        self.con.request('/b')
+
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(self.created[1].kwargs['host'], 'example.org')
+        self.assertEqual(self.pool.stats()['idle'], 2)
+
+    def test_pool_size_is_bounded(self):
+        connections = [self.pool.acquire('key', Mock) for _ in range(3)]
+        self.assertEqual(self.pool.misses, 3)
+
+        for _ in range(3):
+            connection = Mock()
+            connection.sock = self._get_socket_pair()[0]
+            self.pool.release('key', connection)
+
+        self.assertEqual(len(connections), 3)
+        self.assertEqual(self.pool.stats()['idle'], 2)
+
+    def test_connection_closed_by_server_is_discarded(self):
+        self.con.request('/a')
+        self.created[0].remote.close()
+
+        self.con.request('/b')
+
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(self.pool.stale, 1)
+        self.assertTrue(self.created[0].close.called)
+
+    def test_idle_timeout(self):
+        self.pool.idle_timeout = 0
+        self.con.request('/a')
+        time.sleep(0.01)
+        self.con.request('/b')
+
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(self.pool.stats()['hits'], 0)
+
+    def test_request_is_retried_once_on_stale_connection(self):
+        self.con.request('/a')
+        self.created[0].getresponse.side_effect = httplib.BadStatusLine('')
+
+        self.con.request('/b')
+
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(self.created[1].request.call_args[1]['url'], '/b')
+
+        # New connections are never retried
+        self.pool.clear()
+        self.con.conn_classes = (Mock(), Mock())
+        connection = self.con.conn_classes[1].return_value
+        connection.getresponse.side_effect = httplib.BadStatusLine('')
+        self.assertRaises(httplib.BadStatusLine, self.con.request, '/c')
+        self.assertEqual(connection.request.call_count, 1)
+
+    def test_request_is_not_retried_on_timeout(self):
+        self.con.request('/a')
+        self.created[0].getresponse.side_effect = \
+            socket.timeout('timed out')
+
+        self.assertRaises(socket.timeout, self.con.request, '/b')
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual(self.created[0].request.call_count, 2)
+        self.assertEqual(self.pool.stale, 0)
+
+    def test_non_idempotent_request_is_not_retried(self):
+        self.con.request('/a')
+        self.created[0].getresponse.side_effect = httplib.BadStatusLine('')
+
+        self.assertRaises(httplib.BadStatusLine, self.con.request, '/b',
+                          method='POST')
+        self.assertEqual(len(self.created), 1)
+
+    def test_request_is_retried_on_connection_reset(self):
+        self.con.request('/a')
+        error = socket.error(errno.ECONNRESET, 'Connection reset by peer')
+        self.created[0].getresponse.side_effect = error
+
+        self.con.request('/b', method='DELETE')
+
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(self.pool.stale, 1)
+
+    def test_connection_is_not_returned_if_response_is_not_read(self):
+        self.con.request('/a')
+        response = self._get_response()
+        response.will_close = True
+        self.created[0].getresponse.return_value = response
+
+        self.con.request('/b')
+
+        self.assertEqual(self.pool.stats()['idle'], 0)
+        self.assertTrue(self.created[0].close.called)
+
+    def test_streaming_response_connection_is_released(self):
+        self.con.streamingResponseCls = StreamingResponse
+        response = self.con.request_stream('/a')
+        self.assertEqual(self.pool.stats()['idle'], 0)
+
+        # Other requests can be performed before the body is consumed
+        self.con.request('/b')
+        self.assertEqual(len(self.created), 2)
+
+        response.release()
+        response.release()
+        self.assertEqual(self.pool.stats()['idle'], 2)
+        self.assertFalse(self.created[0].close.called)
+
+    def test_partially_read_streaming_response_is_discarded(self):
+        self.con.streamingResponseCls = StreamingResponse
+        response = self.con.request_stream('/a')
+        response.response.isclosed.return_value = False
+
+        response.release()
+        self.assertEqual(self.pool.stats()['idle'], 0)
+        self.assertTrue(self.created[0].close.called)
+
+
+class ThreadedMockHttp(MockHttp):
+    """
+    Mock HTTP connection which yields control to other threads while the
+    request is "in flight" to make any shared request state visible.
+    """
+    jobs = {}
+    lock = threading.Lock()
+
+    def _echo(self, method, url, body, headers):
+        time.sleep(random.random() / 1000)
+        qs = parse_qs(urlparse.urlparse(url).query)
+        return (httplib.OK, qs['id'][0], {}, httplib.responses[httplib.OK])
+
+    _job = _echo
+
+    def _job_status(self, method, url, body, headers):
+        time.sleep(random.random() / 1000)
+        job_id = parse_qs(urlparse.urlparse(url).query)['id'][0]
+
+        with self.lock:
+            self.jobs[job_id] = self.jobs.get(job_id, 0) + 1
+            polls = self.jobs[job_id]
+
+        body = '%s:%s' % (job_id, polls >= 3 and 'done' or 'pending')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+
+class EchoResponse(Response):
+    def parse_body(self):
+        # Request state seen by the response must belong to the same request
+        connection = self.connection
+        return (self.body, connection.action, connection.method,
+                connection.context.get('id'))
+
+
+class ThreadedConnection(PollingConnection):
+    conn_classes = (ThreadedMockHttp, ThreadedMockHttp)
+    responseCls = EchoResponse
+    poll_interval = 0.001
+    timeout = 10
+
+    def request(self, action, params=None, data=None, headers=None,
+                method='GET', raw=False):
+        self.set_context({'id': params['id']})
+        return super(ThreadedConnection, self).request(
+            action, params=params, data=data, headers=headers,
+            method=method, raw=raw)
+
+    def get_poll_request_kwargs(self, response, context, request_kwargs):
+        return {'action': '/job/status',
+                'params': {'id': context['id']}}
+
+    def has_completed(self, response):
+        job_id, status = response.body.split(':')
+        return status == 'done'
+
+
+class ConnectionThreadSafetyTestCase(unittest.TestCase):
+    thread_count = 16
+    requests_per_thread = 25
+
+    def setUp(self):
+        ThreadedMockHttp.jobs = {}
+        self.connection = ThreadedConnection(host='localhost')
+        self.errors = []
+
+    def _run_in_threads(self, target):
+        threads = [threading.Thread(target=target, args=(index,))
+                   for index in range(self.thread_count)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.errors, [])
+
+    def test_request_state_is_not_shared_between_threads(self):
+        def worker(index):
+            for request in range(self.requests_per_thread):
+                request_id = '%s-%s' % (index, request)
+                method = random.choice(['GET', 'POST', 'DELETE'])
+
+                try:
+                    response = self.connection.request(
+                        '/echo', params={'id': request_id}, method=method)
+                    expected = (request_id, '/echo', method, request_id)
+                    if response.object != expected:
+                        self.errors.append((expected, response.object))
+                except Exception:
+                    self.errors.append(sys.exc_info()[1])
+
+        self._run_in_threads(worker)
+        self.assertEqual(self.connection.context, {})
+
+    def test_async_request_can_be_shared_between_threads(self):
+        def worker(index):
+            for request in range(5):
+                job_id = '%s-%s' % (index, request)
+
+                try:
+                    response = self.connection.async_request(
+                        '/job', params={'id': job_id},
+                        context={'id': job_id})
+                    if response.body != '%s:done' % (job_id):
+                        self.errors.append((job_id, response.body))
+                except Exception:
+                    self.errors.append(sys.exc_info()[1])
+
+        self._run_in_threads(worker)
+        self.assertEqual(len(ThreadedMockHttp.jobs), self.thread_count * 5)
+        self.assertTrue(all(polls == 3 for polls in
+                            ThreadedMockHttp.jobs.values()))
+
+    def test_underlying_connection_is_local_to_thread(self):
+        self.connection.connect()
+        main_connection = self.connection.connection
+        seen = []
+
+        def worker(index):
+            seen.append(self.connection.connection)
+            self.connection.connect()
+            seen.append(self.connection.connection)
+
+        self._run_in_threads(worker)
+        self.assertEqual(seen[::2], [None] * self.thread_count)
+        self.assertTrue(main_connection not in seen)
+        self.assertTrue(self.connection.connection is main_connection)
+
+
 if __name__ == '__main__':
     sys.exit(unittest.main())
@@ -15,8 +15,15 @@
 
 import os.path
 import sys
+import shutil
+import tempfile
 import unittest
 
+try:
+    import simplejson as json
+except ImportError:
+    import json
+
 import libcloud.pricing
 
 PRICING_FILE_PATH = os.path.join(os.path.dirname(__file__), 'pricing_test.json')
@@ -102,5 +109,119 @@ class PricingTestCase(unittest.TestCase):
                                      pricing={'foo': 1})
         self.assertTrue('foo' in libcloud.pricing.PRICING_DATA['compute'])
 
+
+class PricingIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.old_directory = libcloud.pricing.PRICING_INDEX_DIRECTORY
+        self.old_use_index = libcloud.pricing.USE_PRICING_INDEX
+        libcloud.pricing.PRICING_INDEX_DIRECTORY = self.directory
+        libcloud.pricing.USE_PRICING_INDEX = True
+        libcloud.pricing.invalidate_pricing_cache()
+
+    def tearDown(self):
+        libcloud.pricing.invalidate_pricing_cache()
+        libcloud.pricing.PRICING_INDEX_DIRECTORY = self.old_directory
+        libcloud.pricing.USE_PRICING_INDEX = self.old_use_index
+        shutil.rmtree(self.directory)
+
+    def _write_pricing_file(self, pricing):
+        file_path = os.path.join(self.directory, 'pricing.json')
+
+        with open(file_path, 'w') as fp:
+            fp.write(json.dumps({'compute': pricing, 'updated': 1}))
+
+        return file_path
+
+    def test_index_lookups(self):
+        index = libcloud.pricing.get_pricing_index(PRICING_FILE_PATH)
+
+        self.assertEqual(index.get_pricing('compute', 'foo'),
+                         {'1': 1.0, '2': 2.0})
+        self.assertEqual(index.get_size_price('compute', 'foo', '2'), 2.0)
+        self.assertRaises(KeyError, index.get_size_price, 'compute', 'foo',
+                          '3')
+        self.assertRaises(KeyError, index.get_size_price, 'compute', 'foo', 2)
+        self.assertRaises(KeyError, index.get_pricing, 'compute', 'bar')
+        self.assertRaises(KeyError, index.get_pricing, 'storage', 'foo')
+
+        # Index is compiled only once
+        self.assertTrue(libcloud.pricing.get_pricing_index(PRICING_FILE_PATH)
+                        is index)
+
+    def test_index_matches_pricing_file(self):
+        pricing = {'a': {'small': 0.1, 'medium': '0.2', 'large': None},
+                   'b': dict([('size-%s' % (i), i) for i in range(500)]),
+                   'c': {}}
+        file_path = self._write_pricing_file(pricing)
+        index = libcloud.pricing.get_pricing_index(file_path)
+
+        for driver_name, driver_pricing in pricing.items():
+            self.assertEqual(index.get_pricing('compute', driver_name),
+                             driver_pricing)
+
+            for size_id, price in driver_pricing.items():
+                self.assertEqual(
+                    index.get_size_price('compute', driver_name, size_id),
+                    price)
+
+    def test_stale_index_is_rebuilt(self):
+        file_path = self._write_pricing_file({'a': {'small': 1}})
+        index = libcloud.pricing.get_pricing_index(file_path)
+        self.assertEqual(index.get_size_price('compute', 'a', 'small'), 1)
+
+        libcloud.pricing.invalidate_pricing_cache()
+        file_path = self._write_pricing_file({'a': {'small': 22}})
+        os.utime(file_path, (0, 0))
+
+        index = libcloud.pricing.get_pricing_index(file_path)
+        self.assertEqual(index.get_size_price('compute', 'a', 'small'), 22)
+
+    def test_get_pricing_only_loads_requested_driver(self):
+        file_path = self._write_pricing_file({'a': {'small': 1},
+                                              'b': {'small': 2}})
+        pricing = libcloud.pricing.get_pricing(driver_type='compute',
+                                               driver_name='a',
+                                               pricing_file_path=file_path)
+
+        self.assertEqual(pricing, {'small': 1})
+        self.assertEqual(list(libcloud.pricing.PRICING_DATA['compute']),
+                         ['a'])
+
+    def test_index_is_disabled_by_default(self):
+        libcloud.pricing.USE_PRICING_INDEX = self.old_use_index
+        pricing = libcloud.pricing.get_pricing(
+            driver_type='compute', driver_name='foo',
+            pricing_file_path=PRICING_FILE_PATH)
+
+        self.assertEqual(pricing['1'], 1.0)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_get_size_price_uses_index(self):
+        price = libcloud.pricing.get_size_price(driver_type='compute',
+                                                driver_name='ec2_us_east',
+                                                size_id='m1.small')
+
+        self.assertTrue(price > 0)
+        self.assertEqual(libcloud.pricing.PRICING_DATA['compute'], {})
+
+    def test_fallback_if_index_directory_is_not_writable(self):
+        file_path = os.path.join(self.directory, 'file')
+
+        with open(file_path, 'w') as fp:
+            fp.write('')
+
+        libcloud.pricing.PRICING_INDEX_DIRECTORY = os.path.join(file_path,
+                                                                'dir')
+        self.assertEqual(libcloud.pricing.get_pricing_index(PRICING_FILE_PATH),
+                         None)
+
+        pricing = libcloud.pricing.get_pricing(
+            driver_type='compute', driver_name='foo',
+            pricing_file_path=PRICING_FILE_PATH)
+        self.assertEqual(pricing['1'], 1.0)
+
+
 if __name__ == '__main__':
     sys.exit(unittest.main())
@@ -22,6 +22,7 @@ from mock import Mock
 
 from libcloud.utils.py3 import httplib, b, StringIO, PY3
 from libcloud.common.base import Response, XmlResponse, JsonResponse
+from libcloud.common.base import StreamingResponse
 from libcloud.common.types import MalformedResponseError
 
 
@@ -146,6 +147,23 @@ class ResponseClassesTests(unittest.TestCase):
         body = response.parse_body()
         self.assertEqual(body, original_data)
 
+    def test_StreamingResponse_gzip_encoding(self):
+        original_data = b('<foo>bar</foo>' * 100)
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        compressed_data = compressor.compress(original_data) + \
+            compressor.flush()
+        chunks = [compressed_data[:10], compressed_data[10:], b('')]
+
+        self._mock_response.read.side_effect = lambda size: chunks.pop(0)
+        self._mock_response.getheaders.return_value = \
+            {'Content-Encoding': 'gzip'}
+
+        response = StreamingResponse(response=self._mock_response,
+                                     connection=self._mock_connection)
+
+        self.assertEqual(response.read(), original_data)
+        self.assertEqual(chunks, [])
+
 
 if __name__ == '__main__':
     sys.exit(unittest.main())
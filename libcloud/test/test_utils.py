@@ -14,14 +14,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import with_statement
+
 import sys
+import tempfile
 import socket
 import codecs
 import unittest
 import warnings
 import os.path
+import zlib
+import subprocess
 
+from io import BytesIO
 from itertools import chain
+from datetime import datetime
+
+from mock import patch
 
 # In Python > 2.7 DeprecationWarnings are disabled by default
 warnings.simplefilter('default')
@@ -29,6 +38,8 @@ warnings.simplefilter('default')
 import libcloud.utils.files
 
 from libcloud.utils.misc import get_driver, set_driver
+from libcloud.utils.compression import DecompressedStream
+from libcloud.utils.xml import findtext, iterfindall
 
 from libcloud.utils.py3 import PY3
 from libcloud.utils.py3 import StringIO
@@ -39,6 +50,9 @@ from libcloud.utils.py3 import urlquote
 from libcloud.compute.types import Provider
 from libcloud.compute.providers import DRIVERS
 from libcloud.utils.misc import get_secure_random_string
+from libcloud.utils.misc import get_backoff_delay
+from libcloud.utils.misc import to_timestamp
+from libcloud.utils.misc import timestamp_to_iso
 from libcloud.utils.networking import is_public_subnet
 from libcloud.utils.networking import is_private_subnet
 from libcloud.utils.networking import is_valid_ip_address
@@ -87,6 +101,39 @@ class TestUtils(unittest.TestCase):
         else:
             self.fail('Invalid provider, but an exception was not thrown')
 
+    def test_get_driver_is_cached(self):
+        drivers = {'dummy': ('libcloud.compute.drivers.dummy',
+                             'DummyNodeDriver')}
+        driver = get_driver(drivers=drivers, provider='dummy')
+
+        with patch('libcloud.utils.misc.__import__', create=True) as mock:
+            self.assertTrue(get_driver(drivers=drivers,
+                                       provider='dummy') is driver)
+            self.assertEqual(mock.call_count, 0)
+
+        # Provider which is registered again is resolved using the new module
+        drivers['dummy'] = ('libcloud.storage.drivers.dummy',
+                            'DummyStorageDriver')
+        self.assertEqual(get_driver(drivers=drivers,
+                                    provider='dummy').__name__,
+                         'DummyStorageDriver')
+
+    def test_get_driver_does_not_import_concurrent_futures(self):
+        code = ('import sys\n'
+                'from libcloud.compute.providers import get_driver\n'
+                'from libcloud.compute.types import Provider\n'
+                'from libcloud.storage.providers import get_driver as gd\n'
+                'from libcloud.storage.types import Provider as SP\n'
+                'get_driver(Provider.EC2)\n'
+                'gd(SP.S3)\n'
+                'print("concurrent.futures" in sys.modules)\n')
+        # Other tests might leave an invalid SSL_CERT_FILE in the environment
+        env = dict(os.environ)
+        env.pop('SSL_CERT_FILE', None)
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         env=env)
+        self.assertEqual(output.strip(), b('False'))
+
     def test_set_driver(self):
         # Set an existing driver
         try:
@@ -218,6 +265,28 @@ class TestUtils(unittest.TestCase):
 
             self.assertEqual(index, 548)
 
+    def test_read_in_chunks_large_chunks(self):
+        # Iterator returns chunks which are much larger than chunk_size
+        def iterator():
+            for x in range(0, 3):
+                yield b('a') * 25
+
+        result = list(libcloud.utils.files.read_in_chunks(iterator(),
+                                                          chunk_size=10,
+                                                          fill_size=True))
+
+        self.assertEqual(result, [b('a') * 10] * 7 + [b('a') * 5])
+
+    def test_read_in_chunks_file(self):
+        with tempfile.TemporaryFile() as fp:
+            fp.write(b('a') * 25)
+            fp.seek(0)
+
+            result = list(libcloud.utils.files.read_in_chunks(
+                fp, chunk_size=10, fill_size=True))
+
+        self.assertEqual(result, [b('a') * 10, b('a') * 10, b('a') * 5])
+
     def test_exhaust_iterator(self):
         def iterator_func():
             for x in range(0, 1000):
@@ -266,6 +335,35 @@ class TestUtils(unittest.TestCase):
             value = get_secure_random_string(size=i)
             self.assertEqual(len(value), i)
 
+    def test_get_backoff_delay(self):
+        delays = [get_backoff_delay(attempt=attempt, initial_delay=2,
+                                    max_delay=10, factor=2, jitter=0)
+                  for attempt in range(5)]
+        self.assertEqual(delays, [2, 4, 8, 10, 10])
+
+        for _ in range(100):
+            delay = get_backoff_delay(attempt=1, initial_delay=2, factor=2,
+                                      jitter=0.5)
+            self.assertTrue(2 <= delay <= 6)
+
+    def test_to_timestamp(self):
+        expected = 1425985740.0
+        values = ['2015-03-10T11:09:00Z', '2015-03-10T11:09:00',
+                  '2015-03-10 11:09:00', '2015-03-10T12:09:00+01:00',
+                  '2015-03-10T06:09:00-0500', datetime(2015, 3, 10, 11, 9),
+                  1425985740]
+
+        for value in values:
+            self.assertEqual(to_timestamp(value), expected)
+
+        self.assertEqual(to_timestamp('2015-03-10T11:09:00.25Z'),
+                         expected + 0.25)
+        self.assertRaises(ValueError, to_timestamp, '10.3.2015')
+
+    def test_timestamp_to_iso(self):
+        self.assertEqual(timestamp_to_iso(1425985740.5),
+                         '2015-03-10T11:09:00Z')
+
     def test_hexadigits(self):
         self.assertEqual(hexadigits(b('')), [])
         self.assertEqual(hexadigits(b('a')), ['61'])
@@ -280,6 +378,45 @@ class TestUtils(unittest.TestCase):
             self.assertEqual(bchr(0), '\x00')
             self.assertEqual(bchr(97), 'a')
 
+    def test_decompressed_stream(self):
+        data = b('<root>' + '<item>value</item>' * 1000 + '</root>')
+        compressed = zlib.compress(data)
+
+        stream = DecompressedStream(BytesIO(compressed), 'zlib')
+        stream.chunk_size = 64
+        self.assertEqual(stream.read(10), data[:10])
+        self.assertEqual(stream.read(), data[10:])
+        self.assertEqual(stream.read(), b(''))
+
+        stream = DecompressedStream(StringIO('text'))
+        self.assertEqual(stream.read(), b('text'))
+
+    def test_iterfindall(self):
+        namespace = 'http://ec2.amazonaws.com/doc/2013-10-15/'
+        data = ('<Response xmlns="%s"><volumeSet>'
+                '<item><id>1</id><tagSet><item>tag</item></tagSet></item>'
+                '<item><id>2</id></item></volumeSet></Response>' %
+                (namespace))
+        ids = []
+        parents = []
+
+        for element in iterfindall(BytesIO(b(data)), 'volumeSet/item',
+                                   namespace=namespace):
+            ids.append(findtext(element, 'id', namespace=namespace))
+            parents.append(element)
+
+        # nested items are not yielded and processed elements are cleared
+        self.assertEqual(ids, ['1', '2'])
+        self.assertEqual(len(parents[0]), 0)
+
+        data = data.replace('</Response>', '<nextToken>a</nextToken>'
+                                           '</Response>')
+        elements = iterfindall(BytesIO(b(data)),
+                               ['volumeSet/item', 'nextToken'],
+                               namespace=namespace)
+        self.assertEqual([element.text for element in elements],
+                         [None, None, 'a'])
+
 
 class NetworkingUtilsTestCase(unittest.TestCase):
     def test_is_public_and_is_private_subnet(self):
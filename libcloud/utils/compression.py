@@ -17,11 +17,13 @@ import zlib
 import gzip
 
 from libcloud.utils.py3 import PY3
+from libcloud.utils.py3 import b
 from libcloud.utils.py3 import StringIO
 
 
 __all__ = [
-    'decompress_data'
+    'decompress_data',
+    'DecompressedStream'
 ]
 
 
@@ -40,3 +42,69 @@ def decompress_data(compression_type, data):
     else:
         raise Exception('Invalid or onsupported compression type: %s' %
                         (compression_type))
+
+
+class DecompressedStream(object):
+    """
+    File-like object which decompresses data read from the underlying
+    file object (e.g. HTTP response) on the fly.
+    """
+
+    chunk_size = 16 * 1024
+
+    def __init__(self, fileobj, compression_type=None):
+        """
+        :param fileobj: Object with a ``read`` method.
+        :type fileobj: ``object``
+
+        :param compression_type: ``zlib``, ``gzip`` or ``None`` if the data
+                                 is not compressed.
+        :type compression_type: ``str``
+        """
+        if compression_type == 'zlib':
+            self._decompressor = zlib.decompressobj()
+        elif compression_type == 'gzip':
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif compression_type is None:
+            self._decompressor = None
+        else:
+            raise Exception('Invalid or onsupported compression type: %s' %
+                            (compression_type))
+
+        self._fileobj = fileobj
+        self._buffer = b('')
+        self._eof = False
+
+    def read(self, size=-1):
+        """
+        Read and return up to ``size`` bytes (everything if ``size`` is
+        negative).
+
+        :rtype: ``bytes``
+        """
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            self._fill()
+
+        if size < 0:
+            data, self._buffer = self._buffer, b('')
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+
+        return data
+
+    def _fill(self):
+        data = self._fileobj.read(self.chunk_size)
+
+        if not data:
+            self._eof = True
+
+            if self._decompressor is not None:
+                self._buffer += self._decompressor.flush()
+            return
+
+        data = b(data)
+
+        if self._decompressor is not None:
+            data = self._decompressor.decompress(data)
+
+        self._buffer += data
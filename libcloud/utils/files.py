@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import os
 import mimetypes
 
@@ -52,46 +53,56 @@ def read_in_chunks(iterator, chunk_size=None, fill_size=False,
     :param yield_empty: If true and iterator returned no data, yield empty
                         bytes object before raising StopIteration.
     :type yield_empty: ``bool``
-
-    TODO: At some point in the future we could use byte arrays here if version
-    >= Python 3. This should speed things up a bit and reduce memory usage.
     """
     chunk_size = chunk_size or CHUNK_SIZE
 
-    if isinstance(iterator, (file, httplib.HTTPResponse)):
+    if isinstance(iterator, (file, io.IOBase, httplib.HTTPResponse)):
         get_data = iterator.read
         args = (chunk_size, )
     else:
         get_data = next
         args = (iterator, )
 
-    data = b('')
+    # Data is accumulated in a bytearray (appending to it doesn't copy the
+    # data which has already been buffered) and consumed from an offset so
+    # every byte is copied a constant number of times, no matter how the
+    # sizes of the chunks returned by the iterator relate to chunk_size
+    data = bytearray()
     empty = False
+    yielded = False
 
-    while not empty or len(data) > 0:
-        if not empty:
-            try:
-                chunk = b(get_data(*args))
-                if len(chunk) > 0:
-                    data += chunk
-                else:
-                    empty = True
-            except StopIteration:
-                empty = True
-
-        if len(data) == 0:
-            if empty and yield_empty:
-                yield b('')
-
-            raise StopIteration
-
-        if fill_size:
-            if empty or len(data) >= chunk_size:
-                yield data[:chunk_size]
-                data = data[chunk_size:]
+    while not empty:
+        try:
+            chunk = get_data(*args)
+        except StopIteration:
+            chunk = None
+
+        if not chunk:
+            empty = True
+        elif not fill_size:
+            yielded = True
+            yield b(chunk)
+            continue
         else:
-            yield data
-            data = b('')
+            data += b(chunk)
+
+        if len(data) < chunk_size and not empty:
+            continue
+
+        offset = 0
+
+        # memoryview is not available on Python 2.6, slicing the bytearray
+        # copies only the chunk which is yielded
+        while len(data) - offset >= chunk_size or \
+                (empty and offset < len(data)):
+            yielded = True
+            yield bytes(data[offset:offset + chunk_size])
+            offset += chunk_size
+
+        del data[:offset]
+
+    if not yielded and yield_empty:
+        yield b('')
 
 
 def exhaust_iterator(iterator):
@@ -15,12 +15,18 @@
 
 from datetime import datetime
 import os
+import re
 import sys
+import time
+import random
+import calendar
 import binascii
 
 
 __all__ = [
     'iso_to_datetime',
+    'to_timestamp',
+    'timestamp_to_iso',
     'find',
     'get_driver',
     'set_driver',
@@ -31,8 +37,11 @@ __all__ = [
     'reverse_dict',
     'lowercase_keys',
     'get_secure_random_string',
+    'get_backoff_delay',
+    'lazy_dict_property',
 
-    'ReprMixin'
+    'ReprMixin',
+    'SlotsMixin'
 ]
 
 
@@ -53,23 +62,96 @@ def iso_to_datetime(isodate):
     return date
 
 
+ISO_TIMESTAMP_RE = re.compile(r'^(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})'
+                              r'(\.\d+)?(Z|[+-]\d{2}:?\d{2})?$')
+
+
+def to_timestamp(value):
+    """
+    Return number of seconds since epoch for the provided value.
+
+    :param value: Datetime (naive datetime objects are treated as UTC), ISO
+                  8601 string (e.g. ``2015-03-10T11:09:00.5+01:00``) or a
+                  number of seconds since epoch.
+    :type value: :class:`datetime.datetime` or ``str`` or ``float``
+
+    :rtype: ``float``
+    """
+    if isinstance(value, datetime):
+        timestamp = calendar.timegm(value.timetuple()) + \
+            value.microsecond / 1000000.0
+        offset = value.utcoffset()
+
+        if offset:
+            timestamp -= offset.days * 86400 + offset.seconds
+
+        return timestamp
+
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    match = ISO_TIMESTAMP_RE.match(value.strip())
+
+    if not match:
+        raise ValueError('Invalid timestamp: %s' % (value))
+
+    date, fraction, zone = match.groups()
+    timestamp = calendar.timegm(time.strptime(date.replace(' ', 'T'),
+                                              '%Y-%m-%dT%H:%M:%S'))
+
+    if fraction:
+        timestamp += float(fraction)
+
+    if zone and zone != 'Z':
+        zone = zone.replace(':', '')
+        offset = int(zone[1:3]) * 3600 + int(zone[3:5]) * 60
+        timestamp -= offset if zone[0] == '+' else -offset
+
+    return float(timestamp)
+
+
+def timestamp_to_iso(timestamp):
+    """
+    Return ISO 8601 representation (UTC, second precision) of the provided
+    number of seconds since epoch.
+
+    :rtype: ``str``
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp))
+
+
 def find(l, predicate):
     results = [x for x in l if predicate(x)]
     return results[0] if len(results) > 0 else None
 
 
+# Driver classes which have already been imported, keyed by the
+# (module name, class name) tuple from the provider DRIVERS dictionaries
+_DRIVER_CLASSES = {}
+
+
 def get_driver(drivers, provider):
     """
     Get a driver.
 
+    Driver modules are only imported on the first lookup, subsequent lookups
+    return the cached class.
+
     :param drivers: Dictionary containing valid providers.
     :param provider: Id of provider to get driver
     :type provider: :class:`libcloud.types.Provider`
     """
     if provider in drivers:
-        mod_name, driver_name = drivers[provider]
-        _mod = __import__(mod_name, globals(), locals(), [driver_name])
-        return getattr(_mod, driver_name)
+        entry = drivers[provider]
+        driver = _DRIVER_CLASSES.get(entry, None)
+
+        if driver is None:
+            mod_name, driver_name = entry
+            _mod = __import__(mod_name, globals(), locals(), [driver_name])
+            driver = getattr(_mod, driver_name)
+            _DRIVER_CLASSES[entry] = driver
+
+        return driver
 
     raise AttributeError('Provider %s does not exist' % (provider))
 
@@ -281,6 +363,68 @@ def get_secure_random_string(size):
     return value
 
 
+def get_backoff_delay(attempt, initial_delay, max_delay=None, factor=1.5,
+                      jitter=0.25):
+    """
+    Return the delay (in seconds) before the next attempt when using an
+    exponential back-off with jitter.
+
+    :param attempt: Number of attempts performed so far (starting with 0).
+    :type attempt: ``int``
+
+    :param initial_delay: Delay before the first retry.
+    :type initial_delay: ``float``
+
+    :param max_delay: Upper bound for the delay (before jitter is applied).
+    :type max_delay: ``float``
+
+    :param factor: Multiplier applied to the delay after each attempt.
+    :type factor: ``float``
+
+    :param jitter: Maximum relative amount of random jitter which is added to
+                   or subtracted from the delay (0.25 means +/- 25%).
+    :type jitter: ``float``
+
+    :rtype: ``float``
+    """
+    delay = initial_delay * (factor ** attempt)
+
+    if max_delay is not None:
+        delay = min(delay, max_delay)
+
+    if jitter:
+        delay = delay * random.uniform(1 - jitter, 1 + jitter)
+
+    return delay
+
+
+def lazy_dict_property(attribute, doc=None):
+    """
+    Return a property for a dictionary which is stored in the provided
+    attribute. The (empty) dictionary is only created once the property is
+    accessed for the first time so objects which never use it don't need to
+    store it.
+
+    :param attribute: Name of the attribute (slot) with the value.
+    :type attribute: ``str``
+
+    :rtype: ``property``
+    """
+    def getter(self):
+        value = getattr(self, attribute)
+
+        if value is None:
+            value = {}
+            setattr(self, attribute, value)
+
+        return value
+
+    def setter(self, value):
+        setattr(self, attribute, value)
+
+    return property(getter, setter, doc=doc)
+
+
 class ReprMixin(object):
     """
     Mixin class which adds __repr__ and __str__ methods for the attributes
@@ -301,3 +445,31 @@ class ReprMixin(object):
 
     def __str__(self):
         return str(self.__repr__())
+
+
+class SlotsMixin(object):
+    """
+    Mixin class for classes which store their attributes in ``__slots__``.
+
+    It adds pickle support for all the protocols (objects with ``__slots__``
+    can't be pickled with protocol 0 and 1 by default).
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', None) or {})
+
+        for klass in self.__class__.__mro__:
+            for name in klass.__dict__.get('__slots__', ()):
+                if name in ['__dict__', '__weakref__']:
+                    continue
+
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
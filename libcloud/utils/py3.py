@@ -81,7 +81,11 @@ if PY3:
     from urllib.parse import urlencode as urlencode
     from os.path import relpath
 
-    from imp import reload
+    try:
+        from importlib import reload
+    except ImportError:
+        # Python < 3.4
+        from imp import reload
 
     from builtins import bytes
     from builtins import next
@@ -13,11 +13,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from libcloud.utils.py3 import basestring
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    from xml.etree import ElementTree as ET
+
 __all__ = [
     'fixxpath',
     'findtext',
     'findattr',
-    'findall'
+    'findall',
+    'iterfindall'
 ]
 
 
@@ -48,3 +56,47 @@ def findattr(element, xpath, namespace=None):
 
 def findall(element, xpath, namespace=None):
     return element.findall(fixxpath(xpath=xpath, namespace=namespace))
+
+
+def iterfindall(stream, xpath, namespace=None):
+    """
+    Incrementally parse XML document from a file-like object and yield
+    elements which match the provided path (relative to the root element).
+
+    Yielded elements (and their children) are cleared once the caller asks
+    for the next element so the whole document is never kept in memory.
+    This means an element is only valid until the next one is yielded.
+
+    :param stream: File-like object with a ``read`` method.
+    :type stream: ``object``
+
+    :param xpath: Path of the elements to yield (e.g. ``volumeSet/item``)
+                  or a list of paths.
+    :type xpath: ``str`` or ``list`` of ``str``
+
+    :rtype: ``generator`` of ``Element``
+    """
+    if isinstance(xpath, basestring):
+        xpath = [xpath]
+
+    paths = [[fixxpath(xpath=tag, namespace=namespace)
+              for tag in value.split('/')] for value in xpath]
+    tags = []
+    parents = []
+
+    for event, element in ET.iterparse(stream, events=('start', 'end')):
+        if event == 'start':
+            tags.append(element.tag)
+            parents.append(element)
+            continue
+
+        tags.pop()
+        parents.pop()
+
+        if not tags or tags[1:] + [element.tag] not in paths:
+            continue
+
+        yield element
+
+        element.clear()
+        parents[-1].remove(element)
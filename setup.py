@@ -242,6 +242,10 @@ if PY2_pre_26:
 if PY2_pre_279 or PY3_pre_32:
     install_requires.append('backports.ssl_match_hostname')
 
+if PY2:
+    # concurrent.futures backport
+    install_requires.append('futures')
+
 setup(
     name='apache-libcloud',
     version=read_version_string(),